@@ -11,17 +11,23 @@ combined MachineConfig with deduplicated contents.
 For an alternative approach that uses .d directory includes (one file per rule),
 see modular/create-modular-configs.sh and model-context/MODULAR_APPROACH.md.
 
+With --compress, file contents are gzipped and base64-encoded
+(compression: gzip) and the plaintext comment copy of every line is
+dropped unless --comment-lines is given, which keeps large audit-rules and
+sysctl combos small in etcd and in the MCO's rendered configs.
+--size-report compares both encodings over the whole remediation set
+without writing anything.
+
 Usage:
     python3 core/combine-machineconfigs-by-path.py \\
         --src-dir complianceremediations --out-dir complianceremediations \\
         [--severity high,medium,low] [--header none|provenance|full] \\
-        [--no-move] [--dry-run]
+        [--compress [--comment-lines]] [--no-move] [--dry-run] [--size-report]
 """
 from __future__ import annotations
 
 import os
 import sys
-import urllib.parse
 import argparse
 from typing import Any
 
@@ -29,7 +35,7 @@ from typing import Any
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from lib.compliance_utils import (  # noqa: E402
     safe_shortname, parse_machineconfig_files as _parse_mc_files,
-    parse_severity_filter,
+    parse_severity_filter, encode_file_contents,
 )
 
 
@@ -39,74 +45,135 @@ def parse_machineconfig_files(
     dict[tuple[str, str | None], list[dict[str, Any]]],
     list[tuple[str, str]],
 ]:
-    """Parse MachineConfig YAMLs, skipping the combo/ subdirectory."""
-    return _parse_mc_files(src_dir, exclude_dirs={'combo'})
+    """Parse MachineConfig YAMLs, skipping the combo/ subdirectory and the
+    consolidated/ output of consolidate-machineconfigs.py."""
+    return _parse_mc_files(src_dir, exclude_dirs={'combo', 'consolidated'})
 
 
-def write_combo_yaml(
+def combo_filename(path: str, severity: str | None) -> str:
+    shortname = safe_shortname(path)
+    if severity:
+        return f"{shortname}-{severity}-combo.yaml"
+    return f"{shortname}-combo.yaml"
+
+
+def render_combo_yaml(
     path: str,
     severity: str | None,
     sources: list[dict[str, Any]],
-    out_dir: str,
     header_mode: str = "none",
-) -> None:
-    """Write a combined MachineConfig YAML for a given file path and severity.
+    compress: bool = False,
+    comment_lines: bool | None = None,
+) -> str:
+    """Render a combined MachineConfig YAML for a given file path and severity.
     Sources is a list of dicts with 'source_file' and 'lines' keys.
+
+    comment_lines controls the plaintext comment copy of the contents; it
+    defaults to on for plain sources and off for compressed ones.
     """
+    if comment_lines is None:
+        comment_lines = not compress
     all_lines = set()
     for source in sources:
         all_lines.update(source['lines'])
     deduped_lines = sorted(all_lines)
-    shortname = safe_shortname(path)
-    if severity:
-        outname = f"{shortname}-{severity}-combo.yaml"
-    else:
-        outname = f"{shortname}-combo.yaml"
-    outpath = os.path.join(out_dir, outname)
-    with open(outpath, "w") as out:
-        # Optional top-of-file header
-        if header_mode and header_mode != "none":
-            if header_mode == "provenance":
-                out.write(
-                    f"# Combined from {len(sources)} remediations for {path}"
-                    f"{' | severity: ' + severity if severity else ''}.\n"
-                )
-            elif header_mode == "full":
-                out.write(
-                    "# Combined from the following remediations "
-                    f"for {path} (all roles){' | severity: ' + severity if severity else ''}:\n"
-                )
-                for source in sources:
-                    out.write(f"#   - {source['source_file']}\n")
-        out.write(
-            "apiVersion: machineconfiguration.openshift.io/v1\n"
-            "kind: MachineConfig\n"
-            "spec:\n"
-            "  config:\n"
-            "    ignition:\n"
-            "      version: 3.5.0\n"
-            "    storage:\n"
-            "      files:\n"
-            "        - contents:\n"
+    contents = encode_file_contents("\n".join(deduped_lines) + "\n", compress)
+    out = []
+    # Optional top-of-file header
+    if header_mode and header_mode != "none":
+        if header_mode == "provenance":
+            out.append(
+                f"# Combined from {len(sources)} remediations for {path}"
+                f"{' | severity: ' + severity if severity else ''}.\n"
+            )
+        elif header_mode == "full":
+            out.append(
+                "# Combined from the following remediations "
+                f"for {path} (all roles){' | severity: ' + severity if severity else ''}:\n"
+            )
+            for source in sources:
+                out.append(f"#   - {source['source_file']}\n")
+    out.append(
+        "apiVersion: machineconfiguration.openshift.io/v1\n"
+        "kind: MachineConfig\n"
+        "spec:\n"
+        "  config:\n"
+        "    ignition:\n"
+        "      version: 3.5.0\n"
+        "    storage:\n"
+        "      files:\n"
+        "        - contents:\n"
+    )
+    if comment_lines:
+        out.append(
             "            # The following lines are the deduplicated, combined "
             "plaintext contents from all related MachineConfig remediations.\n"
         )
         for line in deduped_lines:
-            out.write(f"            # {line}\n")
-        out.write("            source: data:,")
-        encoded = urllib.parse.quote(
-            "\n".join(deduped_lines) + "\n", safe='')
-        out.write(encoded)
-        out.write(
-            """
+            out.append(f"            # {line}\n")
+    if 'compression' in contents:
+        out.append(f"            compression: {contents['compression']}\n")
+    out.append(f"            source: {contents['source']}")
+    out.append(
+        """
           mode: 384
           overwrite: true
           path: {path}
 """.format(path=path)
-        )
+    )
+    return "".join(out)
+
+
+def write_combo_yaml(
+    path: str,
+    severity: str | None,
+    sources: list[dict[str, Any]],
+    out_dir: str,
+    header_mode: str = "none",
+    compress: bool = False,
+    comment_lines: bool | None = None,
+) -> None:
+    """Write a combined MachineConfig YAML for a given file path and severity.
+    Sources is a list of dicts with 'source_file' and 'lines' keys.
+    """
+    outpath = os.path.join(out_dir, combo_filename(path, severity))
+    with open(outpath, "w") as out:
+        out.write(render_combo_yaml(
+            path, severity, sources, header_mode, compress, comment_lines))
     print(f"Wrote {outpath}")
 
 
+def size_report(
+    combo_map: dict[tuple[str, str | None], list[dict[str, Any]]],
+    header_mode: str = "none",
+) -> tuple[int, int]:
+    """Print plain vs compressed YAML sizes for every combo that would be
+    written; return the (plain, compressed) byte totals."""
+    rows = []
+    for (path, severity), sources in sorted(
+            combo_map.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+        if len(sources) < 2:
+            continue
+        plain = len(render_combo_yaml(path, severity, sources, header_mode).encode())
+        packed = len(render_combo_yaml(
+            path, severity, sources, header_mode, compress=True).encode())
+        rows.append((combo_filename(path, severity), plain, packed))
+
+    width = max([len(name) for name, _, _ in rows] + [len("COMBO")])
+    print(f"{'COMBO':<{width}}  {'PLAIN':>9}  {'GZIP':>9}  {'SAVED':>6}")
+    for name, plain, packed in rows:
+        print(f"{name:<{width}}  {plain:>9}  {packed:>9}  {_saved(plain, packed):>6}")
+    total_plain = sum(plain for _, plain, _ in rows)
+    total_packed = sum(packed for _, _, packed in rows)
+    print(f"{'TOTAL (' + str(len(rows)) + ' combos)':<{width}}  "
+          f"{total_plain:>9}  {total_packed:>9}  {_saved(total_plain, total_packed):>6}")
+    return total_plain, total_packed
+
+
+def _saved(plain: int, packed: int) -> str:
+    return f"{100 - packed * 100 / plain:.0f}%" if plain else "-"
+
+
 def move_originals_to_combo(
     combo_map: dict[tuple[str, str | None], list[dict[str, Any]]],
     src_dir: str,
@@ -154,6 +221,10 @@ Examples:
 
   # Combine only high severity remediations
   %(prog)s -s high --no-move
+
+  # Compare plain and gzip-compressed sizes, then write compressed combos
+  %(prog)s --size-report
+  %(prog)s --compress --no-move
 """
     )
     parser.add_argument(
@@ -173,6 +244,19 @@ Examples:
         '--header', default='none', choices=['none', 'provenance', 'full'],
         help="Top-of-file header mode for generated files: 'none' (default), 'provenance' (one-line), or 'full' (list sources)"
     )
+    parser.add_argument(
+        '--compress', action='store_true',
+        help="Emit gzip-compressed, base64-encoded file contents (compression: gzip) "
+             "and drop the plaintext comment copy of each line"
+    )
+    parser.add_argument(
+        '--comment-lines', action='store_true',
+        help="With --compress, still write the plaintext comment copy of each line"
+    )
+    parser.add_argument(
+        '--size-report', action='store_true',
+        help="Compare plain and --compress YAML sizes for every combo, without writing files"
+    )
     parser.add_argument(
         '--no-move', action='store_true',
         help="Don't move original files to combo/ folder (makes script idempotent)"
@@ -187,6 +271,21 @@ Examples:
     out_dir = args.out_dir
     severity_filter = parse_severity_filter(args.severity)
     combo_dir = os.path.join(src_dir, "combo")
+    comment_lines = True if args.comment_lines else None
+
+    if args.size_report:
+        combo_map, skipped = parse_machineconfig_files(src_dir)
+        if severity_filter is not None:
+            combo_map = {
+                key: sources for key, sources in combo_map.items()
+                if key[1] in severity_filter
+            }
+        size_report(combo_map, args.header)
+        if skipped:
+            print(f"\nWARNING: {len(skipped)} file(s) skipped due to YAML parse errors",
+                  file=sys.stderr)
+            sys.exit(2)
+        return
 
     if args.dry_run:
         print("[DRY-RUN] Preview mode - no files will be modified")
@@ -212,13 +311,13 @@ Examples:
         combo_count += 1
 
         if args.dry_run:
-            shortname = safe_shortname(path)
-            outname = f"{shortname}-{severity}-combo.yaml" if severity else f"{shortname}-combo.yaml"
+            outname = combo_filename(path, severity)
             print(f"[DRY-RUN] Would combine {len(sources)} files for {path} -> {outname}")
             for source in sources:
                 print(f"          - {source['source_file']}")
         else:
-            write_combo_yaml(path, severity, sources, out_dir, header_mode=args.header)
+            write_combo_yaml(path, severity, sources, out_dir, header_mode=args.header,
+                             compress=args.compress, comment_lines=comment_lines)
 
     if args.dry_run:
         print(f"\n[DRY-RUN] Would create {combo_count} combined file(s)")
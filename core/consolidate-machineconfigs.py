@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Consolidate MachineConfig remediations into one MachineConfig per pool.
+
+Every MachineConfig object applied to a pool makes the MCO render a new
+config and roll it out, usually with a drain and reboot per node. Even after
+combine-machineconfigs-by-path.py a hardening set is dozens of objects per
+role. This packs the storage entries (files, directories, links), systemd
+units, users, kernel arguments and extensions of every MachineConfig for a
+role/severity into a single MachineConfig, so the whole set is one rendered
+config and one reboot per pool.
+
+Entries are merged in lexical MachineConfig name order, as the MCO does.
+Two sources writing the same path (or unit, or user) with different content
+are a collision: by default nothing is written and the collisions are
+listed; with --on-collision last the lexically later source wins, which is
+what the cluster would have done. Kernel arguments accumulate, and
+conflicting values for the same key are reported.
+
+Output goes to --out-dir as <prefix>-<severity>-<role>.yaml (or
+<prefix>-<role>.yaml with --merge-severities), plus provenance.json, which
+maps every consolidated MachineConfig, file path, unit and kernel argument
+back to the source MachineConfigs. An output larger than --max-bytes is
+split into numbered parts, so every object stays under the etcd size limit.
+
+Usage:
+    python3 core/consolidate-machineconfigs.py \\
+        --src-dir complianceremediations --out-dir complianceremediations/consolidated \\
+        [--severity high,medium,low] [--merge-severities] [--prefix 75-compliance] \\
+        [--on-collision error|last] [--max-bytes N] [--dry-run]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import json
+import argparse
+from collections import defaultdict
+from typing import Any
+
+# Add project root to path for shared module imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lib.compliance_utils import (  # noqa: E402
+    DERIVED_MC_DIRS, ROLE_LABEL, load_machineconfigs, parse_severity_filter, decode_file_contents,
+)
+
+# Check for required dependencies
+try:
+    import yaml
+except ImportError:
+    print("ERROR: PyYAML not installed.", file=sys.stderr)
+    print("Install with: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+
+PROVENANCE_FILE = 'provenance.json'
+# Well under the ~1.5 MiB etcd request limit.
+DEFAULT_MAX_BYTES = 1_000_000
+
+# Ignition list fields merged by key; a later entry with the same key
+# replaces an earlier one.
+KEYED_LISTS = {
+    ('storage', 'files'): 'path',
+    ('storage', 'directories'): 'path',
+    ('storage', 'links'): 'path',
+    ('systemd', 'units'): 'name',
+    ('passwd', 'users'): 'name',
+}
+# MachineConfig spec fields that hold a single value for the whole pool.
+SPEC_SCALARS = ('fips', 'kernelType', 'osImageURL', 'baseOSExtensionsContainerImage')
+
+
+def _version_key(version: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in version.split('.'))
+    except ValueError:
+        return ()
+
+
+def _same_entry(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """Entries are the same if equal, or if only the contents encoding differs."""
+    if a == b:
+        return True
+    if 'contents' not in a or 'contents' not in b:
+        return False
+    rest_a = {k: v for k, v in a.items() if k != 'contents'}
+    rest_b = {k: v for k, v in b.items() if k != 'contents'}
+    if rest_a != rest_b:
+        return False
+    decoded = decode_file_contents(a['contents'] or {})
+    return decoded is not None and decoded == decode_file_contents(b['contents'] or {})
+
+
+def merge_machineconfigs(
+    machineconfigs: list[dict[str, Any]],
+    on_collision: str = 'error',
+) -> dict[str, Any]:
+    """Merge MachineConfigs (as returned by load_machineconfigs) in name order.
+
+    Returns a dict with keys:
+      ignition_version: highest Ignition version among the sources
+      lists: {(section, field): {key: entry}} for KEYED_LISTS
+      kernel_arguments, extensions: accumulated, duplicates dropped
+      scalars: {field: value} for SPEC_SCALARS
+      provenance: {kind: {key: [source names]}}, kind being e.g.
+        "storage.files", "kernelArguments", "spec.fips"
+      collisions: [{kind, key, sources, winner}]
+      warnings, unsupported: lists of messages
+    """
+    lists: dict[tuple[str, str], dict[str, Any]] = defaultdict(dict)
+    provenance: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+    collisions: list[dict[str, Any]] = []
+    warnings: list[str] = []
+    unsupported: list[str] = []
+    versions: dict[str, list[str]] = defaultdict(list)
+    kernel_arguments: list[str] = []
+    extensions: list[str] = []
+    scalars: dict[str, Any] = {}
+
+    def record(kind: str, key: str, name: str, same: bool) -> None:
+        sources = provenance[kind][key]
+        if not same:
+            collisions.append({
+                'kind': kind,
+                'key': key,
+                'sources': sorted(set(sources)) + [name],
+                'winner': name if on_collision == 'last' else None,
+            })
+        sources.append(name)
+
+    for mc in sorted(machineconfigs, key=lambda m: m['name']):
+        name = mc['name']
+        spec = mc['doc'].get('spec') or {}
+        config = spec.get('config') or {}
+        version = (config.get('ignition') or {}).get('version')
+        if version:
+            versions[version].append(name)
+
+        for section, body in config.items():
+            if section == 'ignition' or not body:
+                continue
+            if not isinstance(body, dict):
+                unsupported.append(f"{name}: spec.config.{section}")
+                continue
+            for field, items in body.items():
+                keyname = KEYED_LISTS.get((section, field))
+                if keyname is None:
+                    if items:
+                        unsupported.append(f"{name}: spec.config.{section}.{field}")
+                    continue
+                kind = f"{section}.{field}"
+                entries = lists[(section, field)]
+                for item in items or []:
+                    key = item.get(keyname)
+                    if key is None:
+                        unsupported.append(f"{name}: {kind} entry without {keyname}")
+                        continue
+                    existing = entries.get(key)
+                    same = existing is None or _same_entry(existing, item)
+                    if existing is None or (not same and on_collision == 'last'):
+                        entries[key] = item
+                    record(kind, key, name, same)
+
+        for arg in spec.get('kernelArguments') or []:
+            if arg not in kernel_arguments:
+                kernel_arguments.append(arg)
+            provenance['kernelArguments'][arg].append(name)
+        for ext in spec.get('extensions') or []:
+            if ext not in extensions:
+                extensions.append(ext)
+            provenance['extensions'][ext].append(name)
+        for field in SPEC_SCALARS:
+            if field not in spec:
+                continue
+            same = field not in scalars or scalars[field] == spec[field]
+            if field not in scalars or (not same and on_collision == 'last'):
+                scalars[field] = spec[field]
+            record(f"spec.{field}", field, name, same)
+        for field in spec:
+            if field not in ('config', 'kernelArguments', 'extensions') + SPEC_SCALARS:
+                unsupported.append(f"{name}: spec.{field}")
+
+    by_key: dict[str, set[str]] = defaultdict(set)
+    for arg in kernel_arguments:
+        by_key[arg.split('=', 1)[0]].add(arg)
+    for key, args in sorted(by_key.items()):
+        if len(args) > 1:
+            warnings.append(f"kernel argument {key} is set to different values: "
+                            f"{', '.join(sorted(args))}")
+    if len(versions) > 1:
+        warnings.append("mixed Ignition versions: " + ", ".join(
+            f"{v} ({len(names)})" for v, names in sorted(versions.items())))
+
+    return {
+        'ignition_version': max(versions, key=_version_key) if versions else None,
+        'lists': dict(lists),
+        'kernel_arguments': kernel_arguments,
+        'extensions': extensions,
+        'scalars': scalars,
+        'provenance': {kind: dict(keys) for kind, keys in provenance.items()},
+        'collisions': collisions,
+        'warnings': warnings,
+        'unsupported': unsupported,
+    }
+
+
+def _config_for(lists: dict[tuple[str, str], list[Any]], version: str) -> dict[str, Any]:
+    config: dict[str, Any] = {'ignition': {'version': version}}
+    for (section, field), items in lists.items():
+        if items:
+            config.setdefault(section, {})[field] = items
+    return config
+
+
+def _entry_size(kind: tuple[str, str], item: dict[str, Any]) -> int:
+    """Bytes item adds to a dumped MachineConfig, measured at its real depth."""
+    section, field = kind
+    text = yaml.dump({'spec': {'config': {section: {field: [item]}}}},
+                     default_flow_style=False, sort_keys=False)
+    return len(text.split('\n', 4)[4])
+
+
+def build_documents(
+    merged: dict[str, Any],
+    name: str,
+    role: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> list[dict[str, Any]]:
+    """Build the consolidated MachineConfig(s) for a merge result.
+
+    Units, users, kernel arguments, extensions and spec scalars go into the
+    first document; storage entries are added in order until a document
+    would exceed max_bytes, then a new part (<name>-2, <name>-3, ...) starts.
+    """
+    version = merged['ignition_version'] or '3.5.0'
+    storage_kinds = [k for k in KEYED_LISTS if k[0] == 'storage']
+    other_lists = {k: list(v.values()) for k, v in merged['lists'].items()
+                   if k not in storage_kinds}
+    storage_items = [(k, item) for k in storage_kinds
+                     for _, item in sorted(merged['lists'].get(k, {}).items())]
+
+    def new_doc(part: int, lists: dict[tuple[str, str], list[Any]]) -> dict[str, Any]:
+        spec: dict[str, Any] = {}
+        spec['config'] = _config_for(lists, version)
+        if part == 1:
+            if merged['kernel_arguments']:
+                spec['kernelArguments'] = list(merged['kernel_arguments'])
+            if merged['extensions']:
+                spec['extensions'] = list(merged['extensions'])
+            spec.update(merged['scalars'])
+        return {
+            'apiVersion': 'machineconfiguration.openshift.io/v1',
+            'kind': 'MachineConfig',
+            'metadata': {
+                'name': name if part == 1 else f"{name}-{part}",
+                'labels': {ROLE_LABEL: role},
+            },
+            'spec': spec,
+        }
+
+    parts: list[dict[tuple[str, str], list[Any]]] = [dict(other_lists)]
+
+    def dumped_size(doc: dict[str, Any]) -> int:
+        return len(yaml.dump(doc, default_flow_style=False, sort_keys=False))
+
+    def header_size(lists: dict[tuple[str, str], list[Any]], kind: tuple[str, str]) -> int:
+        if kind in lists:
+            return 0
+        storage = "" if any(k in lists for k in storage_kinds) else "    storage:\n"
+        return len(f"{storage}      {kind[1]}:\n")
+
+    size = dumped_size(new_doc(1, parts[0]))
+    for kind, item in storage_items:
+        item_size = _entry_size(kind, item)
+        if (size + header_size(parts[-1], kind) + item_size > max_bytes
+                and any(k in parts[-1] for k in storage_kinds)):
+            parts.append({})
+            size = dumped_size(new_doc(len(parts), {}))
+        size += header_size(parts[-1], kind) + item_size
+        parts[-1].setdefault(kind, []).append(item)
+
+    return [new_doc(i, lists) for i, lists in enumerate(parts, start=1)]
+
+
+def output_name(prefix: str, role: str, severity: str | None) -> str:
+    return f"{prefix}-{severity}-{role}" if severity else f"{prefix}-{role}"
+
+
+def group_machineconfigs(
+    machineconfigs: list[dict[str, Any]],
+    merge_severities: bool = False,
+) -> dict[tuple[str, str | None], list[dict[str, Any]]]:
+    """Group MachineConfigs by (role, severity); severity is None when merged."""
+    groups: dict[tuple[str, str | None], list[dict[str, Any]]] = defaultdict(list)
+    for mc in machineconfigs:
+        groups[(mc['role'], None if merge_severities else mc['severity'])].append(mc)
+    return dict(groups)
+
+
+def format_collision(collision: dict[str, Any]) -> str:
+    line = f"{collision['kind']} {collision['key']}: {', '.join(collision['sources'])}"
+    if collision['winner']:
+        line += f" (using {collision['winner']})"
+    return line
+
+
+def write_outputs(
+    out_dir: str,
+    documents: dict[str, list[dict[str, Any]]],
+    provenance: dict[str, Any],
+) -> list[str]:
+    """Write one YAML per document and provenance.json; remove YAMLs written
+    by a previous run that this run no longer produces."""
+    os.makedirs(out_dir, exist_ok=True)
+    prov_path = os.path.join(out_dir, PROVENANCE_FILE)
+    previous: set[str] = set()
+    if os.path.exists(prov_path):
+        with open(prov_path) as f:
+            for entry in json.load(f).get('machineconfigs', {}).values():
+                previous.update(entry.get('parts', []))
+
+    written = []
+    for name, docs in sorted(documents.items()):
+        sources = provenance['machineconfigs'][name]['sources']
+        for doc in docs:
+            part = doc['metadata']['name']
+            outpath = os.path.join(out_dir, f"{part}.yaml")
+            with open(outpath, 'w') as out:
+                out.write(f"# Consolidated from {len(sources)} MachineConfigs for role "
+                          f"{doc['metadata']['labels'][ROLE_LABEL]}; "
+                          f"see {PROVENANCE_FILE} for sources.\n")
+                yaml.dump(doc, out, default_flow_style=False, sort_keys=False)
+            written.append(f"{part}.yaml")
+
+    for stale in sorted(previous - set(written)):
+        stale_path = os.path.join(out_dir, stale)
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+            print(f"Removed stale {stale_path}")
+
+    with open(prov_path, 'w') as f:
+        json.dump(provenance, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return written
+
+
+def consolidate(
+    machineconfigs: list[dict[str, Any]],
+    prefix: str = '75-compliance',
+    merge_severities: bool = False,
+    on_collision: str = 'error',
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> tuple[dict[str, list[dict[str, Any]]], dict[str, Any]]:
+    """Consolidate MachineConfigs; return (documents by output name, provenance).
+
+    Collisions are detected per role across all severities, since the MCO
+    merges every MachineConfig of a pool together. With on_collision='last',
+    an entry that loses to a source in another severity group is left out
+    of its own group, so the pool ends up with the same winner either way.
+    """
+    documents: dict[str, list[dict[str, Any]]] = {}
+    provenance: dict[str, Any] = {
+        'machineconfigs': {},
+        'collisions': [],
+        'warnings': [],
+        'unsupported': [],
+    }
+
+    pools = {}
+    by_role = group_machineconfigs(machineconfigs, merge_severities=True)
+    for (role, _), mcs in sorted(by_role.items()):
+        pool = pools[role] = merge_machineconfigs(mcs, on_collision)
+        for collision in pool['collisions']:
+            provenance['collisions'].append({'role': role, **collision})
+        provenance['warnings'].extend(f"{role}: {w}" for w in pool['warnings'])
+        provenance['unsupported'].extend(pool['unsupported'])
+
+    groups = group_machineconfigs(machineconfigs, merge_severities)
+    for (role, severity), mcs in sorted(groups.items(), key=lambda g: (g[0][0], g[0][1] or '')):
+        merged = merge_machineconfigs(mcs, on_collision)
+        pool = pools[role]
+        dropped = []
+        for (section, field), entries in merged['lists'].items():
+            for key in list(entries):
+                if not _same_entry(entries[key], pool['lists'][(section, field)][key]):
+                    del entries[key]
+                    dropped.append((f"{section}.{field}", key))
+        for field in list(merged['scalars']):
+            if merged['scalars'][field] != pool['scalars'][field]:
+                del merged['scalars'][field]
+                dropped.append((f"spec.{field}", field))
+        for kind, key in dropped:
+            del merged['provenance'][kind][key]
+            if not merged['provenance'][kind]:
+                del merged['provenance'][kind]
+        name = output_name(prefix, role, severity)
+        docs = build_documents(merged, name, role, max_bytes)
+        documents[name] = docs
+        provenance['machineconfigs'][name] = {
+            'role': role,
+            'severity': severity,
+            'parts': [f"{doc['metadata']['name']}.yaml" for doc in docs],
+            'sources': [
+                {'name': mc['name'], 'source_file': mc['source_file']}
+                for mc in sorted(mcs, key=lambda m: m['name'])
+            ],
+            'entries': merged['provenance'],
+        }
+    return documents, provenance
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Consolidate MachineConfigs into one per role/severity to "
+                    "minimise MCO rendered configs and reboots",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # One MachineConfig per role and severity
+  %(prog)s --src-dir complianceremediations --out-dir complianceremediations/consolidated
+
+  # One MachineConfig per role for high and medium, later sources winning collisions
+  %(prog)s -s high,medium --merge-severities --on-collision last
+
+  # Show what would be consolidated without writing anything
+  %(prog)s --dry-run
+"""
+    )
+    parser.add_argument(
+        '--src-dir', default='complianceremediations',
+        help='Source directory containing MachineConfig YAMLs'
+    )
+    parser.add_argument(
+        '--out-dir', default='complianceremediations/consolidated',
+        help='Directory to write consolidated YAMLs and provenance.json'
+    )
+    parser.add_argument(
+        '-s', '--severity', default=None,
+        help='Comma-separated severities to include: high,medium,low'
+    )
+    parser.add_argument(
+        '--merge-severities', action='store_true',
+        help='Write one MachineConfig per role instead of one per role and severity'
+    )
+    parser.add_argument(
+        '--prefix', default='75-compliance',
+        help='Name prefix for consolidated MachineConfigs (sets their MCO merge order)'
+    )
+    parser.add_argument(
+        '--on-collision', choices=['error', 'last'], default='error',
+        help="What to do when sources write different content to the same path or unit: "
+             "'error' (default) writes nothing, 'last' keeps the lexically later source like the MCO"
+    )
+    parser.add_argument(
+        '--max-bytes', type=int, default=DEFAULT_MAX_BYTES,
+        help=f'Split a consolidated MachineConfig into parts above this size (default: {DEFAULT_MAX_BYTES})'
+    )
+    parser.add_argument(
+        '--exclude-dir', action='append', default=[],
+        help='Directory name to skip under --src-dir (repeatable; combo/, consolidated/ and modular/ are always skipped)'
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help='Report what would be consolidated without writing files'
+    )
+    args = parser.parse_args()
+
+    severity_filter = parse_severity_filter(args.severity)
+    exclude_dirs = DERIVED_MC_DIRS | set(args.exclude_dir) | {
+        os.path.basename(os.path.normpath(args.out_dir))}
+    machineconfigs, skipped = load_machineconfigs(args.src_dir, exclude_dirs)
+    if severity_filter is not None:
+        machineconfigs = [mc for mc in machineconfigs if mc['severity'] in severity_filter]
+    if not machineconfigs:
+        print(f"No MachineConfigs found in {args.src_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    documents, provenance = consolidate(
+        machineconfigs, args.prefix, args.merge_severities, args.on_collision, args.max_bytes)
+
+    for name, entry in provenance['machineconfigs'].items():
+        counts = {kind: len(keys) for kind, keys in entry['entries'].items()}
+        detail = ", ".join(f"{n} {kind}" for kind, n in sorted(counts.items()))
+        parts = f" in {len(entry['parts'])} parts" if len(entry['parts']) > 1 else ""
+        print(f"{name}: {len(entry['sources'])} MachineConfigs{parts} ({detail})")
+    for warning in provenance['warnings']:
+        print(f"WARNING: {warning}", file=sys.stderr)
+    for collision in provenance['collisions']:
+        print(f"COLLISION [{collision['role']}] {format_collision(collision)}", file=sys.stderr)
+    for item in provenance['unsupported']:
+        print(f"UNSUPPORTED {item}", file=sys.stderr)
+
+    roles = sorted({entry['role'] for entry in provenance['machineconfigs'].values()})
+    print(f"\n{len(machineconfigs)} MachineConfigs -> {len(documents)} consolidated "
+          f"for pool(s): {', '.join(roles)}")
+
+    if provenance['unsupported'] or (provenance['collisions'] and args.on_collision == 'error'):
+        print(f"\n{len(provenance['collisions'])} collision(s), "
+              f"{len(provenance['unsupported'])} unsupported field(s); nothing written. "
+              "Resolve them, or use --on-collision last to keep the lexically later source.",
+              file=sys.stderr)
+        sys.exit(1)
+
+    if args.dry_run:
+        print("[DRY-RUN] No files written")
+    else:
+        written = write_outputs(args.out_dir, documents, provenance)
+        print(f"Wrote {len(written)} MachineConfig(s) and {PROVENANCE_FILE} to {args.out_dir}/")
+
+    if skipped:
+        print(f"\nWARNING: {len(skipped)} file(s) skipped due to YAML parse errors:",
+              file=sys.stderr)
+        for fpath, err in skipped:
+            print(f"  - {fpath}: {err}", file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Extract remediation summaries from check descriptions, offline.
+
+Most ComplianceAsCode descriptions embed the exact fix in one of a few
+fixed shapes: a sysctl key=value, an audit rule, an sshd_config (or other
+config file) directive, a chmod/chown/chgrp command, a kernel argument,
+or a modprobe blacklist line. This parses those out of the description
+text and emits the imperative summary directly, with no API calls.
+
+Checks whose description matches none of the shapes are reported (and
+optionally written to --unhandled) so only that long tail needs
+summarize-remediations.py and the API.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from collections import Counter
+from typing import Any, Callable
+
+MAX_SUMMARY_LEN = 100
+
+SYSCTL_RE = re.compile(r"sysctl -w ([\w.\-/]+)=\s*(\S+)")
+AUDIT_RULE_RE = re.compile(r"^\s*(-[aw]\s+\S.*?)\s*$", re.MULTILINE)
+# Fields that only repeat the rule per architecture or exclude unset auids.
+AUDIT_NOISE_RE = re.compile(r"\s+-F\s+(?:arch=\s*\w+|auid!=(?:unset|4294967295))(?=\s|$)")
+# Rules after this are illustrations ("See an example of multiple combined
+# syscalls"), not part of the fix.
+AUDIT_EXAMPLE_RE = re.compile(r"\bexample\b", re.IGNORECASE)
+KERNEL_ARG_ADD_RE = re.compile(r"add the argument (\S+) to all BLS")
+KERNEL_ARG_REMOVE_RE = re.compile(r"[Rr]emove any instances of (\S+) from the kernel arguments")
+KERNEL_MODULE_RE = re.compile(r"^install (\S+) /bin/(?:false|true)\s*$", re.MULTILINE)
+FILE_COMMANDS = (
+    (re.compile(r"\$ sudo chmod (\S+) (/\S+)"), "Set permissions {0} on {1}"),
+    (re.compile(r"\$ sudo chown (\S+) (/\S+)"), "Set owner {0} on {1}"),
+    (re.compile(r"\$ sudo chgrp (\S+) (/\S+)"), "Set group owner {0} on {1}"),
+)
+CONFIG_LINE_RES = (
+    re.compile(r"add or correct the following line in (/[^\s:]+)[^:\n]*:\s*\n(.*)",
+               re.IGNORECASE | re.DOTALL),
+    re.compile(r"In the file (/[^\s,]+)\s*,\s*add or correct the following line[^:\n]*:\s*\n(.*)",
+               re.IGNORECASE | re.DOTALL),
+)
+
+
+def _truncate(summary: str) -> str:
+    if len(summary) > MAX_SUMMARY_LEN:
+        return summary[:MAX_SUMMARY_LEN - 3] + "..."
+    return summary
+
+
+def _normalize_setting(line: str) -> str:
+    """Collapse whitespace and drop spaces around '=' ("SELINUX= enforcing")."""
+    return re.sub(r"\s*=\s*", "=", " ".join(line.split()))
+
+
+def extract_sysctl(description: str) -> str | None:
+    match = SYSCTL_RE.search(description)
+    if not match:
+        return None
+    return f"Set {match.group(1)}={match.group(2)} via sysctl"
+
+
+def extract_audit_rule(description: str) -> str | None:
+    rules: list[str] = []
+    example = AUDIT_EXAMPLE_RE.search(description)
+    if example:
+        description = description[:example.start()]
+    for match in AUDIT_RULE_RE.finditer(description):
+        rule = " ".join(AUDIT_NOISE_RE.sub("", match.group(1)).split())
+        if rule not in rules:
+            rules.append(rule)
+    if not rules:
+        return None
+    more = f" (+{len(rules) - 1} more)" if len(rules) > 1 else ""
+    return f"Add audit rule: {rules[0]}{more}"
+
+
+def extract_kernel_argument(description: str) -> str | None:
+    match = KERNEL_ARG_ADD_RE.search(description)
+    if match:
+        return f"Add kernel argument {match.group(1)}"
+    match = KERNEL_ARG_REMOVE_RE.search(description)
+    if match:
+        return f"Remove kernel argument {match.group(1)}"
+    return None
+
+
+def extract_kernel_module(description: str) -> str | None:
+    match = KERNEL_MODULE_RE.search(description)
+    if not match:
+        return None
+    return f"Disable kernel module {match.group(1)} in /etc/modprobe.d"
+
+
+def extract_file_permission(description: str) -> str | None:
+    for pattern, template in FILE_COMMANDS:
+        match = pattern.search(description)
+        if match:
+            return template.format(match.group(1), match.group(2))
+    return None
+
+
+def extract_config_line(description: str) -> str | None:
+    """The first setting after "add or correct the following line in FILE"."""
+    for pattern in CONFIG_LINE_RES:
+        match = pattern.search(description)
+        if not match:
+            continue
+        path, rest = match.group(1), match.group(2)
+        for line in rest.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                target = "sshd_config" if "sshd_config" in path else path
+                setting = _normalize_setting(line)
+                if " " not in setting and "=" not in setting:
+                    return f"Add {setting} to {target}"
+                return f"Set {setting} in {target}"
+    return None
+
+
+# Tried in order; the first extractor that returns a summary wins. Order
+# matters where shapes overlap: sysctl and audit descriptions also say
+# "add the following line to a file", so they come before config lines.
+EXTRACTORS: list[tuple[str, Callable[[str], str | None]]] = [
+    ("sysctl", extract_sysctl),
+    ("audit-rule", extract_audit_rule),
+    ("kernel-argument", extract_kernel_argument),
+    ("kernel-module", extract_kernel_module),
+    ("file-permission", extract_file_permission),
+    ("config-line", extract_config_line),
+]
+
+
+def extract_summary(description: str) -> tuple[str, str] | None:
+    """Return (shape, summary) for a recognised description, else None."""
+    if not description:
+        return None
+    for shape, extractor in EXTRACTORS:
+        summary = extractor(description)
+        if summary:
+            return shape, _truncate(summary)
+    return None
+
+
+def process_checks(
+    checks: list[dict[str, Any]], shapes: Counter[str], unhandled: list[str],
+    overwrite: bool = False,
+) -> int:
+    """Add extracted summaries to checks, return count of summaries added.
+
+    Counts each recognised shape in shapes and appends the names of checks
+    that still need a summary to unhandled.
+    """
+    count = 0
+    for check in checks:
+        name = check.get("name", "")
+        if check.get("summary") and not overwrite:
+            continue
+        result = extract_summary(check.get("description", ""))
+        if result is None:
+            unhandled.append(name)
+            continue
+        shape, summary = result
+        shapes[shape] += 1
+        check["summary"] = summary
+        count += 1
+        print(f"  {name}: {summary}")
+    return count
+
+
+def iter_check_lists(data: dict[str, Any]) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Every (label, check list) in a scan export, in report order."""
+    lists = []
+    for section, prefix in (("remediations", ""), ("passing_checks", "PASSING ")):
+        for severity in ("high", "medium", "low"):
+            checks = data.get(section, {}).get(severity)
+            if checks:
+                lists.append((f"{prefix}{severity.upper()}", checks))
+    if data.get("manual_checks"):
+        lists.append(("MANUAL", data["manual_checks"]))
+    return lists
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Extract summaries from compliance check descriptions without API calls"
+    )
+    parser.add_argument(
+        "json_file",
+        help="Path to the compliance JSON file to enrich with summaries"
+    )
+    parser.add_argument(
+        "--unhandled",
+        metavar="FILE",
+        help="Write the names of checks no extractor recognised, one per line"
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace existing summaries when an extractor recognises the description"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be extracted without writing json_file"
+    )
+    args = parser.parse_args()
+
+    json_file = args.json_file
+    if not os.path.exists(json_file):
+        print(f"Error: File not found: {json_file}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Loading {json_file}...")
+    with open(json_file, 'r') as f:
+        data = json.load(f)
+
+    total = 0
+    shapes: Counter[str] = Counter()
+    unhandled: list[str] = []
+    for label, checks in iter_check_lists(data):
+        print(f"\nProcessing {label} checks...")
+        total += process_checks(checks, shapes, unhandled, args.overwrite)
+
+    print(f"\nExtracted {total} summaries: "
+          + ", ".join(f"{shape} {n}" for shape, n in shapes.most_common()))
+    print(f"{len(unhandled)} checks need summarize-remediations.py")
+    if args.unhandled:
+        with open(args.unhandled, "w") as f:
+            f.writelines(f"{name}\n" for name in unhandled)
+        print(f"Wrote unhandled check names to {args.unhandled}")
+
+    if args.dry_run:
+        return
+    print(f"\nWriting {json_file}...")
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        suffix='.json', dir=os.path.dirname(os.path.abspath(json_file))
+    )
+    try:
+        with os.fdopen(tmp_fd, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, json_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,20 @@
 Filter specific configuration flags from a combined MachineConfig YAML.
 
 This script allows you to create focused MachineConfig files by selecting
-only specific flags/directives from a combined configuration file.
+only specific flags/directives from a combined configuration file. Input
+contents may be plain data: URLs or gzip-compressed (compression: gzip);
+--compress writes the output the same way.
 """
 from __future__ import annotations
 
 import os
 import sys
-import urllib.parse
 import argparse
 
+# Add project root to path for shared module imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lib.compliance_utils import decode_file_contents, encode_file_contents  # noqa: E402
+
 # Check for required dependencies
 try:
     import yaml
@@ -21,15 +26,6 @@ except ImportError:
     sys.exit(1)
 
 
-def parse_config_content(encoded_source: str) -> list[str]:
-    """Parse the data:, encoded source and return list of config lines."""
-    if not encoded_source.startswith('data:,'):
-        raise ValueError("Source must start with 'data:,'")
-
-    decoded = urllib.parse.unquote(encoded_source[6:])
-    return [line.strip() for line in decoded.splitlines() if line.strip()]
-
-
 def filter_config_lines(lines: list[str], flags: set[str], case_sensitive: bool = False) -> list[str]:
     """
     Filter configuration lines to only include those matching the specified flags.
@@ -73,6 +69,8 @@ def create_filtered_machineconfig(
     flags: list[str],
     description: str | None = None,
     case_sensitive: bool = False,
+    compress: bool = False,
+    comment_lines: bool | None = None,
 ) -> None:
     """
     Create a filtered MachineConfig YAML with only specified flags.
@@ -83,7 +81,12 @@ def create_filtered_machineconfig(
         flags: List of flag names to include
         description: Optional description for the header comment
         case_sensitive: Whether to use case-sensitive flag matching
+        compress: Gzip and base64-encode the output contents
+        comment_lines: Echo the filtered lines as comments; defaults to
+            on for plain output and off for compressed output
     """
+    if comment_lines is None:
+        comment_lines = not compress
     # Read the input YAML
     with open(input_file, 'r') as f:
         doc = yaml.safe_load(f)
@@ -101,15 +104,15 @@ def create_filtered_machineconfig(
     filtered_files = []
     for file_entry in files:
         path = file_entry.get('path')
-        source = file_entry.get('contents', {}).get('source')
+        decoded = decode_file_contents(file_entry.get('contents') or {})
         mode = file_entry.get('mode', 384)
         overwrite = file_entry.get('overwrite', True)
 
-        if not source or not source.startswith('data:,'):
+        if decoded is None:
             continue
 
         # Parse and filter the configuration lines
-        all_lines = parse_config_content(source)
+        all_lines = [line.strip() for line in decoded.splitlines() if line.strip()]
         filtered_lines = filter_config_lines(all_lines, set(flags), case_sensitive)
 
         if filtered_lines:
@@ -144,17 +147,16 @@ def create_filtered_machineconfig(
 
         for file_info in filtered_files:
             out.write("        - contents:\n")
-            out.write("            # Filtered configuration flags:\n")
-            for line in file_info['lines']:
-                out.write(f"            # {line}\n")
+            if comment_lines:
+                out.write("            # Filtered configuration flags:\n")
+                for line in file_info['lines']:
+                    out.write(f"            # {line}\n")
 
             # Encode the content
-            content = "\n".join(file_info['lines']) + "\n"
-            encoded = urllib.parse.quote(content, safe='')
-
-            out.write("            source: data:,")
-            out.write(encoded)
-            out.write("\n")
+            contents = encode_file_contents("\n".join(file_info['lines']) + "\n", compress)
+            if 'compression' in contents:
+                out.write(f"            compression: {contents['compression']}\n")
+            out.write(f"            source: {contents['source']}\n")
             out.write(f"          mode: {file_info['mode']}\n")
             out.write(f"          overwrite: {str(file_info['overwrite']).lower()}\n")
             out.write(f"          path: {file_info['path']}\n")
@@ -184,6 +186,9 @@ Examples:
 
   # Use a flags file
   %(prog)s -i input.yaml -o output.yaml --flags-file my_flags.txt
+
+  # Write gzip-compressed contents without the plaintext comment copy
+  %(prog)s -i input.yaml -o output.yaml -f PermitRootLogin --compress
 """
     )
 
@@ -221,6 +226,19 @@ Examples:
         help='Use case-sensitive flag matching (default: case-insensitive)'
     )
 
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Emit gzip-compressed, base64-encoded contents (compression: gzip) '
+             'and drop the plaintext comment copy of each line'
+    )
+
+    parser.add_argument(
+        '--comment-lines',
+        action='store_true',
+        help='With --compress, still write the filtered lines as comments'
+    )
+
     args = parser.parse_args()
 
     # Collect flags from arguments and/or file
@@ -242,7 +260,9 @@ Examples:
         args.output,
         flags,
         args.description,
-        args.case_sensitive
+        args.case_sensitive,
+        args.compress,
+        True if args.comment_lines else None,
     )
 
 
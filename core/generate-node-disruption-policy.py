@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Generate a NodeDisruptionPolicy for compliance MachineConfigs and predict reboots.
+
+By default every MachineConfig change drains and reboots each node in the
+pool. Most hardening remediations only rewrite files that a service re-reads
+on reload or restart (sshd_config, sysctl.d, chrony.conf, auditd.conf) or
+that are read on every use (PAM, login.defs, modprobe.d). This looks at the
+file paths and systemd units in the MachineConfigs under --src-dir, picks
+the matching actions from FILE_POLICIES and UNIT_POLICIES, and writes the
+cluster MachineConfiguration with a spec.nodeDisruptionPolicy for them:
+
+    apiVersion: operator.openshift.io/v1
+    kind: MachineConfiguration
+    metadata:
+      name: cluster
+    spec:
+      nodeDisruptionPolicy:
+        files:
+        - path: /etc/ssh/sshd_config
+          actions:
+          - type: Reload
+            reload:
+              serviceName: sshd.service
+
+Apply it (OCP 4.17+) before the MachineConfigs. The MCO uses the closest
+listed parent directory for files without their own entry, so directory
+entries such as /etc/sysctl.d cover every file under them.
+
+It also prints which MachineConfigs will still reboot and why: kernel
+arguments, extensions, kernel type, FIPS, OS image, and any file or unit
+without a policy all need one. A rollout reboots if any MachineConfig in it
+does, so a consolidated MachineConfig (consolidate-machineconfigs.py)
+reboots if any of its sources would.
+
+Audit rules are not covered by default: auditd.service refuses a manual
+restart and its reload does not re-read rules.d. On RHCOS releases that
+ship audit-rules.service, pass --audit-rules-service audit-rules.service.
+
+Usage:
+    python3 core/generate-node-disruption-policy.py --src-dir complianceremediations \\
+        [-o node-disruption-policy.yaml] [--report report.json] \\
+        [--severity high,medium] [--audit-rules-service audit-rules.service] \\
+        [--exclude-path /etc/chrony.conf] [--all]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import copy
+import json
+import argparse
+from collections import defaultdict
+from typing import Any
+
+# Add project root to path for shared module imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lib.compliance_utils import DERIVED_MC_DIRS, load_machineconfigs, parse_severity_filter  # noqa: E402
+
+# Check for required dependencies
+try:
+    import yaml
+except ImportError:
+    print("ERROR: PyYAML not installed.", file=sys.stderr)
+    print("Install with: pip install pyyaml", file=sys.stderr)
+    sys.exit(1)
+
+# The MachineConfiguration API accepts at most this many files and units.
+MAX_POLICY_ENTRIES = 50
+
+
+def reload(service: str) -> dict[str, Any]:
+    return {'type': 'Reload', 'reload': {'serviceName': service}}
+
+
+def restart(service: str) -> dict[str, Any]:
+    return {'type': 'Restart', 'restart': {'serviceName': service}}
+
+
+NONE = {'type': 'None'}
+DAEMON_RELOAD = {'type': 'DaemonReload'}
+
+# Path -> actions for files the remediations write. A directory entry
+# applies to every file under it that has no closer entry.
+FILE_POLICIES: dict[str, list[dict[str, Any]]] = {
+    '/etc/ssh/sshd_config': [reload('sshd.service')],
+    '/etc/ssh/sshd_config.d': [reload('sshd.service')],
+    '/etc/sysctl.conf': [restart('systemd-sysctl.service')],
+    '/etc/sysctl.d': [restart('systemd-sysctl.service')],
+    '/etc/chrony.conf': [restart('chronyd.service')],
+    # SIGHUP re-reads auditd.conf (rules are loaded separately).
+    '/etc/audit/auditd.conf': [reload('auditd.service')],
+    '/etc/systemd/journald.conf': [restart('systemd-journald.service')],
+    '/etc/systemd/journald.conf.d': [restart('systemd-journald.service')],
+    # Read on every use: PAM stacks and their module configs, login
+    # defaults, sudo, banners, module blacklists (future loads only),
+    # login shell profiles, logrotate and coredump settings.
+    '/etc/pam.d': [NONE],
+    '/etc/security': [NONE],
+    '/etc/login.defs': [NONE],
+    '/etc/sudoers.d': [NONE],
+    '/etc/issue': [NONE],
+    '/etc/issue.net': [NONE],
+    '/etc/motd': [NONE],
+    '/etc/modprobe.d': [NONE],
+    '/etc/profile.d': [NONE],
+    '/etc/logrotate.conf': [NONE],
+    '/etc/logrotate.d': [NONE],
+    '/etc/systemd/coredump.conf': [NONE],
+    '/etc/systemd/coredump.conf.d': [NONE],
+}
+AUDIT_RULES_DIR = '/etc/audit/rules.d'
+
+# Unit name -> actions when a MachineConfig changes the unit itself.
+UNIT_POLICIES: dict[str, list[dict[str, Any]]] = {
+    'sshd.service': [DAEMON_RELOAD, restart('sshd.service')],
+    'chronyd.service': [DAEMON_RELOAD, restart('chronyd.service')],
+}
+
+# Cluster defaults the MCO applies without a user policy.
+MCO_DEFAULT_FILES: dict[str, list[dict[str, Any]]] = {
+    '/etc/mco/internal-registry-pull-secret.json': [NONE],
+    '/var/lib/kubelet/config.json': [NONE],
+    '/etc/containers/policy.json': [reload('crio.service')],
+    '/etc/containers/registries.conf': [{'type': 'Special'}],
+}
+
+# Spec fields that always need a reboot when they change.
+REBOOT_SPEC_FIELDS = ('kernelArguments', 'extensions', 'kernelType', 'fips', 'osImageURL')
+
+
+def file_catalog(
+    audit_rules_service: str | None = None,
+    exclude_paths: list[str] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """FILE_POLICIES, plus audit rules if a service reloads them, minus exclusions."""
+    catalog = dict(FILE_POLICIES)
+    if audit_rules_service:
+        catalog[AUDIT_RULES_DIR] = [restart(audit_rules_service)]
+    for path in exclude_paths or []:
+        catalog.pop(path.rstrip('/'), None)
+    return catalog
+
+
+def closest_policy(path: str, catalog: dict[str, Any]) -> str | None:
+    """The catalog entry for path itself, else for its closest parent directory."""
+    candidate = path.rstrip('/')
+    while candidate:
+        if candidate in catalog:
+            return candidate
+        candidate = candidate.rpartition('/')[0]
+    return None
+
+
+def analyze_machineconfig(
+    mc: dict[str, Any],
+    catalog: dict[str, list[dict[str, Any]]],
+    unit_catalog: dict[str, list[dict[str, Any]]] | None = None,
+) -> dict[str, Any]:
+    """Predict the disruption of applying one MachineConfig.
+
+    Returns a dict with keys name, role, reboot (bool), reasons (why it
+    reboots), actions (the non-reboot actions it triggers, in order, without
+    duplicates) and matched ({policy path or unit: 'file' | 'unit'}).
+    """
+    if unit_catalog is None:
+        unit_catalog = UNIT_POLICIES
+    spec = mc['doc'].get('spec') or {}
+    config = spec.get('config') or {}
+    reasons: list[str] = []
+    actions: list[dict[str, Any]] = []
+    matched: dict[str, str] = {}
+
+    def add_actions(new: list[dict[str, Any]]) -> None:
+        for action in new:
+            if action != NONE and action not in actions:
+                actions.append(action)
+
+    for field in REBOOT_SPEC_FIELDS:
+        value = spec.get(field)
+        if value:
+            shown = ', '.join(value) if isinstance(value, list) else value
+            reasons.append(f"{field}: {shown}")
+
+    for entry in (config.get('storage') or {}).get('files') or []:
+        path = entry.get('path', '')
+        policy = closest_policy(path, catalog)
+        if policy is not None:
+            matched[policy] = 'file'
+            add_actions(catalog[policy])
+        elif path in MCO_DEFAULT_FILES:
+            add_actions(MCO_DEFAULT_FILES[path])
+        else:
+            reasons.append(f"file {path} has no policy")
+    for field in ('directories', 'links'):
+        for entry in (config.get('storage') or {}).get(field) or []:
+            reasons.append(f"{field[:-1]} {entry.get('path')}")
+
+    for unit in (config.get('systemd') or {}).get('units') or []:
+        name = unit.get('name', '')
+        if name in unit_catalog:
+            matched[name] = 'unit'
+            add_actions(unit_catalog[name])
+        else:
+            reasons.append(f"unit {name} has no policy")
+
+    for user in (config.get('passwd') or {}).get('users') or []:
+        # SSH key changes for the core user are rebootless by default.
+        if set(user) - {'name', 'sshAuthorizedKeys'} or user.get('name') != 'core':
+            reasons.append(f"user {user.get('name')}")
+
+    return {
+        'name': mc['name'],
+        'role': mc['role'],
+        'source_file': mc['source_file'],
+        'reboot': bool(reasons),
+        'reasons': reasons,
+        'actions': actions,
+        'matched': matched,
+    }
+
+
+def build_policy(
+    analyses: list[dict[str, Any]],
+    catalog: dict[str, list[dict[str, Any]]],
+    unit_catalog: dict[str, list[dict[str, Any]]] | None = None,
+    include_all: bool = False,
+) -> dict[str, Any]:
+    """The MachineConfiguration for every policy the analyses matched (or all)."""
+    if unit_catalog is None:
+        unit_catalog = UNIT_POLICIES
+    files = set(catalog) if include_all else set()
+    units = set(unit_catalog) if include_all else set()
+    for analysis in analyses:
+        for key, kind in analysis['matched'].items():
+            (files if kind == 'file' else units).add(key)
+    if len(files) > MAX_POLICY_ENTRIES or len(units) > MAX_POLICY_ENTRIES:
+        raise ValueError(f"NodeDisruptionPolicy allows at most {MAX_POLICY_ENTRIES} files "
+                         f"and units; got {len(files)} files and {len(units)} units")
+
+    # Copies, so the YAML has no anchors for actions shared between entries.
+    policy: dict[str, Any] = {}
+    if files:
+        policy['files'] = [{'path': path, 'actions': copy.deepcopy(catalog[path])}
+                           for path in sorted(files)]
+    if units:
+        policy['units'] = [{'name': name, 'actions': copy.deepcopy(unit_catalog[name])}
+                           for name in sorted(units)]
+    return {
+        'apiVersion': 'operator.openshift.io/v1',
+        'kind': 'MachineConfiguration',
+        'metadata': {'name': 'cluster'},
+        'spec': {'nodeDisruptionPolicy': policy},
+    }
+
+
+def describe_actions(actions: list[dict[str, Any]]) -> str:
+    if not actions:
+        return "none"
+    parts = []
+    for action in actions:
+        kind = action['type']
+        target = (action.get(kind.lower()) or {}).get('serviceName')
+        parts.append(f"{kind} {target}" if target else kind)
+    return ", ".join(parts)
+
+
+def format_report(analyses: list[dict[str, Any]]) -> str:
+    """Per-MachineConfig prediction, reboots first, then a per-pool summary."""
+    lines = []
+    width = max([len(a['name']) for a in analyses] + [len("MACHINECONFIG")])
+    lines.append(f"{'RESULT':<9} {'MACHINECONFIG':<{width}}  DETAIL")
+    for a in sorted(analyses, key=lambda a: (not a['reboot'], a['role'], a['name'])):
+        if a['reboot']:
+            lines.append(f"{'REBOOT':<9} {a['name']:<{width}}  {'; '.join(a['reasons'])}")
+        else:
+            lines.append(f"{'NO-REBOOT':<9} {a['name']:<{width}}  {describe_actions(a['actions'])}")
+
+    by_role: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for a in analyses:
+        by_role[a['role']].append(a)
+    lines.append("")
+    for role, items in sorted(by_role.items()):
+        rebooting = [a for a in items if a['reboot']]
+        if rebooting:
+            lines.append(f"Pool {role}: {len(rebooting)} of {len(items)} MachineConfigs still "
+                         "reboot; applying them together costs one reboot per node.")
+        else:
+            lines.append(f"Pool {role}: all {len(items)} MachineConfigs apply without a reboot.")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate a NodeDisruptionPolicy for compliance MachineConfigs "
+                    "and predict which still reboot",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Policy for everything collected, then apply it before the MachineConfigs
+  %(prog)s --src-dir complianceremediations -o node-disruption-policy.yaml
+  oc apply -f node-disruption-policy.yaml
+
+  # Predict reboots for consolidated MachineConfigs, with a JSON report
+  %(prog)s --src-dir complianceremediations/consolidated --report disruption.json -o /dev/null
+
+  # Also reload audit rules without a reboot (RHCOS with audit-rules.service)
+  %(prog)s --audit-rules-service audit-rules.service -o node-disruption-policy.yaml
+"""
+    )
+    parser.add_argument(
+        '--src-dir', default='complianceremediations',
+        help='Directory containing MachineConfig YAMLs (searched recursively; '
+             'combo/, consolidated/ and modular/ are skipped)'
+    )
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help='Write the MachineConfiguration YAML here (default: stdout)'
+    )
+    parser.add_argument(
+        '--report',
+        help='Also write the per-MachineConfig prediction as JSON to this file'
+    )
+    parser.add_argument(
+        '-s', '--severity', default=None,
+        help='Comma-separated severities to include: high,medium,low'
+    )
+    parser.add_argument(
+        '--audit-rules-service', metavar='UNIT',
+        help=f'Restart UNIT to load {AUDIT_RULES_DIR} changes instead of rebooting'
+    )
+    parser.add_argument(
+        '--exclude-path', action='append', default=[],
+        help='Drop the built-in policy for this path so changes to it reboot (repeatable)'
+    )
+    parser.add_argument(
+        '--all', action='store_true',
+        help='Include every built-in policy, not only those the MachineConfigs match'
+    )
+    args = parser.parse_args()
+
+    severity_filter = parse_severity_filter(args.severity)
+    machineconfigs, skipped = load_machineconfigs(args.src_dir, exclude_dirs=DERIVED_MC_DIRS)
+    if severity_filter is not None:
+        machineconfigs = [mc for mc in machineconfigs if mc['severity'] in severity_filter]
+    if not machineconfigs:
+        print(f"No MachineConfigs found in {args.src_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    catalog = file_catalog(args.audit_rules_service, args.exclude_path)
+    analyses = [analyze_machineconfig(mc, catalog) for mc in machineconfigs]
+    try:
+        policy = build_policy(analyses, catalog, include_all=args.all)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    text = ("# NodeDisruptionPolicy for compliance remediations; apply before the "
+            "MachineConfigs.\n" + yaml.dump(policy, default_flow_style=False, sort_keys=False))
+    if args.output == '-':
+        sys.stdout.write(text)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(text)
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+    print(format_report(analyses), file=sys.stderr)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'machineconfigs': analyses}, f, indent=2)
+            f.write('\n')
+        print(f"Wrote {args.report}", file=sys.stderr)
+
+    if skipped:
+        print(f"\nWARNING: {len(skipped)} file(s) skipped due to YAML parse errors:",
+              file=sys.stderr)
+        for fpath, err in skipped:
+            print(f"  - {fpath}: {err}", file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,10 @@
 # WARNING: The -x flag applies MachineConfigs directly to the connected cluster.
 # MachineConfig changes trigger rolling node reboots. Use --dry-run first to
 # preview what would be created, and review all YAML before applying.
+# MachineConfigs are applied in one batch per MachineConfigPool (the pool is
+# paused while its batch is applied) and all affected pools are then waited
+# on concurrently, so each pool goes through a single reboot cycle.
+# MCP_WAIT_TIMEOUT (default 45m) bounds the wait for each pool.
 #
 # Usage: ./core/organize-machine-configs.sh [OPTIONS]
 #
@@ -52,12 +56,13 @@ usage() {
 	echo "  -x  Execute automated apply + health/performance tests for created files"
 	echo "  -h  Show this help message"
 	echo ""
-	echo "Environment variables: REMEDIATION_DIR, MACHINECONFIG_DIR, EXTRAMANIFESTS_DIR"
+	echo "Environment variables: REMEDIATION_DIR, MACHINECONFIG_DIR, EXTRAMANIFESTS_DIR, MCP_WAIT_TIMEOUT"
 	exit 1
 }
 
 SEVERITY_FILTER=""
 EXECUTE_TESTS=0
+MCP_WAIT_TIMEOUT="${MCP_WAIT_TIMEOUT:-45m}"
 DRY_RUN="${DRY_RUN:-false}"
 
 # Counters for summary
@@ -130,51 +135,162 @@ get_role_label() {
 	echo "$role"
 }
 
-# Apply a single file and wait for reconciliation where possible
-apply_and_wait() {
-	path="$1"
-	kind=$(yq e '.kind' "$path" 2>/dev/null || echo "")
-	log "Dry-run apply: $path"
-	oc apply --dry-run=server -f "$path"
-	log "Applying: $path"
-	oc apply -f "$path"
-	if [[ "$kind" == "MachineConfig" ]]; then
-		role=$(get_role_label "$path")
-		log "Waiting for MCP/$role to become Updated=True"
-		oc wait mcp/"$role" --for=condition=Updated=True --timeout=45m
-		oc get mcp "$role" -o wide || true
-	elif [[ "$kind" == "APIServer" ]]; then
-		log "Waiting for kube-apiserver operator Available=True"
+# Group files into rollout batches, printing "<batch><TAB><path>" lines.
+# Non-MachineConfig manifests form the "manifests" batch, applied first;
+# MachineConfigs form one "mcp/<role>" batch per target pool. File order is
+# preserved within each batch.
+plan_rollout() {
+	local paths="$1"
+	local path kind
+	while IFS= read -r path; do
+		[[ -z "$path" ]] && continue
+		kind=$(yq e '.kind' "$path" 2>/dev/null || echo "")
+		if [[ "$kind" == "MachineConfig" ]]; then
+			printf 'mcp/%s\t%s\n' "$(get_role_label "$path")" "$path"
+		else
+			printf 'manifests\t%s\n' "$path"
+		fi
+	done <<<"$paths" | sort -s -t $'\t' -k1,1
+}
+
+# Apply the non-MachineConfig manifests together and wait for the
+# operators they touch.
+apply_manifest_batch() {
+	local -a files=("$@")
+	local -a args=()
+	local path wait_apiserver=0
+	for path in "${files[@]}"; do
+		args+=(-f "$path")
+		if [[ "$(yq e '.kind' "$path" 2>/dev/null || echo "")" == "APIServer" ]]; then
+			wait_apiserver=1
+		fi
+	done
+	log_info "Dry-run apply: ${#files[@]} manifest(s)"
+	oc apply --dry-run=server "${args[@]}"
+	log_info "Applying: ${files[*]}"
+	oc apply "${args[@]}"
+	if [[ $wait_apiserver -eq 1 ]]; then
+		log_info "Waiting for kube-apiserver operator Available=True"
 		oc wait co/kube-apiserver --for=condition=Available=True --timeout=10m || true
-	else
-		oc get -f "$path" >/dev/null 2>&1 || true
 	fi
+	oc get "${args[@]}" >/dev/null 2>&1 || true
+}
+
+# Apply one pool's MachineConfigs as a single change. The pool is paused
+# while the batch is applied so the MCO renders one config from all of
+# them and nodes reboot once, not once per file.
+apply_pool_batch() {
+	local role="$1"
+	shift
+	local -a args=()
+	local path
+	for path in "$@"; do
+		args+=(-f "$path")
+	done
+	log_info "Dry-run apply: $# MachineConfig(s) for MCP/$role"
+	oc apply --dry-run=server "${args[@]}"
+	oc patch mcp/"$role" --type merge -p '{"spec":{"paused":true}}' >/dev/null
+	log_info "Applying to MCP/$role: $*"
+	if ! oc apply "${args[@]}"; then
+		oc patch mcp/"$role" --type merge -p '{"spec":{"paused":false}}' >/dev/null || true
+		return 1
+	fi
+	oc patch mcp/"$role" --type merge -p '{"spec":{"paused":false}}' >/dev/null
+}
+
+# Wait for several pools concurrently; each wait logs to wait-<role>.log.
+# The pool is first given a short window to report Updating=True so a wait
+# issued right after the apply does not see the previous Updated=True.
+wait_for_pools() {
+	local out_dir="$1"
+	shift
+	local -A pids=()
+	local role failed=0
+	for role in "$@"; do
+		log_info "Waiting for MCP/$role to become Updated=True"
+		{
+			oc wait mcp/"$role" --for=condition=Updating=True --timeout=2m || true
+			oc wait mcp/"$role" --for=condition=Updated=True --timeout="$MCP_WAIT_TIMEOUT"
+		} >"$out_dir/wait-$role.log" 2>&1 &
+		pids[$role]=$!
+	done
+	for role in "$@"; do
+		if wait "${pids[$role]}"; then
+			log_success "MCP/$role updated"
+		else
+			log_error "MCP/$role not Updated within $MCP_WAIT_TIMEOUT (see $out_dir/wait-$role.log)"
+			failed=1
+		fi
+		oc get mcp "$role" -o wide || true
+	done
+	return $failed
+}
+
+# Take the performance and health snapshots for a finished batch
+snapshot_batch() {
+	local label="$1"
+	local out_dir="$2"
+	capture_performance "$label" "$out_dir"
+	check_cluster_health "$out_dir/$label"
 }
 
 # Run automated apply + tests
 run_automated_tests() {
 	ensure_prereqs
 	if [[ -z "$new_paths" ]]; then
-		log "No files to apply/test. Skipping."
+		log_info "No files to apply/test. Skipping."
 		return 0
 	fi
 
 	ts=$(date -u +"%Y%m%dT%H%M%SZ")
 	results_dir="test-results/$ts"
 	mkdir -p "$results_dir"
-	log "Capturing baseline performance metrics"
+	log_info "Capturing baseline performance metrics"
 	capture_performance "baseline" "$results_dir"
 
-	# Apply each file and wait as appropriate
-	while IFS= read -r path; do
-		[[ -z "$path" ]] && continue
-		apply_and_wait "$path"
-	done <<<"$new_paths"
+	plan=$(plan_rollout "$new_paths")
+	printf '%s\n' "$plan" >"$results_dir/rollout-plan.tsv"
+
+	local -a manifests=() pools=()
+	local -A pool_files=()
+	local batch path role
+	while IFS=$'\t' read -r batch path; do
+		[[ -z "$batch" ]] && continue
+		if [[ "$batch" == "manifests" ]]; then
+			manifests+=("$path")
+		else
+			role="${batch#mcp/}"
+			if [[ -z "${pool_files[$role]+x}" ]]; then
+				pools+=("$role")
+				pool_files[$role]=""
+			fi
+			pool_files[$role]+="$path"$'\n'
+		fi
+	done <<<"$plan"
+	log_info "Rollout plan: ${#manifests[@]} manifest(s), ${#pools[@]} pool batch(es): ${pools[*]}"
+
+	# The post capture below covers the last batch; only the manifest batch
+	# gets its own snapshot, and only when pool batches follow it.
+	if [[ ${#manifests[@]} -gt 0 ]]; then
+		apply_manifest_batch "${manifests[@]}"
+		if [[ ${#pools[@]} -gt 0 ]]; then
+			snapshot_batch "post-manifests" "$results_dir"
+		fi
+	fi
 
-	log "Capturing post-change performance metrics"
+	if [[ ${#pools[@]} -gt 0 ]]; then
+		local -a files=()
+		for role in "${pools[@]}"; do
+			mapfile -t files < <(printf '%s' "${pool_files[$role]}")
+			apply_pool_batch "$role" "${files[@]}"
+		done
+		wait_for_pools "$results_dir" "${pools[@]}" || log_warn "Not every pool finished updating; see health checks"
+	fi
+
+	log_info "Capturing post-change performance metrics"
 	capture_performance "post" "$results_dir"
 
-	log "Running cluster health checks"
+	log_info "Running cluster health checks"
 	check_cluster_health "$results_dir"
 
 	# Generate simple diffs
@@ -194,6 +310,11 @@ run_automated_tests() {
 	echo "$summary"
 }
 
+# When sourced (tests), define the functions only
+if [[ "${BASH_SOURCE[0]}" != "$0" ]]; then
+	return 0
+fi
+
 # Parse long options first
 for arg in "$@"; do
 	case $arg in
@@ -6,6 +6,10 @@ Adds a concise "summary" field to each check in the JSON data file.
 Supports offline/cached mode: previously generated summaries are cached
 to disk and served when the API key is missing or rate-limited.
 
+Descriptions in a shape extract-summaries.py recognises (sysctl, audit
+rule, sshd directive, file permission, kernel argument, ...) are
+summarised locally first; only the rest reach the cache or the API.
+
 Requires: ANTHROPIC_API_KEY environment variable (optional with --offline)
 """
 from __future__ import annotations
@@ -16,8 +20,15 @@ import json
 import os
 import sys
 import tempfile
+from importlib.util import module_from_spec, spec_from_file_location
 from typing import Any
 
+_spec = spec_from_file_location(
+    "extract_summaries",
+    os.path.join(os.path.dirname(__file__), "extract-summaries.py"))
+assert _spec and _spec.loader
+extract_summaries = module_from_spec(_spec)
+_spec.loader.exec_module(extract_summaries)
 
 DEFAULT_MODEL = os.environ.get("ANTHROPIC_MODEL", "claude-sonnet-4-20250514")
 CACHE_FILENAME = ".summary-cache.json"
@@ -111,12 +122,25 @@ def process_checks(
     client: Any | None, checks: list[dict[str, Any]],
     cache: dict[str, str] | None = None,
     model: str = DEFAULT_MODEL,
+    extract: bool = True,
 ) -> list[dict[str, Any]]:
-    """Add summaries to a list of checks."""
+    """Add summaries to a list of checks.
+
+    With extract, descriptions extract-summaries.py recognises are
+    summarised locally without touching the cache or the API.
+    """
     for check in checks:
         name = check.get("name", "unknown")
         description = check.get("description", "")
 
+        if description and not check.get("summary") and extract:
+            extracted = extract_summaries.extract_summary(description)
+            if extracted:
+                check["summary"] = extracted[1]
+                print(f"  Extracted ({extracted[0]}): {name}")
+                print(f"    -> {extracted[1]}")
+                continue
+
         if description and not check.get("summary"):
             print(f"  Summarizing: {name}")
             summary = summarize_remediation(client, description, cache, model)
@@ -159,6 +183,11 @@ def main() -> None:
         action="store_true",
         help="Disable caching entirely"
     )
+    parser.add_argument(
+        "--no-extract",
+        action="store_true",
+        help="Send every description to the API, skipping local extraction"
+    )
     args = parser.parse_args()
 
     json_file = args.json_file
@@ -204,25 +233,29 @@ def main() -> None:
     print("\nProcessing HIGH severity checks...")
     if data.get("remediations", {}).get("high"):
         data["remediations"]["high"] = process_checks(
-            client, data["remediations"]["high"], cache, args.model
+            client, data["remediations"]["high"], cache, args.model,
+            not args.no_extract
         )
 
     print("\nProcessing MEDIUM severity checks...")
     if data.get("remediations", {}).get("medium"):
         data["remediations"]["medium"] = process_checks(
-            client, data["remediations"]["medium"], cache, args.model
+            client, data["remediations"]["medium"], cache, args.model,
+            not args.no_extract
         )
 
     print("\nProcessing LOW severity checks...")
     if data.get("remediations", {}).get("low"):
         data["remediations"]["low"] = process_checks(
-            client, data["remediations"]["low"], cache, args.model
+            client, data["remediations"]["low"], cache, args.model,
+            not args.no_extract
         )
 
     print("\nProcessing MANUAL checks...")
     if data.get("manual_checks"):
         data["manual_checks"] = process_checks(
-            client, data["manual_checks"], cache, args.model
+            client, data["manual_checks"], cache, args.model,
+            not args.no_extract
         )
 
     if cache is not None and not args.no_cache:
@@ -0,0 +1,40 @@
+// Fetch generated dashboard data (docs/assets/compare/, docs/assets/search/)
+// through the content-hashed copies from scripts/publish-data-assets.py.
+// The manifest is revalidated once per page; hashed files never change, so
+// the service worker (sw.js) serves them from its cache. Without a manifest
+// (e.g. a plain jekyll serve) files are fetched under their stable names.
+
+var dataAssetsRoot = document.currentScript.getAttribute('data-root');
+var dataAssetsManifest = null;
+var dataAssetsCache = {};
+
+function loadDataManifest() {
+  if (!dataAssetsManifest) {
+    dataAssetsManifest = fetch(dataAssetsRoot + 'data/manifest.json', {cache: 'no-cache'})
+      .then(function(resp) { return resp.ok ? resp.json() : {files: {}}; })
+      .then(function(manifest) { return manifest.files || {}; },
+            function() { return {}; });
+  }
+  return dataAssetsManifest;
+}
+
+// Resolve a stable path relative to assets/ ("compare/index.json") to a URL.
+function dataAssetUrl(path) {
+  return loadDataManifest().then(function(files) {
+    return files[path] ? dataAssetsRoot + 'data/' + files[path] : dataAssetsRoot + path;
+  });
+}
+
+// Fetch and parse a data file once per page; failed fetches are retried.
+function fetchDataAsset(path) {
+  if (!dataAssetsCache[path]) {
+    dataAssetsCache[path] = dataAssetUrl(path).then(function(url) { return fetch(url); }).then(function(resp) {
+      if (!resp.ok) throw new Error(resp.status + ' ' + resp.statusText);
+      return resp.json();
+    }).catch(function(err) {
+      delete dataAssetsCache[path];
+      throw err;
+    });
+  }
+  return dataAssetsCache[path];
+}
@@ -0,0 +1,140 @@
+// Full-text search over the prebuilt index from scripts/generate-search-index.py.
+// Shards (one per OCP version) are fetched lazily on first use and cached.
+// Multi-word queries match documents containing every word; the last word
+// also matches as a prefix while it is still being typed, unless it is a
+// stopword that starts no indexed term.
+
+var SEARCH_STOPWORDS = {};
+('an and are as at be by for from has have if in into is it its of on or ' +
+ 'that the this to was were which will with').split(' ').forEach(function(w) {
+  SEARCH_STOPWORDS[w] = true;
+});
+var SEARCH_MIN_TOKEN_LEN = 2;
+var SEARCH_STATUS_ORDER = {FAIL: 0, MANUAL: 1, PASS: 2};
+
+// Split a query into whole-word tokens and an optional trailing prefix,
+// using the same rules as tokenize() in generate-search-index.py.
+function searchParseQuery(query) {
+  var text = (query || '').toLowerCase();
+  var words = text.match(/[a-z0-9]+/g) || [];
+  var prefix = '';
+  if (words.length && /[a-z0-9]$/.test(text)) prefix = words.pop();
+  if (prefix.length < SEARCH_MIN_TOKEN_LEN) prefix = '';
+  var tokens = [];
+  words.forEach(function(w) {
+    if (w.length >= SEARCH_MIN_TOKEN_LEN && !SEARCH_STOPWORDS[w] && tokens.indexOf(w) === -1) {
+      tokens.push(w);
+    }
+  });
+  return {tokens: tokens, prefix: prefix};
+}
+
+// Undo the delta encoding of the posting lists, once per shard.
+function searchPrepareShard(shard) {
+  if (shard.decoded) return shard;
+  shard.postings = shard.postings.map(function(gaps) {
+    var ids = new Array(gaps.length), id = 0;
+    for (var i = 0; i < gaps.length; i++) { id += gaps[i]; ids[i] = id; }
+    return ids;
+  });
+  shard.decoded = true;
+  return shard;
+}
+
+function searchLowerBound(terms, value) {
+  var lo = 0, hi = terms.length;
+  while (lo < hi) {
+    var mid = (lo + hi) >> 1;
+    if (terms[mid] < value) lo = mid + 1; else hi = mid;
+  }
+  return lo;
+}
+
+function searchExact(shard, token) {
+  var i = searchLowerBound(shard.terms, token);
+  return shard.terms[i] === token ? shard.postings[i] : [];
+}
+
+// Sorted union of the postings of every term starting with prefix.
+function searchPrefix(shard, prefix) {
+  var seen = {}, ids = [];
+  for (var i = searchLowerBound(shard.terms, prefix);
+       i < shard.terms.length && shard.terms[i].lastIndexOf(prefix, 0) === 0; i++) {
+    shard.postings[i].forEach(function(id) {
+      if (!seen[id]) { seen[id] = true; ids.push(id); }
+    });
+  }
+  return ids.sort(function(a, b) { return a - b; });
+}
+
+function searchIntersect(a, b) {
+  var out = [], i = 0, j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) { out.push(a[i]); i++; j++; }
+    else if (a[i] < b[j]) i++;
+    else j++;
+  }
+  return out;
+}
+
+// Return up to limit results ({type, id, status, group, title, score}),
+// best first: words found in the name or title rank above words found only
+// in descriptions, then groups before checks, then failing checks first.
+function searchQuery(shard, query, limit) {
+  searchPrepareShard(shard);
+  var parsed = searchParseQuery(query);
+  var lists = parsed.tokens.map(function(t) { return searchExact(shard, t); });
+  var prefix = parsed.prefix;
+  if (prefix) {
+    var prefixIds = searchPrefix(shard, prefix);
+    // A trailing stopword that starts no indexed term is a finished word
+    // ("sshd and "), so it is dropped like any other stopword.
+    if (prefixIds.length || !SEARCH_STOPWORDS[prefix]) lists.push(prefixIds);
+    else prefix = '';
+  }
+  if (!lists.length) return [];
+  lists.sort(function(a, b) { return a.length - b.length; });
+  var ids = lists.reduce(searchIntersect);
+
+  var words = parsed.tokens.concat(prefix ? [prefix] : []);
+  var results = ids.map(function(id) {
+    var doc = shard.docs[id];
+    var head = (doc[1] + ' ' + doc[4]).toLowerCase();
+    var score = 0;
+    words.forEach(function(w) { if (head.indexOf(w) !== -1) score++; });
+    return {
+      type: doc[0] === 'g' ? 'group' : 'check',
+      id: doc[1],
+      status: doc[0] === 'g' ? doc[2] : shard.statuses[doc[2]],
+      group: doc[3],
+      title: doc[4],
+      score: score
+    };
+  });
+  results.sort(function(a, b) {
+    if (a.score !== b.score) return b.score - a.score;
+    if (a.type !== b.type) return a.type === 'group' ? -1 : 1;
+    var sa = SEARCH_STATUS_ORDER[a.status], sb = SEARCH_STATUS_ORDER[b.status];
+    if (sa !== sb) return (sa === undefined ? 3 : sa) - (sb === undefined ? 3 : sb);
+    return a.id < b.id ? -1 : a.id > b.id ? 1 : 0;
+  });
+  return limit ? results.slice(0, limit) : results;
+}
+
+// base is the index directory relative to assets/ ("search/"); files are
+// fetched through fetchDataAsset() from data-assets.js.
+function searchFetch(base, file) {
+  return fetchDataAsset(base + file);
+}
+
+function searchLoadManifest(base) {
+  return searchFetch(base, 'index.json');
+}
+
+function searchLoadShard(base, version) {
+  return searchLoadManifest(base).then(function(manifest) {
+    var entry = manifest.versions[version];
+    if (!entry) throw new Error('No search index for OCP ' + version);
+    return searchFetch(base, entry.shard).then(searchPrepareShard);
+  });
+}
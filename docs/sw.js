@@ -0,0 +1,91 @@
+// Service worker for the compliance dashboard.
+//
+// - assets/data/<name>.<hash>.json (scripts/publish-data-assets.py) is
+//   immutable: served from cache, fetched at most once.
+// - assets/data/manifest.json is always revalidated; after each fetch,
+//   hashed files it no longer lists are dropped from the cache.
+// - Everything else on the site (pages, scripts, styles, stable-name data)
+//   is network-first with a cached fallback, so visited pages work offline.
+
+var DATA_CACHE = 'dashboard-data-v1';
+var SITE_CACHE = 'dashboard-site-v1';
+var SCOPE = self.registration.scope;
+var DATA_ROOT = SCOPE + 'assets/data/';
+var MANIFEST_URL = DATA_ROOT + 'manifest.json';
+var HASHED_RE = /\.[0-9a-f]{12}\.json$/;
+
+self.addEventListener('install', function() {
+  self.skipWaiting();
+});
+
+self.addEventListener('activate', function(event) {
+  event.waitUntil(caches.keys().then(function(names) {
+    return Promise.all(names.filter(function(name) {
+      return name !== DATA_CACHE && name !== SITE_CACHE;
+    }).map(function(name) { return caches.delete(name); }));
+  }).then(function() { return self.clients.claim(); }));
+});
+
+function cacheFirst(request) {
+  return caches.open(DATA_CACHE).then(function(cache) {
+    return cache.match(request).then(function(cached) {
+      if (cached) return cached;
+      return fetch(request).then(function(resp) {
+        if (resp.ok) cache.put(request, resp.clone());
+        return resp;
+      });
+    });
+  });
+}
+
+function networkFirst(request, cacheName) {
+  return caches.open(cacheName).then(function(cache) {
+    return fetch(request).then(function(resp) {
+      if (resp.ok) cache.put(request, resp.clone());
+      return resp;
+    }, function(err) {
+      return cache.match(request).then(function(cached) {
+        if (cached) return cached;
+        throw err;
+      });
+    });
+  });
+}
+
+// Drop hashed data files that the current manifest no longer references.
+function pruneData(manifest) {
+  var keep = {};
+  Object.keys(manifest.files || {}).forEach(function(path) {
+    keep[DATA_ROOT + manifest.files[path]] = true;
+  });
+  return caches.open(DATA_CACHE).then(function(cache) {
+    return cache.keys().then(function(requests) {
+      return Promise.all(requests.filter(function(request) {
+        return request.url !== MANIFEST_URL && !keep[request.url];
+      }).map(function(request) { return cache.delete(request); }));
+    });
+  });
+}
+
+function revalidateManifest(event) {
+  var request = new Request(MANIFEST_URL, {cache: 'no-cache'});
+  return networkFirst(request, DATA_CACHE).then(function(resp) {
+    if (resp.ok) {
+      event.waitUntil(resp.clone().json().then(pruneData, function() {}));
+    }
+    return resp;
+  });
+}
+
+self.addEventListener('fetch', function(event) {
+  var request = event.request;
+  if (request.method !== 'GET' || request.url.lastIndexOf(SCOPE, 0) !== 0) return;
+  var url = request.url.split(/[?#]/)[0];
+  if (url === MANIFEST_URL) {
+    event.respondWith(revalidateManifest(event));
+  } else if (url.lastIndexOf(DATA_ROOT, 0) === 0 && HASHED_RE.test(url)) {
+    event.respondWith(cacheFirst(request));
+  } else {
+    event.respondWith(networkFirst(request, SITE_CACHE));
+  }
+});
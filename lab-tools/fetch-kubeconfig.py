@@ -15,19 +15,27 @@ Usage:
   ./fetch-kubeconfig.py --env cnfdc4                  # fetch from cnfdc4 environment
   ./fetch-kubeconfig.py <REMOTE_IP>                   # use custom IP (skip scraping)
   ./fetch-kubeconfig.py <REMOTE_IP> <DEST>            # custom IP and destination
+  ./fetch-kubeconfig.py --env cnfdc3,cnfdc4 --wait    # wait for several clusters at once
 
 Examples:
   ./fetch-kubeconfig.py --env cnfdc3 --wait --max-wait 90       # wait up to 90 minutes
   ./fetch-kubeconfig.py --env cnfdc4 --wait --poll-interval 60  # check every 60 seconds
+  ./fetch-kubeconfig.py --env cnfdc3 --wait --max-poll-interval 300  # back off to 5 minutes
   ./fetch-kubeconfig.py 10.6.105.126                            # use specific IP
 """
 from __future__ import annotations
 
 import sys
 import os
+import random
+import re
 import subprocess
 import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
 
 # Add project root to path for shared module imports
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
@@ -46,86 +54,143 @@ except ImportError:
     sys.exit(1)
 
 
-def check_node_status(url: str, verify_ssl: bool = False) -> dict:
+IP_PATTERN = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+
+# Polls of one status page (or of a whole fleet sharing one host) reuse
+# these pooled keep-alive connections instead of reconnecting each time.
+POOL_SIZE = 16
+# Each sleep is scaled by a random factor in [1 - JITTER, 1 + JITTER] so a
+# fleet of waiters does not hit the status server in lockstep.
+JITTER = 0.1
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def make_session(verify_ssl: bool = False, pool_size: int = POOL_SIZE) -> requests.Session:
     """
-    Check the status of all nodes in the cluster.
+    Create a keep-alive session for polling status pages.
+
+    Kerberos authentication is attached when requests-kerberos is
+    installed, so the negotiation happens once per pooled connection
+    rather than on every poll. Certificate verification is not set on the
+    session: REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE would override it, so every
+    request passes verify= itself.
 
     Args:
-        url: The URL to scrape
-        verify_ssl: Whether to verify SSL certificates
+        verify_ssl: Whether SSL certificates will be verified (the insecure
+            request warning is silenced when not)
+        pool_size: Connections kept open per host
 
     Returns:
-        Dictionary with node status information
+        A configured requests.Session
     """
-    import re
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
 
+    # Try to use Kerberos authentication if available
     try:
-        # For Red Hat internal sites, disable SSL verification and use Kerberos auth if available
-        session = requests.Session()
+        from requests_kerberos import HTTPKerberosAuth, OPTIONAL
+        session.auth = HTTPKerberosAuth(mutual_authentication=OPTIONAL)
+    except ImportError:
+        pass
 
-        # Try to use Kerberos authentication if available
-        try:
-            from requests_kerberos import HTTPKerberosAuth, OPTIONAL
-            session.auth = HTTPKerberosAuth(mutual_authentication=OPTIONAL)
-        except ImportError:
-            pass
+    # Disable SSL verification warnings for internal Red Hat sites
+    if not verify_ssl:
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return session
+
+
+def get_session(verify_ssl: bool = False) -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = make_session(verify_ssl)
+        return _session
+
+
+def parse_node_status(html: str) -> dict:
+    """
+    Parse VM rows out of a succulent infoplan page.
+
+    Args:
+        html: Page content
+
+    Returns:
+        Dictionary with 'nodes' ({name: {'status', 'ip'}}) and 'installer_ip'
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+
+    nodes = {}
+    installer_ip = None
+
+    # Find table rows with VM information
+    tables = soup.find_all('table')
+    for table in tables:
+        rows = table.find_all('tr')
+
+        # Parse all rows and filter based on content
+        for row in rows:
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 2:
+                vm_name = cells[0].get_text().strip()
+                status_or_client = cells[1].get_text().strip()
 
-        # Disable SSL verification for internal Red Hat sites
-        if not verify_ssl:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                # Skip header rows and plan name rows
+                if vm_name.lower() in ['vm name', 'plan name']:
+                    continue
 
+                # Only process rows where the status is "up" or "down" (VM rows)
+                # This filters out the Plan name table which has "Client" in the 2nd column
+                if status_or_client.lower() not in ['up', 'down']:
+                    continue
+
+                # This is a VM row, get the IP from the 3rd column
+                ip_text = cells[2].get_text().strip() if len(cells) > 2 else ""
+
+                # Extract IP if present
+                ip_match = IP_PATTERN.search(ip_text)
+                ip = ip_match.group(0) if ip_match else None
+
+                # Store node info
+                nodes[vm_name] = {
+                    'status': status_or_client.lower(),
+                    'ip': ip
+                }
+
+                # Track installer IP
+                if 'installer' in vm_name.lower() and ip:
+                    installer_ip = ip
+
+    return {
+        'nodes': nodes,
+        'installer_ip': installer_ip
+    }
+
+
+def check_node_status(url: str, verify_ssl: bool = False,
+                      session: requests.Session | None = None) -> dict:
+    """
+    Check the status of all nodes in the cluster.
+
+    Args:
+        url: The URL to scrape
+        verify_ssl: Whether to verify SSL certificates
+        session: Session to poll with (default: the shared pooled session)
+
+    Returns:
+        Dictionary with node status information
+    """
+    try:
+        if session is None:
+            session = get_session(verify_ssl)
         response = session.get(url, timeout=10, verify=verify_ssl)
         response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        nodes = {}
-        installer_ip = None
-
-        # Find table rows with VM information
-        tables = soup.find_all('table')
-        for table in tables:
-            rows = table.find_all('tr')
-
-            # Parse all rows and filter based on content
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    vm_name = cells[0].get_text().strip()
-                    status_or_client = cells[1].get_text().strip()
-
-                    # Skip header rows and plan name rows
-                    if vm_name.lower() in ['vm name', 'plan name']:
-                        continue
-
-                    # Only process rows where the status is "up" or "down" (VM rows)
-                    # This filters out the Plan name table which has "Client" in the 2nd column
-                    if status_or_client.lower() not in ['up', 'down']:
-                        continue
-
-                    # This is a VM row, get the IP from the 3rd column
-                    ip_text = cells[2].get_text().strip() if len(cells) > 2 else ""
-
-                    # Extract IP if present
-                    ip_pattern = r'\b(?:\d{1,3}\.){3}\d{1,3}\b'
-                    ip_match = re.search(ip_pattern, ip_text)
-                    ip = ip_match.group(0) if ip_match else None
-
-                    # Store node info
-                    nodes[vm_name] = {
-                        'status': status_or_client.lower(),
-                        'ip': ip
-                    }
-
-                    # Track installer IP
-                    if 'installer' in vm_name.lower() and ip:
-                        installer_ip = ip
-
-        return {
-            'nodes': nodes,
-            'installer_ip': installer_ip
-        }
+        return parse_node_status(response.text)
 
     except requests.exceptions.ConnectionError as e:
         # Check if it's a DNS resolution error (likely VPN issue)
@@ -152,9 +217,49 @@ def check_node_status(url: str, verify_ssl: bool = False) -> dict:
         return {'nodes': {}, 'installer_ip': None}
 
 
+def poll_delay(attempt: int, poll_interval: float,
+               max_poll_interval: float | None = None,
+               rng: random.Random | None = None) -> float:
+    """
+    Seconds to sleep after the given (0-based) poll attempt.
+
+    The interval doubles each attempt up to max_poll_interval (no growth
+    when it is unset or not above poll_interval), then gets +/-JITTER.
+    """
+    cap = max(poll_interval, max_poll_interval or poll_interval)
+    base = min(cap, poll_interval * 2 ** min(attempt, 32))
+    return base * (rng or random).uniform(1 - JITTER, 1 + JITTER)
+
+
+def cluster_readiness(nodes: dict, installer_ip: str | None) -> bool:
+    """
+    Whether the installer and every critical node are up with IPs.
+
+    Bootstrap nodes are ignored, and workers may still be coming up.
+    """
+    if not installer_ip:
+        return False
+    for name, info in nodes.items():
+        # Skip bootstrap and worker nodes for initial readiness
+        if 'bootstrap' in name.lower():
+            continue
+        if 'worker' in name.lower() and info['status'] != 'up':
+            continue  # Workers might come up later
+
+        if info['status'] != 'up':
+            return False
+        elif not info['ip'] and 'worker' not in name.lower():
+            return False
+    return True
+
+
 def wait_for_cluster_ready(url: str, verify_ssl: bool = False,
-                           max_wait_minutes: int = 60,
-                           poll_interval: int = 30) -> str | None:
+                           max_wait_minutes: float = 60,
+                           poll_interval: float = 30,
+                           max_poll_interval: float | None = None,
+                           session: requests.Session | None = None,
+                           label: str | None = None,
+                           sleep: Callable[[float], None] = time.sleep) -> str | None:
     """
     Wait for all cluster nodes to be up with IPs assigned.
 
@@ -162,15 +267,29 @@ def wait_for_cluster_ready(url: str, verify_ssl: bool = False,
         url: The URL to scrape
         verify_ssl: Whether to verify SSL certificates
         max_wait_minutes: Maximum time to wait in minutes
-        poll_interval: Seconds between polls
+        poll_interval: Seconds between polls (first interval with backoff)
+        max_poll_interval: Back off exponentially up to this many seconds
+        session: Session to poll with (default: the shared pooled session)
+        label: Prefix for progress lines, when several clusters are watched
+        sleep: Sleep function (tests pass a no-op)
 
     Returns:
         The installer IP address if successful, None otherwise
     """
-    import time
+    prefix = f"[{label}] " if label else ""
 
-    print("Waiting for cluster nodes to be ready...")
-    print(f"Will check {url} every {poll_interval} seconds (max {max_wait_minutes} minutes)\n")
+    def say(message: str = "") -> None:
+        print(f"{prefix}{message}" if message else "", flush=True)
+
+    if session is None:
+        session = get_session(verify_ssl)
+
+    say("Waiting for cluster nodes to be ready...")
+    if max_poll_interval and max_poll_interval > poll_interval:
+        say(f"Will check {url} every {poll_interval}s, backing off to {max_poll_interval}s "
+            f"(max {max_wait_minutes} minutes)\n")
+    else:
+        say(f"Will check {url} every {poll_interval} seconds (max {max_wait_minutes} minutes)\n")
 
     start_time = time.time()
     max_wait_seconds = max_wait_minutes * 60
@@ -179,15 +298,16 @@ def wait_for_cluster_ready(url: str, verify_ssl: bool = False,
     while time.time() - start_time < max_wait_seconds:
         attempt += 1
         elapsed = int(time.time() - start_time)
-        print(f"[Attempt {attempt}, {elapsed}s elapsed] Checking node status...")
+        say(f"[Attempt {attempt}, {elapsed}s elapsed] Checking node status...")
 
-        status = check_node_status(url, verify_ssl)
+        status = check_node_status(url, verify_ssl, session)
         nodes = status.get('nodes', {})
         installer_ip = status.get('installer_ip')
+        delay = poll_delay(attempt - 1, poll_interval, max_poll_interval)
 
         if not nodes:
-            print("  ⚠ No nodes found on the page")
-            time.sleep(poll_interval)
+            say("  ⚠ No nodes found on the page")
+            sleep(delay)
             continue
 
         # Analyze node status
@@ -195,50 +315,66 @@ def wait_for_cluster_ready(url: str, verify_ssl: bool = False,
         up_nodes = sum(1 for n in nodes.values() if n['status'] == 'up')
         nodes_with_ip = sum(1 for n in nodes.values() if n['ip'])
 
-        print(f"  Nodes: {up_nodes}/{total_nodes} up, {nodes_with_ip}/{total_nodes} have IPs")
+        say(f"  Nodes: {up_nodes}/{total_nodes} up, {nodes_with_ip}/{total_nodes} have IPs")
 
         # Show details
         for name, info in sorted(nodes.items()):
             status_icon = "✓" if info['status'] == 'up' else "✗"
             ip_info = info['ip'] if info['ip'] else "no IP"
-            print(f"    {status_icon} {name}: {info['status']}, {ip_info}")
-
-        # Check if all critical nodes are ready
-        # We need at least installer and masters to be up with IPs
-        critical_ready = True
+            say(f"    {status_icon} {name}: {info['status']}, {ip_info}")
 
         if not installer_ip:
-            print("  ⚠ Installer IP not found")
-            critical_ready = False
-
-        # Check for any nodes that are down or missing IPs
-        for name, info in nodes.items():
-            # Skip bootstrap and worker nodes for initial readiness
-            if 'bootstrap' in name.lower():
-                continue
-            if 'worker' in name.lower() and info['status'] != 'up':
-                continue  # Workers might come up later
-
-            if info['status'] != 'up':
-                critical_ready = False
-            elif not info['ip'] and 'worker' not in name.lower():
-                critical_ready = False
-
-        if critical_ready and installer_ip:
-            print(f"\n✓ Cluster is ready! Installer IP: {installer_ip}")
+            say("  ⚠ Installer IP not found")
+
+        # We need at least installer and masters to be up with IPs
+        if cluster_readiness(nodes, installer_ip):
+            say(f"\n{prefix}✓ Cluster is ready! Installer IP: {installer_ip}")
             return installer_ip
 
-        print(f"  Waiting {poll_interval} seconds before next check...\n")
-        time.sleep(poll_interval)
+        say(f"  Waiting {delay:.0f} seconds before next check...\n")
+        sleep(delay)
 
-    print(f"\n✗ Timeout: Cluster not ready after {max_wait_minutes} minutes", file=sys.stderr)
+    print(f"\n{prefix}✗ Timeout: Cluster not ready after {max_wait_minutes} minutes", file=sys.stderr)
     return None
 
 
+def wait_for_clusters(urls: dict[str, str], verify_ssl: bool = False,
+                      max_wait_minutes: float = 60,
+                      poll_interval: float = 30,
+                      max_poll_interval: float | None = None,
+                      max_workers: int | None = None,
+                      sleep: Callable[[float], None] = time.sleep) -> dict[str, str | None]:
+    """
+    Wait for several clusters concurrently, e.g. after reprovisioning a fleet.
+
+    Every cluster is polled from its own worker thread over one shared
+    pooled session.
+
+    Args:
+        urls: Cluster label -> status page URL
+        max_workers: Concurrent waiters (default: one per cluster)
+
+    Returns:
+        Cluster label -> installer IP (None if it never became ready)
+    """
+    if not urls:
+        return {}
+    workers = max(1, min(max_workers or len(urls), len(urls)))
+    session = make_session(verify_ssl, pool_size=max(POOL_SIZE, workers))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            label: pool.submit(wait_for_cluster_ready, url, verify_ssl, max_wait_minutes,
+                               poll_interval, max_poll_interval, session, label, sleep)
+            for label, url in urls.items()
+        }
+        return {label: f.result() for label, f in futures.items()}
+
+
 def scrape_installer_ip(url: str, verify_ssl: bool = False,
                         wait_for_ready: bool = False,
                         max_wait_minutes: int = 60,
-                        poll_interval: int = 30) -> str | None:
+                        poll_interval: int = 30,
+                        max_poll_interval: int | None = None) -> str | None:
     """
     Scrape the installer machine's IP from the succulent webpage.
 
@@ -248,12 +384,14 @@ def scrape_installer_ip(url: str, verify_ssl: bool = False,
         wait_for_ready: Wait for all nodes to be up with IPs
         max_wait_minutes: Maximum time to wait for cluster ready
         poll_interval: Seconds between checks when waiting
+        max_poll_interval: Back off up to this many seconds between checks
 
     Returns:
         The installer IP address if found, None otherwise
     """
     if wait_for_ready:
-        return wait_for_cluster_ready(url, verify_ssl, max_wait_minutes, poll_interval)
+        return wait_for_cluster_ready(url, verify_ssl, max_wait_minutes, poll_interval,
+                                      max_poll_interval)
 
     # Quick fetch without waiting
     print(f"Fetching installer IP from {url} ...")
@@ -365,6 +503,41 @@ def fetch_kubeconfig(remote_ip: str, remote_user: str = "root",
         return False
 
 
+def fetch_many(envs: list[str], args: argparse.Namespace) -> int:
+    """
+    Fetch kubeconfigs for several environments, polling them concurrently.
+
+    Each kubeconfig is saved to ~/Downloads/{env}-kubeconfig.
+
+    Returns:
+        Exit code: 0 if every kubeconfig was fetched, 1 otherwise
+    """
+    urls = {env: f'https://succulent.eng.redhat.com/infoplan/{env}' for env in envs}
+    if args.wait:
+        ips = wait_for_clusters(urls, args.verify_ssl, args.max_wait,
+                                args.poll_interval, args.max_poll_interval)
+    else:
+        session = get_session(args.verify_ssl)
+        ips = {env: check_node_status(url, args.verify_ssl, session).get('installer_ip')
+               for env, url in urls.items()}
+
+    failed = []
+    for env, ip in ips.items():
+        print(f"\n=== {env} ===")
+        if not ip:
+            print(f"❌ Could not determine installer IP for {env}", file=sys.stderr)
+            failed.append(env)
+            continue
+        remove_ssh_host_key(ip)
+        destination = str(Path.home() / "Downloads" / f"{env}-kubeconfig")
+        if not fetch_kubeconfig(ip, args.user, args.path, destination):
+            failed.append(env)
+
+    if failed:
+        print(f"\nFailed: {', '.join(failed)}", file=sys.stderr)
+    return 1 if failed else 0
+
+
 def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -384,7 +557,8 @@ def main() -> None:
     )
     parser.add_argument(
         '--env',
-        help='Environment name (e.g., cnfdc3, cnfdc4)'
+        help='Environment name (e.g., cnfdc3, cnfdc4); a comma-separated list '
+             'waits for and fetches each cluster concurrently'
     )
     parser.add_argument(
         '--url',
@@ -424,9 +598,24 @@ def main() -> None:
         metavar='SECONDS',
         help='Seconds between status checks when waiting (default: %(default)s)'
     )
+    parser.add_argument(
+        '--max-poll-interval',
+        type=int,
+        metavar='SECONDS',
+        help='Back off exponentially (with jitter) up to this many seconds between '
+             'checks (default: fixed --poll-interval)'
+    )
 
     args = parser.parse_args()
 
+    envs = [e.strip() for e in (args.env or '').split(',') if e.strip()]
+    if len(envs) > 1:
+        if args.remote_ip or args.destination or args.url:
+            print("Error: IP, destination and --url cannot be combined with several --env values",
+                  file=sys.stderr)
+            sys.exit(1)
+        sys.exit(fetch_many(envs, args))
+
     # Determine remote IP
     if args.remote_ip:
         remote_ip = args.remote_ip
@@ -463,7 +652,8 @@ def main() -> None:
             verify_ssl=args.verify_ssl,
             wait_for_ready=args.wait,
             max_wait_minutes=args.max_wait,
-            poll_interval=args.poll_interval
+            poll_interval=args.poll_interval,
+            max_poll_interval=args.max_poll_interval
         )
         if not remote_ip:
             print("\n❌ Could not determine installer IP", file=sys.stderr)
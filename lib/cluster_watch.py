@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Watch ComplianceSuites, ComplianceScans and MachineConfigPools for phase changes.
+
+Replaces the sleep-polling loops in the shell scripts (one ``oc get`` per
+suite every 20s) with one ``oc get --watch`` stream per resource kind,
+merged into a single asyncio event stream. A waiter wakes as soon as the
+event that completes its condition arrives instead of at the next tick.
+
+Event sources are async iterables of raw watch events:
+
+    {"kind": "suite", "type": "ADDED" | "MODIFIED" | "DELETED", "object": {...}}
+    {"kind": "suite", "type": "SYNCED"}
+
+SYNCED marks the end of a kind's initial listing, so "all suites are DONE"
+is only decided once every existing suite has been seen. OcEventSource
+reads a live cluster; FakeEventSource replays a scripted list for tests.
+PhaseTracker turns raw events into phase transitions:
+
+    {"kind": "suite", "name": "cis", "old": "RUNNING", "new": "DONE"}
+
+Usage:
+    python3 lib/cluster_watch.py wait-suites --timeout 30m
+    python3 lib/cluster_watch.py wait-mcps --timeout 45m
+    python3 lib/cluster_watch.py events --kinds suite,scan
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Iterable
+
+DEFAULT_COMPLIANCE_NAMESPACE = "openshift-compliance"
+
+# kind -> (oc resource, namespaced)
+KINDS = {
+    "suite": ("compliancesuites", True),
+    "scan": ("compliancescans", True),
+    "mcp": ("machineconfigpools", False),
+}
+
+# MachineConfigPool conditions in the order they decide the pool's phase.
+MCP_CONDITIONS = ("Degraded", "Updating", "Updated")
+
+DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$")
+DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration such as 90, 90s, 30m or 1.5h into seconds."""
+    match = DURATION_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid duration: {value!r} (expected e.g. 90s, 30m, 1h)")
+    number, unit = match.groups()
+    return float(number) * DURATION_UNITS[unit]
+
+
+def phase_of(kind: str, obj: dict[str, Any]) -> str:
+    """Return the phase of a watched object.
+
+    Suites and scans report ``status.phase``; MachineConfigPools have no
+    phase, so it is derived from the first true condition among Degraded,
+    Updating and Updated.
+    """
+    status = obj.get("status") or {}
+    if kind == "mcp":
+        true_conditions = {
+            c.get("type") for c in status.get("conditions") or []
+            if c.get("status") == "True"
+        }
+        for condition in MCP_CONDITIONS:
+            if condition in true_conditions:
+                return condition
+        return "Unknown"
+    return status.get("phase") or "PENDING"
+
+
+def _resource_version(obj: dict[str, Any]) -> int | None:
+    rv = (obj.get("metadata") or {}).get("resourceVersion")
+    return int(rv) if isinstance(rv, str) and rv.isdigit() else None
+
+
+class PhaseTracker:
+    """Current phase of every watched object, updated one event at a time.
+
+    Events older than the state already seen (by resourceVersion) are
+    ignored, since a watch started before the initial listing can replay
+    changes the listing already reflects.
+    """
+
+    __slots__ = ("phases", "versions", "synced")
+
+    def __init__(self) -> None:
+        self.phases: dict[str, dict[str, str]] = {kind: {} for kind in KINDS}
+        self.versions: dict[tuple[str, str], int] = {}
+        self.synced: set[str] = set()
+
+    def apply(self, event: dict[str, Any]) -> dict[str, Any] | None:
+        """Apply a raw watch event; return the transition it causes, if any."""
+        kind = event["kind"]
+        if event["type"] == "SYNCED":
+            self.synced.add(kind)
+            return None
+        obj = event.get("object") or {}
+        name = (obj.get("metadata") or {}).get("name")
+        if not name:
+            return None
+        key = (kind, name)
+        rv = _resource_version(obj)
+        seen = self.versions.get(key)
+        if rv is not None and seen is not None and rv <= seen:
+            return None
+        if rv is not None:
+            self.versions[key] = rv
+
+        phases = self.phases.setdefault(kind, {})
+        old = phases.get(name)
+        if event["type"] == "DELETED":
+            phases.pop(name, None)
+            self.versions.pop(key, None)
+            new = None
+        else:
+            new = phases[name] = phase_of(kind, obj)
+        if old == new:
+            return None
+        return {"kind": kind, "name": name, "old": old, "new": new}
+
+    def all_in(self, kind: str, phases: Iterable[str]) -> bool:
+        """True once ``kind`` is synced and every object is in one of ``phases``.
+
+        A kind with no objects counts as done, as the polling loops did.
+        """
+        wanted = set(phases)
+        return kind in self.synced and all(
+            p in wanted for p in self.phases.get(kind, {}).values())
+
+
+class FakeEventSource:
+    """Replay scripted events; a number in the script sleeps that many seconds.
+
+    Ends after the script unless ``hold`` is set, in which case it then
+    blocks forever like a live watch with nothing more to report.
+    """
+
+    def __init__(self, script: Iterable[dict[str, Any] | float], hold: bool = False):
+        self.script = list(script)
+        self.hold = hold
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        for step in self.script:
+            if isinstance(step, (int, float)):
+                await asyncio.sleep(step)
+            else:
+                yield step
+        if self.hold:
+            await asyncio.Event().wait()
+
+
+def iter_json_objects(buffer: str) -> tuple[list[Any], str]:
+    """Split back-to-back JSON documents, as ``oc get -w -o json`` prints them.
+
+    Returns (complete documents, unconsumed remainder).
+    """
+    decoder = json.JSONDecoder()
+    docs: list[Any] = []
+    pos = 0
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos >= len(buffer):
+            return docs, ""
+        try:
+            doc, pos = decoder.raw_decode(buffer, pos)
+        except ValueError:
+            return docs, buffer[pos:]
+        docs.append(doc)
+
+
+class OcEventSource:
+    """Watch events from the cluster: one ``oc get --watch`` per kind.
+
+    Each kind's watch is started before its initial listing so nothing
+    changes unobserved in between; when the server closes a watch, it is
+    restarted the same way.
+    """
+
+    def __init__(
+        self,
+        kinds: Iterable[str],
+        namespace: str = DEFAULT_COMPLIANCE_NAMESPACE,
+        oc: str = "oc",
+    ):
+        self.kinds = list(kinds)
+        self.namespace = namespace
+        self.oc = oc
+
+    def _argv(self, kind: str, *extra: str) -> list[str]:
+        resource, namespaced = KINDS[kind]
+        argv = [self.oc, "get", resource, "-o", "json", *extra]
+        if namespaced:
+            argv += ["-n", self.namespace]
+        return argv
+
+    async def _pump(self, kind: str, queue: asyncio.Queue) -> None:
+        while True:
+            watch = await asyncio.create_subprocess_exec(
+                *self._argv(kind, "--watch-only", "--output-watch-events"),
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            try:
+                listing = await asyncio.create_subprocess_exec(
+                    *self._argv(kind),
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+                out, _ = await listing.communicate()
+                try:
+                    items = json.loads(out or b"{}").get("items") or []
+                except ValueError:
+                    items = []
+                for obj in items:
+                    await queue.put({"kind": kind, "type": "ADDED", "object": obj})
+                await queue.put({"kind": kind, "type": "SYNCED"})
+
+                assert watch.stdout is not None
+                pending = ""
+                while True:
+                    chunk = await watch.stdout.read(65536)
+                    if not chunk:
+                        break
+                    docs, pending = iter_json_objects(pending + chunk.decode())
+                    for doc in docs:
+                        if isinstance(doc, dict) and "type" in doc:
+                            await queue.put({"kind": kind, "type": doc["type"],
+                                             "object": doc.get("object") or {}})
+            finally:
+                if watch.returncode is None:
+                    watch.kill()
+                await watch.wait()
+            await asyncio.sleep(1)
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        queue: asyncio.Queue = asyncio.Queue()
+        tasks = [asyncio.create_task(self._pump(kind, queue)) for kind in self.kinds]
+        # A pump only ends by failing (e.g. oc not found); hand the task to
+        # the consumer so the error is raised here instead of being lost.
+        for task in tasks:
+            task.add_done_callback(queue.put_nowait)
+        try:
+            while True:
+                event = await queue.get()
+                if isinstance(event, asyncio.Task):
+                    event.result()
+                    continue
+                yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def transitions(
+    source: Any, tracker: PhaseTracker | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield phase transitions from a raw event source."""
+    tracker = tracker if tracker is not None else PhaseTracker()
+    async with aclosing(aiter(source)) as events:
+        async for event in events:
+            change = tracker.apply(event)
+            if change is not None:
+                yield change
+
+
+async def wait_for_phases(
+    source: Any,
+    kind: str,
+    done: Iterable[str],
+    timeout: float | None = None,
+    on_change: Callable[[dict[str, Any]], None] | None = None,
+) -> bool:
+    """Wait until every object of ``kind`` is in one of the ``done`` phases.
+
+    Returns False if ``timeout`` seconds pass first. ``on_change`` is
+    called with each transition of ``kind``, for progress output.
+    """
+    done = set(done)
+    tracker = PhaseTracker()
+
+    async def run() -> bool:
+        # aclosing() stops the source's watches as soon as the wait ends.
+        async with aclosing(aiter(source)) as events:
+            async for event in events:
+                change = tracker.apply(event)
+                if change is not None and change["kind"] == kind and on_change:
+                    on_change(change)
+                if event["kind"] == kind and tracker.all_in(kind, done):
+                    return True
+        return False
+
+    try:
+        return await asyncio.wait_for(run(), timeout)
+    except asyncio.TimeoutError:
+        return False
+
+
+def format_change(change: dict[str, Any]) -> str:
+    old = change["old"] or "(new)"
+    new = change["new"] or "(deleted)"
+    return f"[{time.strftime('%H:%M:%S')}] {change['kind']}/{change['name']}: {old} -> {new}"
+
+
+def print_change(change: dict[str, Any]) -> None:
+    print(format_change(change), flush=True)
+
+
+async def print_events(source: Any, initial: bool = False) -> None:
+    """Print transitions; those from a kind's initial listing only if ``initial``."""
+    tracker = PhaseTracker()
+    async with aclosing(aiter(source)) as events:
+        async for event in events:
+            change = tracker.apply(event)
+            if change is not None and (initial or change["kind"] in tracker.synced):
+                print_change(change)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Watch compliance suites, scans and MachineConfigPools for phase changes"
+    )
+    parser.add_argument("-n", "--namespace", default=DEFAULT_COMPLIANCE_NAMESPACE,
+                        help=f"Compliance namespace (default: {DEFAULT_COMPLIANCE_NAMESPACE})")
+    parser.add_argument("--oc", default="oc", help="oc binary (default: oc on PATH)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_suites = sub.add_parser("wait-suites", help="Wait until every ComplianceSuite is DONE")
+    p_suites.add_argument("--timeout", default="30m", help="Give up after this long (default: 30m)")
+
+    p_mcps = sub.add_parser("wait-mcps", help="Wait until every MachineConfigPool is Updated")
+    p_mcps.add_argument("--timeout", default="45m", help="Give up after this long (default: 45m)")
+
+    p_events = sub.add_parser("events", help="Print phase transitions as they happen")
+    p_events.add_argument("--kinds", default=",".join(KINDS),
+                          help=f"Comma-separated kinds to watch (default: {','.join(KINDS)})")
+    p_events.add_argument("--initial", action="store_true",
+                          help="Also print the phases found by the initial listing")
+
+    args = parser.parse_args()
+
+    if args.command == "events":
+        kinds = [k for k in args.kinds.split(",") if k]
+        unknown = sorted(set(kinds) - set(KINDS))
+        if unknown:
+            parser.error(f"unknown kind(s): {', '.join(unknown)} (choose from {', '.join(KINDS)})")
+        source = OcEventSource(kinds, args.namespace, args.oc)
+        try:
+            asyncio.run(print_events(source, args.initial))
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            sys.exit(f"ERROR: cannot run {args.oc}: {e}")
+        return
+
+    kind, done = ("suite", {"DONE"}) if args.command == "wait-suites" else ("mcp", {"Updated"})
+    try:
+        timeout = parse_duration(args.timeout)
+    except ValueError as e:
+        parser.error(str(e))
+    source = OcEventSource([kind], args.namespace, args.oc)
+    try:
+        ok = asyncio.run(wait_for_phases(source, kind, done, timeout, print_change))
+    except OSError as e:
+        sys.exit(f"ERROR: cannot run {args.oc}: {e}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,17 @@ Shared utility functions for compliance scripts.
 Provides common functions used across multiple scripts to avoid
 code duplication:
 - safe_shortname: Convert file paths to safe shortnames for filenames
+- load_machineconfigs: Load MachineConfig documents with role/severity/name
 - parse_machineconfig_files: Parse MachineConfig YAMLs grouped by path/severity
 - parse_severity_filter: Validate and parse severity filter strings
+- encode_file_contents / decode_file_contents / decode_file_bytes: Ignition
+  file contents as data: URLs, optionally gzip-compressed
 - check_virtualenv: Check for virtual environment and warn if missing
 """
 from __future__ import annotations
 
+import base64
+import gzip
 import os
 import re
 import sys
@@ -24,6 +29,20 @@ except ImportError:
     print("Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
+# The libyaml loader is an order of magnitude faster on large remediation sets.
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+LIST_KINDS = {'List', 'MachineConfigList'}
+
+# Label that assigns a MachineConfig to a MachineConfigPool role.
+ROLE_LABEL = 'machineconfiguration.openshift.io/role'
+
+# Subdirectories of a remediation directory that hold copies or alternative
+# layouts of the same MachineConfigs: originals moved aside by
+# combine-machineconfigs-by-path.py, consolidate-machineconfigs.py output and
+# the .d layout from modular/create-modular-configs.sh. Tools that read the
+# whole set skip them; point --src-dir at one of them to read it instead.
+DERIVED_MC_DIRS = {'combo', 'consolidated', 'modular'}
 
 # Valid severity levels for compliance remediations
 VALID_SEVERITIES = {"high", "medium", "low"}
@@ -51,28 +70,84 @@ def safe_shortname(path: str) -> str:
     return name.strip('-')
 
 
-def parse_machineconfig_files(
+def encode_file_contents(content: str, compress: bool = False) -> dict[str, str]:
+    """Build an Ignition file ``contents`` object for content.
+
+    By default the source is a percent-encoded ``data:,`` URL. With compress,
+    the content is gzipped (with a fixed mtime, so output is reproducible) and
+    emitted as ``data:;base64,`` with ``compression: gzip``, unless that would
+    be longer than the plain source, as it is for very short files.
+    """
+    plain = "data:," + urllib.parse.quote(content, safe='')
+    if compress:
+        packed = base64.b64encode(gzip.compress(content.encode(), mtime=0)).decode()
+        source = "data:;base64," + packed
+        if len(source) < len(plain):
+            return {'compression': 'gzip', 'source': source}
+    return {'source': plain}
+
+
+def decode_file_bytes(contents: dict[str, Any]) -> bytes | None:
+    """Decode an Ignition file ``contents`` object with a data: URL source.
+
+    Handles percent-encoded and base64 sources, with or without gzip
+    compression. Returns None for sources that are not data: URLs.
+    """
+    source = contents.get('source') or ''
+    if not source.startswith('data:'):
+        return None
+    header, _, data = source[5:].partition(',')
+    if header.endswith(';base64'):
+        raw = base64.b64decode(data)
+    else:
+        raw = urllib.parse.unquote_to_bytes(data)
+    if contents.get('compression') == 'gzip':
+        raw = gzip.decompress(raw)
+    return raw
+
+
+def decode_file_contents(contents: dict[str, Any]) -> str | None:
+    """Like decode_file_bytes, decoded as UTF-8 text."""
+    raw = decode_file_bytes(contents)
+    return None if raw is None else raw.decode()
+
+
+def _expand_lists(docs: list[Any]) -> list[dict[str, Any]]:
+    """Replace List documents (oc get machineconfigs -o yaml) with their items."""
+    expanded: list[dict[str, Any]] = []
+    for doc in docs:
+        if not isinstance(doc, dict):
+            continue
+        if doc.get('kind') in LIST_KINDS:
+            expanded.extend(item for item in doc.get('items') or [] if isinstance(item, dict))
+        else:
+            expanded.append(doc)
+    return expanded
+
+
+def load_machineconfigs(
     src_dir: str,
     exclude_dirs: set[str] | None = None,
-) -> tuple[
-    dict[tuple[str, str | None], list[dict[str, Any]]],
-    list[tuple[str, str]],
-]:
-    """Parse all MachineConfig YAMLs under src_dir (recursively) and group by
-    (file path, severity), where severity is inferred from directory names
-    containing one of: high, medium, low. If none found, severity is None.
+) -> tuple[list[dict[str, Any]], list[tuple[str, str]]]:
+    """Load every MachineConfig document in the YAMLs under src_dir (recursively).
+
+    Items of List documents, as written by oc get machineconfigs -o yaml,
+    are loaded too. Severity is inferred from directory names containing one of: high,
+    medium, low. If none found, severity is None.
 
     Args:
         src_dir: Source directory to scan for YAML files.
         exclude_dirs: Optional set of directory names to skip during traversal.
 
     Returns:
-        (files_map, skipped) where:
-        - files_map maps (path, severity) to list of dicts with keys:
-          source_file, role, lines, basename
+        (machineconfigs, skipped) where:
+        - machineconfigs is a list of dicts with keys: name (metadata.name,
+          or the file name without .yaml), role (the role label, default
+          worker), severity, source_file, basename and doc (the parsed
+          MachineConfig), in directory walk order
         - skipped is a list of (filepath, error) tuples for unparseable files.
     """
-    files_map = defaultdict(list)
+    machineconfigs = []
     skipped = []
 
     if exclude_dirs is None:
@@ -100,36 +175,70 @@ def parse_machineconfig_files(
 
             try:
                 with open(fpath) as f:
-                    docs = list(yaml.safe_load_all(f))
+                    docs = list(yaml.load_all(f, Loader=YAML_LOADER))
             except yaml.YAMLError as e:
                 print(f"WARNING: Skipping {fpath}: YAML parse error: {e}",
                       file=sys.stderr)
                 skipped.append((fpath, str(e)))
                 continue
 
-            for doc in docs:
-                if not doc or doc.get('kind') != 'MachineConfig':
+            for doc in _expand_lists(docs):
+                if doc.get('kind') != 'MachineConfig':
                     continue
 
+                metadata = doc.get('metadata') or {}
                 # Extract role from labels or default to worker
-                role = doc.get('metadata', {}).get('labels', {}).get(
-                    'machineconfiguration.openshift.io/role', 'worker'
-                )
-
-                file_entries = doc.get('spec', {}).get('config', {}).get(
-                    'storage', {}).get('files', [])
-                for file_entry in file_entries:
-                    file_path = file_entry.get('path')
-                    source = file_entry.get('contents', {}).get('source')
-                    if file_path and source and source.startswith('data:,'):
-                        decoded = urllib.parse.unquote(source[6:])
-                        lines = [line for line in decoded.splitlines() if line.strip()]
-                        files_map[(file_path, severity)].append({
-                            'source_file': os.path.relpath(fpath, src_dir),
-                            'role': role,
-                            'lines': lines,
-                            'basename': os.path.basename(fpath),
-                        })
+                role = (metadata.get('labels') or {}).get(ROLE_LABEL, 'worker')
+                machineconfigs.append({
+                    'name': metadata.get('name') or fname[:-len('.yaml')],
+                    'role': role,
+                    'severity': severity,
+                    'source_file': os.path.relpath(fpath, src_dir),
+                    'basename': fname,
+                    'doc': doc,
+                })
+
+    return machineconfigs, skipped
+
+
+def parse_machineconfig_files(
+    src_dir: str,
+    exclude_dirs: set[str] | None = None,
+) -> tuple[
+    dict[tuple[str, str | None], list[dict[str, Any]]],
+    list[tuple[str, str]],
+]:
+    """Parse all MachineConfig YAMLs under src_dir (recursively) and group by
+    (file path, severity), where severity is inferred from directory names
+    containing one of: high, medium, low. If none found, severity is None.
+
+    Args:
+        src_dir: Source directory to scan for YAML files.
+        exclude_dirs: Optional set of directory names to skip during traversal.
+
+    Returns:
+        (files_map, skipped) where:
+        - files_map maps (path, severity) to list of dicts with keys:
+          source_file, role, lines, basename
+        - skipped is a list of (filepath, error) tuples for unparseable files.
+    """
+    files_map = defaultdict(list)
+    machineconfigs, skipped = load_machineconfigs(src_dir, exclude_dirs)
+
+    for mc in machineconfigs:
+        file_entries = mc['doc'].get('spec', {}).get('config', {}).get(
+            'storage', {}).get('files', [])
+        for file_entry in file_entries:
+            file_path = file_entry.get('path')
+            decoded = decode_file_contents(file_entry.get('contents') or {})
+            if file_path and decoded is not None:
+                lines = [line for line in decoded.splitlines() if line.strip()]
+                files_map[(file_path, mc['severity'])].append({
+                    'source_file': mc['source_file'],
+                    'role': mc['role'],
+                    'lines': lines,
+                    'basename': mc['basename'],
+                })
 
     return files_map, skipped
 
@@ -13,12 +13,14 @@ source "$SCRIPT_DIR/lib/common.sh"
 source_dir="complianceremediations"
 modular_dir="complianceremediations/modular"
 severity="high"
+compress=false
 
 usage() {
-	echo "Usage: $0 [-s severity] [-i input-dir] [-o output-dir] [-h]"
+	echo "Usage: $0 [-s severity] [-i input-dir] [-o output-dir] [-z] [-h]"
 	echo "  -s  Severity level(s) to process: high,medium,low (default: high)"
 	echo "  -i  Input directory for remediation YAMLs (default: $source_dir)"
 	echo "  -o  Output directory for modular YAMLs (default: $modular_dir)"
+	echo "  -z  Gzip-compress file contents (compression: gzip) where smaller"
 	echo "  -h  Show this help message"
 	echo ""
 	echo "This script creates modular MachineConfig files using .d directory includes."
@@ -30,11 +32,12 @@ usage() {
 	exit 1
 }
 
-while getopts "s:i:o:h" opt; do
+while getopts "s:i:o:zh" opt; do
 	case $opt in
 	s) severity="$OPTARG" ;;
 	i) source_dir="$OPTARG" ;;
 	o) modular_dir="$OPTARG" ;;
+	z) compress=true ;;
 	h) usage ;;
 	*) usage ;;
 	esac
@@ -67,10 +70,11 @@ log_info "  Output: $modular_dir"
 log_info "  Severity: $severity"
 echo ""
 
-python3 "$MODULAR_DIR/split-machineconfigs-modular.py" \
-	--src-dir "$source_dir" \
-	--out-dir "$modular_dir" \
-	-s "$severity"
+split_args=(--src-dir "$source_dir" --out-dir "$modular_dir" -s "$severity")
+if [[ "$compress" == true ]]; then
+	split_args+=(--compress)
+fi
+python3 "$MODULAR_DIR/split-machineconfigs-modular.py" "${split_args[@]}"
 
 # Check if any files were created
 if [[ ! -d "$modular_dir" ]] || [[ -z "$(ls -A "$modular_dir" 2>/dev/null)" ]]; then
@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import os
 import sys
-import urllib.parse
 import yaml
 import argparse
 from typing import Any
@@ -17,6 +16,7 @@ from typing import Any
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from lib.compliance_utils import (  # noqa: E402
     safe_shortname, parse_machineconfig_files, parse_severity_filter,
+    encode_file_contents,
 )
 
 
@@ -69,6 +69,7 @@ def generate_base_yaml(
     config: dict[str, str],
     out_dir: str,
     counter: int,
+    compress: bool = False,
 ) -> str:
     """Generate a base MachineConfig that enables the .d include directory."""
     shortname = safe_shortname(path)
@@ -82,7 +83,7 @@ def generate_base_yaml(
     include_path = os.path.join(config['include_dir'], config['base_file'])
     content = config['base_content']
 
-    encoded_content = urllib.parse.quote(content + '\n', safe='')
+    contents = encode_file_contents(content + '\n', compress)
     yaml_doc = {
         'apiVersion': 'machineconfiguration.openshift.io/v1',
         'kind': 'MachineConfig',
@@ -100,9 +101,7 @@ def generate_base_yaml(
                 'storage': {
                     'files': [
                         {
-                            'contents': {
-                                'source': f"data:,{encoded_content}"
-                            },
+                            'contents': contents,
                             'mode': 0o644,
                             'overwrite': True,
                             'path': include_path
@@ -130,7 +129,8 @@ def generate_modular_yaml(
         remediation_info: dict[str, Any],
         config: dict[str, str],
         out_dir: str,
-        counter: int) -> str | None:
+        counter: int,
+        compress: bool = False) -> str | None:
     """Generate a modular MachineConfig for a specific remediation."""
     source_file = remediation_info['source_file']
     role = remediation_info['role']
@@ -167,8 +167,7 @@ def generate_modular_yaml(
     config_filename = f"{counter:02d}-{desc}{config['file_extension']}"
     config_path = os.path.join(config['include_dir'], config_filename)
 
-    content = '\n'.join(settings) + '\n'
-    encoded_content = urllib.parse.quote(content, safe='')
+    contents = encode_file_contents('\n'.join(settings) + '\n', compress)
 
     yaml_doc = {
         'apiVersion': 'machineconfiguration.openshift.io/v1',
@@ -187,9 +186,7 @@ def generate_modular_yaml(
                 'storage': {
                     'files': [
                         {
-                            'contents': {
-                                'source': f"data:,{encoded_content}"
-                            },
+                            'contents': contents,
                             'mode': 0o644,
                             'overwrite': True,
                             'path': config_path
@@ -215,6 +212,7 @@ def write_combo_yaml(
     severity: str | None,
     sources: list[dict[str, Any]],
     out_dir: str,
+    compress: bool = False,
 ) -> str:
     """Write a combined MachineConfig YAML (fallback for non-modular paths)."""
     all_lines = set()
@@ -230,8 +228,7 @@ def write_combo_yaml(
         filename = f"{shortname}-combo.yaml"
         name = f"75-{shortname}-combo"
 
-    content = '\n'.join(deduped_lines) + '\n'
-    encoded_content = urllib.parse.quote(content, safe='')
+    contents = encode_file_contents('\n'.join(deduped_lines) + '\n', compress)
 
     yaml_doc = {
         'apiVersion': 'machineconfiguration.openshift.io/v1',
@@ -250,9 +247,7 @@ def write_combo_yaml(
                 'storage': {
                     'files': [
                         {
-                            'contents': {
-                                'source': f"data:,{encoded_content}"
-                            },
+                            'contents': contents,
                             'mode': 0o600,
                             'overwrite': True,
                             'path': path
@@ -290,6 +285,11 @@ def main() -> None:
         '-s', '--severity', default=None,
         help='Comma-separated severities to include: high,medium,low'
     )
+    parser.add_argument(
+        '--compress', action='store_true',
+        help='Gzip and base64-encode file contents (compression: gzip) '
+             'where that is smaller than the plain data: URL'
+    )
     args = parser.parse_args()
 
     src_dir = args.src_dir
@@ -325,13 +325,14 @@ def main() -> None:
                     severity or 'all'})")
 
             # Generate base file (only once per path)
-            base_file = generate_base_yaml(path, severity, config, out_dir, 75)
+            base_file = generate_base_yaml(
+                path, severity, config, out_dir, 75, args.compress)
             created_files.append(base_file)
 
             # Generate individual modular files
             for idx, source in enumerate(sources, start=76):
                 modular_file = generate_modular_yaml(
-                    path, severity, source, config, out_dir, idx
+                    path, severity, source, config, out_dir, idx, args.compress
                 )
                 if modular_file:
                     created_files.append(modular_file)
@@ -340,7 +341,8 @@ def main() -> None:
             sev = severity or 'all'
             print(
                 f"\nProcessing non-modular path: {path} (severity: {sev})")
-            combo_file = write_combo_yaml(path, severity, sources, out_dir)
+            combo_file = write_combo_yaml(
+                path, severity, sources, out_dir, args.compress)
             created_files.append(combo_file)
 
     print(f"\n{'=' * 60}")
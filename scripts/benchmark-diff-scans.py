@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark diff-scans.py check maps against the dict-per-check layout.
+
+Generates synthetic scan exports (many checks, a few percent of statuses
+flipping between consecutive exports), then for both implementations maps
+every export and diffs each consecutive pair, reporting wall time and peak
+traced memory.
+
+The "dict" implementation is the previous build_check_map / diff loop: one
+dict per check and a sorted per-name status comparison. The "compact"
+implementation is the current diff-scans.py: slotted records, interned
+strings, and set operations on status-partitioned name sets.
+
+Usage:
+    python3 scripts/benchmark-diff-scans.py
+    python3 scripts/benchmark-diff-scans.py --checks 50000 --exports 20
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import random
+import time
+import tracemalloc
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import Any, Callable
+
+_spec = spec_from_file_location(
+    "diff_scans", os.path.join(os.path.dirname(__file__), "diff-scans.py"))
+assert _spec and _spec.loader
+diff_scans = module_from_spec(_spec)
+_spec.loader.exec_module(diff_scans)
+
+SEVERITIES = diff_scans.SEVERITIES
+PLATFORMS = ["ocp", "rhcos"]
+PROFILES = ["E8", "CIS", "Moderate", "PCI-DSS"]
+
+
+def synthetic_exports(n_checks: int, n_exports: int, flip_rate: float,
+                      seed: int = 0) -> list[dict[str, Any]]:
+    """Build exports that share check names and drift by flip_rate each step."""
+    rng = random.Random(seed)
+    base = [
+        {
+            "name": f"rhcos4-{rng.choice(PROFILES).lower()}-worker-check-{i:06d}",
+            "severity": rng.choice(SEVERITIES),
+            "platform": rng.choice(PLATFORMS),
+            "profile": rng.choice(PROFILES),
+            "status": rng.choice(["PASS", "PASS", "PASS", "FAIL", "MANUAL"]),
+        }
+        for i in range(n_checks)
+    ]
+    exports = []
+    for step in range(n_exports):
+        if step:
+            for item in rng.sample(base, int(n_checks * flip_rate)):
+                item["status"] = "FAIL" if item["status"] == "PASS" else "PASS"
+        data: dict[str, Any] = {
+            "version": "4.22",
+            "scan_date": f"2026-01-{step + 1:02d}T00:00:00Z",
+            "summary": {},
+            "remediations": {s: [] for s in SEVERITIES},
+            "passing_checks": {s: [] for s in SEVERITIES},
+            "manual_checks": [],
+        }
+        for item in base:
+            # Round-trip through JSON so every export owns fresh strings,
+            # as it would when loaded from separate files.
+            entry = json.loads(json.dumps({k: v for k, v in item.items() if k != "status"}))
+            if item["status"] == "FAIL":
+                data["remediations"][item["severity"]].append(entry)
+            elif item["status"] == "PASS":
+                data["passing_checks"][item["severity"]].append(entry)
+            else:
+                data["manual_checks"].append(entry)
+        exports.append(data)
+    return exports
+
+
+def dict_check_map(data: dict[str, Any]) -> dict[str, dict[str, str]]:
+    """Previous build_check_map: a fresh dict per check."""
+    checks = {}
+    for section, status in [("remediations", "FAIL"), ("passing_checks", "PASS")]:
+        for severity in SEVERITIES:
+            for item in data.get(section, {}).get(severity, []):
+                checks[item["name"]] = {
+                    "status": status,
+                    "severity": item.get("severity", severity),
+                    "platform": item.get("platform", ""),
+                    "profile": item.get("profile", ""),
+                }
+    for item in data.get("manual_checks", []):
+        checks[item["name"]] = {
+            "status": "MANUAL",
+            "severity": item.get("severity", ""),
+            "platform": item.get("platform", ""),
+            "profile": item.get("profile", ""),
+        }
+    return checks
+
+
+def dict_diff(old: dict[str, dict[str, str]], new: dict[str, dict[str, str]]) -> int:
+    """Previous diff loop: sort the common names and compare one by one."""
+    changed = 0
+    for name in sorted(set(old) & set(new)):
+        if old[name]["status"] != new[name]["status"]:
+            changed += 1
+    return changed
+
+
+def compact_diff(old: Any, new: Any) -> int:
+    return sum(len(names) for names in diff_scans.status_changes(old, new).values())
+
+
+def run(exports: list[dict[str, Any]], build: Callable[[dict[str, Any]], Any],
+        diff: Callable[[Any, Any], int]) -> tuple[float, int, int]:
+    """Map every export, diff consecutive pairs; return (seconds, peak bytes, changes).
+
+    Time and memory are measured in separate passes because tracemalloc
+    slows allocation-heavy code enough to distort the timing.
+    """
+    def once() -> tuple[list[Any], int]:
+        maps = [build(data) for data in exports]
+        return maps, sum(diff(a, b) for a, b in zip(maps, maps[1:]))
+
+    gc.collect()
+    start = time.perf_counter()
+    maps, changes = once()
+    elapsed = time.perf_counter() - start
+    del maps
+
+    gc.collect()
+    tracemalloc.start()
+    maps, _ = once()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del maps
+    return elapsed, peak, changes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--checks", type=int, default=20000,
+                        help="Checks per export (default: 20000)")
+    parser.add_argument("--exports", type=int, default=10,
+                        help="Number of exports in the series (default: 10)")
+    parser.add_argument("--flip-rate", type=float, default=0.02,
+                        help="Fraction of statuses flipped per step (default: 0.02)")
+    args = parser.parse_args()
+
+    exports = synthetic_exports(args.checks, args.exports, args.flip_rate)
+    print(f"{args.exports} exports x {args.checks} checks, "
+          f"{args.flip_rate:.0%} flips per step")
+
+    results = {
+        "dict": run(exports, dict_check_map, dict_diff),
+        "compact": run(exports, diff_scans.build_check_map, compact_diff),
+    }
+    for label, (seconds, peak, changes) in results.items():
+        print(f"  {label:8s} {seconds * 1000:9.1f} ms  {peak / 1024 ** 2:8.1f} MiB peak  "
+              f"{changes} changes")
+
+    if results["dict"][2] != results["compact"][2]:
+        raise SystemExit("Implementations disagree on the number of changes")
+    d_time, d_peak, _ = results["dict"]
+    c_time, c_peak, _ = results["compact"]
+    print(f"  speedup {d_time / c_time:.2f}x, memory {c_peak / d_peak:.0%} of dict layout")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark the dashboard's Jekyll build against another git revision.
+
+Builds docs/ from the working tree and from a baseline revision (checked
+out into a temporary git worktree), several times each, and reports the
+median wall time plus Jekyll's --profile rows for the layouts that render
+per group (group.html, remediations.html, hardened.html).
+
+Use it to measure layout changes such as the precomputed group-index
+data files (scripts/generate-group-index.py): run with --baseline set to
+the commit before the change.
+
+Requires Jekyll installed for docs/Gemfile (make install-jekyll).
+
+Usage:
+    python3 scripts/benchmark-jekyll-build.py --baseline HEAD~1
+    python3 scripts/benchmark-jekyll-build.py --baseline origin/main --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+PROFILED_LAYOUTS = ("_layouts/group.html", "_layouts/remediations.html", "_layouts/hardened.html")
+
+
+def build(docs_dir: str, dest: str) -> tuple[float, list[str]]:
+    """Run one profiled Jekyll build; return (seconds, profile rows for PROFILED_LAYOUTS)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        ["bundle", "exec", "jekyll", "build", "--profile", "--destination", dest],
+        cwd=docs_dir, capture_output=True, text=True,
+        env={**os.environ, "BUNDLE_GEMFILE": os.path.join(docs_dir, "Gemfile")},
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.stderr.write(result.stdout + result.stderr)
+        raise SystemExit(f"jekyll build failed in {docs_dir}")
+    rows = [line.strip() for line in result.stdout.splitlines()
+            if any(layout in line for layout in PROFILED_LAYOUTS)]
+    return elapsed, rows
+
+
+def bench(label: str, docs_dir: str, runs: int, dest: str) -> float:
+    times = []
+    rows: list[str] = []
+    for _ in range(runs):
+        elapsed, rows = build(docs_dir, dest)
+        times.append(elapsed)
+    median = statistics.median(times)
+    print(f"{label}: median {median:.2f}s over {runs} runs "
+          f"(min {min(times):.2f}s, max {max(times):.2f}s)")
+    for row in rows:
+        print(f"    {row}")
+    return median
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default="HEAD",
+                        help="Git revision to compare the working tree against (default: HEAD)")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="Builds per tree; the median is reported (default: 3)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="jekyll-bench-") as tmp:
+        worktree = os.path.join(tmp, "baseline")
+        subprocess.run(["git", "-C", REPO_ROOT, "worktree", "add", "--detach", "--quiet",
+                        worktree, args.baseline], check=True)
+        try:
+            before = bench(f"baseline ({args.baseline})", os.path.join(worktree, "docs"),
+                           args.runs, os.path.join(tmp, "site-baseline"))
+            after = bench("working tree", os.path.join(REPO_ROOT, "docs"), args.runs,
+                          os.path.join(tmp, "site-working"))
+        finally:
+            subprocess.run(["git", "-C", REPO_ROOT, "worktree", "remove", "--force", worktree],
+                           check=False)
+    print(f"speedup {before / after:.2f}x ({before - after:.2f}s saved per build)")
+
+
+if __name__ == "__main__":
+    main()
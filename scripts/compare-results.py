@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Compare two ComplianceCheckResult dumps taken before and after remediation.
+
+Used by verify-all-groups.sh. Each dump is ``oc get compliancecheckresult
+-o json`` output and can cover every profile on the cluster, so the items
+array is streamed one result at a time rather than loaded whole. Status
+totals (overall and per remediation group) are counted in the same pass
+that builds the check maps; FAIL -> PASS and PASS -> FAIL flips then come
+from diff-scans.py's status-partitioned CheckMap set operations.
+
+Results are mapped to tracking.json groups by their rule name (the
+``compliance.openshift.io/rule`` annotation, else the check name without
+its scan prefix).
+
+Usage:
+    python3 scripts/compare-results.py before-results.json after-results.json
+    python3 scripts/compare-results.py --tracking docs/_data/tracking.json \\
+        --output diff-report.json before-results.json after-results.json
+    python3 scripts/compare-results.py --json before-results.json after-results.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import IO, Any, Iterator
+
+_spec = spec_from_file_location(
+    "diff_scans", os.path.join(os.path.dirname(__file__), "diff-scans.py"))
+assert _spec and _spec.loader
+diff_scans = module_from_spec(_spec)
+_spec.loader.exec_module(diff_scans)
+
+FAIL, PASS, MANUAL = diff_scans.FAIL, diff_scans.PASS, diff_scans.MANUAL
+STATUS_CODES = {status: code for code, status in enumerate(diff_scans.STATUSES)}
+# Distinct from 1 (tracebacks, unreadable dumps) and 2 (usage errors) so
+# callers can tell regressions from a comparison that did not run.
+EXIT_REGRESSIONS = 3
+
+RULE_ANNOTATION = "compliance.openshift.io/rule"
+SCAN_LABEL = "compliance.openshift.io/scan-name"
+PROFILE_PREFIXES = [
+    "rhcos4-e8-master-", "rhcos4-e8-worker-", "rhcos4-e8-",
+    "rhcos4-moderate-master-", "rhcos4-moderate-worker-", "rhcos4-moderate-",
+    "ocp4-e8-", "ocp4-cis-", "ocp4-moderate-", "ocp4-pci-dss-",
+]
+CHUNK_SIZE = 1 << 20
+LIST_LIMIT = 20
+
+
+class _JsonReader:
+    """Incremental reader for one large JSON document.
+
+    Values are decoded one at a time with JSONDecoder.raw_decode, refilling
+    the buffer from the file whenever a value runs past its end, so memory
+    stays bounded by the largest single value rather than the file.
+    """
+
+    def __init__(self, f: IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ("" at end of file)."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> str:
+        ch = self.peek()
+        if ch not in expected:
+            raise ValueError(f"Expected one of {expected!r} at offset {self.pos}, got {ch!r}")
+        self.pos += 1
+        return ch
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal that ends exactly at the buffer edge may
+            # continue in the next chunk.
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_results(f: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """Yield each item of an ``oc get ... -o json`` List (or a bare array)."""
+    reader = _JsonReader(f, chunk_size)
+
+    def array() -> Iterator[dict[str, Any]]:
+        reader.take("[")
+        if reader.peek() == "]":
+            reader.take("]")
+            return
+        while True:
+            yield reader.value()
+            if reader.take(",]") == "]":
+                return
+
+    if reader.peek() == "[":
+        yield from array()
+        return
+    reader.take("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.take(":")
+        if key == "items":
+            yield from array()
+        else:
+            reader.value()
+        if reader.take(",}") == "}":
+            return
+
+
+def rule_name(item: dict[str, Any]) -> str:
+    """Return the rule a check result evaluates, as tracking.json keys it."""
+    metadata = item.get("metadata") or {}
+    name = metadata.get("name", "")
+    rule = (metadata.get("annotations") or {}).get(RULE_ANNOTATION)
+    if rule:
+        return rule
+    scan = (metadata.get("labels") or {}).get(SCAN_LABEL)
+    if scan and name.startswith(f"{scan}-"):
+        return name[len(scan) + 1:]
+    for prefix in PROFILE_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def load_results(
+    f: IO[str], rule_groups: dict[str, str]
+) -> tuple[Any, Counter, dict[str, Counter], dict[str, str]]:
+    """Stream one dump into (check map, status counts, per-group counts, name -> group).
+
+    Only FAIL, PASS and MANUAL results enter the check map; every status
+    is counted.
+    """
+    checks = diff_scans.CheckMap()
+    by_status = checks.by_status
+    counts: Counter = Counter()
+    group_counts: dict[str, Counter] = defaultdict(Counter)
+    name_groups: dict[str, str] = {}
+    intern = sys.intern
+    for item in iter_results(f):
+        name = (item.get("metadata") or {}).get("name")
+        if not name:
+            continue
+        status = item.get("status", "UNKNOWN")
+        counts[status] += 1
+        gid = rule_groups.get(rule_name(item)) if rule_groups else None
+        if gid:
+            group_counts[gid][status] += 1
+            name_groups[name] = gid
+        code = STATUS_CODES.get(status)
+        if code is None:
+            continue
+        name = intern(name)
+        platform = "rhcos" if name.startswith("rhcos4-") else "ocp" if name.startswith("ocp4-") else ""
+        checks[name] = diff_scans.check_record(code, item.get("severity", ""), platform, "")
+        by_status[code].add(name)
+    return checks, counts, group_counts, name_groups
+
+
+def compare_results(
+    before: IO[str], after: IO[str], tracking: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Compare two ComplianceCheckResult dumps and return the report dict."""
+    tracking = tracking or {}
+    rule_groups = {
+        rule: info["group"]
+        for rule, info in tracking.get("remediations", {}).items()
+        if info.get("group")
+    }
+    old, old_counts, old_groups, old_names = load_results(before, rule_groups)
+    new, new_counts, new_groups, new_names = load_results(after, rule_groups)
+
+    changes = diff_scans.status_changes(old, new)
+    flipped_pass = sorted(changes.get((FAIL, PASS), ()))
+    flipped_fail = sorted(changes.get((PASS, FAIL), ()))
+    unchanged_fail = sorted(old.by_status[FAIL] & new.by_status[FAIL])
+
+    report: dict[str, Any] = {
+        "before_pass": old_counts["PASS"],
+        "before_fail": old_counts["FAIL"],
+        "after_pass": new_counts["PASS"],
+        "after_fail": new_counts["FAIL"],
+        "flipped_to_pass": flipped_pass,
+        "flipped_to_fail": flipped_fail,
+        "unchanged_fail": unchanged_fail,
+        "before_counts": dict(sorted(old_counts.items())),
+        "after_counts": dict(sorted(new_counts.items())),
+    }
+    if not rule_groups:
+        return report
+
+    name_groups = {**old_names, **new_names}
+    titles = tracking.get("groups", {})
+    groups: dict[str, dict[str, Any]] = {}
+    for gid in titles:
+        if gid not in old_groups and gid not in new_groups:
+            continue
+        groups[gid] = {
+            "title": (titles.get(gid) or {}).get("title", ""),
+            "before": {"pass": old_groups[gid]["PASS"], "fail": old_groups[gid]["FAIL"]},
+            "after": {"pass": new_groups[gid]["PASS"], "fail": new_groups[gid]["FAIL"]},
+            "fixed": [], "regressed": [], "still_failing": [],
+        }
+    for key, names in (("fixed", flipped_pass), ("regressed", flipped_fail),
+                       ("still_failing", unchanged_fail)):
+        for name in names:
+            gid = name_groups.get(name)
+            if gid in groups:
+                groups[gid][key].append(name)
+    report["groups"] = groups
+    return report
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print the human-readable verification report."""
+    flipped_pass = report["flipped_to_pass"]
+    flipped_fail = report["flipped_to_fail"]
+
+    print(f"\n{'=' * 60}")
+    print("  FULL REMEDIATION VERIFICATION REPORT")
+    print(f"{'=' * 60}")
+    print(f"  Before: {report['before_pass']} PASS / {report['before_fail']} FAIL")
+    print(f"  After:  {report['after_pass']} PASS / {report['after_fail']} FAIL")
+    print(f"  Flipped FAIL->PASS: {len(flipped_pass)}")
+    print(f"  Flipped PASS->FAIL: {len(flipped_fail)}")
+    print(f"  Unchanged FAIL:     {len(report['unchanged_fail'])}")
+    print(f"{'=' * 60}")
+
+    if flipped_pass:
+        print(f"\n  Checks fixed ({len(flipped_pass)}):")
+        for n in flipped_pass[:LIST_LIMIT]:
+            print(f"    + {n}")
+        if len(flipped_pass) > LIST_LIMIT:
+            print(f"    ... and {len(flipped_pass) - LIST_LIMIT} more")
+
+    if flipped_fail:
+        print(f"\n  REGRESSIONS ({len(flipped_fail)}):")
+        for n in flipped_fail:
+            print(f"    ! {n}")
+
+    groups = report.get("groups")
+    if groups:
+        width = max(len(gid) for gid in groups)
+        print("\n  Per group (FAIL before -> after):")
+        for gid, g in groups.items():
+            line = (f"    {gid:{width}s}  {g['before']['fail']:3d} -> {g['after']['fail']:3d}"
+                    f"  fixed {len(g['fixed'])}")
+            if g["regressed"]:
+                line += f"  REGRESSED {len(g['regressed'])}"
+            print(f"{line}  {g['title']}")
+
+    print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare ComplianceCheckResult dumps taken before and after remediation"
+    )
+    parser.add_argument("before", help="oc get compliancecheckresult -o json dump (baseline)")
+    parser.add_argument("after", help="oc get compliancecheckresult -o json dump (post-remediation)")
+    parser.add_argument("--tracking", help="tracking.json for per-group results")
+    parser.add_argument("--output", metavar="FILE", help="Also write the JSON report to FILE")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the JSON report instead of the text report")
+    args = parser.parse_args()
+
+    tracking = None
+    if args.tracking:
+        with open(args.tracking) as f:
+            tracking = json.load(f)
+    with open(args.before) as before, open(args.after) as after:
+        report = compare_results(before, after, tracking)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+
+    sys.exit(EXIT_REGRESSIONS if report["flipped_to_fail"] else 0)
+
+
+if __name__ == "__main__":
+    main()
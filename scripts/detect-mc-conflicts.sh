@@ -126,7 +126,7 @@ for dir in "${DIRS[@]}"; do
 			printf "%s\t%s\t%s\n" "$ign_ver" "$role" "$mc_base" >>"$IGNITION_MAP"
 		fi
 
-		# Collect sysctl values from data:, encoded sysctl.d files
+		# Collect sysctl values from data: encoded (optionally gzip) sysctl.d files
 		file_paths=$(yq e '.spec.config.storage.files[].path' "$yaml_file" 2>/dev/null || true)
 		if [[ -n "$file_paths" ]]; then
 			while IFS= read -r fp; do
@@ -136,8 +136,9 @@ for dir in "${DIRS[@]}"; do
 				# Extract sysctl key=value pairs from sysctl.d files
 				if [[ "$fp" == /etc/sysctl.d/* || "$fp" == /etc/sysctl.conf ]]; then
 					source_data=$(yq e ".spec.config.storage.files[] | select(.path == \"$fp\") | .contents.source" "$yaml_file" 2>/dev/null || true)
-					if [[ "$source_data" == data:,* ]]; then
-						decoded=$(python3 -c "import urllib.parse,sys; print(urllib.parse.unquote(sys.argv[1][6:]))" "$source_data" 2>/dev/null || true)
+					compression=$(yq e ".spec.config.storage.files[] | select(.path == \"$fp\") | .contents.compression // \"\"" "$yaml_file" 2>/dev/null || true)
+					if [[ "$source_data" == data:* ]]; then
+						decoded=$(PYTHONPATH="$SCRIPT_DIR" python3 -c "import sys; from lib.compliance_utils import decode_file_contents; print(decode_file_contents({'source': sys.argv[1], 'compression': sys.argv[2]}) or '')" "$source_data" "$compression" 2>/dev/null || true)
 						if [[ -n "$decoded" ]]; then
 							while IFS= read -r line; do
 								line=$(echo "$line" | sed 's/#.*//; s/^[[:space:]]*//; s/[[:space:]]*$//')
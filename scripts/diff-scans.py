@@ -6,10 +6,15 @@ Shows status changes (PASS->FAIL, FAIL->PASS), new checks, removed checks,
 and summary delta. Useful for detecting regressions after cluster rebuilds,
 OCP upgrades, or content image updates.
 
+With --series, takes an ordered list of exports (oldest first), loads each
+once, and reports a per-check status timeline with the scan date each check
+first regressed (PASS -> FAIL) and first got fixed (FAIL -> PASS).
+
 Usage:
     python3 scripts/diff-scans.py <old.json> <new.json>
     python3 scripts/diff-scans.py docs/_data/ocp-4_22-baseline-2026-05-05.json docs/_data/ocp-4_22.json
     python3 scripts/diff-scans.py --json <old.json> <new.json>
+    python3 scripts/diff-scans.py --series <oldest.json> ... <newest.json>
 """
 from __future__ import annotations
 
@@ -20,59 +25,146 @@ from typing import Any
 
 SEVERITIES = ["high", "medium", "low"]
 
+# Statuses are stored as small ints; STATUSES maps them back to names.
+FAIL, PASS, MANUAL = 0, 1, 2
+STATUSES = ("FAIL", "PASS", "MANUAL")
+
+
+class CheckRecord:
+    """Compact per-check record: status code plus interned metadata strings.
+
+    Records are shared between checks and must not be mutated. They support
+    read-only mapping access (record["status"], record.get(...)) so they can
+    stand in for the dict-per-check form the map used to hold.
+    """
+
+    __slots__ = ("code", "severity", "platform", "profile")
+
+    def __init__(self, code: int, severity: str, platform: str, profile: str) -> None:
+        self.code = code
+        self.severity = severity
+        self.platform = platform
+        self.profile = profile
+
+    @property
+    def status(self) -> str:
+        return STATUSES[self.code]
 
-def build_check_map(data: dict[str, Any]) -> dict[str, dict[str, str]]:
-    """Build a name -> {status, severity, platform, profile} map from export data."""
-    checks = {}
-    for section, status in [("remediations", "FAIL"), ("passing_checks", "PASS")]:
-        for severity in SEVERITIES:
-            for item in data.get(section, {}).get(severity, []):
-                checks[item["name"]] = {
-                    "status": status,
-                    "severity": item.get("severity", severity),
-                    "platform": item.get("platform", ""),
-                    "profile": item.get("profile", ""),
-                }
-    for item in data.get("manual_checks", []):
-        checks[item["name"]] = {
-            "status": "MANUAL",
-            "severity": item.get("severity", ""),
-            "platform": item.get("platform", ""),
-            "profile": item.get("profile", ""),
+    def __getitem__(self, key: str) -> str:
+        if key not in ("status", "severity", "platform", "profile"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def as_dict(self) -> dict[str, str]:
+        return {
+            "status": self.status,
+            "severity": self.severity,
+            "platform": self.platform,
+            "profile": self.profile,
         }
+
+
+class CheckMap(dict):
+    """name -> CheckRecord map that also keeps names partitioned by status.
+
+    by_status[code] is the set of names whose status is that code, which
+    lets diffs be computed with set intersections instead of per-name
+    comparisons.
+    """
+
+    __slots__ = ("by_status",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.by_status: tuple[set[str], ...] = tuple(set() for _ in STATUSES)
+
+
+# Records are immutable and their field combinations are few (status x
+# severity x platform x profile), so identical ones are shared.
+_RECORDS: dict[tuple[int, str, str, str], CheckRecord] = {}
+
+
+def check_record(code: int, severity: str, platform: str, profile: str) -> CheckRecord:
+    """Return the shared CheckRecord for these field values."""
+    key = (code, severity, platform, profile)
+    record = _RECORDS.get(key)
+    if record is None:
+        intern = sys.intern
+        record = CheckRecord(code, intern(severity), intern(platform), intern(profile))
+        _RECORDS[key] = record
+    return record
+
+
+def build_check_map(data: dict[str, Any]) -> CheckMap:
+    """Build a name -> CheckRecord (status, severity, platform, profile) map from export data."""
+    intern = sys.intern
+    shared = _RECORDS
+    records: dict[str, CheckRecord] = {}
+    sections = [
+        (FAIL, severity, data.get("remediations", {}).get(severity, []))
+        for severity in SEVERITIES
+    ] + [
+        (PASS, severity, data.get("passing_checks", {}).get(severity, []))
+        for severity in SEVERITIES
+    ] + [(MANUAL, "", data.get("manual_checks", []))]
+    for code, severity, items in sections:
+        for item in items:
+            get = item.get
+            key = (code, get("severity", severity), get("platform", ""), get("profile", ""))
+            record = shared.get(key)
+            if record is None:
+                record = check_record(*key)
+            records[intern(item["name"])] = record
+
+    checks = CheckMap()
+    checks.update(records)
+    by_status = checks.by_status
+    for name, record in records.items():
+        by_status[record.code].add(name)
     return checks
 
 
+def status_changes(old_checks: CheckMap, new_checks: CheckMap) -> dict[tuple[int, int], set[str]]:
+    """Return {(old_code, new_code): names} for every status that changed."""
+    changes = {}
+    for old_code, old_names in enumerate(old_checks.by_status):
+        for new_code, new_names in enumerate(new_checks.by_status):
+            if old_code != new_code:
+                moved = old_names & new_names
+                if moved:
+                    changes[(old_code, new_code)] = moved
+    return changes
+
+
 def diff_scans(old_data: dict[str, Any], new_data: dict[str, Any]) -> dict[str, Any]:
     """Compare two scan exports and return structured diff."""
     old_checks = build_check_map(old_data)
     new_checks = build_check_map(new_data)
 
-    common = set(old_checks) & set(new_checks)
-    added = sorted(set(new_checks) - set(old_checks))
-    removed = sorted(set(old_checks) - set(new_checks))
-
-    pass_to_fail = []
-    fail_to_pass = []
-    manual_changes = []
-
-    for name in sorted(common):
-        old_status = old_checks[name]["status"]
-        new_status = new_checks[name]["status"]
-        if old_status == new_status:
-            continue
-        entry = {
-            "name": name,
-            "old_status": old_status,
-            "new_status": new_status,
-            "platform": new_checks[name].get("platform", ""),
-        }
-        if old_status == "PASS" and new_status == "FAIL":
-            pass_to_fail.append(entry)
-        elif old_status == "FAIL" and new_status == "PASS":
-            fail_to_pass.append(entry)
-        else:
-            manual_changes.append(entry)
+    added = sorted(new_checks.keys() - old_checks.keys())
+    removed = sorted(old_checks.keys() - new_checks.keys())
+    changes = status_changes(old_checks, new_checks)
+
+    def entries(names: set[str]) -> list[dict[str, str]]:
+        return [
+            {
+                "name": name,
+                "old_status": old_checks[name].status,
+                "new_status": new_checks[name].status,
+                "platform": new_checks[name].platform,
+            }
+            for name in sorted(names)
+        ]
+
+    pass_to_fail = entries(changes.pop((PASS, FAIL), set()))
+    fail_to_pass = entries(changes.pop((FAIL, PASS), set()))
+    manual_changes = entries(set().union(*changes.values()))
 
     old_summary = old_data.get("summary", {})
     new_summary = new_data.get("summary", {})
@@ -93,8 +185,8 @@ def diff_scans(old_data: dict[str, Any], new_data: dict[str, Any]) -> dict[str,
         "pass_to_fail": pass_to_fail,
         "fail_to_pass": fail_to_pass,
         "manual_changes": manual_changes,
-        "added": [{"name": n, **new_checks[n]} for n in added],
-        "removed": [{"name": n, **old_checks[n]} for n in removed],
+        "added": [{"name": n, **new_checks[n].as_dict()} for n in added],
+        "removed": [{"name": n, **old_checks[n].as_dict()} for n in removed],
     }
 
 
@@ -196,6 +288,117 @@ def print_diff(result: dict[str, Any]) -> None:
             )
 
 
+def snapshot_info(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the identifying fields of a scan export."""
+    return {
+        "version": data.get("version", "?"),
+        "scan_date": data.get("scan_date", "?"),
+        "content_image": data.get("content_image", ""),
+        "summary": data.get("summary", {}),
+    }
+
+
+def diff_series(exports: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build per-check status timelines across an ordered series of exports.
+
+    Each export is mapped once. Only checks whose status changes somewhere
+    in the series (including appearing or disappearing) get a timeline;
+    a missing check is recorded as None. first_regressed / first_fixed hold
+    the scan_date of the first PASS -> FAIL / FAIL -> PASS transition.
+    """
+    snapshots = [snapshot_info(data) for data in exports]
+    maps = [build_check_map(data) for data in exports]
+    names: set[str] = set()
+    for check_map in maps:
+        names.update(check_map)
+
+    checks: dict[str, dict[str, Any]] = {}
+    regressed = []
+    fixed = []
+    for name in sorted(names):
+        timeline = [m[name].status if name in m else None for m in maps]
+        if len(set(timeline)) == 1:
+            continue
+        first_regressed = None
+        first_fixed = None
+        for i in range(1, len(timeline)):
+            prev, cur = timeline[i - 1], timeline[i]
+            if prev == "PASS" and cur == "FAIL" and first_regressed is None:
+                first_regressed = snapshots[i]["scan_date"]
+            elif prev == "FAIL" and cur == "PASS" and first_fixed is None:
+                first_fixed = snapshots[i]["scan_date"]
+        latest = next(m[name] for m in reversed(maps) if name in m)
+        checks[name] = {
+            "timeline": timeline,
+            "platform": latest.platform,
+            "first_regressed": first_regressed,
+            "first_fixed": first_fixed,
+        }
+        if first_regressed:
+            regressed.append(name)
+        if first_fixed:
+            fixed.append(name)
+
+    latest_regressions = []
+    if len(maps) >= 2:
+        latest_regressions = [
+            name for name, info in checks.items()
+            if info["timeline"][-2] == "PASS" and info["timeline"][-1] == "FAIL"
+        ]
+
+    return {
+        "snapshots": snapshots,
+        "checks": checks,
+        "regressed": regressed,
+        "fixed": fixed,
+        "latest_regressions": latest_regressions,
+    }
+
+
+def _short_date(scan_date: str) -> str:
+    return scan_date.split("T", 1)[0]
+
+
+def print_series(result: dict[str, Any]) -> None:
+    """Print a human-readable multi-scan timeline report."""
+    snapshots = result["snapshots"]
+    checks = result["checks"]
+
+    print("=" * 65)
+    print(f"  COMPLIANCE SCAN TIMELINE ({len(snapshots)} scans)")
+    print("=" * 65)
+    for i, snap in enumerate(snapshots, 1):
+        summary = snap["summary"]
+        print(
+            f"  [{i}] v{snap['version']}  {_short_date(snap['scan_date'])}  "
+            f"pass={summary.get('passing', 0)} fail={summary.get('failing', 0)} "
+            f"manual={summary.get('manual', 0)}"
+        )
+    print()
+
+    if result["regressed"]:
+        print(f"FIRST REGRESSED (PASS -> FAIL) ({len(result['regressed'])}):")
+        for name in result["regressed"]:
+            print(f"  {_short_date(checks[name]['first_regressed'])}  {name}")
+        print()
+
+    if result["fixed"]:
+        print(f"FIRST FIXED (FAIL -> PASS) ({len(result['fixed'])}):")
+        for name in result["fixed"]:
+            print(f"  {_short_date(checks[name]['first_fixed'])}  {name}")
+        print()
+
+    if checks:
+        print(f"STATUS TIMELINES ({len(checks)} changed check(s)):")
+        width = max(len(name) for name in checks)
+        for name, info in checks.items():
+            cells = " ".join(f"{s or '-':6s}" for s in info["timeline"])
+            print(f"  {name:{width}s}  {cells.rstrip()}")
+        print()
+    else:
+        print("No status changes across the series.")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Compare two compliance scan exports and report differences",
@@ -210,20 +413,42 @@ Examples:
 
   # Output as JSON for scripting
   %(prog)s --json docs/_data/ocp-4_22-baseline-2026-05-05.json docs/_data/ocp-4_22.json
+
+  # Status timelines across archived snapshots (oldest first)
+  %(prog)s --series docs/_data/ocp-4_22-baseline-2026-05-05.json \\
+      docs/_data/ocp-4_22-2026-07-01.json docs/_data/ocp-4_22.json
 """
     )
-    parser.add_argument("old", help="Older scan export JSON file")
-    parser.add_argument("new", help="Newer scan export JSON file")
+    parser.add_argument("scans", nargs="+", metavar="SCAN",
+                        help="Old and new scan export JSON files "
+                             "(with --series: two or more, oldest first)")
     parser.add_argument("--json", action="store_true",
                         help="Output as JSON instead of human-readable")
+    parser.add_argument("--series", action="store_true",
+                        help="Report per-check status timelines across "
+                             "an ordered series of exports")
     args = parser.parse_args()
 
-    with open(args.old) as f:
-        old_data = json.load(f)
-    with open(args.new) as f:
-        new_data = json.load(f)
+    if args.series and len(args.scans) < 2:
+        parser.error("--series needs at least two scan exports")
+    if not args.series and len(args.scans) != 2:
+        parser.error("expected exactly two scan exports (use --series for more)")
+
+    exports = []
+    for path in args.scans:
+        with open(path) as f:
+            exports.append(json.load(f))
+
+    if args.series:
+        series = diff_series(exports)
+        if args.json:
+            json.dump(series, sys.stdout, indent=2)
+            print()
+        else:
+            print_series(series)
+        sys.exit(1 if series["latest_regressions"] else 0)
 
-    result = diff_scans(old_data, new_data)
+    result = diff_scans(exports[0], exports[1])
 
     if args.json:
         json.dump(result, sys.stdout, indent=2)
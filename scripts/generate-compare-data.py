@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""Generate the static data behind the Compare Versions page.
+
+The Compare page used to inline every full scan export (with check
+descriptions) into one HTML page and diff them in the browser on every
+selector change. Instead, this writes static assets to
+docs/assets/compare/:
+
+  index.json           versions the page can compare, their tables, and
+                       which (old, new) pairs have a precomputed diff
+  ocp-X_Y.json         compact check table for each scan export
+  diff/OLD_to_NEW.json diff-scans.py --json output for every ordered pair
+                       of versions, plus each version's latest baseline
+                       (ocp-X_Y-baseline-DATE.json) against the current
+                       export
+
+Check tables look like:
+
+    {
+      "version": "4.22", "scan_date": "...", "summary": {...},
+      "statuses": ["FAIL", "PASS", "MANUAL"],
+      "severities": ["high", ...], "platforms": ["ocp", ...],
+      "checks": [["ocp4-cis-...", 0, 0, 0], ...]
+    }
+
+Each check row is [name, status index, severity index, platform index],
+sorted by name. The page renders a precomputed diff when one exists and
+only falls back to diffing two tables for other pairs.
+
+Usage:
+    python3 scripts/generate-compare-data.py
+    python3 scripts/generate-compare-data.py --data-dir docs/_data --output-dir docs/assets/compare
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import re
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import Any
+
+_spec = spec_from_file_location(
+    "diff_scans", os.path.join(os.path.dirname(__file__), "diff-scans.py"))
+assert _spec and _spec.loader
+diff_scans = module_from_spec(_spec)
+_spec.loader.exec_module(diff_scans)
+
+VERSIONED_SCAN_RE = re.compile(r"^ocp-(\d+)_(\d+)\.json$")
+BASELINE_SCAN_RE = re.compile(r"^ocp-(\d+)_(\d+)-baseline-(\d{4}-\d{2}-\d{2})\.json$")
+SUMMARY_KEYS = ["total_checks", "passing", "failing", "manual"]
+INDEX_FILE = "index.json"
+DIFF_DIR = "diff"
+
+
+def default_data_dir() -> str:
+    return os.path.normpath(
+        os.path.join(os.path.dirname(__file__), "..", "docs", "_data")
+    )
+
+
+def default_output_dir() -> str:
+    return os.path.normpath(
+        os.path.join(os.path.dirname(__file__), "..", "docs", "assets", "compare")
+    )
+
+
+def list_matching_json(data_dir: str, name_re: re.Pattern[str]) -> list[str]:
+    return sorted(
+        path for path in glob.glob(os.path.join(data_dir, "*.json"))
+        if name_re.match(os.path.basename(path))
+    )
+
+
+def list_scan_files(data_dir: str) -> list[str]:
+    return list_matching_json(data_dir, VERSIONED_SCAN_RE)
+
+
+def find_sources(data_dir: str) -> dict[str, dict[str, str]]:
+    """Return compare key -> {"path", "label"} for every comparable export.
+
+    Keys are the version ("4.22") for current exports and "4.22-baseline"
+    for the newest baseline of a version that also has a current export.
+    Versions are ordered oldest first, each baseline just before its version.
+    """
+    current: dict[tuple[int, int], str] = {}
+    for path in list_scan_files(data_dir):
+        match = VERSIONED_SCAN_RE.match(os.path.basename(path))
+        assert match
+        current[(int(match.group(1)), int(match.group(2)))] = path
+    baselines: dict[tuple[int, int], tuple[str, str]] = {}
+    for path in list_matching_json(data_dir, BASELINE_SCAN_RE):
+        match = BASELINE_SCAN_RE.match(os.path.basename(path))
+        assert match
+        key = (int(match.group(1)), int(match.group(2)))
+        if key not in baselines or match.group(3) > baselines[key][1]:
+            baselines[key] = (path, match.group(3))
+
+    sources: dict[str, dict[str, str]] = {}
+    for key in sorted(current):
+        version = f"{key[0]}.{key[1]}"
+        if key in baselines:
+            path, date = baselines[key]
+            sources[f"{version}-baseline"] = {
+                "path": path, "label": f"OCP {version} baseline ({date})"}
+        sources[version] = {"path": current[key], "label": f"OCP {version}"}
+    return sources
+
+
+def compare_pairs(keys: list[str]) -> list[tuple[str, str]]:
+    """Every ordered pair of versions, plus each baseline against its version."""
+    versions = [k for k in keys if not k.endswith("-baseline")]
+    pairs = [(old, new) for old in versions for new in versions if old != new]
+    pairs += [(k, k[:-len("-baseline")]) for k in keys if k.endswith("-baseline")]
+    return pairs
+
+
+def compact_table(data: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a scan export to the compare page's check table."""
+    checks = diff_scans.build_check_map(data)
+    severities: dict[str, int] = {}
+    platforms: dict[str, int] = {}
+    rows = []
+    for name in sorted(checks):
+        record = checks[name]
+        rows.append([
+            name,
+            record.code,
+            severities.setdefault(record.severity, len(severities)),
+            platforms.setdefault(record.platform, len(platforms)),
+        ])
+    summary = data.get("summary", {})
+    return {
+        "version": data.get("version", ""),
+        "scan_date": data.get("scan_date", ""),
+        "summary": {key: summary.get(key, 0) for key in SUMMARY_KEYS},
+        "statuses": list(diff_scans.STATUSES),
+        "severities": list(severities),
+        "platforms": list(platforms),
+        "checks": rows,
+    }
+
+
+def compact_diff(old_data: dict[str, Any], new_data: dict[str, Any]) -> dict[str, Any]:
+    """diff-scans.py's diff, trimmed to the fields the compare page shows."""
+    result = diff_scans.diff_scans(old_data, new_data)
+    for side in ("old", "new"):
+        summary = result[side]["summary"]
+        result[side]["summary"] = {key: summary.get(key, 0) for key in SUMMARY_KEYS}
+    for key in ("added", "removed"):
+        result[key] = [
+            {"name": e["name"], "status": e["status"], "platform": e["platform"]}
+            for e in result[key]
+        ]
+    return result
+
+
+def dump_table(table: dict[str, Any]) -> str:
+    """Serialize compactly, one check row per line so diffs stay readable."""
+    head = {key: value for key, value in table.items() if key != "checks"}
+    rows = ",\n".join(json.dumps(row, separators=(",", ":")) for row in table["checks"])
+    return json.dumps(head, separators=(",", ":"))[:-1] + ',"checks":[\n' + rows + "\n]}\n"
+
+
+def dump_diff(diff: dict[str, Any]) -> str:
+    """Serialize compactly, one changed check per line."""
+    head = {k: v for k, v in diff.items() if not isinstance(v, list)}
+    parts = [json.dumps(head, separators=(",", ":"))[:-1]]
+    for key, entries in diff.items():
+        if isinstance(entries, list):
+            body = ",\n".join(json.dumps(e, separators=(",", ":")) for e in entries)
+            parts.append(f'"{key}":[' + (f"\n{body}\n" if body else "") + "]")
+    return ",".join(parts) + "}\n"
+
+
+def diff_filename(old: str, new: str) -> str:
+    return f"{DIFF_DIR}/{old.replace('.', '_')}_to_{new.replace('.', '_')}.json"
+
+
+def generate(data_dir: str) -> dict[str, str]:
+    """Return output relative path -> file content for everything the page needs."""
+    sources = find_sources(data_dir)
+    exports = {}
+    for key, source in sources.items():
+        with open(source["path"]) as f:
+            exports[key] = json.load(f)
+
+    files: dict[str, str] = {}
+    versions: dict[str, dict[str, str]] = {}
+    for key, source in sources.items():
+        table_file = os.path.basename(source["path"])
+        files[table_file] = dump_table(compact_table(exports[key]))
+        versions[key] = {
+            "label": source["label"],
+            "table": table_file,
+            "scan_date": exports[key].get("scan_date", ""),
+        }
+
+    diffs: dict[str, dict[str, str]] = {}
+    for old, new in compare_pairs(list(sources)):
+        name = diff_filename(old, new)
+        files[name] = dump_diff(compact_diff(exports[old], exports[new]))
+        diffs.setdefault(old, {})[new] = name
+
+    files[INDEX_FILE] = json.dumps({"versions": versions, "diffs": diffs}, indent=2) + "\n"
+    return files
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(content)
+    os.replace(tmp, path)
+    return True
+
+
+def prune(output_dir: str, keep: set[str]) -> list[str]:
+    """Remove generated JSON files that are no longer produced."""
+    removed = []
+    for pattern in ("*.json", os.path.join(DIFF_DIR, "*.json")):
+        for path in glob.glob(os.path.join(output_dir, pattern)):
+            rel = os.path.relpath(path, output_dir).replace(os.sep, "/")
+            if rel not in keep:
+                os.remove(path)
+                removed.append(rel)
+    return sorted(removed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=default_data_dir(),
+                        help="Directory with ocp-X_Y.json scan exports (default: docs/_data)")
+    parser.add_argument("--output-dir", default=default_output_dir(),
+                        help="Where to write the compare data (default: docs/assets/compare)")
+    args = parser.parse_args()
+
+    if not list_scan_files(args.data_dir):
+        raise SystemExit(f"No ocp-X_Y.json scan exports found in {args.data_dir}")
+    files = generate(args.data_dir)
+    os.makedirs(os.path.join(args.output_dir, DIFF_DIR), exist_ok=True)
+
+    updated = [rel for rel, content in sorted(files.items())
+               if write_if_changed(os.path.join(args.output_dir, rel), content)]
+    removed = prune(args.output_dir, set(files))
+    size = sum(len(content) for content in files.values())
+    print(f"Generated {len(files)} files in {args.output_dir} ({size / 1024:.0f} KiB): "
+          f"{len(updated)} updated, {len(removed)} removed")
+    for rel in updated:
+        print(f"  updated {rel}")
+    for rel in removed:
+        print(f"  removed {rel}")
+
+
+if __name__ == "__main__":
+    main()
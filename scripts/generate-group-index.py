@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Generate per-version group-index data files for the dashboard layouts.
+
+group.html and remediations.html used to walk every tracking remediation
+(259+) several times per group on every page, so Jekyll build time grew
+with groups x versions x remediations. This precomputes, per tracking
+file, each group's check list, certsuite coverage, and scan status, so
+the layouts look a group up instead of scanning.
+
+Writes docs/_data/group-index-X_Y.json for every tracking-X_Y.json (scan
+status from ocp-X_Y.json) and docs/_data/group-index.json for the default
+tracking.json (scan status from the newest ocp-X_Y.json):
+
+    {
+      "M1": {
+        "check_count": 7,
+        "checks": [{"name": "sshd-disable-root-login", "description": "..."}],
+        "certsuite_total": 7,
+        "certsuite_covered": 1,
+        "certsuite_pct": 14,
+        "certsuite_tests": [{"check": "...", "id": "...", "suite": "..."}],
+        "scan": {"pass": 0, "fail": 7, "manual": 0}
+      }
+    }
+
+Checks keep tracking.json order. "scan" (the group's PASS/FAIL/MANUAL
+counts, shown in the group.html header) is omitted when there is no scan
+export for the version.
+
+Usage:
+    python3 scripts/generate-group-index.py
+    python3 scripts/generate-group-index.py --data-dir docs/_data
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import Any
+
+_spec = spec_from_file_location(
+    "generate_group_matrix",
+    os.path.join(os.path.dirname(__file__), "generate-group-matrix.py"))
+assert _spec and _spec.loader
+group_matrix = module_from_spec(_spec)
+_spec.loader.exec_module(group_matrix)
+
+
+def certsuite_tests(value: Any) -> list[dict[str, str]]:
+    """Normalise a remediation's certsuite field to [{id, suite}].
+
+    The tracking schema allows a bare test ID string as well as a list of
+    objects; anything else yields no tests.
+    """
+    if isinstance(value, str):
+        return [{"id": value, "suite": ""}] if value else []
+    if not isinstance(value, list):
+        return []
+    return [{"id": t.get("id", ""), "suite": t.get("suite", "")}
+            for t in value if isinstance(t, dict)]
+
+
+def build_group_index(tracking: dict[str, Any], scan: dict[str, Any] | None = None) -> dict[str, dict]:
+    """Index a tracking document by group, with scan status when scan is given."""
+    index: dict[str, dict] = {
+        gid: {
+            "check_count": 0,
+            "checks": [],
+            "certsuite_total": 0,
+            "certsuite_covered": 0,
+            "certsuite_pct": 0,
+            "certsuite_tests": [],
+        }
+        for gid in tracking.get("groups", {})
+    }
+    members: dict[str, set[str]] = {gid: set() for gid in index}
+    for name, info in tracking.get("remediations", {}).items():
+        gid = info.get("group") or ""
+        if gid not in index:
+            continue
+        entry = index[gid]
+        entry["check_count"] += 1
+        entry["checks"].append({"name": name, "description": info.get("description") or ""})
+        members[gid].add(name)
+        entry["certsuite_total"] += 1
+        tests = certsuite_tests(info.get("certsuite"))
+        if tests:
+            entry["certsuite_covered"] += 1
+            entry["certsuite_tests"].extend({"check": name, **t} for t in tests)
+
+    if scan is not None:
+        passing, failing, manual = group_matrix.collect_scan_status(scan)
+    for gid, entry in index.items():
+        if entry["certsuite_covered"]:
+            entry["certsuite_pct"] = entry["certsuite_covered"] * 100 // entry["certsuite_total"]
+        if scan is not None:
+            short_names = members[gid]
+            entry["scan"] = {
+                "pass": group_matrix.count_suffix_matches(short_names, passing),
+                "fail": group_matrix.count_suffix_matches(short_names, failing),
+                "manual": group_matrix.count_suffix_matches(short_names, manual),
+            }
+    return index
+
+
+def index_targets(data_dir: str) -> list[tuple[str, str, str | None]]:
+    """Return (tracking path, output path, scan path or None) for each tracking file."""
+    scans = {
+        group_matrix.version_slug_from_scan(path): path
+        for path in group_matrix.list_scan_files(data_dir)
+    }
+    targets = []
+    for path in group_matrix.list_versioned_tracking_files(data_dir):
+        slug = os.path.basename(path)[len("tracking-"):-len(".json")]
+        targets.append((path, os.path.join(data_dir, f"group-index-{slug}.json"), scans.get(slug)))
+
+    default = os.path.join(data_dir, "tracking.json")
+    if os.path.exists(default):
+        latest = max(scans, key=lambda s: tuple(int(p) for p in s.split("_")), default=None)
+        targets.append((default, os.path.join(data_dir, "group-index.json"),
+                        scans[latest] if latest else None))
+    return targets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=group_matrix.default_data_dir(),
+                        help="Directory with tracking and scan JSON (default: docs/_data)")
+    args = parser.parse_args()
+
+    targets = index_targets(args.data_dir)
+    if not targets:
+        raise SystemExit(f"No tracking files found in {args.data_dir}")
+    for tracking_path, output, scan_path in targets:
+        scan = group_matrix.load_json(scan_path) if scan_path else None
+        index = build_group_index(group_matrix.load_json(tracking_path), scan)
+        group_matrix.write_matrix(output, index)
+        print(f"Generated {output} with {len(index)} groups")
+
+
+if __name__ == "__main__":
+    main()
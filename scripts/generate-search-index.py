@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Generate the dashboard's full-text search index, one shard per version.
+
+Searching check names, descriptions and summaries in the browser by
+scanning the scan exports would mean walking megabytes of description
+text on every keystroke. Instead this builds a compact inverted index at
+build time (token -> posting list of document ids) over each version's
+scan export (ocp-X_Y.json) and tracking file (tracking-X_Y.json), which
+docs/assets/js/search.js loads lazily, one version at a time.
+
+Documents are every scanned check (name, description, summary, and its
+tracking group) and every tracking group (id, title, status note).
+
+Writes to docs/assets/search/:
+
+  index.json     {"versions": {"5.0": {"shard": "ocp-5_0.json", "docs": N,
+                                       "terms": M}}, "latest": "5.0"}
+  ocp-X_Y.json   {
+                   "version": "5.0",
+                   "statuses": ["FAIL", "PASS", "MANUAL", ""],
+                   "docs": [["c", name, status, group, title], ...,
+                            ["g", group id, status, group id, title], ...],
+                   "terms": ["account", "accounts", ...],
+                   "postings": [[3, 1, 7], ...]
+                 }
+
+"terms" is sorted so the query engine can binary-search a prefix range.
+Each posting list holds sorted document ids, delta-encoded (each entry is
+the gap from the previous id). Check document status is an index into
+"statuses"; group documents carry the tracking status string.
+
+Usage:
+    python3 scripts/generate-search-index.py
+    python3 scripts/generate-search-index.py --data-dir docs/_data --output-dir docs/assets/search
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import re
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import Any
+
+_spec = spec_from_file_location(
+    "diff_scans", os.path.join(os.path.dirname(__file__), "diff-scans.py"))
+assert _spec and _spec.loader
+diff_scans = module_from_spec(_spec)
+_spec.loader.exec_module(diff_scans)
+
+VERSIONED_SCAN_RE = re.compile(r"^ocp-(\d+)_(\d+)\.json$")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+MIN_TOKEN_LEN = 2
+STOPWORDS = frozenset(
+    "an and are as at be by for from has have if in into is it its of on or "
+    "that the this to was were which will with".split()
+)
+TITLE_LEN = 120
+
+
+def default_data_dir() -> str:
+    return os.path.normpath(
+        os.path.join(os.path.dirname(__file__), "..", "docs", "_data")
+    )
+
+
+def default_output_dir() -> str:
+    return os.path.normpath(
+        os.path.join(os.path.dirname(__file__), "..", "docs", "assets", "search")
+    )
+
+
+def tokenize(text: str) -> set[str]:
+    """Lowercase alphanumeric tokens, minus stopwords and single characters.
+
+    Must stay in step with searchParseQuery() in docs/assets/js/search.js.
+    """
+    return {
+        token for token in TOKEN_RE.findall(text.lower())
+        if len(token) >= MIN_TOKEN_LEN and token not in STOPWORDS
+    }
+
+
+def list_versions(data_dir: str) -> list[tuple[str, str]]:
+    """Return (version, slug) for each ocp-X_Y.json, oldest first."""
+    versions = []
+    for path in glob.glob(os.path.join(data_dir, "ocp-*.json")):
+        match = VERSIONED_SCAN_RE.match(os.path.basename(path))
+        if match:
+            versions.append((int(match.group(1)), int(match.group(2))))
+    return [(f"{major}.{minor}", f"{major}_{minor}") for major, minor in sorted(versions)]
+
+
+def check_groups(names: list[str], remediations: dict[str, Any]) -> dict[str, str]:
+    """Map full check names to tracking groups by their short-name suffix."""
+    suffixes: dict[str, str] = {}
+    for short, info in remediations.items():
+        if info.get("group"):
+            suffixes[short] = info["group"]
+    groups = {}
+    for name in names:
+        # Try the longest suffix first: "rhcos4-e8-worker-sshd-x" -> "sshd-x".
+        parts = name.split("-")
+        for i in range(1, len(parts)):
+            gid = suffixes.get("-".join(parts[i:]))
+            if gid:
+                groups[name] = gid
+                break
+        else:
+            if name in suffixes:
+                groups[name] = suffixes[name]
+    return groups
+
+
+def build_shard(version: str, scan: dict[str, Any], tracking: dict[str, Any]) -> dict[str, Any]:
+    """Build one version's documents and inverted index."""
+    checks = diff_scans.build_check_map(scan)
+    texts: dict[str, list[str]] = {}
+    for section in ("remediations", "passing_checks"):
+        for items in scan.get(section, {}).values():
+            for item in items:
+                texts[item["name"]] = [item.get("description") or "", item.get("summary") or ""]
+    for item in scan.get("manual_checks", []):
+        texts[item["name"]] = [item.get("description") or "", item.get("summary") or ""]
+
+    names = sorted(checks)
+    groups = tracking.get("groups", {})
+    remediations = tracking.get("remediations", {})
+    name_groups = check_groups(names, remediations)
+    statuses = list(diff_scans.STATUSES) + [""]
+
+    docs: list[list[Any]] = []
+    doc_tokens: list[set[str]] = []
+    for name in names:
+        description, summary = texts.get(name, ["", ""])
+        gid = name_groups.get(name, "")
+        title = (description.strip().splitlines() or [""])[0][:TITLE_LEN]
+        docs.append(["c", name, checks[name].code, gid, title])
+        doc_tokens.append(tokenize(" ".join([name, description, summary, gid])))
+    for gid, group in groups.items():
+        title = group.get("title") or ""
+        docs.append(["g", gid, group.get("status") or "", gid, title])
+        doc_tokens.append(tokenize(" ".join([gid, title, group.get("status_note") or ""])))
+
+    index: dict[str, list[int]] = {}
+    for doc_id, tokens in enumerate(doc_tokens):
+        for token in tokens:
+            index.setdefault(token, []).append(doc_id)
+    terms = sorted(index)
+    postings = []
+    for term in terms:
+        ids = index[term]
+        postings.append([ids[0]] + [b - a for a, b in zip(ids, ids[1:])])
+
+    return {
+        "version": version,
+        "statuses": statuses,
+        "docs": docs,
+        "terms": terms,
+        "postings": postings,
+    }
+
+
+def dump_shard(shard: dict[str, Any]) -> str:
+    return json.dumps(shard, separators=(",", ":")) + "\n"
+
+
+def generate(data_dir: str) -> dict[str, str]:
+    """Return output file name -> content for the manifest and every shard."""
+    files: dict[str, str] = {}
+    manifest: dict[str, Any] = {"versions": {}, "latest": ""}
+    for version, slug in list_versions(data_dir):
+        with open(os.path.join(data_dir, f"ocp-{slug}.json")) as f:
+            scan = json.load(f)
+        tracking_path = os.path.join(data_dir, f"tracking-{slug}.json")
+        if not os.path.exists(tracking_path):
+            tracking_path = os.path.join(data_dir, "tracking.json")
+        tracking = {}
+        if os.path.exists(tracking_path):
+            with open(tracking_path) as f:
+                tracking = json.load(f)
+        shard = build_shard(version, scan, tracking)
+        name = f"ocp-{slug}.json"
+        files[name] = dump_shard(shard)
+        manifest["versions"][version] = {
+            "shard": name, "docs": len(shard["docs"]), "terms": len(shard["terms"])}
+        manifest["latest"] = version
+    files["index.json"] = json.dumps(manifest, indent=2) + "\n"
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", default=default_data_dir(),
+                        help="Directory with scan and tracking JSON (default: docs/_data)")
+    parser.add_argument("--output-dir", default=default_output_dir(),
+                        help="Where to write the index (default: docs/assets/search)")
+    args = parser.parse_args()
+
+    files = generate(args.data_dir)
+    if len(files) == 1:
+        raise SystemExit(f"No ocp-X_Y.json scan exports found in {args.data_dir}")
+    os.makedirs(args.output_dir, exist_ok=True)
+    for stale in set(os.listdir(args.output_dir)) - set(files):
+        if stale.endswith(".json"):
+            os.remove(os.path.join(args.output_dir, stale))
+    for name, content in sorted(files.items()):
+        with open(os.path.join(args.output_dir, name), "w") as f:
+            f.write(content)
+        print(f"Generated {os.path.join(args.output_dir, name)} ({len(content) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
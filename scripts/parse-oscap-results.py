@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
-"""Parse OSCAP XCCDF results XML and compare against tracking.json groups."""
+"""Parse OSCAP XCCDF results XML and compare against tracking.json groups.
+
+Accepts one or more results files. With several files (one per profile, as
+written by rhcos-static-scan.sh) the files are parsed concurrently in a
+process pool and merged into a single report with per-profile and union
+counts.
+"""
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import re
 import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 XCCDF_NS = "http://checklists.nist.gov/xccdf/1.2"
+PROFILE_PREFIX = "xccdf_org.ssgproject.content_profile_"
+RESULTS_FILE_RE = re.compile(r"^results-(.+)\.xml$")
+
+# When merging profiles, a check takes the most significant result seen
+# in any profile: a FAIL anywhere is a FAIL in the union.
+UNION_PRECEDENCE = {"fail": 0, "error": 1, "pass": 2}
 
 
 def parse_results(results_file: str) -> list[dict[str, str]]:
@@ -35,6 +50,80 @@ def parse_results(results_file: str) -> list[dict[str, str]]:
     return checks
 
 
+def profile_name(results_file: str) -> str:
+    """Return the short profile name for a results file.
+
+    Prefers the profile idref recorded in the TestResult element, falling
+    back to the results-<profile>.xml naming used by rhcos-static-scan.sh.
+    """
+    try:
+        for event, elem in ET.iterparse(results_file, events=("start",)):
+            if elem.tag == f"{{{XCCDF_NS}}}profile":
+                idref = elem.get("idref", "")
+                if idref:
+                    return idref.replace(PROFILE_PREFIX, "")
+            elif elem.tag == f"{{{XCCDF_NS}}}rule-result":
+                break
+    except ET.ParseError:
+        pass
+
+    basename = os.path.basename(results_file)
+    match = RESULTS_FILE_RE.match(basename)
+    if match:
+        return match.group(1)
+    return os.path.splitext(basename)[0]
+
+
+def _parse_profile(results_file: str) -> tuple[str, list[dict[str, str]]]:
+    """Pool worker: parse one results file and tag it with its profile."""
+    return profile_name(results_file), parse_results(results_file)
+
+
+def parse_many(
+    results_files: list[str],
+    jobs: int | None = None,
+) -> dict[str, list[dict[str, str]]]:
+    """Parse several results files, concurrently when there is more than one.
+
+    Returns a profile -> checks mapping in the order the files were given.
+    Duplicate profile names get the file basename appended so nothing is
+    silently overwritten.
+    """
+    if len(results_files) <= 1 or jobs == 1:
+        parsed = [_parse_profile(path) for path in results_files]
+    else:
+        workers = min(jobs or os.cpu_count() or 1, len(results_files))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_profile, results_files))
+
+    per_profile: dict[str, list[dict[str, str]]] = {}
+    for path, (profile, checks) in zip(results_files, parsed):
+        if profile in per_profile:
+            profile = f"{profile} ({os.path.basename(path)})"
+        per_profile[profile] = checks
+    return per_profile
+
+
+def merge_results(
+    per_profile: dict[str, list[dict[str, str]]],
+) -> list[dict[str, str]]:
+    """Merge per-profile checks into one union list keyed by check name.
+
+    A check evaluated by several profiles keeps its most significant
+    result (fail > error > pass > anything else).
+    """
+    merged: dict[str, dict[str, str]] = {}
+    for checks in per_profile.values():
+        for check in checks:
+            current = merged.get(check["name"])
+            if current is None or (
+                UNION_PRECEDENCE.get(check["result"], 99)
+                < UNION_PRECEDENCE.get(current["result"], 99)
+            ):
+                merged[check["name"]] = check
+    return [merged[name] for name in sorted(merged)]
+
+
 def load_tracking(tracking_file: str) -> tuple[dict[str, str], dict[str, Any]]:
     """Load tracking.json and build check-to-group mapping."""
     with open(tracking_file) as f:
@@ -161,6 +250,89 @@ def print_group_comparison(
             )
 
 
+def print_profile_summary(
+    per_profile: dict[str, list[dict[str, str]]],
+    union: list[dict[str, str]],
+    output_format: str = "text",
+) -> None:
+    """Print pass/fail counts for each profile plus the merged union."""
+    rows = [(profile, count_results(checks), len(checks))
+            for profile, checks in per_profile.items()]
+    rows.append(("union", count_results(union), len(union)))
+
+    if output_format == "markdown":
+        print("## Profile Summary\n")
+        print("| Profile | PASS | FAIL | Other | Total |")
+        print("|---------|------|------|-------|-------|")
+    else:
+        print("=== Profile Summary ===")
+
+    for profile, counts, total in rows:
+        passed = counts.get("pass", 0)
+        failed = counts.get("fail", 0)
+        other = total - passed - failed
+        if output_format == "markdown":
+            print(f"| {profile} | {passed} | {failed} | {other} | {total} |")
+        else:
+            print(f"  {profile:20s} pass={passed} fail={failed} "
+                  f"other={other} total={total}")
+    print()
+
+
+def group_summary(
+    group_results: dict[str, dict[str, Any]],
+    groups: dict[str, Any],
+) -> dict[str, dict[str, Any]]:
+    """Build the JSON-friendly per-group verdict mapping."""
+    return {
+        gid: {
+            "title": groups.get(gid, {}).get("title", ""),
+            "current_status": groups.get(gid, {}).get("status", ""),
+            "pass": gr["pass"],
+            "fail": gr["fail"],
+            "needs_remediation": gr["fail"] > 0,
+        }
+        for gid, gr in group_results.items()
+    }
+
+
+def print_failing(
+    failing: list[dict[str, str]],
+    check_to_group: dict[str, str],
+    output_format: str = "text",
+) -> None:
+    """Print the failing checks that follow the summary header."""
+    for check in sorted(failing, key=lambda c: c["name"]):
+        group_id = check_to_group.get(check["name"], "-")
+        if output_format == "markdown":
+            print(f"| `{check['name']}` | {group_id} |")
+        else:
+            print(f"  FAIL: {check['name']}")
+
+
+def markdown_report(
+    checks: list[dict[str, str]],
+    check_to_group: dict[str, str],
+    groups: dict[str, Any],
+    with_groups: bool,
+) -> str:
+    """Render the markdown summary for a set of checks as a string."""
+    import io
+    old_stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        failing = print_summary(checks, "markdown")
+        if failing:
+            print_failing(failing, check_to_group, "markdown")
+        if with_groups:
+            print_group_comparison(
+                build_group_results(checks, check_to_group), groups, "markdown"
+            )
+        return sys.stdout.getvalue()
+    finally:
+        sys.stdout = old_stdout
+
+
 def write_failing_list(
     failing: list[dict[str, str]],
     check_to_group: dict[str, str],
@@ -172,9 +344,29 @@ def write_failing_list(
             f.write(check["name"] + "\n")
 
 
+def write_per_profile(
+    template: str,
+    per_profile: dict[str, list[dict[str, str]]],
+    union: list[dict[str, str]],
+    write: Any,
+) -> None:
+    """Expand a {profile} path template for each profile, or write the union.
+
+    ``write`` is called as write(path, checks) for every output file.
+    """
+    if "{profile}" in template:
+        for profile, checks in per_profile.items():
+            write(template.replace("{profile}", profile), checks)
+    else:
+        write(template, union)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Parse OSCAP XCCDF results")
-    parser.add_argument("results", help="XCCDF results XML file")
+    parser.add_argument(
+        "results", nargs="+",
+        help="XCCDF results XML file(s); several files are merged"
+    )
     parser.add_argument(
         "--tracking", help="tracking.json file for group comparison"
     )
@@ -187,15 +379,25 @@ def main() -> None:
     )
     parser.add_argument(
         "--markdown-file",
-        help="Write markdown output to this file (in addition to stdout)"
+        help="Write markdown output to this file (in addition to stdout); "
+             "with several results, {profile} writes one file per profile"
     )
     parser.add_argument(
         "--failing-file",
-        help="Write sorted failing check names to this file"
+        help="Write sorted failing check names to this file; "
+             "with several results, {profile} writes one file per profile"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Worker processes for parsing several results files "
+             "(default: CPU count)"
     )
     args = parser.parse_args()
 
-    checks = parse_results(args.results)
+    per_profile = parse_many(args.results, args.jobs)
+    merged = len(per_profile) > 1
+    checks = merge_results(per_profile) if merged else next(
+        iter(per_profile.values()))
 
     check_to_group: dict[str, str] = {}
     groups: dict[str, Any] = {}
@@ -210,16 +412,20 @@ def main() -> None:
             "summary": count_results(checks),
         }
 
-        if args.tracking:
-            output["groups"] = {}
-            for gid, gr in group_results.items():
-                output["groups"][gid] = {
-                    "title": groups.get(gid, {}).get("title", ""),
-                    "current_status": groups.get(gid, {}).get("status", ""),
-                    "pass": gr["pass"],
-                    "fail": gr["fail"],
-                    "needs_remediation": gr["fail"] > 0,
+        if merged:
+            output["profiles"] = {
+                profile: {
+                    "summary": count_results(profile_checks),
+                    "failing": sorted(
+                        c["name"] for c in profile_checks
+                        if c["result"] == "fail"
+                    ),
                 }
+                for profile, profile_checks in per_profile.items()
+            }
+
+        if args.tracking:
+            output["groups"] = group_summary(group_results, groups)
 
         if args.failing_only:
             output["checks"] = [
@@ -230,38 +436,34 @@ def main() -> None:
         print()
         return
 
+    if merged:
+        print_profile_summary(per_profile, checks, args.format)
+
     failing = print_summary(checks, args.format)
 
     if failing:
-        for check in sorted(failing, key=lambda c: c["name"]):
-            group_id = check_to_group.get(check["name"], "-")
-            if args.format == "markdown":
-                print(f"| `{check['name']}` | {group_id} |")
-            else:
-                print(f"  FAIL: {check['name']}")
+        print_failing(failing, check_to_group, args.format)
 
     if args.tracking and not args.failing_only:
         print_group_comparison(group_results, groups, args.format)
 
     # Write optional output files (single-pass, no re-parsing)
-    if args.failing_file and failing:
-        write_failing_list(failing, check_to_group, args.failing_file)
+    if args.failing_file:
+        def write_failing(path: str, file_checks: list[dict[str, str]]) -> None:
+            file_failing = [c for c in file_checks if c["result"] == "fail"]
+            if file_failing:
+                write_failing_list(file_failing, check_to_group, path)
+
+        write_per_profile(args.failing_file, per_profile, checks, write_failing)
 
     if args.markdown_file:
-        import io
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        print_summary(checks, "markdown")
-        if failing:
-            for check in sorted(failing, key=lambda c: c["name"]):
-                group_id = check_to_group.get(check["name"], "-")
-                print(f"| `{check['name']}` | {group_id} |")
-        if args.tracking:
-            print_group_comparison(group_results, groups, "markdown")
-        md_content = sys.stdout.getvalue()
-        sys.stdout = old_stdout
-        with open(args.markdown_file, "w") as f:
-            f.write(md_content)
+        def write_markdown(path: str, file_checks: list[dict[str, str]]) -> None:
+            with open(path, "w") as f:
+                f.write(markdown_report(
+                    file_checks, check_to_group, groups, bool(args.tracking)
+                ))
+
+        write_per_profile(args.markdown_file, per_profile, checks, write_markdown)
 
 
 if __name__ == "__main__":
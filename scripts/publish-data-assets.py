@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Publish the dashboard's fetched data files under content-hashed names.
+
+The Compare and Search pages fetch JSON from docs/assets/compare/ and
+docs/assets/search/ under stable names, and GitHub Pages serves every
+file with a short max-age, so browsers revalidate or re-download the same
+data on every visit. This copies each of those files to
+docs/assets/data/ with a content hash in its name and writes a manifest
+mapping the stable name to the hashed one:
+
+    docs/assets/data/manifest.json
+        {"files": {"compare/index.json": "compare/index.1a2b3c4d5e6f.json", ...}}
+    docs/assets/data/compare/index.1a2b3c4d5e6f.json
+    docs/assets/data/search/ocp-5_0.0f9e8d7c6b5a.json
+    ...
+
+docs/assets/js/data-assets.js resolves names through the manifest, and
+the service worker (docs/sw.js) caches hashed files forever while
+revalidating only the manifest. A file that changes gets a new name, so
+cached copies never go stale.
+
+docs/assets/data/ is a build output: the Pages workflow and
+make serve-docs run this before Jekyll, and it is not committed.
+
+Usage:
+    python3 scripts/publish-data-assets.py
+    python3 scripts/publish-data-assets.py --assets-dir docs/assets --output-dir docs/assets/data
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+
+SOURCE_DIRS = ("compare", "search")
+MANIFEST_FILE = "manifest.json"
+HASH_LEN = 12
+
+
+def default_assets_dir() -> str:
+    return os.path.normpath(
+        os.path.join(os.path.dirname(__file__), "..", "docs", "assets")
+    )
+
+
+def hashed_name(rel: str, content: bytes) -> str:
+    """Insert a content hash before the extension: "a/b.json" -> "a/b.<hash>.json"."""
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LEN]
+    stem, ext = os.path.splitext(rel)
+    return f"{stem}.{digest}{ext}"
+
+
+def collect(assets_dir: str) -> dict[str, bytes]:
+    """Return stable relative path -> content for every JSON file to publish."""
+    files = {}
+    for source in SOURCE_DIRS:
+        pattern = os.path.join(assets_dir, source, "**", "*.json")
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            rel = os.path.relpath(path, assets_dir).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                files[rel] = f.read()
+    return files
+
+
+def build(files: dict[str, bytes]) -> tuple[dict[str, str], dict[str, bytes]]:
+    """Return (manifest entries, hashed relative path -> content)."""
+    manifest = {}
+    outputs = {}
+    for rel, content in sorted(files.items()):
+        name = hashed_name(rel, content)
+        manifest[rel] = name
+        outputs[name] = content
+    return manifest, outputs
+
+
+def publish(assets_dir: str, output_dir: str) -> dict[str, str]:
+    """Write hashed copies and the manifest; remove hashed files no longer listed."""
+    manifest, outputs = build(collect(assets_dir))
+    for name, content in outputs.items():
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+    for path in glob.glob(os.path.join(output_dir, "**", "*.json"), recursive=True):
+        rel = os.path.relpath(path, output_dir).replace(os.sep, "/")
+        if rel != MANIFEST_FILE and rel not in outputs:
+            os.remove(path)
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w") as f:
+        json.dump({"files": manifest}, f, indent=2)
+        f.write("\n")
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets-dir", default=default_assets_dir(),
+                        help="Site assets directory with compare/ and search/ (default: docs/assets)")
+    parser.add_argument("--output-dir",
+                        help="Where to write hashed files and the manifest (default: ASSETS_DIR/data)")
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or os.path.join(args.assets_dir, "data")
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = publish(args.assets_dir, output_dir)
+    if not manifest:
+        raise SystemExit(f"No data files found under {args.assets_dir}/{{{','.join(SOURCE_DIRS)}}}")
+    print(f"Published {len(manifest)} data files to {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Render MachineConfigs offline into what each pool's nodes will end up with.
+
+Applies the Machine Config Operator's merge rules to a directory of
+MachineConfigs, without a cluster:
+
+  - MachineConfigs are merged in lexical order of their names.
+  - Ignition configs merge like Ignition's own config merge, which the MCO
+    uses: files, directories and links are keyed by path, units, dropins
+    and users by name. A later entry for the same key overrides the fields
+    it sets and keeps the rest. Lists of plain values are unioned.
+  - kernelArguments accumulate in order, extensions are unioned, fips is on
+    if any MachineConfig enables it, and the last non-default kernelType
+    and the last osImageURL win.
+  - Ignition versions outside SUPPORTED_IGNITION_VERSIONS are errors, and
+    2.2.0 configs (converted by the MCO) get a warning.
+
+A pool renders the MachineConfigs whose role label it selects: master and
+worker select their own role, and a custom pool such as infra selects
+worker and infra (override with --pool NAME=ROLE,...).
+Rendered MachineConfigs (rendered-*, owned by a MachineConfigPool) in an
+oc get machineconfigs -o yaml dump are ignored: they are the MCO's output
+for the pool, not inputs to it.
+
+The result is the effective file set per pool, with the MachineConfig each
+file comes from and any it overrides. The same data is available as JSON
+(--json), or as a file tree (--dump) to diff -r between hardening sets.
+With --baseline, both sets are rendered and only the differences are
+printed. --exit-code then exits 3 if the candidate changes anything.
+
+Usage:
+    python3 scripts/render-machineconfigs.py --src-dir complianceremediations
+    python3 scripts/render-machineconfigs.py --src-dir cluster-mcs --src-dir new-remediations \\
+        --baseline cluster-mcs --exit-code
+    python3 scripts/render-machineconfigs.py --src-dir complianceremediations/consolidated \\
+        --json rendered.json --dump rendered/
+"""
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import gzip
+import hashlib
+import argparse
+import binascii
+from collections import Counter
+from typing import Any
+
+# Add project root to path for shared module imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lib.compliance_utils import (  # noqa: E402
+    DERIVED_MC_DIRS, ROLE_LABEL, load_machineconfigs, decode_file_bytes,
+)
+
+SUPPORTED_IGNITION_VERSIONS = ('3.0.0', '3.1.0', '3.2.0', '3.3.0', '3.4.0', '3.5.0')
+LEGACY_IGNITION_VERSION = '2.2.0'
+
+# Ignition list fields whose entries are merged by key.
+KEYED_FIELDS = {
+    'files': 'path',
+    'directories': 'path',
+    'links': 'path',
+    'units': 'name',
+    'dropins': 'name',
+    'users': 'name',
+    'groups': 'name',
+    'disks': 'device',
+    'filesystems': 'device',
+    'raid': 'name',
+    'luks': 'name',
+    'partitions': 'number',
+}
+
+
+def merge_ignition(parent: Any, child: Any, field: str | None = None) -> Any:
+    """Merge child into parent the way Ignition merges configs.
+
+    Fields set in child replace those in parent, nested objects merge
+    recursively and null means unset. Keyed lists (KEYED_FIELDS) merge
+    entries with the same key in place and append new ones; other lists
+    gain the child's values they do not already have.
+    """
+    if child is None:
+        return parent
+    if isinstance(parent, dict) and isinstance(child, dict):
+        merged = dict(parent)
+        for key, value in child.items():
+            merged[key] = merge_ignition(merged[key], value, key) if key in merged else value
+        return merged
+    if isinstance(parent, list) and isinstance(child, list):
+        keyname = KEYED_FIELDS.get(field or '')
+        if keyname is None:
+            return parent + [item for item in child if item not in parent]
+        merged_list = list(parent)
+        index = {item.get(keyname): i for i, item in enumerate(merged_list)
+                 if isinstance(item, dict)}
+        for item in child:
+            key = item.get(keyname) if isinstance(item, dict) else None
+            if key is not None and key in index:
+                merged_list[index[key]] = merge_ignition(merged_list[index[key]], item)
+            else:
+                if key is not None:
+                    index[key] = len(merged_list)
+                merged_list.append(item)
+        return merged_list
+    return child
+
+
+def pool_roles(roles: set[str], overrides: dict[str, list[str]] | None = None) -> dict[str, list[str]]:
+    """Map each pool to the roles it selects."""
+    pools: dict[str, list[str]] = {}
+    for role in sorted(roles):
+        pools[role] = [role] if role in ('master', 'worker') else ['worker', role]
+    pools.update(overrides or {})
+    return pools
+
+
+def _file_summary(entry: dict[str, Any]) -> dict[str, Any]:
+    contents = entry.get('contents') or {}
+    summary: dict[str, Any] = {
+        'mode': format(entry['mode'], '04o') if isinstance(entry.get('mode'), int) else None,
+        'overwrite': entry.get('overwrite'),
+    }
+    try:
+        raw = decode_file_bytes(contents)
+    except (binascii.Error, gzip.BadGzipFile, EOFError, ValueError) as e:
+        summary['error'] = f"contents cannot be decoded: {e}"
+        return summary
+    if raw is None:
+        summary['source'] = contents.get('source')
+    else:
+        summary['size'] = len(raw)
+        summary['sha256'] = hashlib.sha256(raw).hexdigest()
+    return summary
+
+
+def _unit_summary(unit: dict[str, Any]) -> dict[str, Any]:
+    summary: dict[str, Any] = {key: unit[key] for key in ('enabled', 'mask') if key in unit}
+    body = json.dumps({'contents': unit.get('contents'), 'dropins': unit.get('dropins')},
+                      sort_keys=True)
+    summary['sha256'] = hashlib.sha256(body.encode()).hexdigest()
+    if unit.get('dropins'):
+        summary['dropins'] = sorted(d.get('name') for d in unit['dropins'])
+    return summary
+
+
+def render_pool(pool: str, roles: list[str], machineconfigs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Render one pool from every MachineConfig whose role it selects.
+
+    Returns a dict with the pool, roles, the MachineConfigs in merge order,
+    the merged Ignition config (config), per-path files and per-name units
+    ({'set_by': [...], mode/sha256/...}), links, kernel_arguments,
+    extensions, fips, kernel_type, os_image_url, ignition_version, and
+    errors and warnings.
+    """
+    selected = sorted((mc for mc in machineconfigs if mc['role'] in roles), key=lambda m: m['name'])
+    config: dict[str, Any] = {}
+    errors: list[str] = []
+    warnings: list[str] = []
+    versions: set[str] = set()
+    set_by: dict[str, dict[str, list[str]]] = {'files': {}, 'units': {}, 'links': {}}
+    kernel_arguments: list[str] = []
+    extensions: list[str] = []
+    fips = False
+    kernel_type = 'default'
+    os_image_url = None
+
+    for mc in selected:
+        name = mc['name']
+        labels = (mc['doc'].get('metadata') or {}).get('labels') or {}
+        if ROLE_LABEL not in labels:
+            warnings.append(f"{name}: no {ROLE_LABEL} label; assumed {mc['role']}")
+        spec = mc['doc'].get('spec') or {}
+        ign = spec.get('config') or {}
+        if ign:
+            version = (ign.get('ignition') or {}).get('version')
+            if not version:
+                errors.append(f"{name}: Ignition config has no ignition.version")
+                continue
+            if version == LEGACY_IGNITION_VERSION:
+                warnings.append(f"{name}: Ignition {version} is converted to spec 3 by the MCO")
+            elif version not in SUPPORTED_IGNITION_VERSIONS:
+                errors.append(f"{name}: unsupported Ignition version {version}")
+                continue
+            versions.add(version)
+            body = {k: v for k, v in ign.items() if k != 'ignition'}
+            for section, field in (('storage', 'files'), ('storage', 'links'), ('systemd', 'units')):
+                for entry in (body.get(section) or {}).get(field) or []:
+                    key = entry.get(KEYED_FIELDS[field])
+                    set_by[field].setdefault(key, []).append(name)
+            config = merge_ignition(config, body)
+
+        kernel_arguments.extend(spec.get('kernelArguments') or [])
+        extensions.extend(e for e in spec.get('extensions') or [] if e not in extensions)
+        fips = fips or bool(spec.get('fips'))
+        if spec.get('kernelType') and spec['kernelType'] != 'default':
+            kernel_type = spec['kernelType']
+        if spec.get('osImageURL'):
+            os_image_url = spec['osImageURL']
+
+    files = {}
+    for entry in (config.get('storage') or {}).get('files') or []:
+        summary = _file_summary(entry)
+        if 'error' in summary:
+            errors.append(f"file {entry['path']}: {summary['error']}")
+        files[entry['path']] = {'set_by': set_by['files'][entry['path']], **summary}
+    units = {unit['name']: {'set_by': set_by['units'][unit['name']], **_unit_summary(unit)}
+             for unit in (config.get('systemd') or {}).get('units') or []}
+    links = {link['path']: {'set_by': set_by['links'][link['path']], 'target': link.get('target')}
+             for link in (config.get('storage') or {}).get('links') or []}
+
+    for arg, count in Counter(kernel_arguments).items():
+        if count > 1:
+            warnings.append(f"kernel argument {arg} is set {count} times")
+    values: dict[str, set[str]] = {}
+    for arg in kernel_arguments:
+        values.setdefault(arg.split('=', 1)[0], set()).add(arg)
+    for key, args in sorted(values.items()):
+        if len(args) > 1:
+            warnings.append(f"kernel argument {key} has conflicting values: {', '.join(sorted(args))}")
+
+    return {
+        'pool': pool,
+        'roles': roles,
+        'machineconfigs': [mc['name'] for mc in selected],
+        'ignition_version': max(versions, key=lambda v: tuple(int(p) for p in v.split('.')))
+        if versions else None,
+        'config': config,
+        'files': files,
+        'units': units,
+        'links': links,
+        'kernel_arguments': kernel_arguments,
+        'extensions': extensions,
+        'fips': fips,
+        'kernel_type': kernel_type,
+        'os_image_url': os_image_url,
+        'errors': errors,
+        'warnings': warnings,
+    }
+
+
+def render(
+    machineconfigs: list[dict[str, Any]],
+    pool_overrides: dict[str, list[str]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Render every pool the MachineConfigs' roles (and pool_overrides) imply."""
+    pools = pool_roles({mc['role'] for mc in machineconfigs}, pool_overrides)
+    return {pool: render_pool(pool, roles, machineconfigs) for pool, roles in pools.items()}
+
+
+def _without_set_by(entry: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in entry.items() if k != 'set_by'}
+
+
+def compare_renders(
+    old: dict[str, dict[str, Any]],
+    new: dict[str, dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Per-pool differences between two renders; pools without changes are omitted."""
+    diffs = {}
+    for pool in sorted(set(old) | set(new)):
+        before = old.get(pool) or {}
+        after = new.get(pool) or {}
+        diff: dict[str, Any] = {}
+        for kind in ('files', 'units', 'links'):
+            a, b = before.get(kind) or {}, after.get(kind) or {}
+            changes = {
+                'added': sorted(set(b) - set(a)),
+                'removed': sorted(set(a) - set(b)),
+                'changed': sorted(k for k in set(a) & set(b)
+                                  if _without_set_by(a[k]) != _without_set_by(b[k])),
+            }
+            if any(changes.values()):
+                diff[kind] = changes
+        a_args, b_args = before.get('kernel_arguments') or [], after.get('kernel_arguments') or []
+        if a_args != b_args:
+            diff['kernel_arguments'] = {
+                'added': [arg for arg in b_args if arg not in a_args],
+                'removed': [arg for arg in a_args if arg not in b_args],
+            }
+        for field in ('extensions', 'fips', 'kernel_type', 'os_image_url'):
+            if before.get(field) != after.get(field):
+                diff[field] = {'from': before.get(field), 'to': after.get(field)}
+        if diff:
+            diffs[pool] = diff
+    return diffs
+
+
+def dump_tree(rendered: dict[str, dict[str, Any]], out_dir: str) -> int:
+    """Write each pool's effective files under out_dir/<pool>/, plus systemd
+    units and <pool>.kernel-arguments; return the number of files written."""
+    count = 0
+
+    def write(path: str, data: bytes) -> None:
+        nonlocal count
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        count += 1
+
+    for pool, result in rendered.items():
+        root = os.path.join(out_dir, pool)
+        config = result['config']
+        for entry in (config.get('storage') or {}).get('files') or []:
+            if 'error' in result['files'][entry['path']]:
+                continue
+            raw = decode_file_bytes(entry.get('contents') or {})
+            if raw is not None:
+                write(os.path.join(root, entry['path'].lstrip('/')), raw)
+        for unit in (config.get('systemd') or {}).get('units') or []:
+            unit_dir = os.path.join(root, 'etc', 'systemd', 'system')
+            if unit.get('contents') is not None:
+                write(os.path.join(unit_dir, unit['name']), unit['contents'].encode())
+            for dropin in unit.get('dropins') or []:
+                if dropin.get('contents') is not None:
+                    write(os.path.join(unit_dir, f"{unit['name']}.d", dropin['name']),
+                          dropin['contents'].encode())
+        write(os.path.join(out_dir, f"{pool}.kernel-arguments"),
+              "".join(f"{arg}\n" for arg in result['kernel_arguments']).encode())
+    return count
+
+
+def format_render(rendered: dict[str, dict[str, Any]], summary_only: bool = False) -> str:
+    lines = []
+    for pool, result in rendered.items():
+        lines.append(f"Pool {pool} (roles: {', '.join(result['roles'])}): "
+                     f"{len(result['machineconfigs'])} MachineConfigs, "
+                     f"Ignition {result['ignition_version'] or '-'}, "
+                     f"{len(result['files'])} files, {len(result['units'])} units, "
+                     f"{len(result['kernel_arguments'])} kernel arguments")
+        if not summary_only:
+            for path, entry in sorted(result['files'].items()):
+                size = f"{entry['size']} B" if 'size' in entry else entry.get('source') or '?'
+                origin = entry['set_by'][-1]
+                overrides = sorted(set(entry['set_by'][:-1]) - {origin})
+                extra = f" (overrides {', '.join(overrides)})" if overrides else ""
+                lines.append(f"  {entry['mode'] or '----'}  {size:>8}  {path}  <- {origin}{extra}")
+            for name, unit in sorted(result['units'].items()):
+                state = ", ".join(f"{k}={unit[k]}" for k in ('enabled', 'mask') if k in unit)
+                lines.append(f"  unit {name}{' (' + state + ')' if state else ''}  <- {unit['set_by'][-1]}")
+            if result['kernel_arguments']:
+                lines.append(f"  kernelArguments: {' '.join(result['kernel_arguments'])}")
+            for field in ('extensions',):
+                if result[field]:
+                    lines.append(f"  {field}: {', '.join(result[field])}")
+            if result['fips'] or result['kernel_type'] != 'default':
+                lines.append(f"  fips: {result['fips']}, kernelType: {result['kernel_type']}")
+        for warning in result['warnings']:
+            lines.append(f"  WARNING: {warning}")
+        for error in result['errors']:
+            lines.append(f"  ERROR: {error}")
+    return "\n".join(lines)
+
+
+def format_diff(diffs: dict[str, dict[str, Any]]) -> str:
+    if not diffs:
+        return "No changes: every pool renders the same as the baseline."
+    lines = []
+    for pool, diff in diffs.items():
+        lines.append(f"Pool {pool}:")
+        for kind in ('files', 'units', 'links'):
+            for change, sign in (('added', '+'), ('removed', '-'), ('changed', '~')):
+                for key in diff.get(kind, {}).get(change, []):
+                    lines.append(f"  {sign} {kind[:-1]} {key}")
+        if 'kernel_arguments' in diff:
+            for arg in diff['kernel_arguments']['added']:
+                lines.append(f"  + kernel argument {arg}")
+            for arg in diff['kernel_arguments']['removed']:
+                lines.append(f"  - kernel argument {arg}")
+            if not diff['kernel_arguments']['added'] and not diff['kernel_arguments']['removed']:
+                lines.append("  ~ kernel argument order or duplicates")
+        for field in ('extensions', 'fips', 'kernel_type', 'os_image_url'):
+            if field in diff:
+                lines.append(f"  ~ {field}: {diff[field]['from']} -> {diff[field]['to']}")
+    return "\n".join(lines)
+
+
+def is_rendered(mc: dict[str, Any]) -> bool:
+    """True for a controller-generated rendered-<pool>-<hash> MachineConfig.
+
+    These are the merge result of a pool's MachineConfigs, not an input to
+    it; rendering them again would override the inputs with a stale copy.
+    """
+    metadata = mc['doc'].get('metadata') or {}
+    owners = metadata.get('ownerReferences') or []
+    return (mc['name'].startswith('rendered-')
+            or any(ref.get('kind') == 'MachineConfigPool' for ref in owners))
+
+
+def load_dirs(dirs: list[str]) -> tuple[list[dict[str, Any]], list[tuple[str, str]]]:
+    """Load the MachineConfigs under dirs, leaving out rendered ones."""
+    machineconfigs: list[dict[str, Any]] = []
+    skipped: list[tuple[str, str]] = []
+    rendered = 0
+    for src_dir in dirs:
+        mcs, bad = load_machineconfigs(src_dir, exclude_dirs=DERIVED_MC_DIRS)
+        machineconfigs.extend(mc for mc in mcs if not is_rendered(mc))
+        rendered += sum(1 for mc in mcs if is_rendered(mc))
+        skipped.extend(bad)
+    if rendered:
+        print(f"Ignoring {rendered} rendered MachineConfig(s) from {', '.join(dirs)}", file=sys.stderr)
+    return machineconfigs, skipped
+
+
+def parse_pool_overrides(values: list[str]) -> dict[str, list[str]]:
+    overrides = {}
+    for value in values:
+        pool, sep, roles = value.partition('=')
+        if not sep or not pool or not roles:
+            raise SystemExit(f"Invalid --pool {value!r}: expected NAME=ROLE[,ROLE...]")
+        overrides[pool] = [r.strip() for r in roles.split(',') if r.strip()]
+    return overrides
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Render MachineConfigs offline with MCO merge semantics",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exit status: 0 success, 1 render errors, 2 YAML files skipped,
+3 differences from --baseline with --exit-code.
+
+Examples:
+  # Effective files per pool for the collected remediations
+  %(prog)s --src-dir complianceremediations
+
+  # Will adding these remediations to the cluster's current MachineConfigs change anything?
+  oc get machineconfigs -o yaml > cluster-mcs/all.yaml
+  %(prog)s --baseline cluster-mcs --src-dir cluster-mcs --src-dir complianceremediations --exit-code
+
+  # Compare two hardening sets file by file
+  %(prog)s --src-dir set-a --dump /tmp/a && %(prog)s --src-dir set-b --dump /tmp/b && diff -r /tmp/a /tmp/b
+"""
+    )
+    parser.add_argument(
+        '--src-dir', action='append', default=[],
+        help='Directory of MachineConfig YAMLs or oc get -o yaml dumps to render '
+             '(repeatable; default: complianceremediations)'
+    )
+    parser.add_argument(
+        '--baseline', action='append', default=[], metavar='DIR',
+        help='Render these directories too and print only how --src-dir differs (repeatable)'
+    )
+    parser.add_argument(
+        '--pool', action='append', default=[], metavar='NAME=ROLE[,ROLE...]',
+        help='Roles a pool selects (default: master and worker their own role, '
+             'any other role R worker and R)'
+    )
+    parser.add_argument('--json', metavar='FILE', help="Write the render (or diff) as JSON ('-' for stdout)")
+    parser.add_argument('--dump', metavar='DIR', help='Write the effective files of every pool under DIR/<pool>/')
+    parser.add_argument('--summary', action='store_true', help='Print only per-pool counts, warnings and errors')
+    parser.add_argument('--exit-code', action='store_true',
+                        help='With --baseline, exit 3 if the render differs from the baseline')
+    args = parser.parse_args()
+
+    overrides = parse_pool_overrides(args.pool)
+    started = time.perf_counter()
+    machineconfigs, skipped = load_dirs(args.src_dir or ['complianceremediations'])
+    loaded = time.perf_counter()
+    rendered = render(machineconfigs, overrides)
+    diffs = None
+    if args.baseline:
+        baseline_mcs, baseline_skipped = load_dirs(args.baseline)
+        skipped.extend(baseline_skipped)
+        diffs = compare_renders(render(baseline_mcs, overrides), rendered)
+    finished = time.perf_counter()
+
+    if args.json != '-':
+        print(format_diff(diffs) if diffs is not None else format_render(rendered, args.summary))
+    if args.json:
+        strip = {pool: {k: v for k, v in result.items() if k != 'config'}
+                 for pool, result in rendered.items()}
+        payload = {'diff': diffs} if diffs is not None else {'pools': strip}
+        text = json.dumps(payload, indent=2, sort_keys=True) + '\n'
+        if args.json == '-':
+            sys.stdout.write(text)
+        else:
+            with open(args.json, 'w') as f:
+                f.write(text)
+    if args.dump:
+        written = dump_tree(rendered, args.dump)
+        print(f"Wrote {written} files to {args.dump}/", file=sys.stderr)
+    print(f"Rendered {len(machineconfigs)} MachineConfigs into {len(rendered)} pool(s) "
+          f"in {(finished - loaded) * 1000:.1f} ms (loading YAML: {(loaded - started) * 1000:.1f} ms)",
+          file=sys.stderr)
+
+    errors = [e for result in rendered.values() for e in result['errors']]
+    if errors:
+        sys.exit(1)
+    if skipped:
+        print(f"\nWARNING: {len(skipped)} file(s) skipped due to YAML parse errors:",
+              file=sys.stderr)
+        for fpath, err in skipped:
+            print(f"  - {fpath}: {err}", file=sys.stderr)
+        sys.exit(2)
+    if args.exit_code and diffs:
+        sys.exit(3)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ PULL_SECRET="${PULL_SECRET:-$HOME/Downloads/pull-secret.txt}"
 PROFILES="${PROFILES:-xccdf_org.ssgproject.content_profile_e8,xccdf_org.ssgproject.content_profile_moderate}"
 RESULTS_DIR="${RESULTS_DIR:-/tmp/rhcos-scan-results}"
 SUMMARY_FILE="${SUMMARY_FILE:-}"
+SCAN_JOBS="${SCAN_JOBS:-}"
+SCAN_CACHE="${SCAN_CACHE:-1}"
 
 usage() {
 	cat <<USAGE
@@ -40,6 +42,10 @@ Environment:
   PULL_SECRET       Path to OCP pull secret (default: ~/Downloads/pull-secret.txt)
   PROFILES          Comma-separated SCAP profiles (default: e8,moderate)
   RESULTS_DIR       Output directory (default: /tmp/rhcos-scan-results)
+  SCAN_JOBS         Profiles evaluated concurrently (default: one per profile, capped at CPU count)
+  SCAN_CACHE        Reuse cached rootfs/datastream across runs; 0 disables (default: 1)
+  SCAN_CACHE_DIR    Cache location (default: ~/.cache/compliance-scripts/rhcos-scan)
+  SCAN_CACHE_MAX_SIZE  Cache size cap, least recently used entries evicted first (default: 20G)
   SUMMARY_FILE      Write markdown summary to this file (optional, used by CI)
 
 Example:
@@ -90,14 +96,39 @@ if [[ -z "$RHCOS_IMAGE" ]]; then
 fi
 log_info "RHCOS image: $RHCOS_IMAGE"
 
-log_info "Pulling RHCOS image..."
-podman pull --authfile "$PULL_SECRET" --platform linux/amd64 "$RHCOS_IMAGE" 2>&1 | tail -1
+CACHE_TOOL="$SCRIPT_DIR/scripts/scan-cache.py"
+ROOTFS=""
+if [[ "$SCAN_CACHE" == "1" ]]; then
+	ROOTFS=$(python3 "$CACHE_TOOL" lookup rootfs "$RHCOS_IMAGE" || true)
+fi
 
-log_info "Extracting rootfs..."
-podman create --name rhcos-scan-extract "$RHCOS_IMAGE" 2>/dev/null
-ROOTFS="$WORK_DIR/rhcos-root"
-mkdir -p "$ROOTFS"
-podman export rhcos-scan-extract | tar -C "$ROOTFS" -xf - || true
+if [[ -n "$ROOTFS" ]]; then
+	log_info "Using cached rootfs: $ROOTFS"
+else
+	log_info "Pulling RHCOS image..."
+	podman pull --authfile "$PULL_SECRET" --platform linux/amd64 "$RHCOS_IMAGE" 2>&1 | tail -1
+
+	log_info "Extracting rootfs..."
+	podman create --name rhcos-scan-extract "$RHCOS_IMAGE" 2>/dev/null
+	if [[ "$SCAN_CACHE" == "1" ]]; then
+		ROOTFS=$(python3 "$CACHE_TOOL" reserve rootfs)
+		_CLEANUP_DIRS+=("$ROOTFS")
+	else
+		ROOTFS="$WORK_DIR/rhcos-root"
+		mkdir -p "$ROOTFS"
+	fi
+	podman export rhcos-scan-extract | tar -C "$ROOTFS" -xf - || true
+	podman rm rhcos-scan-extract 2>/dev/null || true
+	if [[ "$SCAN_CACHE" == "1" ]]; then
+		# Only cache a rootfs that extracted far enough to identify itself
+		if [[ -e "$ROOTFS/usr/lib/os-release" || -e "$ROOTFS/etc/os-release" ]]; then
+			ROOTFS=$(python3 "$CACHE_TOOL" commit rootfs "$RHCOS_IMAGE" "$ROOTFS")
+			log_info "Cached rootfs: $ROOTFS"
+		else
+			log_warn "Rootfs extraction looks incomplete; not caching it"
+		fi
+	fi
+fi
 
 RHCOS_VERSION="unknown"
 for osrel in "$ROOTFS/usr/lib/os-release" "$ROOTFS/etc/os-release"; do
@@ -121,45 +152,65 @@ ls -la "$ROOTFS/etc/ssh/sshd_config.d/" 2>/dev/null || echo "  sshd_config.d/: n
 ls -d "$ROOTFS/etc/sysctl.d/" 2>/dev/null || echo "  sysctl.d/: not found"
 ls -d "$ROOTFS/etc/audit/" 2>/dev/null || echo "  audit/: not found"
 
-log_info "Extracting SCAP content from ${CONTENT_IMAGE}:${CONTENT_TAG}..."
-podman create --name content-scan-extract "${CONTENT_IMAGE}:${CONTENT_TAG}" 2>/dev/null
-podman cp content-scan-extract:/ssg-rhcos4-ds.xml "$WORK_DIR/ssg-rhcos4-ds.xml"
-podman rm content-scan-extract 2>/dev/null
+CONTENT_REF="${CONTENT_IMAGE}:${CONTENT_TAG}"
+CONTENT_DIR=""
+if [[ "$SCAN_CACHE" == "1" ]]; then
+	CONTENT_DIR=$(python3 "$CACHE_TOOL" lookup datastream "$CONTENT_REF" || true)
+fi
+
+if [[ -n "$CONTENT_DIR" ]]; then
+	log_info "Using cached SCAP content: $CONTENT_DIR"
+else
+	log_info "Extracting SCAP content from ${CONTENT_REF}..."
+	if [[ "$SCAN_CACHE" == "1" ]]; then
+		CONTENT_DIR=$(python3 "$CACHE_TOOL" reserve datastream)
+		_CLEANUP_DIRS+=("$CONTENT_DIR")
+	else
+		CONTENT_DIR="$WORK_DIR"
+	fi
+	podman create --name content-scan-extract "$CONTENT_REF" 2>/dev/null
+	podman cp content-scan-extract:/ssg-rhcos4-ds.xml "$CONTENT_DIR/ssg-rhcos4-ds.xml"
+	podman rm content-scan-extract 2>/dev/null
+	if [[ "$SCAN_CACHE" == "1" ]]; then
+		# Keep the rootfs this scan mounts, whether it was a hit or just committed
+		CONTENT_DIR=$(python3 "$CACHE_TOOL" commit datastream "$CONTENT_REF" "$CONTENT_DIR" --keep "$ROOTFS")
+	fi
+fi
+DATASTREAM="$CONTENT_DIR/ssg-rhcos4-ds.xml"
 
 mkdir -p "$RESULTS_DIR"
 
 IFS=',' read -ra PROFILE_LIST <<<"$PROFILES"
+log_info "Scanning ${#PROFILE_LIST[@]} profile(s) with ${SCAN_JOBS:-auto} worker(s)..."
+python3 "$SCRIPT_DIR/scripts/run-oscap-profiles.py" "${PROFILE_LIST[@]}" \
+	--rootfs "$ROOTFS" \
+	--datastream "$DATASTREAM" \
+	--results-dir "$RESULTS_DIR" \
+	--scanner "$SCANNER" \
+	--jobs "${SCAN_JOBS:-0}" ||
+	log_warn "One or more profile evaluations failed (see $RESULTS_DIR/oscap-*.log)"
+
+# Parse all profile results in one invocation (files are parsed in parallel)
+RESULTS_FILES=()
 for PROFILE in "${PROFILE_LIST[@]}"; do
 	PROFILE_SHORT="${PROFILE##*_profile_}"
-	log_info "Scanning profile: ${PROFILE_SHORT}..."
-
-	podman run --rm \
-		-v "$ROOTFS:/hostroot:ro" \
-		-v "$WORK_DIR/ssg-rhcos4-ds.xml:/content/ssg-rhcos4-ds.xml:ro" \
-		-v "$RESULTS_DIR:/results:z" \
-		-e OSCAP_PROBE_ROOT=/hostroot \
-		"$SCANNER" \
-		oscap xccdf eval \
-		--profile "$PROFILE" \
-		--results "/results/results-${PROFILE_SHORT}.xml" \
-		/content/ssg-rhcos4-ds.xml ||
-		true
-
 	RESULTS_FILE="$RESULTS_DIR/results-${PROFILE_SHORT}.xml"
-	ACTUAL_FAILS="$RESULTS_DIR/actual-${PROFILE_SHORT}-fails.txt"
-	MARKDOWN_OUT="$RESULTS_DIR/summary-${PROFILE_SHORT}.md"
 	if [[ -f "$RESULTS_FILE" ]]; then
-		log_info "Results for ${PROFILE_SHORT}:"
-		python3 "$SCRIPT_DIR/scripts/parse-oscap-results.py" "$RESULTS_FILE" \
-			--tracking "$SCRIPT_DIR/docs/_data/tracking.json" \
-			--format text \
-			--failing-file "$ACTUAL_FAILS" \
-			--markdown-file "$MARKDOWN_OUT"
+		RESULTS_FILES+=("$RESULTS_FILE")
 	else
 		log_warn "No results file for ${PROFILE_SHORT}"
 	fi
 done
 
+if ((${#RESULTS_FILES[@]} > 0)); then
+	log_info "Results for ${#RESULTS_FILES[@]} profile(s):"
+	python3 "$SCRIPT_DIR/scripts/parse-oscap-results.py" "${RESULTS_FILES[@]}" \
+		--tracking "$SCRIPT_DIR/docs/_data/tracking.json" \
+		--format text \
+		--failing-file "$RESULTS_DIR/actual-{profile}-fails.txt" \
+		--markdown-file "$RESULTS_DIR/summary-{profile}.md"
+fi
+
 echo ""
 log_success "Scan complete. Results in $RESULTS_DIR"
 log_info "OCP: $OCP_VERSION | RHCOS: $RHCOS_VERSION | Content: ${CONTENT_TAG} | Scanner: ${OPENSCAP_TAG}"
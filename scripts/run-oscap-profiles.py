@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Evaluate several SCAP profiles concurrently against one extracted rootfs.
+
+Used by rhcos-static-scan.sh. Every profile runs its own ``oscap xccdf eval``
+against the same read-only rootfs and datastream, so profiles are independent
+and can be evaluated side by side. Each evaluation writes
+``results-<profile>.xml`` and ``oscap-<profile>.log`` into the results
+directory.
+
+Two execution modes:
+  --scanner IMAGE   run oscap inside the openscap container via podman,
+                    mounting the rootfs and datastream read-only (default
+                    mode of rhcos-static-scan.sh)
+  --oscap PATH      run a local oscap binary with OSCAP_PROBE_ROOT set
+                    (hosts with openscap installed, and tests with a stub)
+
+Usage:
+    python3 scripts/run-oscap-profiles.py --rootfs /tmp/rhcos-root \\
+        --datastream /tmp/ssg-rhcos4-ds.xml --results-dir /tmp/results \\
+        --scanner quay.io/bapalm/openscap-ocp:v1.9.0 --jobs 2 \\
+        xccdf_org.ssgproject.content_profile_e8 \\
+        xccdf_org.ssgproject.content_profile_moderate
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# oscap xccdf eval exits 0 when every rule passes and 2 when at least one
+# rule fails; both mean the evaluation itself completed.
+OSCAP_OK_CODES = {0, 2}
+
+
+def profile_short(profile: str) -> str:
+    """Strip the SSG profile prefix (matches ${PROFILE##*_profile_})."""
+    return profile.split("_profile_", 1)[-1]
+
+
+def build_command(
+    profile: str,
+    rootfs: str,
+    datastream: str,
+    results_dir: str,
+    scanner: str | None = None,
+    oscap: str = "oscap",
+) -> tuple[list[str], dict[str, str] | None]:
+    """Return (argv, env) for evaluating one profile.
+
+    With a scanner image the command is a ``podman run`` that mounts the
+    rootfs and datastream read-only; otherwise ``oscap`` runs directly on
+    the host and env carries OSCAP_PROBE_ROOT.
+    """
+    results_name = f"results-{profile_short(profile)}.xml"
+    if scanner:
+        argv = [
+            "podman", "run", "--rm",
+            "-v", f"{rootfs}:/hostroot:ro",
+            "-v", f"{datastream}:/content/ssg-rhcos4-ds.xml:ro",
+            "-v", f"{results_dir}:/results:z",
+            "-e", "OSCAP_PROBE_ROOT=/hostroot",
+            scanner,
+            "oscap", "xccdf", "eval",
+            "--profile", profile,
+            "--results", f"/results/{results_name}",
+            "/content/ssg-rhcos4-ds.xml",
+        ]
+        return argv, None
+
+    argv = [
+        oscap, "xccdf", "eval",
+        "--profile", profile,
+        "--results", os.path.join(results_dir, results_name),
+        datastream,
+    ]
+    env = dict(os.environ, OSCAP_PROBE_ROOT=rootfs)
+    return argv, env
+
+
+def run_profile(
+    profile: str,
+    rootfs: str,
+    datastream: str,
+    results_dir: str,
+    scanner: str | None = None,
+    oscap: str = "oscap",
+) -> dict[str, Any]:
+    """Evaluate one profile, logging oscap output to oscap-<profile>.log."""
+    short = profile_short(profile)
+    argv, env = build_command(
+        profile, rootfs, datastream, results_dir, scanner, oscap
+    )
+    log_path = os.path.join(results_dir, f"oscap-{short}.log")
+    results_path = os.path.join(results_dir, f"results-{short}.xml")
+
+    start = time.monotonic()
+    with open(log_path, "w") as log:
+        try:
+            returncode = subprocess.call(
+                argv, stdout=log, stderr=subprocess.STDOUT, env=env
+            )
+        except OSError as e:
+            log.write(f"ERROR: could not run {argv[0]}: {e}\n")
+            returncode = 127
+    elapsed = time.monotonic() - start
+
+    return {
+        "profile": short,
+        "returncode": returncode,
+        "ok": returncode in OSCAP_OK_CODES and os.path.isfile(results_path),
+        "results": results_path,
+        "log": log_path,
+        "seconds": round(elapsed, 1),
+    }
+
+
+def run_profiles(
+    profiles: list[str],
+    rootfs: str,
+    datastream: str,
+    results_dir: str,
+    jobs: int | None = None,
+    scanner: str | None = None,
+    oscap: str = "oscap",
+) -> list[dict[str, Any]]:
+    """Evaluate profiles concurrently, returning results in input order.
+
+    The work is subprocess-bound, so a thread pool is enough; ``jobs``
+    defaults to one worker per profile, capped at the CPU count.
+    """
+    os.makedirs(results_dir, exist_ok=True)
+    if not profiles:
+        return []
+    workers = jobs or min(len(profiles), os.cpu_count() or 1)
+    workers = max(1, min(workers, len(profiles)))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_profile, profile, rootfs, datastream,
+                        results_dir, scanner, oscap)
+            for profile in profiles
+        ]
+        return [f.result() for f in futures]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Evaluate SCAP profiles concurrently against an extracted rootfs"
+    )
+    parser.add_argument("profiles", nargs="+",
+                        help="Full SCAP profile ids (comma-separated lists accepted)")
+    parser.add_argument("--rootfs", required=True,
+                        help="Extracted rootfs directory (mounted read-only)")
+    parser.add_argument("--datastream", required=True,
+                        help="SCAP datastream (ssg-rhcos4-ds.xml)")
+    parser.add_argument("--results-dir", required=True,
+                        help="Directory for results-<profile>.xml and logs")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Concurrent evaluations (default or 0: one per "
+                             "profile, capped at CPU count)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--scanner",
+                      help="openscap container image to run oscap in via podman")
+    mode.add_argument("--oscap", default="oscap",
+                      help="Local oscap binary (default: oscap on PATH)")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the per-profile run summary as JSON")
+    args = parser.parse_args()
+
+    profiles = [p for arg in args.profiles for p in arg.split(",") if p]
+    results = run_profiles(
+        profiles, args.rootfs, args.datastream, args.results_dir,
+        jobs=args.jobs, scanner=args.scanner, oscap=args.oscap,
+    )
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        for r in results:
+            state = "done" if r["ok"] else f"FAILED (rc={r['returncode']}, see {r['log']})"
+            print(f"  {r['profile']:20s} {r['seconds']:7.1f}s  {state}")
+
+    sys.exit(0 if all(r["ok"] for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
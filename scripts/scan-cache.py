@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Local cache for extracted RHCOS rootfs trees and SCAP datastreams.
+
+rhcos-static-scan.sh uses this so repeat scans of the same release skip the
+multi-GB ``podman export`` and the datastream copy. Entries live under the
+cache root as:
+
+    <root>/rootfs/<key>/          extracted rootfs, keyed by image digest
+    <root>/rootfs/<key>.json      entry metadata (ref, size, last use)
+    <root>/datastream/<key>/      ssg-rhcos4-ds.xml, keyed by content image:tag
+
+New entries are extracted into a staging directory inside the cache root and
+renamed into place on commit, so an interrupted extraction never leaves a
+half-populated entry behind. After every commit the cache is trimmed to its
+size cap by evicting the least recently used entries. An entry is marked as
+being evicted before its tree is removed, and its metadata is only dropped
+once the tree is gone, so a partly deleted tree is never handed out.
+
+Usage:
+    python3 scripts/scan-cache.py lookup rootfs quay.io/...@sha256:abc   # path, or exit 1
+    STAGE=$(python3 scripts/scan-cache.py reserve rootfs)
+    python3 scripts/scan-cache.py commit rootfs quay.io/...@sha256:abc "$STAGE"
+    python3 scripts/scan-cache.py commit datastream quay.io/...:v1 "$STAGE" --keep "$ROOTFS"
+    python3 scripts/scan-cache.py list
+    python3 scripts/scan-cache.py evict --max-size 10G
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any
+
+KINDS = ("rootfs", "datastream")
+DEFAULT_MAX_SIZE = "20G"
+SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$", re.IGNORECASE)
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def default_cache_root() -> str:
+    """Return $SCAN_CACHE_DIR, or the per-user cache directory."""
+    root = os.environ.get("SCAN_CACHE_DIR")
+    if root:
+        return root
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "compliance-scripts", "rhcos-scan")
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as 500M, 20G or 1.5GiB into bytes."""
+    match = SIZE_RE.match(value)
+    if not match:
+        raise SystemExit(f"Invalid size: {value!r} (expected e.g. 500M, 20G)")
+    number, unit = match.groups()
+    return int(float(number) * SIZE_UNITS[unit.upper()])
+
+
+def cache_key(ref: str) -> str:
+    """Derive a filesystem-safe key from an image reference.
+
+    Digest references are keyed by the digest alone so the same image
+    pulled through a mirror shares an entry; tag references keep the full
+    repository and tag.
+    """
+    if "@" in ref:
+        ref = ref.rsplit("@", 1)[1]
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", ref)
+
+
+def entry_paths(root: str, kind: str, ref: str) -> tuple[str, str]:
+    """Return (data_dir, metadata_file) for a cache entry."""
+    key = cache_key(ref)
+    return (os.path.join(root, kind, key),
+            os.path.join(root, kind, f"{key}.json"))
+
+
+def dir_size(path: str) -> int:
+    """Total apparent size of regular files under path (symlinks not followed)."""
+    total = 0
+    for dirpath, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            total += st.st_size
+    return total
+
+
+def read_meta(meta_file: str) -> dict[str, Any] | None:
+    try:
+        with open(meta_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_meta(meta_file: str, meta: dict[str, Any]) -> None:
+    tmp = f"{meta_file}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(meta, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, meta_file)
+
+
+def usable(meta: dict[str, Any] | None, data_dir: str) -> bool:
+    """Whether an entry is committed, present and not (partly) evicted."""
+    return meta is not None and not meta.get("evicting") and os.path.isdir(data_dir)
+
+
+def lookup(root: str, kind: str, ref: str) -> str | None:
+    """Return the entry directory if cached, recording the access for LRU."""
+    data_dir, meta_file = entry_paths(root, kind, ref)
+    meta = read_meta(meta_file)
+    if meta is None or not usable(meta, data_dir):
+        return None
+    meta["last_used"] = time.time()
+    write_meta(meta_file, meta)
+    return data_dir
+
+
+def reserve(root: str, kind: str) -> str:
+    """Create and return a staging directory inside the cache root."""
+    parent = os.path.join(root, kind)
+    os.makedirs(parent, exist_ok=True)
+    return tempfile.mkdtemp(prefix=".staging-", dir=parent)
+
+
+def commit(
+    root: str,
+    kind: str,
+    ref: str,
+    staging: str,
+    max_size: int | None = None,
+    keep: set[str] | None = None,
+) -> str:
+    """Move a populated staging directory into place and trim the cache.
+
+    If another scan committed the same entry first, the staging copy is
+    discarded and the existing entry is used. Trimming never evicts the
+    committed entry or any path in ``keep`` (the other entries the current
+    scan uses).
+    """
+    data_dir, meta_file = entry_paths(root, kind, ref)
+    if usable(read_meta(meta_file), data_dir):
+        shutil.rmtree(staging, ignore_errors=True)
+    else:
+        shutil.rmtree(data_dir, ignore_errors=True)
+        os.rename(staging, data_dir)
+    now = time.time()
+    write_meta(meta_file, {
+        "ref": ref,
+        "kind": kind,
+        "size": dir_size(data_dir),
+        "created": now,
+        "last_used": now,
+    })
+    if max_size is not None:
+        evict(root, max_size, keep={data_dir} | (keep or set()))
+    return data_dir
+
+
+def list_entries(root: str) -> list[dict[str, Any]]:
+    """Return all committed entries, least recently used first."""
+    entries: list[dict[str, Any]] = []
+    for kind in KINDS:
+        parent = os.path.join(root, kind)
+        if not os.path.isdir(parent):
+            continue
+        for name in os.listdir(parent):
+            if not name.endswith(".json"):
+                continue
+            meta = read_meta(os.path.join(parent, name))
+            if meta is None:
+                continue
+            meta["path"] = os.path.join(parent, name[:-len(".json")])
+            entries.append(meta)
+    entries.sort(key=lambda e: e.get("last_used", 0))
+    return entries
+
+
+def evict(
+    root: str,
+    max_size: int,
+    keep: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Remove least recently used entries until the cache fits max_size.
+
+    Entries whose path is in ``keep`` (the ones a scan is about to use) are
+    never evicted, even if they alone exceed the cap. An entry whose tree
+    cannot be fully removed keeps its metadata, flagged as evicting with
+    the remaining size, and is retried on the next eviction.
+    """
+    keep = {os.path.realpath(p) for p in keep or ()}
+    entries = list_entries(root)
+    total = sum(e.get("size", 0) for e in entries)
+    evicted = []
+    for entry in entries:
+        if total <= max_size:
+            break
+        if os.path.realpath(entry["path"]) in keep:
+            continue
+        meta_file = f"{entry['path']}.json"
+        meta = {k: v for k, v in entry.items() if k != "path"}
+        write_meta(meta_file, {**meta, "evicting": True})
+        try:
+            if os.path.lexists(entry["path"]):
+                shutil.rmtree(entry["path"])
+        except OSError as e:
+            remaining = dir_size(entry["path"])
+            print(f"WARNING: could not evict {entry['path']}: {e}", file=sys.stderr)
+            write_meta(meta_file, {**meta, "evicting": True, "size": remaining})
+            total -= entry.get("size", 0) - remaining
+            continue
+        os.remove(meta_file)
+        total -= entry.get("size", 0)
+        evicted.append(entry)
+    return evicted
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{int(size)}B"
+        size /= 1024
+    return f"{size:.1f}T"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Cache extracted RHCOS rootfs trees and SCAP datastreams"
+    )
+    parser.add_argument("--cache-dir", default=default_cache_root(),
+                        help="Cache root (default: $SCAN_CACHE_DIR or "
+                             "~/.cache/compliance-scripts/rhcos-scan)")
+    parser.add_argument("--max-size",
+                        default=os.environ.get("SCAN_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE),
+                        help="Size cap enforced on commit/evict "
+                             f"(default: $SCAN_CACHE_MAX_SIZE or {DEFAULT_MAX_SIZE})")
+    # Also accepted after the subcommand; SUPPRESS keeps the subparser from
+    # overwriting a value given before it.
+    size_opt = argparse.ArgumentParser(add_help=False)
+    size_opt.add_argument("--max-size", default=argparse.SUPPRESS,
+                          help="Size cap (same as the top-level option)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_lookup = sub.add_parser("lookup", help="Print cached entry path (exit 1 on miss)")
+    p_lookup.add_argument("kind", choices=KINDS)
+    p_lookup.add_argument("ref", help="Image reference (digest or tag)")
+
+    p_reserve = sub.add_parser("reserve", help="Create a staging dir for a new entry")
+    p_reserve.add_argument("kind", choices=KINDS)
+
+    p_commit = sub.add_parser("commit", parents=[size_opt],
+                              help="Move a staging dir into the cache")
+    p_commit.add_argument("kind", choices=KINDS)
+    p_commit.add_argument("ref", help="Image reference (digest or tag)")
+    p_commit.add_argument("staging", help="Directory returned by reserve")
+    p_commit.add_argument("--keep", action="append", default=[], metavar="PATH",
+                          help="Entry the current scan also uses; never evicted "
+                               "by this commit (repeatable)")
+
+    sub.add_parser("list", parents=[size_opt],
+                   help="List entries, least recently used first")
+    sub.add_parser("evict", parents=[size_opt], help="Trim the cache to --max-size")
+
+    args = parser.parse_args()
+    root = args.cache_dir
+    max_size = parse_size(args.max_size)
+
+    if args.command == "lookup":
+        path = lookup(root, args.kind, args.ref)
+        if path is None:
+            sys.exit(1)
+        print(path)
+    elif args.command == "reserve":
+        print(reserve(root, args.kind))
+    elif args.command == "commit":
+        print(commit(root, args.kind, args.ref, args.staging, max_size,
+                     set(args.keep)))
+    elif args.command == "list":
+        entries = list_entries(root)
+        for e in entries:
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(e.get("last_used", 0)))
+            print(f"  {e['kind']:10s} {format_size(e.get('size', 0)):>8s}  {used}  {e['ref']}")
+        total = sum(e.get("size", 0) for e in entries)
+        print(f"  Total: {format_size(total)} of {format_size(max_size)} in {root}")
+    elif args.command == "evict":
+        for e in evict(root, max_size):
+            print(f"  evicted {e['kind']} {e['ref']} ({format_size(e.get('size', 0))})")
+
+
+if __name__ == "__main__":
+    main()
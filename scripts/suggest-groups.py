@@ -5,13 +5,27 @@ Suggest remediation groups for ungrouped compliance checks.
 Analyzes check names against existing group mappings in tracking.json
 to suggest which group new or ungrouped checks belong to. Uses prefix
 matching, semantic rules, and substring matching.
+
+Known checks are indexed in a prefix trie over their hyphen-separated
+tokens, with per-node group counts, so each query is a single walk of at
+most MAX_PREFIX_DEPTH nodes and a batch of N checks is scored in O(N).
+When no prefix is conclusive, the check is compared against every group
+at once by TF-IDF cosine similarity over check-name and group-title
+tokens (see TokenIndex). With --index the trie and similarity index are
+persisted, keyed on the tracking file's content hash, so repeated runs
+skip rebuilding them.
 """
 from __future__ import annotations
 
+import hashlib
 import json
+import math
+import os
+import re
 import sys
 import argparse
 from collections import defaultdict
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +34,14 @@ DEFAULT_TRACKING = REPO_ROOT / "docs" / "_data" / "tracking.json"
 
 HIGH_THRESHOLD = 0.9
 MEDIUM_THRESHOLD = 0.5
+MAX_PREFIX_DEPTH = 6
+# Bump when the layout of the persisted index changes.
+INDEX_FORMAT = 2
+# Similarity fallback: matches below MIN_SIMILARITY are reported as no
+# match, and confidence never exceeds SIMILARITY_CAP (a dominant prefix).
+MIN_SIMILARITY = 0.1
+SIMILARITY_CAP = 0.85
+TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 SYSCTL_RULES = [
     ("sysctl-kernel-dmesg", "L2", 0.95, "sysctl dmesg_restrict"),
@@ -34,48 +56,296 @@ def load_tracking(path: str | Path) -> dict[str, Any]:
         return json.load(f)
 
 
-def build_prefix_map(
+def _new_node() -> dict[str, Any]:
+    return {"groups": {}, "children": {}, "top": None, "total": 0}
+
+
+class PrefixTrie:
+    """Prefix trie over hyphen-separated check-name tokens.
+
+    Node ``n`` at path ``a -> b -> c`` describes the prefix ``a-b-c``:
+    ``groups`` counts the known checks per group id under that prefix,
+    ``top`` is the group with the highest count (first seen wins ties) and
+    ``total`` the sum of the counts. Nodes are plain dicts so the whole
+    trie round-trips through JSON unchanged.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, root: dict[str, Any] | None = None):
+        self.root = root if root is not None else _new_node()
+
+    def add(self, check: str, gid: str, count: int = 1) -> None:
+        """Count ``check`` under every prefix up to MAX_PREFIX_DEPTH tokens."""
+        node = self.root
+        for token in check.split("-")[:MAX_PREFIX_DEPTH]:
+            children = node["children"]
+            child = children.get(token)
+            if child is None:
+                child = children[token] = _new_node()
+            node = child
+            node["groups"][gid] = node["groups"].get(gid, 0) + count
+
+    def finalize(self) -> PrefixTrie:
+        """Precompute ``top`` and ``total`` for every node."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            groups = node["groups"]
+            if groups:
+                node["top"] = max(groups.items(), key=lambda x: x[1])[0]
+                node["total"] = sum(groups.values())
+            stack.extend(node["children"].values())
+        return self
+
+    def path(self, parts: list[str]) -> list[dict[str, Any]]:
+        """Return the nodes for parts[:1], parts[:2], ... that exist."""
+        nodes = []
+        node = self.root
+        for token in parts[:MAX_PREFIX_DEPTH]:
+            node = node["children"].get(token)
+            if node is None:
+                break
+            nodes.append(node)
+        return nodes
+
+    @classmethod
+    def from_prefix_map(cls, prefix_map: dict[str, dict[str, int]]) -> PrefixTrie:
+        """Build a trie from a flat prefix -> {group_id: count} mapping."""
+        trie = cls()
+        for pfx, counts in prefix_map.items():
+            node = trie.root
+            for token in pfx.split("-"):
+                node = node["children"].setdefault(token, _new_node())
+            for gid, count in counts.items():
+                node["groups"][gid] = node["groups"].get(gid, 0) + count
+        return trie.finalize()
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case alphanumeric tokens of at least three characters."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 2]
+
+
+def _tf_weights(tokens: list[str]) -> dict[str, float]:
+    """Sublinear term frequency: 1 + ln(count)."""
+    counts: dict[str, int] = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    return {t: 1.0 + math.log(c) for t, c in counts.items()}
+
+
+class TokenIndex:
+    """TF-IDF vectors of every group, stored as an inverted index.
+
+    Each group is a document made of its title, description and the names
+    of its known checks. ``postings`` maps a token to two parallel lists,
+    the indexes into ``groups`` that contain it and the token's weight in
+    each (unit-normalised) group vector, so scoring a query against all
+    groups is one sparse matrix-vector product that touches only the
+    query's tokens. Query tokens never seen in tracking data still count
+    towards the query norm at the maximum idf, so checks that share one
+    common word with a group score low instead of matching perfectly.
+    """
+
+    __slots__ = ("groups", "postings", "idf", "unseen_idf")
+
+    def __init__(
+        self,
+        groups: list[str],
+        postings: dict[str, list[list[Any]]],
+        idf: dict[str, float],
+    ):
+        self.groups = groups
+        self.postings = postings
+        self.idf = idf
+        self.unseen_idf = math.log(1 + len(groups)) + 1.0
+
+    @classmethod
+    def build(
+        cls, tracking: dict[str, Any], group_checks: dict[str, list[str]]
+    ) -> TokenIndex:
+        groups = tracking.get("groups", {})
+        gids = list(dict.fromkeys([*groups, *group_checks]))
+        docs = []
+        for gid in gids:
+            info = groups.get(gid) or {}
+            tokens = tokenize(f"{info.get('title', '')} {info.get('description', '')}")
+            for check in group_checks.get(gid, []):
+                tokens.extend(tokenize(check))
+            docs.append(_tf_weights(tokens))
+
+        df: dict[str, int] = {}
+        for doc in docs:
+            for token in doc:
+                df[token] = df.get(token, 0) + 1
+        n = len(gids)
+        idf = {t: math.log((1 + n) / (1 + d)) + 1.0 for t, d in df.items()}
+
+        postings: dict[str, list[list[Any]]] = {}
+        for i, doc in enumerate(docs):
+            weights = {t: tf * idf[t] for t, tf in doc.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for token, w in weights.items():
+                entry = postings.setdefault(token, [[], []])
+                entry[0].append(i)
+                entry[1].append(w / norm)
+        return cls(gids, postings, idf)
+
+    def scores(self, check_name: str) -> tuple[list[float], dict[str, float]]:
+        """Return (cosine per group, query weight per known token)."""
+        query = _tf_weights(tokenize(check_name))
+        acc = [0.0] * len(self.groups)
+        known: dict[str, float] = {}
+        norm_sq = 0.0
+        for token, tf in query.items():
+            idf = self.idf.get(token)
+            w = tf * (idf if idf is not None else self.unseen_idf)
+            norm_sq += w * w
+            if idf is not None:
+                known[token] = w
+        if not known:
+            return acc, known
+        norm = math.sqrt(norm_sq)
+        postings = self.postings
+        for token, w in known.items():
+            q = w / norm
+            idxs, weights = postings[token]
+            for i, gw in zip(idxs, weights):
+                acc[i] += q * gw
+        return acc, known
+
+    def best(self, check_name: str) -> tuple[str | None, float, str]:
+        """Most similar group as (group_id, confidence, reason).
+
+        Confidence is the top cosine less half the runner-up's, so a check
+        that resembles two groups equally is not reported with the
+        certainty of one that resembles only one.
+        """
+        acc, known = self.scores(check_name)
+        if not known:
+            return None, 0.0, "no match"
+        ranked = sorted(range(len(acc)), key=acc.__getitem__, reverse=True)[:2]
+        top = acc[ranked[0]]
+        second = acc[ranked[1]] if len(ranked) > 1 else 0.0
+        if top < MIN_SIMILARITY:
+            return None, 0.0, "no match"
+        i = ranked[0]
+        shared = sorted(
+            (t for t in known if i in self.postings[t][0]),
+            key=lambda t: -known[t],
+        )[:3]
+        conf = round(min(SIMILARITY_CAP, top - second / 2), 2)
+        return self.groups[i], conf, (
+            f"similar to {self.groups[i]} (cosine {top:.2f}; "
+            f"tokens {', '.join(repr(t) for t in shared)})"
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {"groups": self.groups, "postings": self.postings, "idf": self.idf}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> TokenIndex:
+        return cls(data["groups"], data["postings"], data["idf"])
+
+
+def build_indexes(
     tracking: dict[str, Any],
 ) -> tuple[
-    dict[str, dict[str, int]],
+    PrefixTrie,
     dict[str, list[str]],
-    dict[str, str],
+    TokenIndex,
 ]:
-    """Build prefix→{group_id: count} and keyword→group_id maps."""
-    groups = tracking.get("groups", {})
+    """Build the prefix trie and similarity index from tracking data."""
     group_checks: defaultdict[str, list[str]] = defaultdict(list)
     for check, info in tracking.get("remediations", {}).items():
         group_checks[info["group"]].append(check)
 
-    prefix_map: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    trie = PrefixTrie()
     for gid, checks in group_checks.items():
         for check in checks:
-            parts = check.split("-")
-            for depth in range(1, min(len(parts) + 1, 7)):
-                pfx = "-".join(parts[:depth])
-                prefix_map[pfx][gid] += 1
-
-    kw_map = {}
-    for gid, g in groups.items():
-        for word in g.get("title", "").lower().split():
-            if len(word) > 3:
-                kw_map[word] = gid
-    for gid, checks in group_checks.items():
-        for existing in checks:
-            for token in existing.split("-"):
-                if len(token) > 3:
-                    kw_map[token] = gid
+            trie.add(check, gid)
+    trie.finalize()
+
+    return trie, group_checks, TokenIndex.build(tracking, group_checks)
+
 
-    return prefix_map, group_checks, kw_map
+def default_index_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "compliance-scripts", "suggest-groups-index.json")
+
+
+def save_index(
+    index_path: str | Path,
+    digest: str,
+    trie: PrefixTrie,
+    group_checks: dict[str, list[str]],
+    similarity: TokenIndex,
+) -> None:
+    """Persist the built index, tagged with the tracking file's digest."""
+    parent = os.path.dirname(index_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    tmp = f"{index_path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({
+            "format": INDEX_FORMAT,
+            "tracking_sha256": digest,
+            "trie": trie.root,
+            "group_checks": group_checks,
+            "similarity": similarity.to_json(),
+        }, f)
+    os.replace(tmp, index_path)
+
+
+def load_index(
+    index_path: str | Path, digest: str
+) -> tuple[PrefixTrie, dict[str, list[str]], TokenIndex] | None:
+    """Return the persisted index if it was built from the same tracking data."""
+    try:
+        with open(index_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(data, dict) or data.get("format") != INDEX_FORMAT
+            or data.get("tracking_sha256") != digest):
+        return None
+    return (PrefixTrie(data["trie"]), data["group_checks"],
+            TokenIndex.from_json(data["similarity"]))
+
+
+def load_tracking_index(
+    tracking_path: str | Path, index_path: str | Path | None = None
+) -> tuple[dict[str, Any], PrefixTrie, dict[str, list[str]], TokenIndex]:
+    """Load tracking data and its index, reusing a persisted index if current.
+
+    Returns (tracking, trie, group_checks, similarity).
+    """
+    with open(tracking_path, "rb") as f:
+        raw = f.read()
+    tracking = json.loads(raw)
+    if index_path is None:
+        return (tracking, *build_indexes(tracking))
+    digest = hashlib.sha256(raw).hexdigest()
+    index = load_index(index_path, digest)
+    if index is None:
+        index = build_indexes(tracking)
+        save_index(index_path, digest, *index)
+    return (tracking, *index)
 
 
 def suggest_group(
     check_name: str,
-    prefix_map: dict[str, dict[str, int]],
-    kw_map: dict[str, str],
+    trie: PrefixTrie,
+    similarity: TokenIndex,
     medium_threshold: float = MEDIUM_THRESHOLD,
 ) -> tuple[str | None, float, str]:
-    """Suggest the best group for a check name. Returns (group_id, confidence, reason)."""
+    """Suggest the best group for a check name. Returns (group_id, confidence, reason).
+
+    ``similarity`` is consulted when no prefix in ``trie`` reaches
+    medium_threshold.
+    """
     parts = check_name.split("-")
 
     if check_name.startswith("sysctl-"):
@@ -87,42 +357,53 @@ def suggest_group(
     best_confidence = 0.0
     best_reason = ""
 
-    for depth in range(min(len(parts), 6), 0, -1):
-        pfx = "-".join(parts[:depth])
-        if pfx not in prefix_map:
+    nodes = trie.path(parts)
+    for depth in range(len(nodes), 0, -1):
+        node = nodes[depth - 1]
+        candidates = node["groups"]
+        if not candidates:
             continue
 
-        candidates = prefix_map[pfx]
         if len(candidates) == 1:
-            gid = list(candidates.keys())[0]
+            gid = node["top"]
             conf = min(0.95, 0.7 + depth * 0.05)
             if conf > best_confidence:
                 best_group = gid
                 best_confidence = conf
-                best_reason = f"prefix '{pfx}' unique to {gid}"
+                best_reason = f"prefix '{'-'.join(parts[:depth])}' unique to {gid}"
             break
         else:
-            top = max(candidates.items(), key=lambda x: x[1])
-            total = sum(candidates.values())
-            dominance = top[1] / total
+            top = node["top"]
+            top_count = candidates[top]
+            total = node["total"]
+            dominance = top_count / total
             conf = min(0.85, 0.4 + dominance * 0.3 + depth * 0.05)
             if conf > best_confidence:
-                best_group = top[0]
+                best_group = top
                 best_confidence = conf
                 best_reason = (
-                    f"prefix '{pfx}' → {top[0]} "
-                    f"({top[1]}/{total} checks)"
+                    f"prefix '{'-'.join(parts[:depth])}' → {top} "
+                    f"({top_count}/{total} checks)"
                 )
 
     if best_group and best_confidence >= medium_threshold:
         return best_group, best_confidence, best_reason
 
-    for token in parts:
-        if token in kw_map:
-            gid = kw_map[token]
-            return gid, medium_threshold, f"keyword '{token}' found in {gid}"
+    return similarity.best(check_name)
 
-    return None, 0.0, "no match"
+
+def suggest_groups(
+    check_names: list[str],
+    trie: PrefixTrie,
+    similarity: TokenIndex,
+    medium_threshold: float = MEDIUM_THRESHOLD,
+) -> list[tuple[str | None, float, str]]:
+    """Score a batch of check names; one trie walk per name, plus one
+    sparse product against all groups for names with no conclusive prefix."""
+    return [
+        suggest_group(name, trie, similarity, medium_threshold)
+        for name in check_names
+    ]
 
 
 def extract_check_names_from_scan(scan_data: dict[str, Any]) -> set[str]:
@@ -137,6 +418,15 @@ def extract_check_names_from_scan(scan_data: dict[str, Any]) -> set[str]:
     return names
 
 
+def extract_failing_checks(scan_data: dict[str, Any]) -> dict[str, str]:
+    """Return prefix-stripped failing check names mapped to their severity."""
+    failing = {}
+    for severity in ["high", "medium", "low"]:
+        for item in scan_data.get("remediations", {}).get(severity, []):
+            failing[strip_profile_prefix(item["name"])] = item.get("severity", severity)
+    return failing
+
+
 def strip_profile_prefix(name: str) -> str:
     """Strip profile/role prefix from a check name.
     rhcos4-e8-master-sshd-disable-root-login → sshd-disable-root-login
@@ -152,6 +442,57 @@ def strip_profile_prefix(name: str) -> str:
     return name
 
 
+def confidence_bucket(
+    confidence: float,
+    high_threshold: float = HIGH_THRESHOLD,
+    medium_threshold: float = MEDIUM_THRESHOLD,
+) -> str:
+    """Classify a confidence as high, medium, low or unmatched."""
+    if confidence >= high_threshold:
+        return "high"
+    if confidence >= medium_threshold:
+        return "medium"
+    if confidence > 0.0:
+        return "low"
+    return "unmatched"
+
+
+def build_suggestion_file(
+    results: list[dict[str, Any]],
+    tracking_path: str,
+    high_threshold: float = HIGH_THRESHOLD,
+    medium_threshold: float = MEDIUM_THRESHOLD,
+    scan_path: str | None = None,
+    scan_data: dict[str, Any] | None = None,
+    severities: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Build the machine-readable suggestion document written by --output."""
+    severities = severities or {}
+    suggestions = []
+    summary = {"total": len(results), "high": 0, "medium": 0, "low": 0, "unmatched": 0}
+    for r in results:
+        bucket = confidence_bucket(r["confidence"], high_threshold, medium_threshold)
+        summary[bucket] += 1
+        entry = dict(r, bucket=bucket)
+        if r["check"] in severities:
+            entry["severity"] = severities[r["check"]]
+        suggestions.append(entry)
+
+    doc: dict[str, Any] = {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "tracking": tracking_path,
+    }
+    if scan_path:
+        doc["scan"] = scan_path
+    if scan_data:
+        doc["version"] = scan_data.get("version")
+        doc["scan_date"] = scan_data.get("scan_date")
+    doc["thresholds"] = {"high": high_threshold, "medium": medium_threshold}
+    doc["summary"] = summary
+    doc["suggestions"] = suggestions
+    return doc
+
+
 def print_section(
     label: str,
     checks: list[dict[str, Any]],
@@ -181,6 +522,7 @@ Examples:
   %(prog)s --tracking docs/_data/tracking-5_0.json docs/_data/ocp-5_0.json
   %(prog)s --checks "chronyd-configure-local-socket,new-check"
   %(prog)s --json docs/_data/ocp-5_0.json
+  %(prog)s --failing --output suggestions-5_0.json docs/_data/ocp-5_0.json
 """,
     )
     parser.add_argument("scan", nargs="?", help="Scan export JSON file")
@@ -193,18 +535,29 @@ Examples:
                         help="Output as JSON")
     parser.add_argument("--all", action="store_true",
                         help="Show all checks including already-grouped ones")
+    parser.add_argument("--failing", action="store_true",
+                        help="With a scan export, only consider failing checks")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="Also write the suggestions as a JSON document")
     parser.add_argument("--high-threshold", type=float, default=HIGH_THRESHOLD,
                         help=f"Minimum confidence for HIGH bucket (default: {HIGH_THRESHOLD})")
     parser.add_argument("--medium-threshold", type=float, default=MEDIUM_THRESHOLD,
                         help=f"Minimum confidence for MEDIUM bucket (default: {MEDIUM_THRESHOLD})")
+    parser.add_argument("--index", nargs="?", const=default_index_path(),
+                        default=None, metavar="FILE",
+                        help="Persist the prefix index and reuse it while the "
+                             "tracking file is unchanged (default FILE: "
+                             "~/.cache/compliance-scripts/suggest-groups-index.json)")
     args = parser.parse_args()
 
-    tracking = load_tracking(args.tracking)
-    prefix_map, group_checks, kw_map = build_prefix_map(tracking)
+    tracking, trie, group_checks, similarity = load_tracking_index(
+        args.tracking, args.index)
     groups = tracking.get("groups", {})
     tracked_checks = set(tracking.get("remediations", {}).keys())
 
     ungrouped = []
+    scan_data = None
+    severities: dict[str, str] = {}
 
     if args.checks:
         for name in args.checks.split(","):
@@ -219,22 +572,27 @@ Examples:
     elif args.scan:
         with open(args.scan) as f:
             scan_data = json.load(f)
-        all_checks = extract_check_names_from_scan(scan_data)
-        stripped = {strip_profile_prefix(c) for c in all_checks}
-        if args.all:
-            ungrouped = sorted(stripped)
+        severities = extract_failing_checks(scan_data)
+        if args.failing:
+            stripped = set(severities)
         else:
-            ungrouped = sorted(stripped - tracked_checks)
+            all_checks = extract_check_names_from_scan(scan_data)
+            stripped = {strip_profile_prefix(c) for c in all_checks}
+        ungrouped = sorted(stripped)
     else:
         parser.print_help()
         sys.exit(1)
 
     ungrouped = sorted(set(ungrouped))
 
+    untracked = [c for c in ungrouped if c not in tracked_checks]
+    if not args.all:
+        ungrouped = untracked
+    scores = dict(zip(untracked, suggest_groups(
+        untracked, trie, similarity, args.medium_threshold)))
+
     results = []
     for check in ungrouped:
-        if check in tracked_checks and not args.all:
-            continue
         if check in tracked_checks:
             gid = tracking["remediations"][check]["group"]
             results.append({
@@ -243,12 +601,21 @@ Examples:
             })
             continue
 
-        gid, conf, reason = suggest_group(check, prefix_map, kw_map, args.medium_threshold)
+        gid, conf, reason = scores[check]
         results.append({
             "check": check, "group": gid, "confidence": conf,
             "reason": reason,
         })
 
+    if args.output:
+        doc = build_suggestion_file(
+            results, args.tracking, args.high_threshold, args.medium_threshold,
+            scan_path=args.scan, scan_data=scan_data, severities=severities,
+        )
+        with open(args.output, "w") as f:
+            json.dump(doc, f, indent=2)
+            f.write("\n")
+
     if args.json:
         json.dump(results, sys.stdout, indent=2)
         print()
@@ -267,17 +634,13 @@ Examples:
 
     ht = args.high_threshold
     mt = args.medium_threshold
-    high, medium, low, no_match = [], [], [], []
+    buckets: dict[str, list[dict[str, Any]]] = {
+        "high": [], "medium": [], "low": [], "unmatched": [],
+    }
     for r in results:
-        c = r["confidence"]
-        if c >= ht:
-            high.append(r)
-        elif c >= mt:
-            medium.append(r)
-        elif c > 0.0:
-            low.append(r)
-        else:
-            no_match.append(r)
+        buckets[confidence_bucket(r["confidence"], ht, mt)].append(r)
+    high, medium, low, no_match = (
+        buckets["high"], buckets["medium"], buckets["low"], buckets["unmatched"])
 
     print_section(f"HIGH CONFIDENCE (>= {ht})", high, groups)
     print_section(f"MEDIUM CONFIDENCE ({mt}-{ht})", medium, groups)
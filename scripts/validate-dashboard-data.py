@@ -4,24 +4,46 @@ Validate dashboard JSON data files for structural correctness.
 
 Checks docs/_data scan exports, tracking files, scan-history.json,
 group-matrix.json, and upstream-prs.json against expected schemas
-to prevent malformed data from breaking the live dashboard.
-
-Usage: python3 scripts/validate-dashboard-data.py [docs/_data/]
+to prevent malformed data from breaking the live dashboard. Each format is
+declared as a schema (SCAN_EXPORT_SCHEMA, TRACKING_SCHEMA, ...) that is
+compiled once into closures that check the data and report errors; a new
+field is usually one line in the relevant schema.
+
+Each file is parsed exactly once, in a process pool when more than one CPU
+is available; the scan/tracking cross-reference warnings reuse the check
+names extracted during that single parse.
+
+With --cache, results are remembered per file, keyed on the file's content
+hash and on the validator source itself, so unchanged files are not re-parsed
+on the next run. Cross-reference results are reused only while both their
+input files are unchanged. --changed-only restricts the run to the files in
+a git-diff style path list (plus the cross-reference partners they need),
+which keeps local pre-commit/pre-push hooks fast.
+
+Usage: python3 scripts/validate-dashboard-data.py [docs/_data/] [--jobs N]
+           [--cache [FILE]] [--changed-only PATHS_FILE|-]
 """
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
 import os
 import re
 import sys
 import glob
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
 
 ISO8601_PATTERN = re.compile(
     r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$'
 )
 
 
+# Bump when the layout of the --cache file changes.
+CACHE_FORMAT = 1
+
+
 PROFILE_PREFIXES = [
     "rhcos4-e8-master-", "rhcos4-e8-worker-", "rhcos4-e8-",
     "rhcos4-moderate-master-", "rhcos4-moderate-worker-", "rhcos4-moderate-",
@@ -29,6 +51,11 @@ PROFILE_PREFIXES = [
 ]
 
 
+def load_json(filepath: str) -> Any:
+    with open(filepath) as f:
+        return json.load(f)
+
+
 def strip_profile_prefix(name: str) -> str:
     """Strip profile/role prefix from a check name."""
     for prefix in PROFILE_PREFIXES:
@@ -37,143 +64,6 @@ def strip_profile_prefix(name: str) -> str:
     return name
 
 
-def validate_scan_export(filepath: str) -> list[str]:
-    """Validate an ocp-X_XX.json scan export file."""
-    errors = []
-    with open(filepath) as f:
-        data = json.load(f)
-
-    required_top = {"version", "scan_date", "summary", "remediations"}
-    missing_top = required_top - set(data.keys())
-    if missing_top:
-        errors.append(f"Missing top-level keys: {missing_top}")
-
-    if "scan_date" in data:
-        val = data["scan_date"]
-        if not isinstance(val, str):
-            errors.append(
-                f"scan_date must be a string, got {type(val).__name__}"
-            )
-        elif not ISO8601_PATTERN.match(val):
-            errors.append(
-                f"scan_date must be ISO 8601 format "
-                f"(YYYY-MM-DDTHH:MM:SSZ), got '{val}'"
-            )
-
-    if "summary" in data:
-        required_summary = {
-            "total_checks", "passing", "failing", "manual"
-        }
-        missing_summary = required_summary - set(data["summary"].keys())
-        if missing_summary:
-            errors.append(f"Missing summary fields: {missing_summary}")
-
-        for field in ["total_checks", "passing", "failing", "manual"]:
-            val = data["summary"].get(field)
-            if val is not None and not isinstance(val, int):
-                errors.append(f"summary.{field} must be int, got {type(val).__name__}")
-
-        total = data["summary"].get("total_checks", 0)
-        parts = (
-            data["summary"].get("passing", 0)
-            + data["summary"].get("failing", 0)
-            + data["summary"].get("manual", 0)
-            + data["summary"].get("skipped", 0)
-        )
-        if total > 0 and parts != total:
-            errors.append(
-                f"summary counts don't add up: "
-                f"passing({data['summary'].get('passing', 0)}) + "
-                f"failing({data['summary'].get('failing', 0)}) + "
-                f"manual({data['summary'].get('manual', 0)}) + "
-                f"skipped({data['summary'].get('skipped', 0)}) = "
-                f"{parts}, expected {total}"
-            )
-
-    if "remediations" in data:
-        for severity in ["high", "medium", "low"]:
-            items = data["remediations"].get(severity, [])
-            if not isinstance(items, list):
-                errors.append(f"remediations.{severity} must be a list")
-                continue
-            for i, item in enumerate(items):
-                for field in ["name", "status", "severity"]:
-                    if field not in item:
-                        errors.append(
-                            f"remediations.{severity}[{i}] missing '{field}'"
-                        )
-
-    if "passing_checks" in data:
-        if not isinstance(data["passing_checks"], dict):
-            errors.append("'passing_checks' must be a dict")
-        else:
-            for severity in ["high", "medium", "low"]:
-                items = data["passing_checks"].get(severity, [])
-                if not isinstance(items, list):
-                    errors.append(
-                        f"passing_checks.{severity} must be a list"
-                    )
-                    continue
-                for i, item in enumerate(items):
-                    if "name" not in item:
-                        errors.append(
-                            f"passing_checks.{severity}[{i}] missing 'name'"
-                        )
-
-    if "exported_at" in data:
-        val = data["exported_at"]
-        if not isinstance(val, str):
-            errors.append(
-                f"exported_at must be a string, got {type(val).__name__}"
-            )
-        elif not ISO8601_PATTERN.match(val):
-            errors.append(
-                f"exported_at must be ISO 8601 format "
-                f"(YYYY-MM-DDTHH:MM:SSZ), got '{val}'"
-            )
-
-    if "manual_checks" in data:
-        if not isinstance(data["manual_checks"], list):
-            errors.append("'manual_checks' must be a list")
-        else:
-            for i, item in enumerate(data["manual_checks"]):
-                if "name" not in item:
-                    errors.append(
-                        f"manual_checks[{i}] missing 'name'"
-                    )
-
-    return errors
-
-
-def validate_tracking(filepath: str) -> list[str]:
-    """Validate tracking.json structure and field consistency."""
-    errors = []
-    with open(filepath) as f:
-        data = json.load(f)
-
-    required_top = {"meta", "groups", "remediations"}
-    missing_top = required_top - set(data.keys())
-    if missing_top:
-        errors.append(f"Missing top-level keys: {missing_top}")
-
-    if "groups" in data:
-        if not isinstance(data["groups"], dict):
-            errors.append("'groups' must be a dict")
-        else:
-            errors.extend(_validate_tracking_groups(data["groups"]))
-
-    if "remediations" in data:
-        if not isinstance(data["remediations"], dict):
-            errors.append("'remediations' must be a dict")
-        else:
-            errors.extend(_validate_tracking_remediations(
-                data["remediations"],
-                set(data.get("groups", {}).keys())
-            ))
-
-    return errors
-
-
 # Valid enum values for tracking group fields
 VALID_SEVERITIES = {"HIGH", "MEDIUM", "LOW", "MANUAL"}
 VALID_PLATFORMS = {"rhcos", "ocp", "mixed"}
@@ -194,362 +84,660 @@ VERSION_SLUG_PATTERN = re.compile(r'^\d+_\d+$')
 MATRIX_CELL_FIELDS = ("pass", "fail", "manual", "total")
 MATRIX_META_KEYS = {"description", "note"}
 UPSTREAM_PR_REQUIRED = {"number", "title", "url", "state"}
+SCAN_SEVERITIES = ("high", "medium", "low")
+SUMMARY_FIELDS = ("total_checks", "passing", "failing", "manual")
 
 
-def _validate_tracking_groups(groups: dict[str, Any]) -> list[str]:
-    """Validate all groups in a tracking file."""
-    errors = []
-    group_ids = set(groups.keys())
+# --- Schema engine ---
+#
+# Each data file is described declaratively with the spec classes below.
+# Each schema is compiled once, at import time, into a tree of plain
+# closures, one per spec node:
+#
+#   check(value, parent, key, errors, ctx)
+#       Checks ``value`` and appends a message to ``errors`` for each
+#       problem, in the order the checks are declared. ``parent`` is the
+#       enclosing path and ``key`` the field name or list index; paths stay
+#       (parent, key, join) tuples until a message is actually rendered, so
+#       a valid document never formats a string.
+#
+# ``ctx`` holds lookup sets derived from the whole document (Ref fields).
+# Message templates are str.format strings with these fields:
+#   {label}   full path of the value, e.g. "groups.H1 priority"
+#   {parent}  path of the enclosing object, e.g. "groups.H1"
+#   {key}     field name or index of the value, e.g. "priority"
+#   {type}    type name of the offending value (type errors)
+#   {value}   the offending value (enum, pattern and reference errors)
+
+Checker = Callable[[Any, Any, Any, "list[str]", "dict[str, Any]"], None]
+Join = Callable[[str, Any], str]
+_MISSING = object()
+_NEVER = object()
+
+
+def _joiner(sep: str) -> Join:
+    """Join child keys onto a parent path with sep ("" parent = root)."""
+    def join(parent: str, key: Any) -> str:
+        return f"{parent}{sep}{key}" if parent else str(key)
+    return join
+
+
+def _index(parent: str, i: Any) -> str:
+    return f"{parent}[{i}]"
+
+
+def _render(path: Any) -> str:
+    if isinstance(path, str):
+        return path
+    parent, key, join = path
+    return join(_render(parent), key)
+
+
+def _report(
+    errors: list[str], template: str, parent: Any, key: Any, join: Join,
+    **fields: Any,
+) -> None:
+    parent_label = _render(parent)
+    errors.append(template.format(
+        label=join(parent_label, key), parent=parent_label, key=key, **fields
+    ))
+
+
+def _member(value: Any, values: Any) -> bool:
+    try:
+        return value in values
+    except TypeError:  # unhashable value
+        return False
+
+
+class Spec:
+    """A schema node.
+
+    ``nullable`` fields are skipped when null; ``check_missing`` fields are
+    checked (as null) even when absent. Other absent fields are skipped.
+    """
+
+    def __init__(self, nullable: bool = False, check_missing: bool = False):
+        self.nullable = nullable
+        self.check_missing = check_missing
+
+    def compile(self, join: Join) -> Checker:
+        """Return the closure checking this node; ``join`` renders its path."""
+        raise NotImplementedError
+
+
+class Typed(Spec):
+    """Value must be an instance of ``types``."""
+
+    def __init__(self, types: Any, msg: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.types = types
+        self.msg = msg
+
+    def compile(self, join: Join) -> Checker:
+        types, msg = self.types, self.msg
+
+        def check(value, parent, key, errors, ctx):
+            if not isinstance(value, types):
+                _report(errors, msg, parent, key, join, type=type(value).__name__)
+        return check
+
+
+class Str(Spec):
+    """String, optionally required to satisfy ``match``."""
+
+    def __init__(
+        self,
+        msg: str = "{label} must be a string, got {type}",
+        match: Callable[[str], Any] | None = None,
+        match_msg: str = "",
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.msg = msg
+        self.match = match
+        self.match_msg = match_msg
+
+    def compile(self, join: Join) -> Checker:
+        msg, match, match_msg = self.msg, self.match, self.match_msg
+
+        def check(value, parent, key, errors, ctx):
+            if not isinstance(value, str):
+                _report(errors, msg, parent, key, join, type=type(value).__name__)
+            elif match is not None and not match(value):
+                _report(errors, match_msg, parent, key, join, value=value)
+        return check
+
+
+class Int(Spec):
+    """Integer, optionally with a lower bound."""
+
+    def __init__(
+        self,
+        msg: str = "{label} must be int, got {type}",
+        minimum: int | None = None,
+        min_msg: str = "{label} must be >= {minimum}, got {value}",
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.msg = msg
+        self.minimum = minimum
+        self.min_msg = min_msg
+
+    def compile(self, join: Join) -> Checker:
+        msg, minimum, min_msg = self.msg, self.minimum, self.min_msg
+
+        def check(value, parent, key, errors, ctx):
+            if not isinstance(value, int):
+                _report(errors, msg, parent, key, join, type=type(value).__name__)
+            elif minimum is not None and value < minimum:
+                _report(errors, min_msg, parent, key, join,
+                        value=value, minimum=minimum)
+        return check
+
+
+class Enum(Spec):
+    """Value must be one of ``values`` or a string starting with a prefix."""
+
+    def __init__(
+        self,
+        values: Any,
+        msg: str = "{parent} invalid {key}: '{value}'",
+        prefixes: tuple[str, ...] = (),
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.values = frozenset(values)
+        self.msg = msg
+        self.prefixes = prefixes
+
+    def compile(self, join: Join) -> Checker:
+        values, msg, prefixes = self.values, self.msg, self.prefixes
+
+        def check(value, parent, key, errors, ctx):
+            if _member(value, values):
+                return
+            if prefixes and isinstance(value, str) and value.startswith(prefixes):
+                return
+            _report(errors, msg, parent, key, join, value=value)
+        return check
+
+
+class Ref(Spec):
+    """Value must be a member of the set stored under ``ctx[name]``."""
+
+    def __init__(self, name: str, msg: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.name = name
+        self.msg = msg
+
+    def compile(self, join: Join) -> Checker:
+        name, msg = self.name, self.msg
+
+        def check(value, parent, key, errors, ctx):
+            if not _member(value, ctx.get(name, ())):
+                _report(errors, msg, parent, key, join, value=value)
+        return check
+
+
+class List(Spec):
+    """List whose items match ``item``; ``also`` types are accepted as-is."""
+
+    def __init__(
+        self,
+        item: Spec | None = None,
+        msg: str = "{label} must be a list",
+        also: tuple[type, ...] = (),
+        item_join: Join = _index,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.item = item
+        self.msg = msg
+        self.also = also
+        self.item_join = item_join
+
+    def compile(self, join: Join) -> Checker:
+        msg, also = self.msg, self.also
+        item = self.item.compile(self.item_join) if self.item else None
+
+        def check(value, parent, key, errors, ctx):
+            if not isinstance(value, list):
+                if not isinstance(value, also):
+                    _report(errors, msg, parent, key, join,
+                            type=type(value).__name__)
+                return
+            if item is not None:
+                path = (parent, key, join)
+                for i, entry in enumerate(value):
+                    item(entry, path, i, errors, ctx)
+        return check
+
+
+class Object(Spec):
+    """JSON object with declared ``fields``, checked in declaration order.
+
+    ``required`` fields missing from the object are reported together as a
+    set; ``required_each`` fields are reported one message per field.
+    With ``extra=(pattern, spec)`` the object is open: keys are visited in
+    document order, keys matching the pattern are checked against spec and
+    any other undeclared key is reported as unexpected. ``rules`` are
+    callables taking the object and returning an error template or None.
+    With ``msg=None`` a non-object value is checked as an empty object, so
+    it is reported through its missing fields.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, Spec] | None = None,
+        sep: str = ".",
+        msg: str | None = "{label} must be an object",
+        required: set[str] | None = None,
+        missing_msg: str = "{label} missing fields: {missing}",
+        required_each: tuple[str, ...] = (),
+        each_msg: str = "{label} missing '{field}'",
+        extra: tuple[re.Pattern[str], Spec] | None = None,
+        extra_msg: str = "{label}: unexpected key",
+        rules: tuple[Callable[[dict[str, Any]], str | None], ...] = (),
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.fields = fields or {}
+        self.sep = sep
+        self.msg = msg
+        self.required = required or set()
+        self.missing_msg = missing_msg
+        self.required_each = required_each
+        self.each_msg = each_msg
+        self.extra = extra
+        self.extra_msg = extra_msg
+        self.rules = rules
+
+    def compile(self, join: Join) -> Checker:
+        msg, required, missing_msg = self.msg, self.required, self.missing_msg
+        required_each, each_msg = self.required_each, self.each_msg
+        extra_msg, rules = self.extra_msg, self.rules
+        child_join = _joiner(self.sep)
+        fields = {}
+        for name, spec in self.fields.items():
+            if spec.check_missing:
+                default, skip = None, _NEVER
+            elif spec.nullable:
+                default, skip = None, None
+            else:
+                default, skip = _MISSING, _MISSING
+            fields[name] = (default, skip, spec.compile(child_join))
+        ordered = tuple((name, *compiled) for name, compiled in fields.items())
+        open_object = self.extra is not None
+        if self.extra is not None:
+            extra_match = self.extra[0].match
+            extra_check = self.extra[1].compile(child_join)
+
+        def check(value, parent, key, errors, ctx):
+            if not isinstance(value, dict):
+                if msg is not None:
+                    _report(errors, msg, parent, key, join)
+                    return
+                value = {}
+            path = (parent, key, join)
+            if required:
+                missing = required - set(value.keys())
+                if missing:
+                    _report(errors, missing_msg, parent, key, join, missing=missing)
+            for field in required_each:
+                if field not in value:
+                    _report(errors, each_msg, parent, key, join, field=field)
+
+            if not open_object:
+                for name, default, skip, field_check in ordered:
+                    field_value = value.get(name, default)
+                    if field_value is not skip:
+                        field_check(field_value, path, name, errors, ctx)
+            else:
+                for name, field_value in value.items():
+                    if name in fields:
+                        _default, skip, field_check = fields[name]
+                        if field_value is not skip:
+                            field_check(field_value, path, name, errors, ctx)
+                    elif not extra_match(name):
+                        _report(errors, extra_msg, path, name, child_join)
+                    else:
+                        extra_check(field_value, path, name, errors, ctx)
+
+            for rule in rules:
+                template = rule(value)
+                if template:
+                    _report(errors, template, parent, key, join)
+        return check
+
+
+class Map(Spec):
+    """JSON object with arbitrary keys whose values all match ``value``."""
+
+    def __init__(
+        self,
+        value: Spec,
+        sep: str = ".",
+        msg: str = "{label} must be an object",
+        key_pattern: re.Pattern[str] | None = None,
+        key_msg: str = "",
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.value = value
+        self.sep = sep
+        self.msg = msg
+        self.key_pattern = key_pattern
+        self.key_msg = key_msg
+
+    def compile(self, join: Join) -> Checker:
+        msg, key_msg = self.msg, self.key_msg
+        key_match = self.key_pattern.match if self.key_pattern else None
+        child_join = _joiner(self.sep)
+        value_check = self.value.compile(child_join)
+
+        def check(value, parent, key, errors, ctx):
+            if not isinstance(value, dict):
+                _report(errors, msg, parent, key, join)
+                return
+            path = (parent, key, join)
+            for name, item in value.items():
+                if key_match is not None and not key_match(name):
+                    _report(errors, key_msg, path, name, child_join)
+                value_check(item, path, name, errors, ctx)
+        return check
+
+
+def compile_schema(
+    spec: Spec,
+    context: Callable[[Any], dict[str, Any]] | None = None,
+) -> Callable[[Any], list[str]]:
+    """Compile a schema into a function returning the list of errors.
+
+    ``context`` derives lookup sets (for Ref fields) from the whole
+    document before validation starts.
+    """
+    check = spec.compile(lambda parent, key: "")
+
+    def validate(data: Any) -> list[str]:
+        ctx = context(data) if context else {}
+        errors: list[str] = []
+        check(data, "", "", errors, ctx)
+        return errors
+    return validate
 
-    required_group_fields = {
-        "title", "severity", "priority", "status", "platform"
-    }
 
-    for gid, group in groups.items():
-        prefix = f"groups.{gid}"
-
-        # Group ID format
-        if not GROUP_ID_PATTERN.match(gid):
-            errors.append(
-                f"{prefix}: invalid group ID format "
-                f"(expected H#, M#, L#, or MAN#)"
-            )
-
-        # Required fields
-        missing = required_group_fields - set(group.keys())
-        if missing:
-            errors.append(f"{prefix} missing fields: {missing}")
-
-        # Severity enum
-        if group.get("severity") not in VALID_SEVERITIES:
-            errors.append(
-                f"{prefix} invalid severity: "
-                f"'{group.get('severity')}'"
-            )
-
-        # Platform enum
-        if group.get("platform") not in VALID_PLATFORMS:
-            errors.append(
-                f"{prefix} invalid platform: "
-                f"'{group.get('platform')}'"
-            )
-
-        # Status: must be a known value or start with a known prefix
-        status = group.get("status")
-        if status is not None:
-            status_ok = (
-                status in VALID_STATUSES
-                or any(
-                    status.startswith(p) for p in VALID_STATUS_PREFIXES
-                )
-            )
-            if not status_ok:
-                errors.append(
-                    f"{prefix} invalid status: '{status}'"
-                )
-
-        # Priority must be int
-        priority = group.get("priority")
-        if priority is not None and not isinstance(priority, int):
-            errors.append(
-                f"{prefix} priority must be int, "
-                f"got {type(priority).__name__}"
-            )
-
-        # Priority label enum (optional field)
-        plabel = group.get("priority_label")
-        if plabel is not None and plabel not in VALID_PRIORITY_LABELS:
-            errors.append(
-                f"{prefix} invalid priority_label: '{plabel}'"
-            )
-
-        # String-or-null fields
-        for field in ["title", "jira", "compare", "status_note",
-                      "jira_status", "last_sync"]:
-            val = group.get(field)
-            if val is not None and not isinstance(val, str):
-                errors.append(
-                    f"{prefix} {field} must be string or null, "
-                    f"got {type(val).__name__}"
-                )
-
-        # pr: string or int or null (some files use int PR numbers)
-        pr_val = group.get("pr")
-        if pr_val is not None and not isinstance(pr_val, (str, int)):
-            errors.append(
-                f"{prefix} pr must be string, int, or null, "
-                f"got {type(pr_val).__name__}"
-            )
-
-        # pr_state enum (nullable)
-        pr_state = group.get("pr_state")
-        if pr_state is not None and pr_state not in VALID_PR_STATES:
-            errors.append(
-                f"{prefix} invalid pr_state: '{pr_state}'"
-            )
-
-        # prev_group / next_group must reference valid group IDs or null
-        for nav in ["prev_group", "next_group"]:
-            nav_val = group.get(nav)
-            if nav_val is not None and nav_val not in group_ids:
-                errors.append(
-                    f"{prefix} {nav} references unknown "
-                    f"group '{nav_val}'"
-                )
-
-        # upstream_verdict enum (optional, nullable)
-        verdict = group.get("upstream_verdict")
-        if verdict is not None and verdict not in VALID_UPSTREAM_VERDICTS:
-            errors.append(
-                f"{prefix} invalid upstream_verdict: '{verdict}'"
-            )
-
-        # upstream must be a list if present
-        upstream = group.get("upstream")
-        if upstream is not None:
-            if not isinstance(upstream, list):
-                errors.append(f"{prefix} upstream must be a list")
-            else:
-                for i, entry in enumerate(upstream):
-                    if not isinstance(entry, dict):
-                        errors.append(
-                            f"{prefix} upstream[{i}] must be "
-                            f"an object"
-                        )
+# --- Schemas ---
 
-    return errors
+ISO8601_MSG = ("{label} must be ISO 8601 format "
+               "(YYYY-MM-DDTHH:MM:SSZ), got '{value}'")
 
 
-def _validate_tracking_remediations(
-    remediations: dict[str, Any],
-    group_ids: set[str],
-) -> list[str]:
-    """Validate all remediations in a tracking file."""
-    errors = []
+def _iso_date(**kwargs: Any) -> Str:
+    return Str(match=ISO8601_PATTERN.match, match_msg=ISO8601_MSG, **kwargs)
 
-    for rem_name, rem in remediations.items():
-        prefix = f"remediations.{rem_name}"
 
-        if not isinstance(rem, dict):
-            errors.append(f"{prefix} must be an object")
-            continue
+def _summary_totals(summary: dict[str, Any]) -> str | None:
+    """The summary counts must add up to total_checks."""
+    counts = {
+        field: summary.get(field, 0)
+        for field in ("total_checks", "passing", "failing", "manual", "skipped")
+    }
+    if not all(isinstance(count, (int, float)) for count in counts.values()):
+        return None  # reported as type errors
+    parts = (counts["passing"] + counts["failing"] + counts["manual"]
+             + counts["skipped"])
+    total = counts["total_checks"]
+    if total > 0 and parts != total:
+        return (
+            f"{{label}} counts don't add up: "
+            f"passing({counts['passing']}) + failing({counts['failing']}) + "
+            f"manual({counts['manual']}) + skipped({counts['skipped']}) = "
+            f"{parts}, expected {total}"
+        )
+    return None
+
+
+def _check_list(required: tuple[str, ...], msg: str = "{label} must be a list") -> List:
+    return List(Object(required_each=required, msg=None), msg=msg)
+
+
+SCAN_EXPORT_SCHEMA = Object(
+    msg="scan export must be a JSON object",
+    required={"version", "scan_date", "summary", "remediations"},
+    missing_msg="Missing top-level keys: {missing}",
+    fields={
+        "scan_date": _iso_date(),
+        "summary": Object(
+            required={"total_checks", "passing", "failing", "manual"},
+            missing_msg="Missing summary fields: {missing}",
+            fields={field: Int(nullable=True) for field in SUMMARY_FIELDS},
+            rules=(_summary_totals,),
+        ),
+        "remediations": Object({
+            severity: _check_list(("name", "status", "severity"))
+            for severity in SCAN_SEVERITIES
+        }),
+        "passing_checks": Object(
+            {severity: _check_list(("name",)) for severity in SCAN_SEVERITIES},
+            msg="'{label}' must be a dict",
+        ),
+        "exported_at": _iso_date(),
+        "manual_checks": _check_list(("name",), msg="'{label}' must be a list"),
+    },
+)
 
-        if "group" not in rem:
-            errors.append(f"{prefix} missing 'group'")
-        elif rem["group"] not in group_ids:
-            errors.append(
-                f"{prefix} references unknown group '{rem['group']}'"
-            )
-
-        # Optional string fields
-        for field in ["description", "file"]:
-            val = rem.get(field)
-            if val is not None and not isinstance(val, str):
-                errors.append(
-                    f"{prefix} {field} must be string or null, "
-                    f"got {type(val).__name__}"
-                )
+_STRING_OR_NULL = "{label} must be string or null, got {type}"
+_OBJECT_LIST_ITEM = Typed(dict, "{label} must be an object")
+
+TRACKING_GROUP_SCHEMA = Object(
+    sep=" ",
+    required={"title", "severity", "priority", "status", "platform"},
+    fields={
+        "severity": Enum(VALID_SEVERITIES, check_missing=True),
+        "platform": Enum(VALID_PLATFORMS, check_missing=True),
+        "status": Enum(VALID_STATUSES, prefixes=VALID_STATUS_PREFIXES,
+                       nullable=True),
+        "priority": Int(nullable=True),
+        "priority_label": Enum(VALID_PRIORITY_LABELS, nullable=True),
+        **{
+            field: Typed(str, _STRING_OR_NULL, nullable=True)
+            for field in ("title", "jira", "compare", "status_note",
+                          "jira_status", "last_sync")
+        },
+        # Some files use int PR numbers.
+        "pr": Typed((str, int), "{label} must be string, int, or null, got {type}",
+                    nullable=True),
+        "pr_state": Enum(VALID_PR_STATES, nullable=True),
+        **{
+            nav: Ref("group_ids", "{parent} {key} references unknown group '{value}'",
+                     nullable=True)
+            for nav in ("prev_group", "next_group")
+        },
+        "upstream_verdict": Enum(VALID_UPSTREAM_VERDICTS, nullable=True),
+        "upstream": List(_OBJECT_LIST_ITEM, nullable=True),
+    },
+)
 
+TRACKING_REMEDIATION_SCHEMA = Object(
+    sep=" ",
+    required_each=("group",),
+    fields={
+        "group": Ref("group_ids", "{parent} references unknown group '{value}'"),
+        "description": Typed(str, _STRING_OR_NULL, nullable=True),
+        "file": Typed(str, _STRING_OR_NULL, nullable=True),
         # certsuite can be a string or a list of objects
-        certsuite = rem.get("certsuite")
-        if certsuite is not None:
-            if isinstance(certsuite, list):
-                for i, entry in enumerate(certsuite):
-                    if not isinstance(entry, dict):
-                        errors.append(
-                            f"{prefix} certsuite[{i}] must be "
-                            f"an object"
-                        )
-            elif not isinstance(certsuite, str):
-                errors.append(
-                    f"{prefix} certsuite must be string, list, "
-                    f"or null, got {type(certsuite).__name__}"
-                )
+        "certsuite": List(
+            _OBJECT_LIST_ITEM, also=(str,), nullable=True,
+            msg="{label} must be string, list, or null, got {type}",
+        ),
+    },
+)
 
-    return errors
+GROUP_ID_MSG = "{label}: invalid group ID format (expected H#, M#, L#, or MAN#)"
+
+TRACKING_SCHEMA = Object(
+    msg="tracking file must be a JSON object",
+    required={"meta", "groups", "remediations"},
+    missing_msg="Missing top-level keys: {missing}",
+    fields={
+        "groups": Map(TRACKING_GROUP_SCHEMA, msg="'{label}' must be a dict",
+                      key_pattern=GROUP_ID_PATTERN, key_msg=GROUP_ID_MSG),
+        "remediations": Map(TRACKING_REMEDIATION_SCHEMA,
+                            msg="'{label}' must be a dict"),
+    },
+)
 
 
-def validate_scan_history(filepath: str) -> list[str]:
-    """Validate scan-history.json structure."""
-    errors = []
-    with open(filepath) as f:
-        data = json.load(f)
+def _tracking_context(data: Any) -> dict[str, Any]:
+    groups = data.get("groups") if isinstance(data, dict) else None
+    return {"group_ids": set(groups) if isinstance(groups, dict) else set()}
 
-    if not isinstance(data, list):
-        errors.append("scan-history.json must be a JSON array")
-        return errors
 
-    required_fields = {"version", "scan_date", "summary"}
-    for i, entry in enumerate(data):
-        if not isinstance(entry, dict):
-            errors.append(f"Entry [{i}] must be an object")
-            continue
+SCAN_HISTORY_SCHEMA = List(
+    Object(
+        sep=" ",
+        required={"version", "scan_date", "summary"},
+        fields={
+            "scan_date": _iso_date(nullable=True),
+            "summary": Object(
+                {field: Int(nullable=True) for field in SUMMARY_FIELDS}),
+        },
+    ),
+    msg="scan-history.json must be a JSON array",
+    item_join=lambda parent, i: f"Entry [{i}]",
+)
 
-        missing = required_fields - set(entry.keys())
-        if missing:
-            errors.append(f"Entry [{i}] missing fields: {missing}")
-
-        sd = entry.get("scan_date")
-        if sd is not None:
-            if not isinstance(sd, str):
-                errors.append(
-                    f"Entry [{i}] scan_date must be a string, "
-                    f"got {type(sd).__name__}"
-                )
-            elif not ISO8601_PATTERN.match(sd):
-                errors.append(
-                    f"Entry [{i}] scan_date must be ISO 8601 format "
-                    f"(YYYY-MM-DDTHH:MM:SSZ), got '{sd}'"
-                )
-
-        if "summary" in entry:
-            summary = entry["summary"]
-            for field in ["total_checks", "passing", "failing", "manual"]:
-                val = summary.get(field)
-                if val is not None and not isinstance(val, int):
-                    errors.append(
-                        f"Entry [{i}] summary.{field} must be int, "
-                        f"got {type(val).__name__}"
-                    )
 
-    return errors
+def _has_version_cells(entry: dict[str, Any]) -> str | None:
+    if any(VERSION_SLUG_PATTERN.match(key) for key in entry
+           if key not in MATRIX_META_KEYS):
+        return None
+    return "{label}: no version cells"
+
+
+GROUP_MATRIX_SCHEMA = Map(
+    Object(
+        {key: Str(nullable=True) for key in sorted(MATRIX_META_KEYS)},
+        extra=(VERSION_SLUG_PATTERN, Object(
+            {field: Int(minimum=0) for field in MATRIX_CELL_FIELDS},
+            required=set(MATRIX_CELL_FIELDS),
+        )),
+        rules=(_has_version_cells,),
+    ),
+    msg="group-matrix.json must be a JSON object",
+    key_pattern=GROUP_ID_PATTERN,
+    key_msg=GROUP_ID_MSG,
+)
 
+UPSTREAM_PRS_SCHEMA = Map(
+    List(Object(
+        sep=" ",
+        required=UPSTREAM_PR_REQUIRED,
+        fields={
+            "number": Int(),
+            "title": Str(),
+            "url": Str(match=lambda url: url.startswith("https://"),
+                       match_msg="{label} must be an https URL"),
+            "state": Str(match=VALID_PR_STATES.__contains__,
+                         match_msg="{parent} invalid {key}: '{value}'"),
+        },
+    )),
+    msg="upstream-prs.json must be a JSON object",
+)
 
-def validate_group_matrix(filepath: str) -> list[str]:
-    """Validate group-matrix.json structure used by the Hardened page."""
-    errors = []
-    with open(filepath) as f:
-        data = json.load(f)
+_check_scan_export = compile_schema(SCAN_EXPORT_SCHEMA)
+_check_tracking = compile_schema(TRACKING_SCHEMA, context=_tracking_context)
+_check_scan_history = compile_schema(SCAN_HISTORY_SCHEMA)
+_check_group_matrix = compile_schema(GROUP_MATRIX_SCHEMA)
+_check_upstream_prs = compile_schema(UPSTREAM_PRS_SCHEMA)
 
-    if not isinstance(data, dict):
-        errors.append("group-matrix.json must be a JSON object")
-        return errors
 
-    for gid, entry in data.items():
-        prefix = gid
-        if not GROUP_ID_PATTERN.match(gid):
-            errors.append(
-                f"{prefix}: invalid group ID format "
-                f"(expected H#, M#, L#, or MAN#)"
-            )
-        if not isinstance(entry, dict):
-            errors.append(f"{prefix} must be an object")
-            continue
+def validate_scan_export(filepath: str) -> list[str]:
+    """Validate an ocp-X_XX.json scan export file."""
+    return check_scan_export(load_json(filepath))
 
-        version_cells = 0
-        for key, val in entry.items():
-            if key in MATRIX_META_KEYS:
-                if val is not None and not isinstance(val, str):
-                    errors.append(
-                        f"{prefix}.{key} must be a string, "
-                        f"got {type(val).__name__}"
-                    )
-                continue
-            if not VERSION_SLUG_PATTERN.match(key):
-                errors.append(f"{prefix}.{key}: unexpected key")
-                continue
-            version_cells += 1
-            cell_prefix = f"{prefix}.{key}"
-            if not isinstance(val, dict):
-                errors.append(f"{cell_prefix} must be an object")
-                continue
-            missing = set(MATRIX_CELL_FIELDS) - set(val.keys())
-            if missing:
-                errors.append(f"{cell_prefix} missing fields: {missing}")
-            for field in MATRIX_CELL_FIELDS:
-                count = val.get(field)
-                if field not in val:
-                    continue
-                if not isinstance(count, int):
-                    errors.append(
-                        f"{cell_prefix}.{field} must be int, "
-                        f"got {type(count).__name__}"
-                    )
-                elif count < 0:
-                    errors.append(
-                        f"{cell_prefix}.{field} must be >= 0, got {count}"
-                    )
-
-        if version_cells == 0:
-            errors.append(f"{prefix}: no version cells")
 
-    return errors
+def check_scan_export(data: Any) -> list[str]:
+    """Validate parsed scan export data."""
+    return _check_scan_export(data)
+
+
+def validate_tracking(filepath: str) -> list[str]:
+    """Validate tracking.json structure and field consistency."""
+    return check_tracking(load_json(filepath))
+
+
+def check_tracking(data: Any) -> list[str]:
+    """Validate parsed tracking data."""
+    return _check_tracking(data)
+
+
+def validate_scan_history(filepath: str) -> list[str]:
+    """Validate scan-history.json structure."""
+    return check_scan_history(load_json(filepath))
+
+
+def check_scan_history(data: Any) -> list[str]:
+    """Validate parsed scan-history data."""
+    return _check_scan_history(data)
+
+
+def validate_group_matrix(filepath: str) -> list[str]:
+    """Validate group-matrix.json structure used by the Hardened page."""
+    return check_group_matrix(load_json(filepath))
+
+
+def check_group_matrix(data: Any) -> list[str]:
+    """Validate parsed group-matrix data."""
+    return _check_group_matrix(data)
 
 
 def validate_upstream_prs(filepath: str) -> list[str]:
     """Validate upstream-prs.json structure used by the Hardened page."""
-    errors = []
-    with open(filepath) as f:
-        data = json.load(f)
+    return check_upstream_prs(load_json(filepath))
 
-    if not isinstance(data, dict):
-        errors.append("upstream-prs.json must be a JSON object")
-        return errors
 
-    for category, prs in data.items():
-        if not isinstance(prs, list):
-            errors.append(f"{category} must be a list")
-            continue
-        for i, pr in enumerate(prs):
-            prefix = f"{category}[{i}]"
-            if not isinstance(pr, dict):
-                errors.append(f"{prefix} must be an object")
-                continue
-            missing = UPSTREAM_PR_REQUIRED - set(pr.keys())
-            if missing:
-                errors.append(f"{prefix} missing fields: {missing}")
-            number = pr.get("number")
-            if "number" in pr and not isinstance(number, int):
-                errors.append(
-                    f"{prefix} number must be int, got {type(number).__name__}"
-                )
-            title = pr.get("title")
-            if "title" in pr and not isinstance(title, str):
-                errors.append(
-                    f"{prefix} title must be a string, "
-                    f"got {type(title).__name__}"
-                )
-            url = pr.get("url")
-            if "url" in pr:
-                if not isinstance(url, str):
-                    errors.append(
-                        f"{prefix} url must be a string, "
-                        f"got {type(url).__name__}"
-                    )
-                elif not url.startswith("https://"):
-                    errors.append(f"{prefix} url must be an https URL")
-            state = pr.get("state")
-            if "state" in pr:
-                if not isinstance(state, str):
-                    errors.append(
-                        f"{prefix} state must be a string, "
-                        f"got {type(state).__name__}"
-                    )
-                elif state not in VALID_PR_STATES:
-                    errors.append(f"{prefix} invalid state: '{state}'")
+def check_upstream_prs(data: Any) -> list[str]:
+    """Validate parsed upstream-prs data."""
+    return _check_upstream_prs(data)
 
-    return errors
 
+def _named_items(items: Any) -> list[str]:
+    """Return the string ``name`` of each object in a check list."""
+    if not isinstance(items, list):
+        return []
+    names = (item.get("name") for item in items if isinstance(item, dict))
+    return [name for name in names if isinstance(name, str)]
 
-def validate_cross_references(
-    scan_filepath: str, tracking_filepath: str
-) -> list[str]:
-    """Cross-validate tracking remediation names against scan data."""
-    errors = []
-    with open(scan_filepath) as f:
-        scan_data = json.load(f)
-    with open(tracking_filepath) as f:
-        tracking_data = json.load(f)
 
-    scan_names: set[str] = set()
+def scan_check_names(scan_data: Any) -> set[str]:
+    """Return the prefix-stripped check names present in a scan export.
+
+    Runs on files that failed validation too, so malformed sections and
+    nameless items (already reported as errors) are skipped.
+    """
+    if not isinstance(scan_data, dict):
+        return set()
+    lists = [scan_data.get("manual_checks")]
     for section in ["remediations", "passing_checks"]:
-        for severity in ["high", "medium", "low"]:
-            for item in scan_data.get(section, {}).get(severity, []):
-                scan_names.add(strip_profile_prefix(item["name"]))
-    for item in scan_data.get("manual_checks", []):
-        scan_names.add(strip_profile_prefix(item["name"]))
+        by_severity = scan_data.get(section)
+        if isinstance(by_severity, dict):
+            lists.extend(by_severity.get(severity) for severity in SCAN_SEVERITIES)
+    return {strip_profile_prefix(name) for items in lists for name in _named_items(items)}
+
+
+def tracking_remediation_names(tracking_data: Any) -> list[str]:
+    """Return the remediation names listed in a tracking file."""
+    remediations = tracking_data.get("remediations") if isinstance(tracking_data, dict) else None
+    return list(remediations) if isinstance(remediations, dict) else []
 
-    tracking_rems = tracking_data.get("remediations", {})
+
+def check_cross_references(
+    scan_names: set[str], tracking_rems: list[str]
+) -> list[str]:
+    """Cross-validate tracking remediation names against scan check names."""
+    errors = []
     missing = sorted(r for r in tracking_rems if r not in scan_names)
 
     if missing:
@@ -563,67 +751,84 @@ def validate_cross_references(
     return errors
 
 
-def main() -> None:
-    data_dir = sys.argv[1] if len(sys.argv) > 1 else "docs/_data"
+def validate_cross_references(
+    scan_filepath: str, tracking_filepath: str
+) -> list[str]:
+    """Cross-validate tracking remediation names against scan data."""
+    return check_cross_references(
+        scan_check_names(load_json(scan_filepath)),
+        tracking_remediation_names(load_json(tracking_filepath)),
+    )
 
-    if not os.path.isdir(data_dir):
-        print(f"ERROR: Directory not found: {data_dir}", file=sys.stderr)
-        sys.exit(1)
 
-    all_errors = {}
-    total_files = 0
+# kind -> (validator, cross-reference extractor or None)
+VALIDATORS: dict[str, tuple[Callable[[Any], list[str]], Callable[[Any], Any] | None]] = {
+    "scan": (check_scan_export, scan_check_names),
+    "tracking": (check_tracking, tracking_remediation_names),
+    "scan-history": (check_scan_history, None),
+    "group-matrix": (check_group_matrix, None),
+    "upstream-prs": (check_upstream_prs, None),
+}
+
+
+def validate_file(kind: str, filepath: str) -> tuple[list[str], Any]:
+    """Load one file, validate it, and extract what cross-references need.
+
+    This is the unit of work run in the process pool. Each file is parsed
+    exactly once; only the errors and the small cross-reference summary
+    (check or remediation names) travel back to the parent.
+    """
+    validator, extract = VALIDATORS[kind]
+    data = load_json(filepath)
+    return validator(data), extract(data) if extract else None
+
 
-    scan_files = glob.glob(os.path.join(data_dir, "ocp-*.json"))
-    for filepath in sorted(scan_files):
+def collect_files(data_dir: str) -> list[tuple[str, str]]:
+    """Return (kind, filepath) for every dashboard data file, in report order."""
+    files = []
+    for filepath in sorted(glob.glob(os.path.join(data_dir, "ocp-*.json"))):
         if "baseline" in filepath:
             continue
-        total_files += 1
-        basename = os.path.basename(filepath)
-        print(f"Validating {basename}...", end=" ")
-        errors = validate_scan_export(filepath)
-        if errors:
-            print("FAIL")
-            all_errors[basename] = errors
-        else:
-            print("OK")
+        files.append(("scan", filepath))
 
     tracking_files = (
         glob.glob(os.path.join(data_dir, "tracking.json"))
         + glob.glob(os.path.join(data_dir, "tracking-*.json"))
     )
-    for filepath in sorted(tracking_files):
-        total_files += 1
-        basename = os.path.basename(filepath)
-        print(f"Validating {basename}...", end=" ")
-        errors = validate_tracking(filepath)
-        if errors:
-            print("FAIL")
-            all_errors[basename] = errors
-        else:
-            print("OK")
+    files.extend(("tracking", filepath) for filepath in sorted(tracking_files))
 
-    named_validators = (
-        ("scan-history.json", validate_scan_history),
-        ("group-matrix.json", validate_group_matrix),
-        ("upstream-prs.json", validate_upstream_prs),
-    )
-    for filename, validator in named_validators:
+    for filename in ("scan-history.json", "group-matrix.json", "upstream-prs.json"):
         filepath = os.path.join(data_dir, filename)
-        if not os.path.exists(filepath):
-            continue
-        total_files += 1
-        print(f"Validating {filename}...", end=" ")
-        errors = validator(filepath)
-        if errors:
-            print("FAIL")
-            all_errors[filename] = errors
-        else:
-            print("OK")
+        if os.path.exists(filepath):
+            files.append((filename[:-len(".json")], filepath))
+    return files
 
-    # Cross-reference: tracking remediations vs scan data (warnings only)
-    xref_warnings: dict[str, list[str]] = {}
-    for filepath in sorted(scan_files):
-        if "baseline" in filepath:
+
+def validate_files(
+    files: list[tuple[str, str]], jobs: int | None = None
+) -> dict[str, tuple[list[str], Any]]:
+    """Validate files, in a process pool when more than one worker is available.
+
+    Returns a registry of filepath -> (errors, cross-reference summary).
+    """
+    workers = min(jobs or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        return {path: validate_file(kind, path) for kind, path in files}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            path: pool.submit(validate_file, kind, path) for kind, path in files
+        }
+        return {path: future.result() for path, future in futures.items()}
+
+
+def cross_reference_pairs(
+    data_dir: str, files: list[tuple[str, str]]
+) -> list[tuple[str, str]]:
+    """Pair each scan export with its versioned (or default) tracking file."""
+    pairs = []
+    for kind, filepath in files:
+        if kind != "scan":
             continue
         basename = os.path.basename(filepath)
         version_slug = basename.replace("ocp-", "").replace(".json", "")
@@ -631,14 +836,223 @@ def main() -> None:
         if not os.path.exists(tracking_path):
             tracking_path = os.path.join(data_dir, "tracking.json")
         if os.path.exists(tracking_path):
-            xref_label = f"{basename} <-> {os.path.basename(tracking_path)}"
-            print(f"Cross-referencing {xref_label}...", end=" ")
-            errors = validate_cross_references(filepath, tracking_path)
-            if errors:
-                print("WARN")
-                xref_warnings[xref_label] = errors
-            else:
-                print("OK")
+            pairs.append((filepath, tracking_path))
+    return pairs
+
+
+def file_digest(filepath: str) -> str:
+    """Return the sha256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def validator_version() -> str:
+    """Fingerprint of this script, so edited rules invalidate the cache."""
+    return file_digest(os.path.abspath(__file__))
+
+
+def default_cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "compliance-scripts", "validate-dashboard-data.json")
+
+
+def empty_cache(version: str) -> dict[str, Any]:
+    return {"format": CACHE_FORMAT, "version": version, "files": {}, "xref": {}}
+
+
+def load_cache(cache_path: str, version: str) -> dict[str, Any]:
+    """Load the result cache, starting fresh if it is missing, corrupt or stale."""
+    try:
+        cache = load_json(cache_path)
+    except (OSError, ValueError):
+        return empty_cache(version)
+    if (not isinstance(cache, dict) or cache.get("format") != CACHE_FORMAT
+            or cache.get("version") != version):
+        return empty_cache(version)
+    cache.setdefault("files", {})
+    cache.setdefault("xref", {})
+    return cache
+
+
+def save_cache(cache_path: str, cache: dict[str, Any]) -> None:
+    parent = os.path.dirname(cache_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    tmp = f"{cache_path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp, cache_path)
+
+
+def cache_key(filepath: str) -> str:
+    return os.path.abspath(filepath)
+
+
+def cached_results(
+    files: list[tuple[str, str]],
+    cache: dict[str, Any],
+    digests: dict[str, str],
+) -> tuple[dict[str, tuple[list[str], Any]], list[tuple[str, str]]]:
+    """Split files into cache hits and the files that still need validating.
+
+    Returns (registry of hits, misses). A hit requires the same kind and
+    content digest as the cached entry.
+    """
+    registry: dict[str, tuple[list[str], Any]] = {}
+    misses = []
+    for kind, filepath in files:
+        entry = cache["files"].get(cache_key(filepath))
+        if entry and entry.get("kind") == kind and entry.get("sha256") == digests[filepath]:
+            registry[filepath] = (entry["errors"], entry["xref"])
+        else:
+            misses.append((kind, filepath))
+    return registry, misses
+
+
+def store_results(
+    cache: dict[str, Any],
+    files: list[tuple[str, str]],
+    registry: dict[str, tuple[list[str], Any]],
+    digests: dict[str, str],
+) -> None:
+    """Record per-file results in the cache (name sets stored as sorted lists)."""
+    for kind, filepath in files:
+        errors, xref = registry[filepath]
+        if isinstance(xref, set):
+            xref = sorted(xref)
+        cache["files"][cache_key(filepath)] = {
+            "kind": kind,
+            "sha256": digests[filepath],
+            "errors": errors,
+            "xref": xref,
+        }
+
+
+def cross_reference(
+    scan_path: str,
+    tracking_path: str,
+    registry: dict[str, tuple[list[str], Any]],
+    cache: dict[str, Any] | None = None,
+    digests: dict[str, str] | None = None,
+) -> tuple[list[str], bool]:
+    """Return (warnings, from_cache) for one scan/tracking pair.
+
+    A cached result is reused only while both input digests are unchanged.
+    """
+    key = f"{cache_key(scan_path)}|{cache_key(tracking_path)}"
+    inputs = None
+    if cache is not None and digests is not None:
+        inputs = [digests[scan_path], digests[tracking_path]]
+        entry = cache["xref"].get(key)
+        if entry and entry.get("inputs") == inputs:
+            return entry["errors"], True
+    errors = check_cross_references(
+        set(registry[scan_path][1]), registry[tracking_path][1])
+    if cache is not None:
+        cache["xref"][key] = {"inputs": inputs, "errors": errors}
+    return errors, False
+
+
+def read_path_list(source: str) -> list[str]:
+    """Read a newline-separated path list (``git diff --name-only``) from a file or '-'."""
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source) as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+def select_changed(
+    data_dir: str, files: list[tuple[str, str]], changed_paths: list[str]
+) -> list[tuple[str, str]]:
+    """Keep the changed data files plus the partners their cross-references need.
+
+    Paths are matched by real path, so repo-relative ``git diff`` output
+    works when run from the repository root. Deleted paths never match.
+    """
+    changed = {os.path.realpath(p) for p in changed_paths}
+    selected = {path for _kind, path in files if os.path.realpath(path) in changed}
+    for scan_path, tracking_path in cross_reference_pairs(data_dir, files):
+        if scan_path in selected or tracking_path in selected:
+            selected.update((scan_path, tracking_path))
+    return [(kind, path) for kind, path in files if path in selected]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Validate dashboard JSON data files"
+    )
+    parser.add_argument("data_dir", nargs="?", default="docs/_data",
+                        help="Dashboard data directory (default: docs/_data)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count; 1 = serial)")
+    parser.add_argument("--cache", nargs="?", const=default_cache_path(),
+                        default=None, metavar="FILE",
+                        help="Reuse results for unchanged files (default FILE: "
+                             "~/.cache/compliance-scripts/validate-dashboard-data.json)")
+    parser.add_argument("--changed-only", metavar="PATHS",
+                        help="Only validate data files listed in PATHS, one per "
+                             "line as printed by 'git diff --name-only' ('-' = stdin)")
+    args = parser.parse_args()
+    data_dir = args.data_dir
+
+    if not os.path.isdir(data_dir):
+        print(f"ERROR: Directory not found: {data_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    all_errors = {}
+    files = collect_files(data_dir)
+    if args.changed_only:
+        files = select_changed(data_dir, files, read_path_list(args.changed_only))
+        if not files:
+            print("No dashboard data files changed.")
+            return
+
+    cache = None
+    digests = None
+    registry: dict[str, tuple[list[str], Any]] = {}
+    todo = files
+    if args.cache:
+        cache = load_cache(args.cache, validator_version())
+        digests = {path: file_digest(path) for _kind, path in files}
+        registry, todo = cached_results(files, cache, digests)
+    cached = set(registry)
+    registry.update(validate_files(todo, args.jobs))
+
+    for _kind, filepath in files:
+        basename = os.path.basename(filepath)
+        print(f"Validating {basename}...", end=" ")
+        errors, _xref = registry[filepath]
+        suffix = " (cached)" if filepath in cached else ""
+        if errors:
+            print(f"FAIL{suffix}")
+            all_errors[basename] = errors
+        else:
+            print(f"OK{suffix}")
+
+    # Cross-reference: tracking remediations vs scan data (warnings only).
+    # Reuses the names extracted during validation; nothing is re-parsed.
+    xref_warnings: dict[str, list[str]] = {}
+    for scan_path, tracking_path in cross_reference_pairs(data_dir, files):
+        basename = os.path.basename(scan_path)
+        xref_label = f"{basename} <-> {os.path.basename(tracking_path)}"
+        print(f"Cross-referencing {xref_label}...", end=" ")
+        errors, hit = cross_reference(scan_path, tracking_path, registry, cache, digests)
+        suffix = " (cached)" if hit else ""
+        if errors:
+            print(f"WARN{suffix}")
+            xref_warnings[xref_label] = errors
+        else:
+            print(f"OK{suffix}")
+
+    if cache is not None and digests is not None:
+        store_results(cache, todo, registry, digests)
+        save_cache(args.cache, cache)
 
     if xref_warnings:
         print()
@@ -657,7 +1071,7 @@ def main() -> None:
                 print(f"    - {err}")
         sys.exit(1)
     else:
-        print(f"All {total_files} file(s) valid.")
+        print(f"All {len(files)} file(s) valid.")
 
 
 if __name__ == "__main__":
@@ -128,23 +128,10 @@ fetch_group_mcs() {
 wait_for_scans() {
 	local label="$1"
 	log_info "Waiting for $label scans to complete (timeout: 30m)..."
-	for i in $(seq 1 90); do
-		ALL_DONE=true
-		for suite in $(oc get compliancesuite -n "$DEFAULT_COMPLIANCE_NAMESPACE" -o jsonpath='{.items[*].metadata.name}' 2>/dev/null); do
-			PHASE=$(oc get compliancesuite "$suite" -n "$DEFAULT_COMPLIANCE_NAMESPACE" -o jsonpath='{.status.phase}' 2>/dev/null || echo "")
-			if [[ "$PHASE" != "DONE" ]]; then
-				ALL_DONE=false
-				break
-			fi
-		done
-		if [[ "$ALL_DONE" == "true" ]]; then
-			log_success "$label scans completed."
-			return 0
-		fi
-		echo -n "."
-		sleep 20
-	done
-	echo ""
+	if python3 "$SCRIPT_DIR/lib/cluster_watch.py" -n "$DEFAULT_COMPLIANCE_NAMESPACE" wait-suites --timeout 30m; then
+		log_success "$label scans completed."
+		return 0
+	fi
 	log_error "$label scans did not complete within 30 minutes"
 	oc get compliancesuite -n "$DEFAULT_COMPLIANCE_NAMESPACE"
 	return 1
@@ -157,13 +144,12 @@ export_results() {
 }
 
 wait_for_mcp() {
-	for pool in $(oc get mcp -o jsonpath='{.items[*].metadata.name}' 2>/dev/null); do
-		log_info "  Waiting for MCP/$pool (timeout: 45m)..."
-		if ! oc wait mcp/"$pool" --for=condition=Updated=True --timeout=45m; then
-			log_warn "  MCP/$pool did not reach Updated=True within 45m"
-			return 1
-		fi
-	done
+	log_info "  Waiting for all MCPs to become Updated (timeout: 45m)..."
+	if ! python3 "$SCRIPT_DIR/lib/cluster_watch.py" wait-mcps --timeout 45m; then
+		log_warn "  Not every MCP reached Updated=True within 45m"
+		oc get mcp -o wide
+		return 1
+	fi
 	oc get mcp -o wide
 	return 0
 }
@@ -255,65 +241,16 @@ log_info "Phase 5: Export post-remediation results"
 export_results "$OUTPUT_DIR/after-results.json"
 
 log_info "Phase 6: Generate diff report"
-python3 - "$OUTPUT_DIR" <<'PYSCRIPT'
-import json, sys
-
-output_dir = sys.argv[1]
-
-with open(f"{output_dir}/before-results.json") as f:
-    before = {item["metadata"]["name"]: item.get("status", "UNKNOWN") for item in json.load(f)["items"]}
-with open(f"{output_dir}/after-results.json") as f:
-    after = {item["metadata"]["name"]: item.get("status", "UNKNOWN") for item in json.load(f)["items"]}
-
-flipped_pass, flipped_fail, unchanged_fail = [], [], []
-for name in sorted(set(before) | set(after)):
-    b, a = before.get(name, "MISSING"), after.get(name, "MISSING")
-    if a == "PASS" and b == "FAIL":
-        flipped_pass.append(name)
-    elif a == "FAIL" and b == "PASS":
-        flipped_fail.append(name)
-    elif a == "FAIL" and b == "FAIL":
-        unchanged_fail.append(name)
-
-before_pass = sum(1 for v in before.values() if v == "PASS")
-before_fail = sum(1 for v in before.values() if v == "FAIL")
-after_pass = sum(1 for v in after.values() if v == "PASS")
-after_fail = sum(1 for v in after.values() if v == "FAIL")
-
-report = {
-    "before_pass": before_pass, "before_fail": before_fail,
-    "after_pass": after_pass, "after_fail": after_fail,
-    "flipped_to_pass": flipped_pass,
-    "flipped_to_fail": flipped_fail,
-    "unchanged_fail": unchanged_fail,
-}
-with open(f"{output_dir}/diff-report.json", "w") as f:
-    json.dump(report, f, indent=2)
-
-print(f"\n{'='*60}")
-print(f"  FULL REMEDIATION VERIFICATION REPORT")
-print(f"{'='*60}")
-print(f"  Before: {before_pass} PASS / {before_fail} FAIL")
-print(f"  After:  {after_pass} PASS / {after_fail} FAIL")
-print(f"  Flipped FAIL->PASS: {len(flipped_pass)}")
-print(f"  Flipped PASS->FAIL: {len(flipped_fail)}")
-print(f"  Unchanged FAIL:     {len(unchanged_fail)}")
-print(f"{'='*60}")
-
-if flipped_pass:
-    print(f"\n  Checks fixed ({len(flipped_pass)}):")
-    for n in flipped_pass[:20]:
-        print(f"    + {n}")
-    if len(flipped_pass) > 20:
-        print(f"    ... and {len(flipped_pass) - 20} more")
-
-if flipped_fail:
-    print(f"\n  REGRESSIONS ({len(flipped_fail)}):")
-    for n in flipped_fail:
-        print(f"    ! {n}")
-
-print()
-PYSCRIPT
+compare_rc=0
+python3 "$SCRIPT_DIR/scripts/compare-results.py" --tracking "$TRACKING" \
+	--output "$OUTPUT_DIR/diff-report.json" \
+	"$OUTPUT_DIR/before-results.json" "$OUTPUT_DIR/after-results.json" || compare_rc=$?
+if [[ "$compare_rc" -eq 3 ]]; then
+	log_warn "Regressions detected (PASS -> FAIL); see $OUTPUT_DIR/diff-report.json"
+elif [[ "$compare_rc" -ne 0 ]]; then
+	log_error "Comparing before/after results failed (exit $compare_rc)"
+	exit "$compare_rc"
+fi
 
 log_success "Full report saved to $OUTPUT_DIR/"
 log_info "Files: before-results.json, after-results.json, diff-report.json"
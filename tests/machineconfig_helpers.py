@@ -0,0 +1,48 @@
+"""Builders for MachineConfig test data shared by the MachineConfig tool tests."""
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+import compliance_utils  # noqa: E402
+
+
+def file_entry(path: str, content: str = 'x\n', compress: bool = False, **fields: Any) -> dict[str, Any]:
+    """An Ignition storage.files entry (mode 0600, overwrite)."""
+    return {'path': path, 'contents': compliance_utils.encode_file_contents(content, compress),
+            'mode': 384, 'overwrite': True, **fields}
+
+
+def make_mc(name: str, files: list[dict[str, Any] | str] | None = None, role: str = 'worker',
+            severity: str | None = 'high', **spec: Any) -> dict[str, Any]:
+    """A MachineConfig as returned by compliance_utils.load_machineconfigs.
+
+    files may mix file_entry() dicts and bare paths (given 'x\\n' as
+    content). spec holds MachineConfig spec fields, plus version (the
+    Ignition version, default 3.5.0) and units (systemd unit dicts, or bare
+    names for enabled units).
+    """
+    config: dict[str, Any] = {'ignition': {'version': spec.pop('version', '3.5.0')}}
+    if files:
+        config['storage'] = {'files': [file_entry(f) if isinstance(f, str) else f for f in files]}
+    units = spec.pop('units', None)
+    if units:
+        config['systemd'] = {'units': [{'name': u, 'enabled': True} if isinstance(u, str) else u
+                                       for u in units]}
+    doc = {
+        'apiVersion': 'machineconfiguration.openshift.io/v1',
+        'kind': 'MachineConfig',
+        'metadata': {'name': name, 'labels': {compliance_utils.ROLE_LABEL: role}},
+        'spec': {'config': config, **spec},
+    }
+    return {'name': name, 'role': role, 'severity': severity, 'source_file': f"{name}.yaml",
+            'basename': f"{name}.yaml", 'doc': doc}
+
+
+def write_mc(directory: Any, mc: dict[str, Any]) -> None:
+    """Write mc's document to directory/<basename>, creating directory."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, mc['basename']), 'w') as f:
+        compliance_utils.yaml.dump(mc['doc'], f)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Tests for lib/cluster_watch.py"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+import cluster_watch
+from cluster_watch import FakeEventSource, PhaseTracker
+
+
+def suite(name: str, phase: str | None, rv: int | None = None) -> dict:
+    obj: dict = {"metadata": {"name": name}, "status": {}}
+    if phase:
+        obj["status"]["phase"] = phase
+    if rv is not None:
+        obj["metadata"]["resourceVersion"] = str(rv)
+    return obj
+
+
+def event(kind: str, type_: str, obj: dict | None = None) -> dict:
+    return {"kind": kind, "type": type_, "object": obj or {}}
+
+
+def synced(kind: str) -> dict:
+    return {"kind": kind, "type": "SYNCED"}
+
+
+def mcp(name: str, **conditions: str) -> dict:
+    return {"metadata": {"name": name}, "status": {"conditions": [
+        {"type": t, "status": s} for t, s in conditions.items()]}}
+
+
+class TestParseDuration:
+    def test_units(self):
+        assert cluster_watch.parse_duration("90") == 90
+        assert cluster_watch.parse_duration("90s") == 90
+        assert cluster_watch.parse_duration("30m") == 1800
+        assert cluster_watch.parse_duration("1.5h") == 5400
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            cluster_watch.parse_duration("soon")
+
+
+class TestPhaseOf:
+    def test_suite_phase(self):
+        assert cluster_watch.phase_of("suite", suite("a", "RUNNING")) == "RUNNING"
+        assert cluster_watch.phase_of("suite", suite("a", None)) == "PENDING"
+
+    def test_mcp_conditions(self):
+        assert cluster_watch.phase_of("mcp", mcp("w", Updated="True", Updating="False")) == "Updated"
+        assert cluster_watch.phase_of("mcp", mcp("w", Updated="False", Updating="True")) == "Updating"
+        assert cluster_watch.phase_of("mcp", mcp("w", Updating="True", Degraded="True")) == "Degraded"
+        assert cluster_watch.phase_of("mcp", mcp("w")) == "Unknown"
+
+
+class TestPhaseTracker:
+    def test_transitions_only_on_phase_change(self):
+        tracker = PhaseTracker()
+        assert tracker.apply(event("suite", "ADDED", suite("cis", "RUNNING"))) == {
+            "kind": "suite", "name": "cis", "old": None, "new": "RUNNING"}
+        assert tracker.apply(event("suite", "MODIFIED", suite("cis", "RUNNING"))) is None
+        assert tracker.apply(event("suite", "MODIFIED", suite("cis", "DONE")))["new"] == "DONE"
+        assert tracker.apply(event("suite", "DELETED", suite("cis", "DONE")))["new"] is None
+        assert tracker.phases["suite"] == {}
+
+    def test_stale_events_are_ignored(self):
+        tracker = PhaseTracker()
+        tracker.apply(event("suite", "ADDED", suite("cis", "DONE", rv=20)))
+        assert tracker.apply(event("suite", "MODIFIED", suite("cis", "RUNNING", rv=12))) is None
+        assert tracker.phases["suite"]["cis"] == "DONE"
+
+    def test_all_in_requires_sync(self):
+        tracker = PhaseTracker()
+        tracker.apply(event("suite", "ADDED", suite("cis", "DONE")))
+        assert not tracker.all_in("suite", {"DONE"})
+        tracker.apply(synced("suite"))
+        assert tracker.all_in("suite", {"DONE"})
+        tracker.apply(event("suite", "ADDED", suite("e8", "RUNNING")))
+        assert not tracker.all_in("suite", {"DONE"})
+
+    def test_empty_kind_counts_as_done(self):
+        tracker = PhaseTracker()
+        tracker.apply(synced("suite"))
+        assert tracker.all_in("suite", {"DONE"})
+
+
+class TestWaitForPhases:
+    def test_wakes_on_completion_event(self):
+        source = FakeEventSource([
+            event("suite", "ADDED", suite("cis", "RUNNING")),
+            event("suite", "ADDED", suite("e8", "DONE")),
+            synced("suite"),
+            0.05,
+            event("suite", "MODIFIED", suite("cis", "AGGREGATING")),
+            event("suite", "MODIFIED", suite("cis", "DONE")),
+        ], hold=True)
+        seen = []
+        start = time.monotonic()
+        ok = asyncio.run(cluster_watch.wait_for_phases(
+            source, "suite", {"DONE"}, timeout=5, on_change=seen.append))
+        assert ok
+        assert time.monotonic() - start < 1
+        assert [(c["name"], c["new"]) for c in seen][-2:] == [
+            ("cis", "AGGREGATING"), ("cis", "DONE")]
+
+    def test_does_not_finish_before_sync(self):
+        source = FakeEventSource([
+            event("suite", "ADDED", suite("cis", "DONE")),
+            0.05,
+            event("suite", "ADDED", suite("e8", "RUNNING")),
+            synced("suite"),
+        ], hold=True)
+        assert not asyncio.run(cluster_watch.wait_for_phases(
+            source, "suite", {"DONE"}, timeout=0.2))
+
+    def test_other_kinds_do_not_complete_wait(self):
+        source = FakeEventSource([
+            event("mcp", "ADDED", mcp("worker", Updated="True")),
+            synced("mcp"),
+            event("suite", "ADDED", suite("cis", "RUNNING")),
+            synced("suite"),
+        ], hold=True)
+        assert asyncio.run(cluster_watch.wait_for_phases(
+            source, "mcp", {"Updated"}, timeout=1))
+        assert not asyncio.run(cluster_watch.wait_for_phases(
+            FakeEventSource(source.script, hold=True), "suite", {"DONE"}, timeout=0.1))
+
+
+class TestJsonStream:
+    def test_splits_back_to_back_documents(self):
+        docs, rest = cluster_watch.iter_json_objects('{"a": 1}\n{\n  "b": 2\n}{"c"')
+        assert docs == [{"a": 1}, {"b": 2}]
+        assert rest == '{"c"'
+        docs, rest = cluster_watch.iter_json_objects(rest + ': 3}\n')
+        assert docs == [{"c": 3}]
+        assert rest == ""
+
+
+class TestOcEventSource:
+    def write_fake_oc(self, tmp_path) -> str:
+        listing = {"items": [suite("cis", "RUNNING", rv=1)]}
+        watch = [
+            {"type": "MODIFIED", "object": suite("cis", "AGGREGATING", rv=2)},
+            {"type": "MODIFIED", "object": suite("cis", "DONE", rv=3)},
+        ]
+        oc = tmp_path / "oc"
+        oc.write_text(
+            "#!/bin/sh\n"
+            'case " $* " in\n'
+            f"*' --watch-only '*) printf '%s\\n' '{json.dumps(watch[0], indent=2)}'\n"
+            "  sleep 0.1\n"
+            f"  printf '%s\\n' '{json.dumps(watch[1])}'\n"
+            "  exec sleep 60 ;;\n"
+            f"*) printf '%s\\n' '{json.dumps(listing)}' ;;\n"
+            "esac\n")
+        oc.chmod(0o755)
+        return str(oc)
+
+    def test_lists_then_watches(self, tmp_path):
+        source = cluster_watch.OcEventSource(["suite"], "ns", self.write_fake_oc(tmp_path))
+        seen = []
+        ok = asyncio.run(cluster_watch.wait_for_phases(
+            source, "suite", {"DONE"}, timeout=5, on_change=seen.append))
+        assert ok
+        assert [c["new"] for c in seen] == ["RUNNING", "AGGREGATING", "DONE"]
+
+    def test_missing_oc_fails_the_wait_immediately(self, tmp_path):
+        source = cluster_watch.OcEventSource(["suite"], "ns", str(tmp_path / "no-such-oc"))
+        started = time.monotonic()
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(cluster_watch.wait_for_phases(source, "suite", {"DONE"}, timeout=30))
+        assert time.monotonic() - started < 5
+
+    def test_argv_namespaces(self):
+        source = cluster_watch.OcEventSource(["suite", "mcp"], "ns")
+        assert source._argv("suite")[-2:] == ["-n", "ns"]
+        assert "-n" not in source._argv("mcp")
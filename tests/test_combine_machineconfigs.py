@@ -13,6 +13,8 @@ import pytest
 import yaml
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'core'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+import compliance_utils  # noqa: E402
 from importlib.util import spec_from_file_location, module_from_spec
 
 spec = spec_from_file_location(
@@ -198,6 +200,29 @@ class TestWriteComboYaml:
         combine.write_combo_yaml("/etc/test.conf", None, sources, tmpdir, "none")
         assert os.path.exists(os.path.join(tmpdir, "test-combo.yaml"))
 
+    def test_compressed_output(self, tmpdir):
+        lines = [f"-w /etc/file{i} -p wa -k perm_mod" for i in range(20)]
+        sources = [
+            {"source_file": "f1.yaml", "lines": lines[:12], "role": "worker", "basename": "f1.yaml"},
+            {"source_file": "f2.yaml", "lines": lines[8:], "role": "worker", "basename": "f2.yaml"},
+        ]
+        combine.write_combo_yaml("/etc/test.rules", "high", sources, tmpdir, "none", compress=True)
+        with open(os.path.join(tmpdir, "test-high-combo.yaml")) as f:
+            text = f.read()
+        assert "# -w /etc/file0" not in text
+        contents = yaml.safe_load(text)["spec"]["config"]["storage"]["files"][0]["contents"]
+        assert contents["compression"] == "gzip"
+        decoded = compliance_utils.decode_file_contents(contents)
+        assert decoded.splitlines() == sorted(lines)
+
+    def test_compressed_output_can_keep_comments(self, tmpdir):
+        lines = [f"-w /etc/file{i} -p wa -k perm_mod" for i in range(20)]
+        sources = [{"source_file": "f1.yaml", "lines": lines, "role": "worker", "basename": "f1.yaml"}]
+        text = combine.render_combo_yaml("/etc/test.rules", None, sources,
+                                         compress=True, comment_lines=True)
+        assert "            # -w /etc/file0 -p wa -k perm_mod\n" in text
+        assert "compression: gzip" in text
+
     def test_provenance_header(self, tmpdir):
         sources = [{"source_file": "f1.yaml", "lines": ["test"], "role": "worker", "basename": "f1.yaml"}]
         combine.write_combo_yaml("/etc/test.conf", "high", sources, tmpdir, "provenance")
@@ -206,6 +231,24 @@ class TestWriteComboYaml:
         assert "Combined from" in first_line
 
 
+class TestSizeReport:
+    def test_reports_combos_only(self, capsys):
+        lines = [f"net.ipv4.conf.all.param{i} = 0" for i in range(30)]
+        combo_map = {
+            ("/etc/sysctl.d/99-test.conf", "high"): [
+                {"source_file": f"f{i}.yaml", "lines": lines[i::2], "role": "worker",
+                 "basename": f"f{i}.yaml"} for i in range(2)],
+            ("/etc/single.conf", None): [
+                {"source_file": "s.yaml", "lines": ["x"], "role": "worker", "basename": "s.yaml"}],
+        }
+        plain, packed = combine.size_report(combo_map)
+        assert 0 < packed < plain
+        out = capsys.readouterr().out
+        assert "99-test-high-combo.yaml" in out
+        assert "single-combo.yaml" not in out
+        assert "TOTAL (1 combos)" in out
+
+
 class TestMoveOriginals:
     def test_moves_combined_files(self, tmpdir):
         combo_dir = os.path.join(tmpdir, "combo")
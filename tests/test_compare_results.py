@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for scripts/compare-results.py"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from importlib.util import spec_from_file_location, module_from_spec
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'compare-results.py')
+spec = spec_from_file_location("compare_results", SCRIPT)
+compare_results = module_from_spec(spec)
+spec.loader.exec_module(compare_results)
+
+
+def result(scan: str, rule: str, status: str, annotate: bool = True) -> dict:
+    metadata: dict = {
+        "name": f"{scan}-{rule}",
+        "labels": {"compliance.openshift.io/scan-name": scan},
+    }
+    if annotate:
+        metadata["annotations"] = {"compliance.openshift.io/rule": rule}
+    return {"metadata": metadata, "status": status, "severity": "medium"}
+
+
+def dump(items: list[dict]) -> str:
+    return json.dumps({"apiVersion": "v1", "items": items, "kind": "List",
+                       "metadata": {"resourceVersion": ""}}, indent=2)
+
+
+def reference_report(before: str, after: str) -> dict:
+    """The inline verify-all-groups.sh comparison this module replaced."""
+    b = {i["metadata"]["name"]: i.get("status", "UNKNOWN") for i in json.loads(before)["items"]}
+    a = {i["metadata"]["name"]: i.get("status", "UNKNOWN") for i in json.loads(after)["items"]}
+    fp, ff, uf = [], [], []
+    for name in sorted(set(b) | set(a)):
+        x, y = b.get(name, "MISSING"), a.get(name, "MISSING")
+        if y == "PASS" and x == "FAIL":
+            fp.append(name)
+        elif y == "FAIL" and x == "PASS":
+            ff.append(name)
+        elif y == "FAIL" and x == "FAIL":
+            uf.append(name)
+    return {
+        "before_pass": sum(v == "PASS" for v in b.values()),
+        "before_fail": sum(v == "FAIL" for v in b.values()),
+        "after_pass": sum(v == "PASS" for v in a.values()),
+        "after_fail": sum(v == "FAIL" for v in a.values()),
+        "flipped_to_pass": fp, "flipped_to_fail": ff, "unchanged_fail": uf,
+    }
+
+
+TRACKING = {
+    "groups": {"H1": {"title": "Crypto Policy"}, "M4": {"title": "Audit rules"},
+               "M9": {"title": "Unused"}},
+    "remediations": {
+        "configure-crypto-policy": {"group": "H1"},
+        "audit-rules-login-events": {"group": "M4"},
+        "audit-rules-immutable": {"group": "M4"},
+    },
+}
+
+
+class TestIterResults:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+    def test_streams_items_across_chunk_boundaries(self, chunk_size):
+        items = [result("ocp4-cis", f"rule-{i}", "PASS") for i in range(30)]
+        text = dump(items)
+        assert list(compare_results.iter_results(io.StringIO(text), chunk_size)) == items
+
+    def test_bare_array_and_empty_list(self):
+        items = [result("ocp4-cis", "a", "FAIL")]
+        assert list(compare_results.iter_results(io.StringIO(json.dumps(items)))) == items
+        assert list(compare_results.iter_results(io.StringIO('{"items": []}'))) == []
+        assert list(compare_results.iter_results(io.StringIO("{}"))) == []
+
+    def test_truncated_dump_raises(self):
+        with pytest.raises(ValueError):
+            list(compare_results.iter_results(io.StringIO(dump([result("x", "y", "PASS")])[:-40])))
+
+
+class TestRuleName:
+    def test_annotation_wins(self):
+        assert compare_results.rule_name(result("rhcos4-e8-worker", "sshd-x", "PASS")) == "sshd-x"
+
+    def test_scan_label_prefix(self):
+        item = result("rhcos4-e8-worker", "sshd-x", "PASS", annotate=False)
+        assert compare_results.rule_name(item) == "sshd-x"
+
+    def test_profile_prefix_fallback(self):
+        assert compare_results.rule_name({"metadata": {"name": "ocp4-cis-api-x"}}) == "api-x"
+
+
+class TestCompareResults:
+    def test_matches_previous_inline_report(self):
+        rng = random.Random(3)
+        statuses = ["PASS", "FAIL", "MANUAL", "NOT-APPLICABLE", "ERROR"]
+        names = [("ocp4-cis", f"r{i}") for i in range(200)] + [("rhcos4-e8-worker", f"r{i}") for i in range(200)]
+        before = dump([result(s, r, rng.choice(statuses)) for s, r in names if rng.random() > 0.05])
+        after = dump([result(s, r, rng.choice(statuses)) for s, r in names if rng.random() > 0.05])
+        report = compare_results.compare_results(io.StringIO(before), io.StringIO(after))
+        expected = reference_report(before, after)
+        assert {k: report[k] for k in expected} == expected
+        assert sum(report["before_counts"].values()) == len(json.loads(before)["items"])
+
+    def test_per_group_results(self):
+        before = dump([
+            result("rhcos4-e8-worker", "configure-crypto-policy", "FAIL"),
+            result("rhcos4-e8-worker", "audit-rules-login-events", "FAIL"),
+            result("rhcos4-e8-master", "audit-rules-login-events", "PASS"),
+            result("rhcos4-e8-worker", "audit-rules-immutable", "FAIL", annotate=False),
+            result("ocp4-cis", "untracked-rule", "FAIL"),
+        ])
+        after = dump([
+            result("rhcos4-e8-worker", "configure-crypto-policy", "PASS"),
+            result("rhcos4-e8-worker", "audit-rules-login-events", "FAIL"),
+            result("rhcos4-e8-master", "audit-rules-login-events", "FAIL"),
+            result("rhcos4-e8-worker", "audit-rules-immutable", "PASS", annotate=False),
+            result("ocp4-cis", "untracked-rule", "PASS"),
+        ])
+        report = compare_results.compare_results(io.StringIO(before), io.StringIO(after), TRACKING)
+        groups = report["groups"]
+        assert list(groups) == ["H1", "M4"]
+        assert groups["H1"]["fixed"] == ["rhcos4-e8-worker-configure-crypto-policy"]
+        assert groups["M4"]["before"] == {"pass": 1, "fail": 2}
+        assert groups["M4"]["after"] == {"pass": 1, "fail": 2}
+        assert groups["M4"]["fixed"] == ["rhcos4-e8-worker-audit-rules-immutable"]
+        assert groups["M4"]["regressed"] == ["rhcos4-e8-master-audit-rules-login-events"]
+        assert groups["M4"]["still_failing"] == ["rhcos4-e8-worker-audit-rules-login-events"]
+        assert "ocp4-cis-untracked-rule" in report["flipped_to_pass"]
+
+    def test_no_groups_without_tracking(self):
+        empty = dump([])
+        report = compare_results.compare_results(io.StringIO(empty), io.StringIO(empty))
+        assert "groups" not in report
+        assert report["before_pass"] == 0
+
+
+class TestMain:
+    def test_writes_report_and_exits_on_regression(self, tmp_path, monkeypatch, capsys):
+        before = tmp_path / "before.json"
+        after = tmp_path / "after.json"
+        out = tmp_path / "diff-report.json"
+        tracking = tmp_path / "tracking.json"
+        before.write_text(dump([result("ocp4-cis", "a", "PASS")]))
+        after.write_text(dump([result("ocp4-cis", "a", "FAIL")]))
+        tracking.write_text(json.dumps(TRACKING))
+        monkeypatch.setattr(sys, "argv", [
+            "compare-results.py", "--tracking", str(tracking), "--output", str(out),
+            str(before), str(after)])
+        with pytest.raises(SystemExit) as exc:
+            compare_results.main()
+        assert exc.value.code == compare_results.EXIT_REGRESSIONS == 3
+        assert "REGRESSIONS (1)" in capsys.readouterr().out
+        assert json.loads(out.read_text())["flipped_to_fail"] == ["ocp4-cis-a"]
+
+    def test_truncated_dump_is_not_reported_as_regression(self, tmp_path):
+        before = tmp_path / "before.json"
+        after = tmp_path / "after.json"
+        before.write_text(dump([result("ocp4-cis", "a", "PASS")]))
+        after.write_text(dump([result("ocp4-cis", "a", "PASS")])[:40])
+        proc = subprocess.run([sys.executable, SCRIPT, str(before), str(after)],
+                              capture_output=True, text=True)
+        assert proc.returncode not in (0, compare_results.EXIT_REGRESSIONS)
+        proc = subprocess.run([sys.executable, SCRIPT, str(before), str(tmp_path / "missing.json")],
+                              capture_output=True, text=True)
+        assert proc.returncode not in (0, compare_results.EXIT_REGRESSIONS)
@@ -190,6 +190,74 @@ class TestParseMachineConfigFiles:
             assert len(files_map) == 0
             assert len(skipped) == 0
 
+    def test_gzip_compressed_content(self):
+        lines = [f"-w /etc/file{i} -p wa -k perm_mod" for i in range(20)]
+        contents = compliance_utils.encode_file_contents("\n".join(lines) + "\n", compress=True)
+        assert contents["compression"] == "gzip"
+        with tempfile.TemporaryDirectory() as td:
+            mc = {
+                "apiVersion": "machineconfiguration.openshift.io/v1",
+                "kind": "MachineConfig",
+                "metadata": {"name": "99-test"},
+                "spec": {"config": {"ignition": {"version": "3.5.0"}, "storage": {"files": [{
+                    "path": "/etc/audit/rules.d/75-test.rules", "contents": contents}]}}},
+            }
+            with open(os.path.join(td, "test.yaml"), "w") as f:
+                yaml.dump(mc, f)
+            files_map, _ = compliance_utils.parse_machineconfig_files(td)
+            assert files_map[("/etc/audit/rules.d/75-test.rules", None)][0]["lines"] == lines
+
+    def test_list_documents_are_expanded(self):
+        with tempfile.TemporaryDirectory() as td:
+            self._write_mc(td, "one.yaml", "/etc/one.conf", "a")
+            with open(os.path.join(td, "one.yaml")) as f:
+                item = yaml.safe_load(f)
+            os.remove(os.path.join(td, "one.yaml"))
+            listing = {"apiVersion": "v1", "kind": "List",
+                       "items": [item, dict(item, metadata={"name": "99-two"})]}
+            with open(os.path.join(td, "dump.yaml"), "w") as f:
+                yaml.dump(listing, f)
+            mcs, skipped = compliance_utils.load_machineconfigs(td)
+            assert [mc["name"] for mc in mcs] == ["99-one", "99-two"]
+            assert skipped == []
+
+
+class TestFileContentsEncoding:
+    def test_plain_round_trip(self):
+        content = "key = value with spaces\n# comment\n"
+        contents = compliance_utils.encode_file_contents(content)
+        assert contents == {"source": "data:,key%20%3D%20value%20with%20spaces%0A%23%20comment%0A"}
+        assert compliance_utils.decode_file_contents(contents) == content
+
+    def test_compressed_round_trip(self):
+        content = "".join(f"kernel.param{i % 3} = {i}\n" for i in range(50))
+        contents = compliance_utils.encode_file_contents(content, compress=True)
+        assert contents["compression"] == "gzip"
+        assert contents["source"].startswith("data:;base64,")
+        assert len(contents["source"]) < len(compliance_utils.encode_file_contents(content)["source"])
+        assert compliance_utils.decode_file_contents(contents) == content
+
+    def test_compressed_output_is_deterministic(self):
+        content = "PermitRootLogin no\n" * 10
+        assert (compliance_utils.encode_file_contents(content, compress=True)
+                == compliance_utils.encode_file_contents(content, compress=True))
+
+    def test_short_content_stays_plain(self):
+        contents = compliance_utils.encode_file_contents("a=1\n", compress=True)
+        assert contents == {"source": "data:,a%3D1%0A"}
+
+    def test_base64_without_compression(self):
+        assert compliance_utils.decode_file_contents({"source": "data:;base64,YT0xCg=="}) == "a=1\n"
+
+    def test_non_data_source(self):
+        assert compliance_utils.decode_file_contents({"source": "https://example.com/f"}) is None
+        assert compliance_utils.decode_file_contents({}) is None
+
+    def test_decode_bytes(self):
+        contents = compliance_utils.encode_file_contents("\x00binary\n" * 30, compress=True)
+        assert compliance_utils.decode_file_bytes(contents) == b"\x00binary\n" * 30
+        assert compliance_utils.decode_file_bytes({"source": "data:,%FF"}) == b"\xff"
+
 
 class TestParseSeverityFilter:
     def test_none_returns_none(self):
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Tests for core/consolidate-machineconfigs.py"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import Any
+
+import yaml
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'core', 'consolidate-machineconfigs.py')
+_spec = spec_from_file_location("consolidate", SCRIPT)
+assert _spec and _spec.loader
+consolidate = module_from_spec(_spec)
+_spec.loader.exec_module(consolidate)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+sys.path.insert(0, os.path.dirname(__file__))
+import compliance_utils  # noqa: E402
+from machineconfig_helpers import file_entry, make_mc, write_mc  # noqa: E402
+
+
+def files_of(doc: dict[str, Any]) -> dict[str, str | None]:
+    return {f['path']: compliance_utils.decode_file_contents(f['contents'])
+            for f in doc['spec']['config']['storage']['files']}
+
+
+class TestMergeMachineConfigs:
+    def test_packs_entries_from_all_sources(self):
+        merged = consolidate.merge_machineconfigs([
+            make_mc('75-b', [file_entry('/etc/b.conf', 'b\n')], kernelArguments=['audit=1']),
+            make_mc('75-a', [file_entry('/etc/a.conf', 'a\n')],
+                    units=[{'name': 'auditd.service', 'enabled': True}]),
+        ])
+        assert sorted(merged['lists'][('storage', 'files')]) == ['/etc/a.conf', '/etc/b.conf']
+        assert list(merged['lists'][('systemd', 'units')]) == ['auditd.service']
+        assert merged['kernel_arguments'] == ['audit=1']
+        assert merged['provenance']['storage.files']['/etc/b.conf'] == ['75-b']
+        assert merged['collisions'] == []
+
+    def test_identical_entries_are_not_collisions(self):
+        content = "".join(f"-w /etc/file{i} -p wa\n" for i in range(20))
+        merged = consolidate.merge_machineconfigs([
+            make_mc('75-a', [file_entry('/etc/audit/rules.d/x.rules', content)]),
+            make_mc('75-b', [file_entry('/etc/audit/rules.d/x.rules', content, compress=True)]),
+        ])
+        assert merged['collisions'] == []
+        assert merged['provenance']['storage.files']['/etc/audit/rules.d/x.rules'] == ['75-a', '75-b']
+
+    def test_collision_reported(self):
+        merged = consolidate.merge_machineconfigs([
+            make_mc('75-b', [file_entry('/etc/x.conf', 'b\n')]),
+            make_mc('75-a', [file_entry('/etc/x.conf', 'a\n')]),
+        ])
+        assert merged['collisions'] == [{'kind': 'storage.files', 'key': '/etc/x.conf',
+                                         'sources': ['75-a', '75-b'], 'winner': None}]
+
+    def test_collision_last_keeps_lexically_later_source(self):
+        merged = consolidate.merge_machineconfigs([
+            make_mc('75-b', [file_entry('/etc/x.conf', 'b\n')]),
+            make_mc('75-a', [file_entry('/etc/x.conf', 'a\n')]),
+        ], on_collision='last')
+        entry = merged['lists'][('storage', 'files')]['/etc/x.conf']
+        assert compliance_utils.decode_file_contents(entry['contents']) == 'b\n'
+        assert merged['collisions'][0]['winner'] == '75-b'
+
+    def test_kernel_arguments_accumulate_and_conflicts_warn(self):
+        merged = consolidate.merge_machineconfigs([
+            make_mc('75-a', kernelArguments=['audit=1', 'slub_debug=P']),
+            make_mc('75-b', kernelArguments=['audit=1', 'audit_backlog_limit=8192']),
+            make_mc('75-c', kernelArguments=['slub_debug=F']),
+        ])
+        assert merged['kernel_arguments'] == [
+            'audit=1', 'slub_debug=P', 'audit_backlog_limit=8192', 'slub_debug=F']
+        assert merged['provenance']['kernelArguments']['audit=1'] == ['75-a', '75-b']
+        assert any('slub_debug' in w for w in merged['warnings'])
+
+    def test_unsupported_fields(self):
+        mc = make_mc('75-a')
+        mc['doc']['spec']['config']['kernelArguments'] = {'shouldExist': ['x']}
+        mc['doc']['spec']['config']['storage'] = {'filesystems': [{'device': '/dev/sdb'}]}
+        merged = consolidate.merge_machineconfigs([mc])
+        assert merged['unsupported'] == ['75-a: spec.config.kernelArguments.shouldExist',
+                                         '75-a: spec.config.storage.filesystems']
+
+    def test_highest_ignition_version(self):
+        merged = consolidate.merge_machineconfigs([
+            make_mc('75-a', version='3.2.0'), make_mc('75-b', version='3.10.0')])
+        assert merged['ignition_version'] == '3.10.0'
+        assert any('mixed Ignition versions' in w for w in merged['warnings'])
+
+
+class TestConsolidate:
+    def test_one_machineconfig_per_role_and_severity(self):
+        documents, provenance = consolidate.consolidate([
+            make_mc('75-a', [file_entry('/etc/a.conf', 'a\n')]),
+            make_mc('75-b', [file_entry('/etc/b.conf', 'b\n')], severity='medium'),
+            make_mc('75-c', [file_entry('/etc/c.conf', 'c\n')], role='master'),
+        ])
+        assert sorted(documents) == ['75-compliance-high-master', '75-compliance-high-worker',
+                                     '75-compliance-medium-worker']
+        doc = documents['75-compliance-high-worker'][0]
+        assert doc['metadata']['labels'] == {'machineconfiguration.openshift.io/role': 'worker'}
+        assert files_of(doc) == {'/etc/a.conf': 'a\n'}
+        assert provenance['machineconfigs']['75-compliance-high-worker']['sources'] == [
+            {'name': '75-a', 'source_file': '75-a.yaml'}]
+
+    def test_merge_severities(self):
+        documents, _ = consolidate.consolidate([
+            make_mc('75-a', [file_entry('/etc/a.conf', 'a\n')]),
+            make_mc('75-b', [file_entry('/etc/b.conf', 'b\n')], severity='medium'),
+        ], merge_severities=True)
+        assert list(documents) == ['75-compliance-worker']
+        assert sorted(files_of(documents['75-compliance-worker'][0])) == ['/etc/a.conf', '/etc/b.conf']
+
+    def test_collisions_detected_across_severities(self):
+        mcs = [
+            make_mc('75-a', [file_entry('/etc/x.conf', 'a\n')]),
+            make_mc('75-b', [file_entry('/etc/x.conf', 'b\n')], severity='medium'),
+        ]
+        _, provenance = consolidate.consolidate(mcs)
+        assert [c['key'] for c in provenance['collisions']] == ['/etc/x.conf']
+
+        documents, _ = consolidate.consolidate(mcs, on_collision='last')
+        assert 'storage' not in documents['75-compliance-high-worker'][0]['spec']['config']
+        assert files_of(documents['75-compliance-medium-worker'][0]) == {'/etc/x.conf': 'b\n'}
+
+    def test_collision_last_prunes_provenance_of_dropped_entries(self):
+        _, provenance = consolidate.consolidate([
+            make_mc('75-a', [file_entry('/etc/x.conf', 'a\n'), file_entry('/etc/y.conf', 'y\n')], fips=False),
+            make_mc('75-b', [file_entry('/etc/x.conf', 'b\n')], severity='medium', fips=True),
+        ], on_collision='last')
+        machineconfigs = provenance['machineconfigs']
+        assert machineconfigs['75-compliance-high-worker']['entries'] == {
+            'storage.files': {'/etc/y.conf': ['75-a']}}
+        assert machineconfigs['75-compliance-medium-worker']['entries'] == {
+            'storage.files': {'/etc/x.conf': ['75-b']}, 'spec.fips': {'fips': ['75-b']}}
+
+    def test_split_above_max_bytes(self):
+        files = [file_entry(f'/etc/f{i}.conf', 'x' * 200 + '\n') for i in range(10)]
+        documents, provenance = consolidate.consolidate(
+            [make_mc('75-a', files, kernelArguments=['audit=1'])], max_bytes=1500)
+        docs = documents['75-compliance-high-worker']
+        assert len(docs) > 1
+        assert [d['metadata']['name'] for d in docs][:2] == [
+            '75-compliance-high-worker', '75-compliance-high-worker-2']
+        assert docs[0]['spec']['kernelArguments'] == ['audit=1']
+        assert all('kernelArguments' not in d['spec'] for d in docs[1:])
+        assert sum(len(files_of(d)) for d in docs) == 10
+        assert all(len(yaml.dump(d)) <= 1500 for d in docs)
+        assert len(provenance['machineconfigs']['75-compliance-high-worker']['parts']) == len(docs)
+
+
+class TestWriteOutputs:
+    def test_writes_yaml_and_provenance_and_removes_stale(self, tmp_path):
+        files = [file_entry(f'/etc/f{i}.conf', 'x' * 200 + '\n') for i in range(10)]
+        documents, provenance = consolidate.consolidate([make_mc('75-a', files)], max_bytes=1500)
+        written = consolidate.write_outputs(str(tmp_path), documents, provenance)
+        assert (tmp_path / '75-compliance-high-worker-2.yaml').exists()
+
+        documents, provenance = consolidate.consolidate([make_mc('75-a', files[:1])], max_bytes=1500)
+        assert consolidate.write_outputs(str(tmp_path), documents, provenance) == [
+            '75-compliance-high-worker.yaml']
+        assert not (tmp_path / '75-compliance-high-worker-2.yaml').exists()
+        assert len(written) > 1
+        saved = json.loads((tmp_path / 'provenance.json').read_text())
+        assert saved['machineconfigs']['75-compliance-high-worker']['entries'] == {
+            'storage.files': {'/etc/f0.conf': ['75-a']}}
+        doc = yaml.safe_load((tmp_path / '75-compliance-high-worker.yaml').read_text())
+        assert doc['kind'] == 'MachineConfig'
+
+
+class TestMain:
+    def test_collision_exits_without_writing(self, tmp_path):
+        write_mc(tmp_path / 'high', make_mc('75-a', [file_entry('/etc/x.conf', 'a\n')]))
+        write_mc(tmp_path / 'high', make_mc('75-b', [file_entry('/etc/x.conf', 'b\n')]))
+        out = tmp_path / 'consolidated'
+        result = subprocess.run([sys.executable, SCRIPT, '--src-dir', str(tmp_path), '--out-dir', str(out)],
+                                capture_output=True, text=True)
+        assert result.returncode == 1
+        assert 'COLLISION [worker] storage.files /etc/x.conf: 75-a, 75-b' in result.stderr
+        assert not out.exists()
+
+    def test_skips_combo_and_output_dirs(self, tmp_path):
+        write_mc(tmp_path / 'high', make_mc('75-a', [file_entry('/etc/x.conf', 'a\n')]))
+        write_mc(tmp_path / 'combo', make_mc('75-old', [file_entry('/etc/x.conf', 'old\n')]))
+        out = tmp_path / 'consolidated'
+        for _ in range(2):
+            subprocess.run([sys.executable, SCRIPT, '--src-dir', str(tmp_path), '--out-dir', str(out)],
+                           capture_output=True, text=True, check=True)
+        assert sorted(os.listdir(out)) == ['75-compliance-high-worker.yaml', 'provenance.json']
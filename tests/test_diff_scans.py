@@ -64,6 +64,66 @@ class TestBuildCheckMap:
         result = diff_scans.build_check_map(data)
         assert len(result) == 0
 
+    def test_status_partitions(self):
+        data = make_export([
+            ("check-a", "PASS", "high", "ocp"),
+            ("check-b", "FAIL", "medium", "rhcos"),
+            ("check-c", "MANUAL", "low", "ocp"),
+            ("check-d", "FAIL", "low", "ocp"),
+        ])
+        result = diff_scans.build_check_map(data)
+        assert result.by_status[diff_scans.FAIL] == {"check-b", "check-d"}
+        assert result.by_status[diff_scans.PASS] == {"check-a"}
+        assert result.by_status[diff_scans.MANUAL] == {"check-c"}
+
+    def test_later_section_wins_for_duplicate_name(self):
+        data = make_export([
+            ("check-a", "FAIL", "high", "ocp"),
+            ("check-a", "PASS", "high", "ocp"),
+        ])
+        result = diff_scans.build_check_map(data)
+        assert result["check-a"]["status"] == "PASS"
+        assert "check-a" not in result.by_status[diff_scans.FAIL]
+
+    def test_identical_records_shared(self):
+        data = make_export([
+            ("check-a", "PASS", "high", "ocp"),
+            ("check-b", "PASS", "high", "ocp"),
+        ])
+        result = diff_scans.build_check_map(data)
+        assert result["check-a"] is result["check-b"]
+
+    def test_record_as_dict(self):
+        data = make_export([("check-a", "FAIL", "medium", "rhcos")])
+        record = diff_scans.build_check_map(data)["check-a"]
+        assert record.as_dict() == {
+            "status": "FAIL", "severity": "medium",
+            "platform": "rhcos", "profile": "",
+        }
+        assert record.get("missing", "x") == "x"
+
+
+class TestStatusChanges:
+    def test_partitions_by_transition(self):
+        old = diff_scans.build_check_map(make_export([
+            ("a", "PASS", "high", "ocp"),
+            ("b", "FAIL", "high", "ocp"),
+            ("c", "MANUAL", "high", "ocp"),
+            ("same", "PASS", "high", "ocp"),
+        ]))
+        new = diff_scans.build_check_map(make_export([
+            ("a", "FAIL", "high", "ocp"),
+            ("b", "PASS", "high", "ocp"),
+            ("c", "FAIL", "high", "ocp"),
+            ("same", "PASS", "high", "ocp"),
+        ]))
+        changes = diff_scans.status_changes(old, new)
+        assert changes == {
+            (diff_scans.PASS, diff_scans.FAIL): {"a"},
+            (diff_scans.FAIL, diff_scans.PASS): {"b"},
+            (diff_scans.MANUAL, diff_scans.FAIL): {"c"},
+        }
+
 
 class TestDiffScans:
     def test_no_changes(self):
@@ -145,3 +205,68 @@ class TestDiffScans:
         new = make_export([("ocp-check", "FAIL", "high", "ocp")])
         result = diff_scans.diff_scans(old, new)
         assert result["pass_to_fail"][0]["platform"] == "ocp"
+
+
+class TestDiffSeries:
+    def series(self, *statuses: dict[str, str]) -> list[dict[str, Any]]:
+        """Build exports dated 2026-01-0N from name -> status dicts."""
+        return [
+            make_export(
+                [(name, status, "high", "rhcos") for name, status in checks.items()],
+                scan_date=f"2026-01-0{i}T00:00:00Z",
+            )
+            for i, checks in enumerate(statuses, 1)
+        ]
+
+    def test_unchanged_checks_omitted(self):
+        exports = self.series({"a": "PASS"}, {"a": "PASS"}, {"a": "PASS"})
+        result = diff_scans.diff_series(exports)
+        assert result["checks"] == {}
+        assert len(result["snapshots"]) == 3
+
+    def test_timeline_and_first_dates(self):
+        exports = self.series(
+            {"a": "PASS"}, {"a": "FAIL"}, {"a": "PASS"}, {"a": "FAIL"})
+        info = diff_scans.diff_series(exports)["checks"]["a"]
+        assert info["timeline"] == ["PASS", "FAIL", "PASS", "FAIL"]
+        assert info["first_regressed"] == "2026-01-02T00:00:00Z"
+        assert info["first_fixed"] == "2026-01-03T00:00:00Z"
+
+    def test_missing_check_recorded_as_none(self):
+        exports = self.series({"a": "PASS"}, {}, {"a": "FAIL"})
+        info = diff_scans.diff_series(exports)["checks"]["a"]
+        assert info["timeline"] == ["PASS", None, "FAIL"]
+        assert info["first_regressed"] is None
+
+    def test_regressed_and_fixed_lists(self):
+        exports = self.series(
+            {"r": "PASS", "f": "FAIL", "m": "MANUAL"},
+            {"r": "FAIL", "f": "PASS", "m": "PASS"},
+        )
+        result = diff_scans.diff_series(exports)
+        assert result["regressed"] == ["r"]
+        assert result["fixed"] == ["f"]
+        assert set(result["checks"]) == {"f", "m", "r"}
+
+    def test_latest_regressions_only_last_step(self):
+        exports = self.series(
+            {"old": "PASS", "new": "PASS"},
+            {"old": "FAIL", "new": "PASS"},
+            {"old": "FAIL", "new": "FAIL"},
+        )
+        result = diff_scans.diff_series(exports)
+        assert result["latest_regressions"] == ["new"]
+        assert sorted(result["regressed"]) == ["new", "old"]
+
+    def test_platform_from_latest_scan(self):
+        exports = self.series({"a": "PASS"}, {"a": "FAIL"})
+        info = diff_scans.diff_series(exports)["checks"]["a"]
+        assert info["platform"] == "rhcos"
+
+    def test_print_series(self, capsys):
+        exports = self.series({"a": "PASS"}, {"a": "FAIL"})
+        diff_scans.print_series(diff_scans.diff_series(exports))
+        out = capsys.readouterr().out
+        assert "TIMELINE (2 scans)" in out
+        assert "2026-01-02  a" in out
+        assert "PASS   FAIL" in out
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Tests for core/extract-summaries.py"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from collections import Counter
+
+from importlib.util import spec_from_file_location, module_from_spec
+
+spec = spec_from_file_location(
+    "extract_summaries",
+    os.path.join(os.path.dirname(__file__), '..', 'core', 'extract-summaries.py'))
+extract_summaries = module_from_spec(spec)
+spec.loader.exec_module(extract_summaries)
+
+SSHD_DESC = (
+    "Disable SSH Root Login\n"
+    "The root user should never be allowed to login to a system directly over a network.\n"
+    "To disable root login via SSH, add or correct the following line in "
+    "/etc/ssh/sshd_config.d/01-complianceascode-reinforce-os-defaults.conf :\n\n"
+    "PermitRootLogin no"
+)
+SYSCTL_DESC = (
+    "Restrict Exposed Kernel Pointer Addresses Access\n"
+    "To set the runtime status of the kernel.kptr_restrict kernel parameter, "
+    "run the following command:\n\n$ sudo sysctl -w kernel.kptr_restrict= 1 \n        \n\n"
+    "To make sure that the setting is persistent, add the following line to a file "
+    "in the directory /etc/sysctl.d :\n\nkernel.kptr_restrict =  1"
+)
+AUDIT_DESC = (
+    "Record attempts to alter time through adjtimex\n"
+    "If the auditd daemon is configured to use the augenrules program to read audit "
+    "rules during daemon startup (the default), add the following line to a file with "
+    "suffix.rules in the directory /etc/audit/rules.d :\n\n"
+    "-a always,exit -F arch=b32 -S adjtimex -F auid>=1000 -F auid!=unset -F key=audit_time_rules\n\n"
+    "If the system is 64 bit then also add the following line:\n\n"
+    "-a always,exit -F arch=b64 -S adjtimex -F auid>=1000 -F auid!=unset -F key=audit_time_rules\n\n"
+    "Multiple system calls can be defined on the same line to save space if desired, "
+    "but is not required. See an example of multiple combined syscalls:\n\n"
+    "-a always,exit -F arch=b64 -S adjtimex,settimeofday -F key=audit_time_rules"
+)
+AUDIT_WATCH_DESC = (
+    "Ensure auditd Collects System Administrator Actions\n"
+    "add the following lines to a file with suffix.rules in the directory /etc/audit/rules.d :\n\n"
+    "-w /etc/sudoers -p wa -k actions\n\n"
+    "add the following lines to /etc/audit/audit.rules :\n\n"
+    "-w /etc/sudoers -p wa -k actions\n\n"
+    "-w /etc/sudoers.d/ -p wa -k actions"
+)
+CHMOD_DESC = (
+    "Verify Permissions on SSH Server config file\n"
+    "To properly set the permissions of /etc/ssh/sshd_config , run the command:\n\n"
+    "$ sudo chmod 0600 /etc/ssh/sshd_config"
+)
+KARG_DESC = (
+    "Enable Kernel Page-Table Isolation (KPTI)\n"
+    "To enable Kernel page-table isolation, add the argument pti=on to all BLS "
+    "(Boot Loader Specification) entries ('options' line) for the Linux operating "
+    "system in /boot/loader/entries/*.conf."
+)
+
+
+class TestExtractSummary:
+    def test_sshd_directive(self):
+        assert extract_summaries.extract_summary(SSHD_DESC) == (
+            "config-line", "Set PermitRootLogin no in sshd_config")
+
+    def test_sysctl_with_spaced_value(self):
+        assert extract_summaries.extract_summary(SYSCTL_DESC) == (
+            "sysctl", "Set kernel.kptr_restrict=1 via sysctl")
+
+    def test_audit_rule_drops_arch_and_examples(self):
+        assert extract_summaries.extract_summary(AUDIT_DESC) == (
+            "audit-rule",
+            "Add audit rule: -a always,exit -S adjtimex -F auid>=1000 -F key=audit_time_rules")
+
+    def test_audit_watch_rules_counted(self):
+        assert extract_summaries.extract_summary(AUDIT_WATCH_DESC) == (
+            "audit-rule", "Add audit rule: -w /etc/sudoers -p wa -k actions (+1 more)")
+
+    def test_file_permission(self):
+        assert extract_summaries.extract_summary(CHMOD_DESC) == (
+            "file-permission", "Set permissions 0600 on /etc/ssh/sshd_config")
+
+    def test_file_owner_and_group(self):
+        assert extract_summaries.extract_summary(
+            "To properly set the owner of /etc/ssh/sshd_config , run the command:\n\n"
+            "$ sudo chown root /etc/ssh/sshd_config"
+        ) == ("file-permission", "Set owner root on /etc/ssh/sshd_config")
+        assert extract_summaries.extract_summary(
+            "$ sudo chgrp root /etc/ssh/sshd_config"
+        ) == ("file-permission", "Set group owner root on /etc/ssh/sshd_config")
+
+    def test_templated_file_path_not_handled(self):
+        assert extract_summaries.extract_summary("$ sudo chmod 0640 audit_log_file") is None
+
+    def test_kernel_arguments(self):
+        assert extract_summaries.extract_summary(KARG_DESC) == (
+            "kernel-argument", "Add kernel argument pti=on")
+        assert extract_summaries.extract_summary(
+            "Remove any instances of selinux=0 from the kernel arguments in that file"
+        ) == ("kernel-argument", "Remove kernel argument selinux=0")
+
+    def test_kernel_module(self):
+        assert extract_summaries.extract_summary(
+            "add the following line to the file /etc/modprobe.d/atm.conf :\n\n"
+            "install atm /bin/false\n\nThis entry will cause a non-zero return value"
+        ) == ("kernel-module", "Disable kernel module atm in /etc/modprobe.d")
+
+    def test_config_line_in_file_phrasing(self):
+        assert extract_summaries.extract_summary(
+            "In the file /etc/selinux/config , add or correct the following line to "
+            "configure the system to boot into enforcing mode:\n\nSELINUX= enforcing \n"
+        ) == ("config-line", "Set SELINUX=enforcing in /etc/selinux/config")
+
+    def test_config_keyword_skips_comments(self):
+        assert extract_summaries.extract_summary(
+            "add or correct the following line in /etc/logrotate.conf :\n\n"
+            "# rotate log files frequency\ndaily"
+        ) == ("config-line", "Add daily to /etc/logrotate.conf")
+
+    def test_unrecognised_returns_none(self):
+        assert extract_summaries.extract_summary(
+            "Ensure that the audit profile is set in the API server configuration.") is None
+        assert extract_summaries.extract_summary("") is None
+
+    def test_long_summary_truncated(self):
+        result = extract_summaries.extract_summary(
+            "-a always,exit -F path=/usr/libexec/openssh/ssh-keysign -F perm=x "
+            "-F auid>=1000 -F auid!=unset -F key=privileged-ssh-keysign-long-key")
+        assert result is not None
+        assert len(result[1]) == extract_summaries.MAX_SUMMARY_LEN
+        assert result[1].endswith("...")
+
+
+class TestProcessChecks:
+    def test_counts_shapes_and_reports_unhandled(self):
+        checks = [
+            {"name": "sysctl-check", "description": SYSCTL_DESC},
+            {"name": "sshd-check", "description": SSHD_DESC},
+            {"name": "api-check", "description": "Configure the API server."},
+            {"name": "done", "description": SYSCTL_DESC, "summary": "existing"},
+        ]
+        shapes: Counter[str] = Counter()
+        unhandled: list[str] = []
+        assert extract_summaries.process_checks(checks, shapes, unhandled) == 2
+        assert shapes == {"sysctl": 1, "config-line": 1}
+        assert unhandled == ["api-check"]
+        assert checks[3]["summary"] == "existing"
+
+    def test_overwrite_replaces_existing(self):
+        checks = [{"name": "done", "description": SYSCTL_DESC, "summary": "stale"}]
+        extract_summaries.process_checks(checks, Counter(), [], overwrite=True)
+        assert checks[0]["summary"] == "Set kernel.kptr_restrict=1 via sysctl"
+
+
+class TestMain:
+    def _run(self, argv: list[str]) -> None:
+        old_argv = sys.argv
+        try:
+            sys.argv = ["prog"] + argv
+            extract_summaries.main()
+        finally:
+            sys.argv = old_argv
+
+    def _write(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump({
+                "remediations": {"high": [{"name": "a", "description": SSHD_DESC}],
+                                 "medium": [{"name": "b", "description": "Review RBAC."}]},
+                "passing_checks": {"low": [{"name": "c", "description": KARG_DESC}]},
+                "manual_checks": [{"name": "d", "description": "Check manually."}],
+            }, f)
+
+    def test_writes_summaries_and_unhandled(self):
+        with tempfile.TemporaryDirectory() as td:
+            json_path = os.path.join(td, "ocp.json")
+            unhandled_path = os.path.join(td, "unhandled.txt")
+            self._write(json_path)
+            self._run([json_path, "--unhandled", unhandled_path])
+            with open(json_path) as f:
+                data = json.load(f)
+            assert data["remediations"]["high"][0]["summary"] == "Set PermitRootLogin no in sshd_config"
+            assert data["passing_checks"]["low"][0]["summary"] == "Add kernel argument pti=on"
+            assert "summary" not in data["manual_checks"][0]
+            with open(unhandled_path) as f:
+                assert f.read() == "b\nd\n"
+
+    def test_dry_run_leaves_file_unchanged(self):
+        with tempfile.TemporaryDirectory() as td:
+            json_path = os.path.join(td, "ocp.json")
+            self._write(json_path)
+            with open(json_path) as f:
+                before = f.read()
+            self._run([json_path, "--dry-run"])
+            with open(json_path) as f:
+                assert f.read() == before
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Tests for lab-tools/fetch-kubeconfig.py readiness polling"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import module_from_spec, spec_from_file_location
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+_spec = spec_from_file_location(
+    "fetch_kubeconfig",
+    os.path.join(os.path.dirname(__file__), "..", "lab-tools", "fetch-kubeconfig.py"))
+assert _spec and _spec.loader
+fetch_kubeconfig = module_from_spec(_spec)
+_spec.loader.exec_module(fetch_kubeconfig)
+
+
+def status_page(rows: list[tuple[str, str, str]]) -> str:
+    cells = "".join(f"<tr><td>{n}</td><td>{s}</td><td>{ip}</td></tr>" for n, s, ip in rows)
+    return ("<html><body>"
+            "<table><tr><th>Plan name</th><th>Client</th></tr><tr><td>cnfdc3</td><td>team</td></tr></table>"
+            f"<table><tr><th>VM name</th><th>Status</th><th>IP</th></tr>{cells}</table>"
+            "</body></html>")
+
+
+NOT_READY = status_page([
+    ("cnfdc3-installer", "up", "10.0.0.5"),
+    ("cnfdc3-master-0", "down", ""),
+    ("cnfdc3-worker-0", "down", ""),
+])
+READY = status_page([
+    ("cnfdc3-installer", "up", "10.0.0.5"),
+    ("cnfdc3-bootstrap", "down", ""),
+    ("cnfdc3-master-0", "up", "10.0.0.10"),
+    ("cnfdc3-worker-0", "down", ""),
+])
+
+
+class StatusServer:
+    """Local stand-in for succulent: serves a sequence of pages per path."""
+
+    def __init__(self, pages: dict[str, list[str]]):
+        self.pages = pages
+        self.hits: dict[str, int] = {}
+        self.connections = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                with server.lock:
+                    n = server.hits.get(self.path, 0)
+                    server.hits[self.path] = n + 1
+                seq = server.pages.get(self.path)
+                if not seq:
+                    self.send_error(404)
+                    return
+                body = seq[min(n, len(seq) - 1)].encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}{path}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def no_sleep(_seconds: float) -> None:
+    pass
+
+
+class TestParseNodeStatus:
+    def test_vm_rows_and_installer(self):
+        status = fetch_kubeconfig.parse_node_status(READY)
+        assert status["installer_ip"] == "10.0.0.5"
+        assert status["nodes"]["cnfdc3-master-0"] == {"status": "up", "ip": "10.0.0.10"}
+        assert "cnfdc3" not in status["nodes"]
+
+    def test_readiness_rules(self):
+        ready = fetch_kubeconfig.parse_node_status(READY)
+        assert fetch_kubeconfig.cluster_readiness(ready["nodes"], ready["installer_ip"])
+        assert not fetch_kubeconfig.cluster_readiness(ready["nodes"], None)
+        waiting = fetch_kubeconfig.parse_node_status(NOT_READY)
+        assert not fetch_kubeconfig.cluster_readiness(waiting["nodes"], waiting["installer_ip"])
+
+
+class TestPollDelay:
+    def test_fixed_interval_by_default(self):
+        rng = random.Random(0)
+        for attempt in range(6):
+            delay = fetch_kubeconfig.poll_delay(attempt, 30, rng=rng)
+            assert 27 <= delay <= 33
+
+    def test_exponential_backoff_is_capped(self):
+        rng = random.Random(0)
+        delays = [fetch_kubeconfig.poll_delay(a, 10, 80, rng=rng) for a in range(8)]
+        for attempt, delay in enumerate(delays):
+            base = min(80, 10 * 2 ** attempt)
+            assert base * 0.9 <= delay <= base * 1.1
+
+
+class TestWaitForClusterReady:
+    def test_reuses_one_connection(self):
+        with StatusServer({"/cnfdc3": [NOT_READY, NOT_READY, READY]}) as server:
+            session = fetch_kubeconfig.make_session()
+            ip = fetch_kubeconfig.wait_for_cluster_ready(
+                server.url("/cnfdc3"), max_wait_minutes=1, poll_interval=1,
+                session=session, sleep=no_sleep)
+            session.close()
+        assert ip == "10.0.0.5"
+        assert server.hits["/cnfdc3"] == 3
+        assert server.connections == 1
+
+    def test_times_out(self):
+        with StatusServer({"/cnfdc3": [NOT_READY]}) as server:
+            ip = fetch_kubeconfig.wait_for_cluster_ready(
+                server.url("/cnfdc3"), max_wait_minutes=0.001, poll_interval=1,
+                session=fetch_kubeconfig.make_session(), sleep=lambda _s: time.sleep(0.02))
+        assert ip is None
+
+
+class TestWaitForClusters:
+    def test_clusters_polled_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def rendezvous(_seconds: float) -> None:
+            # Both waiters must be sleeping at the same time to get past here.
+            barrier.wait()
+
+        pages = {
+            "/cnfdc3": [NOT_READY, READY],
+            "/cnfdc4": [NOT_READY, READY.replace("10.0.0.5", "10.0.1.5")],
+            "/cnfdc5": [NOT_READY],
+        }
+        with StatusServer(pages) as server:
+            ips = fetch_kubeconfig.wait_for_clusters(
+                {"cnfdc3": server.url("/cnfdc3"), "cnfdc4": server.url("/cnfdc4")},
+                max_wait_minutes=1, poll_interval=1, sleep=rendezvous)
+        assert ips == {"cnfdc3": "10.0.0.5", "cnfdc4": "10.0.1.5"}
+        assert server.connections <= 2
+
+    def test_unreachable_status_page(self):
+        with StatusServer({}) as server:
+            status = fetch_kubeconfig.check_node_status(
+                server.url("/missing"), session=fetch_kubeconfig.make_session())
+        assert status == {"nodes": {}, "installer_ip": None}
+
+    def test_verify_setting_survives_ca_bundle_env(self, monkeypatch):
+        # A CA bundle in the environment overrides session.verify, but not
+        # verify= passed on the request itself.
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/etc/pki/ca-bundle.crt")
+        seen = []
+        with StatusServer({"/cnfdc3": [READY]}) as server:
+            session = fetch_kubeconfig.make_session()
+            adapter = session.get_adapter(server.url("/cnfdc3"))
+            send = adapter.send
+
+            def record(request, **kwargs):
+                seen.append(kwargs["verify"])
+                return send(request, **kwargs)
+            monkeypatch.setattr(adapter, "send", record)
+            status = fetch_kubeconfig.check_node_status(server.url("/cnfdc3"), session=session)
+            session.close()
+        assert status["installer_ip"] == "10.0.0.5"
+        assert seen == [False]
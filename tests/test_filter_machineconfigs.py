@@ -20,22 +20,18 @@ filtmc = module_from_spec(spec)
 spec.loader.exec_module(filtmc)
 
 
-class TestParseConfigContent:
+class TestDecodeFileContents:
     def test_basic_decode(self):
         content = "PermitRootLogin no\nPasswordAuthentication no\n"
         encoded = "data:," + urllib.parse.quote(content, safe='')
-        result = filtmc.parse_config_content(encoded)
-        assert result == ["PermitRootLogin no", "PasswordAuthentication no"]
+        assert filtmc.decode_file_contents({"source": encoded}) == content
 
-    def test_skips_empty_lines(self):
-        content = "line1\n\nline2\n"
-        encoded = "data:," + urllib.parse.quote(content, safe='')
-        result = filtmc.parse_config_content(encoded)
-        assert result == ["line1", "line2"]
+    def test_base64_decode(self):
+        assert filtmc.decode_file_contents(
+            {"source": "data:text/plain;charset=utf-8;base64,bGluZTEKCmxpbmUyCg=="}) == "line1\n\nline2\n"
 
-    def test_invalid_prefix(self):
-        with pytest.raises(ValueError, match="data:,"):
-            filtmc.parse_config_content("https://example.com")
+    def test_non_data_source_is_skipped(self):
+        assert filtmc.decode_file_contents({"source": "https://example.com"}) is None
 
 
 class TestFilterConfigLines:
@@ -123,6 +119,16 @@ class TestCreateFilteredMachineconfig:
         assert "PermitRootLogin" in content
         assert "X11Forwarding" not in content
 
+    def test_skips_empty_lines(self, tmpdir):
+        input_file = self._write_mc(tmpdir, ["PermitRootLogin no", "", "  ", "Match User x"])
+        output_file = os.path.join(tmpdir, "output.yaml")
+        filtmc.create_filtered_machineconfig(
+            input_file, output_file, ["PermitRootLogin", "Match"])
+        with open(output_file) as f:
+            contents = yaml.safe_load(f)["spec"]["config"]["storage"]["files"][0]["contents"]
+        assert filtmc.decode_file_contents(contents).splitlines() == [
+            "PermitRootLogin no", "Match User x"]
+
     def test_no_matching_flags(self, tmpdir, capsys):
         input_file = self._write_mc(tmpdir, ["PermitRootLogin no"])
         output_file = os.path.join(tmpdir, "output.yaml")
@@ -140,6 +146,27 @@ class TestCreateFilteredMachineconfig:
             filtmc.create_filtered_machineconfig(
                 fpath, os.path.join(tmpdir, "out.yaml"), ["test"])
 
+    def test_compressed_input_and_output(self, tmpdir):
+        input_file = self._write_mc(tmpdir, ["PermitRootLogin no"])
+        lines = ["PermitRootLogin no"] + [f"Match User user{i}" for i in range(20)]
+        with open(input_file) as f:
+            mc = yaml.safe_load(f)
+        entry = mc["spec"]["config"]["storage"]["files"][0]
+        entry["contents"] = filtmc.encode_file_contents("\n".join(lines) + "\n", compress=True)
+        assert entry["contents"]["compression"] == "gzip"
+        with open(input_file, 'w') as f:
+            yaml.dump(mc, f)
+
+        output_file = os.path.join(tmpdir, "output.yaml")
+        filtmc.create_filtered_machineconfig(
+            input_file, output_file, ["Match"], compress=True)
+        with open(output_file) as f:
+            text = f.read()
+        assert "# Match User" not in text
+        contents = yaml.safe_load(text)["spec"]["config"]["storage"]["files"][0]["contents"]
+        assert contents["compression"] == "gzip"
+        assert filtmc.decode_file_contents(contents).splitlines() == lines[1:]
+
     def test_description_header(self, tmpdir):
         input_file = self._write_mc(tmpdir, ["PermitRootLogin no"])
         output_file = os.path.join(tmpdir, "output.yaml")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for scripts/generate-compare-data.py."""
+from __future__ import annotations
+
+import json
+import os
+from importlib.util import module_from_spec, spec_from_file_location
+
+_spec = spec_from_file_location(
+    "generate_compare_data",
+    os.path.join(os.path.dirname(__file__), "..", "scripts", "generate-compare-data.py"))
+assert _spec and _spec.loader
+compare_data = module_from_spec(_spec)
+_spec.loader.exec_module(compare_data)
+
+REPO = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def scan_export() -> dict:
+    return {
+        "version": "4.22",
+        "scan_date": "2026-07-01T00:00:00Z",
+        "summary": {"total_checks": 3, "passing": 1, "failing": 1, "manual": 1, "skipped": 0},
+        "remediations": {"high": [{"name": "rhcos4-b", "severity": "high", "platform": "rhcos",
+                                   "description": "long text"}]},
+        "passing_checks": {"medium": [{"name": "ocp4-a", "severity": "medium", "platform": "ocp"}]},
+        "manual_checks": [{"name": "ocp4-c", "severity": "low", "platform": "ocp"}],
+    }
+
+
+def expand(table: dict) -> dict:
+    return {
+        row[0]: (table["statuses"][row[1]], table["severities"][row[2]], table["platforms"][row[3]])
+        for row in table["checks"]
+    }
+
+
+class TestCompactTable:
+    def test_rows_round_trip(self):
+        table = compare_data.compact_table(scan_export())
+        assert [row[0] for row in table["checks"]] == ["ocp4-a", "ocp4-c", "rhcos4-b"]
+        assert expand(table) == {
+            "ocp4-a": ("PASS", "medium", "ocp"),
+            "ocp4-c": ("MANUAL", "low", "ocp"),
+            "rhcos4-b": ("FAIL", "high", "rhcos"),
+        }
+
+    def test_summary_keeps_compare_fields_only(self):
+        table = compare_data.compact_table(scan_export())
+        assert table["summary"] == {"total_checks": 3, "passing": 1, "failing": 1, "manual": 1}
+        assert "description" not in json.dumps(table)
+
+    def test_dump_is_valid_json(self):
+        table = compare_data.compact_table(scan_export())
+        text = compare_data.dump_table(table)
+        assert json.loads(text) == table
+        assert text.count("\n") == len(table["checks"]) + 2
+
+
+class TestSources:
+    def test_latest_baseline_precedes_its_version(self, tmp_path):
+        for name in ["ocp-5_0.json", "ocp-4_22.json", "ocp-4_22-2026-07-01.json",
+                     "ocp-4_22-baseline-2026-01-01.json", "ocp-4_22-baseline-2026-05-05.json",
+                     "ocp-4_21-baseline-2026-01-01.json", "tracking-4_22.json"]:
+            (tmp_path / name).write_text("{}")
+        sources = compare_data.find_sources(str(tmp_path))
+        assert list(sources) == ["4.22-baseline", "4.22", "5.0"]
+        assert sources["4.22-baseline"]["path"].endswith("ocp-4_22-baseline-2026-05-05.json")
+        assert sources["4.22-baseline"]["label"] == "OCP 4.22 baseline (2026-05-05)"
+
+    def test_compare_pairs(self):
+        assert compare_data.compare_pairs(["4.21", "4.22-baseline", "4.22"]) == [
+            ("4.21", "4.22"), ("4.22", "4.21"), ("4.22-baseline", "4.22")]
+
+
+class TestCompactDiff:
+    def test_matches_diff_scans(self):
+        old = scan_export()
+        new = scan_export()
+        new["remediations"] = {}
+        new["passing_checks"]["high"] = [{"name": "rhcos4-b", "severity": "high", "platform": "rhcos"}]
+        new["manual_checks"] = []
+        diff = compare_data.compact_diff(old, new)
+        full = compare_data.diff_scans.diff_scans(old, new)
+        assert diff["fail_to_pass"] == full["fail_to_pass"]
+        assert diff["removed"] == [{"name": "ocp4-c", "status": "MANUAL", "platform": "ocp"}]
+        assert "skipped" not in diff["old"]["summary"]
+        assert json.loads(compare_data.dump_diff(diff)) == diff
+
+
+class TestMain:
+    def test_writes_tables_diffs_and_index(self, tmp_path, monkeypatch, capsys):
+        data, out = tmp_path / "data", tmp_path / "out"
+        data.mkdir()
+        for name in ["ocp-4_22.json", "ocp-5_0.json", "ocp-4_22-baseline-2026-05-05.json",
+                     "tracking-4_22.json"]:
+            (data / name).write_text(json.dumps(scan_export()))
+        (out / "diff").mkdir(parents=True)
+        (out / "diff" / "4_21_to_4_22.json").write_text("{}")
+        monkeypatch.setattr("sys.argv", ["x", "--data-dir", str(data), "--output-dir", str(out)])
+        compare_data.main()
+        assert sorted(os.listdir(out)) == [
+            "diff", "index.json", "ocp-4_22-baseline-2026-05-05.json", "ocp-4_22.json", "ocp-5_0.json"]
+        assert sorted(os.listdir(out / "diff")) == [
+            "4_22-baseline_to_4_22.json", "4_22_to_5_0.json", "5_0_to_4_22.json"]
+        index = json.loads((out / "index.json").read_text())
+        assert index["diffs"]["4.22-baseline"] == {"4.22": "diff/4_22-baseline_to_4_22.json"}
+        assert index["versions"]["5.0"]["table"] == "ocp-5_0.json"
+        assert "removed diff/4_21_to_4_22.json" in capsys.readouterr().out
+        compare_data.main()
+        assert "0 updated, 0 removed" in capsys.readouterr().out
+
+
+def test_committed_compare_data_is_current():
+    out_dir = os.path.join(REPO, "docs", "assets", "compare")
+    files = compare_data.generate(os.path.join(REPO, "docs", "_data"))
+    for rel, expected in files.items():
+        with open(os.path.join(out_dir, rel)) as f:
+            assert f.read() == expected, f"Run make generate-compare-data ({rel})"
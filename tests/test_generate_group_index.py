@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for scripts/generate-group-index.py."""
+from __future__ import annotations
+
+import json
+import os
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+_spec = spec_from_file_location(
+    "generate_group_index",
+    os.path.join(os.path.dirname(__file__), "..", "scripts", "generate-group-index.py"))
+assert _spec and _spec.loader
+group_index = module_from_spec(_spec)
+_spec.loader.exec_module(group_index)
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def tracking() -> dict:
+    return {
+        "groups": {"M1": {"title": "SSHD"}, "M2": {"title": "Sysctl"}},
+        "remediations": {
+            "sshd-disable-root-login": {
+                "group": "M1", "description": "Disable root login",
+                "certsuite": [{"id": "platform-ssh", "suite": "platform"},
+                              {"id": "platform-ssh-2", "suite": "platform"}],
+            },
+            "sshd-disable-rhosts": {"group": "M1", "description": "Disable rhosts"},
+            "sshd-strict-modes": {"group": "M1"},
+            "orphan": {"group": "X9"},
+            "ungrouped": {"group": None},
+        },
+    }
+
+
+class TestBuildGroupIndex:
+    def test_checks_keep_tracking_order(self):
+        index = group_index.build_group_index(tracking())
+        assert index["M1"]["check_count"] == 3
+        assert [c["name"] for c in index["M1"]["checks"]] == [
+            "sshd-disable-root-login", "sshd-disable-rhosts", "sshd-strict-modes"]
+        assert index["M1"]["checks"][2]["description"] == ""
+        assert set(index) == {"M1", "M2"}
+
+    def test_certsuite_coverage(self):
+        m1 = group_index.build_group_index(tracking())["M1"]
+        assert (m1["certsuite_total"], m1["certsuite_covered"], m1["certsuite_pct"]) == (3, 1, 33)
+        assert [t["id"] for t in m1["certsuite_tests"]] == ["platform-ssh", "platform-ssh-2"]
+        assert m1["certsuite_tests"][0]["check"] == "sshd-disable-root-login"
+
+    def test_certsuite_string_is_one_test(self):
+        data = tracking()
+        data["remediations"]["sshd-disable-rhosts"]["certsuite"] = "platform-rhosts"
+        data["remediations"]["sshd-strict-modes"]["certsuite"] = {"id": "bogus"}
+        m1 = group_index.build_group_index(data)["M1"]
+        assert m1["certsuite_covered"] == 2
+        assert m1["certsuite_tests"][-1] == {
+            "check": "sshd-disable-rhosts", "id": "platform-rhosts", "suite": ""}
+
+    def test_empty_group(self):
+        m2 = group_index.build_group_index(tracking())["M2"]
+        assert m2["check_count"] == 0 and m2["certsuite_pct"] == 0 and m2["certsuite_tests"] == []
+        assert "scan" not in m2
+
+    def test_scan_status_matches_suffixes(self):
+        scan = {
+            "passing_checks": {"medium": [{"name": "rhcos4-e8-worker-sshd-disable-rhosts"}]},
+            "remediations": {"medium": [{"name": "rhcos4-e8-worker-sshd-disable-root-login"}]},
+            "manual_checks": [],
+        }
+        index = group_index.build_group_index(tracking(), scan)
+        assert index["M1"]["scan"] == {"pass": 1, "fail": 1, "manual": 0}
+        assert index["M2"]["scan"] == {"pass": 0, "fail": 0, "manual": 0}
+
+
+class TestIndexTargets:
+    def test_pairs_tracking_with_scans(self, tmp_path):
+        for name in ["tracking.json", "tracking-4_22.json", "tracking-5_0.json",
+                     "ocp-4_22.json", "ocp-5_0.json", "ocp-5_0-2026-08-12.json"]:
+            (tmp_path / name).write_text("{}")
+        targets = [(os.path.basename(t), os.path.basename(o), s and os.path.basename(s))
+                   for t, o, s in group_index.index_targets(str(tmp_path))]
+        assert targets == [
+            ("tracking-4_22.json", "group-index-4_22.json", "ocp-4_22.json"),
+            ("tracking-5_0.json", "group-index-5_0.json", "ocp-5_0.json"),
+            ("tracking.json", "group-index.json", "ocp-5_0.json"),
+        ]
+
+    def test_missing_scan(self, tmp_path):
+        (tmp_path / "tracking-5_1.json").write_text("{}")
+        assert group_index.index_targets(str(tmp_path))[0][2] is None
+
+
+def test_committed_group_indexes_are_current():
+    for tracking_path, output, scan_path in group_index.index_targets(str(REPO / "docs" / "_data")):
+        scan = group_index.group_matrix.load_json(scan_path) if scan_path else None
+        expected = group_index.build_group_index(group_index.group_matrix.load_json(tracking_path), scan)
+        with open(output) as f:
+            assert json.load(f) == expected, f"Run make generate-group-index ({os.path.basename(output)})"
+
+
+def test_group_layouts_do_not_scan_remediations():
+    for layout in ["group.html", "remediations.html"]:
+        text = (REPO / "docs" / "_layouts" / layout).read_text()
+        assert "tracking.remediations" not in text, layout
+        assert "group_index[" in text, layout
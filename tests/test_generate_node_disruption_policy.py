@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests for core/generate-node-disruption-policy.py"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+
+import yaml
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'core', 'generate-node-disruption-policy.py')
+_spec = spec_from_file_location("ndp", SCRIPT)
+assert _spec and _spec.loader
+ndp = module_from_spec(_spec)
+_spec.loader.exec_module(ndp)
+
+sys.path.insert(0, os.path.dirname(__file__))
+from machineconfig_helpers import make_mc, write_mc  # noqa: E402
+
+
+class TestClosestPolicy:
+    def test_exact_path_then_parent_directory(self):
+        catalog = ndp.file_catalog()
+        assert ndp.closest_policy('/etc/ssh/sshd_config', catalog) == '/etc/ssh/sshd_config'
+        assert ndp.closest_policy('/etc/sysctl.d/75-net.conf', catalog) == '/etc/sysctl.d'
+        assert ndp.closest_policy('/etc/pam.d/system-auth', catalog) == '/etc/pam.d'
+
+    def test_no_prefix_match_on_names(self):
+        assert ndp.closest_policy('/etc/issue.d/banner', {'/etc/issue': []}) is None
+        assert ndp.closest_policy('/etc/selinux/config', ndp.file_catalog()) is None
+
+    def test_audit_rules_opt_in_and_exclusions(self):
+        assert ndp.closest_policy('/etc/audit/rules.d/75-x.rules', ndp.file_catalog()) is None
+        catalog = ndp.file_catalog('audit-rules.service', exclude_paths=['/etc/chrony.conf'])
+        assert catalog['/etc/audit/rules.d'] == [ndp.restart('audit-rules.service')]
+        assert '/etc/chrony.conf' not in catalog
+
+
+class TestAnalyzeMachineconfig:
+    def test_rebootless_file_changes(self):
+        result = ndp.analyze_machineconfig(
+            make_mc('75-a', ('/etc/ssh/sshd_config', '/etc/sysctl.d/75-x.conf', '/etc/login.defs')),
+            ndp.file_catalog())
+        assert not result['reboot']
+        assert ndp.describe_actions(result['actions']) == (
+            'Reload sshd.service, Restart systemd-sysctl.service')
+        assert result['matched'] == {'/etc/ssh/sshd_config': 'file', '/etc/sysctl.d': 'file',
+                                     '/etc/login.defs': 'file'}
+
+    def test_reboot_reasons(self):
+        result = ndp.analyze_machineconfig(
+            make_mc('75-a', ('/etc/selinux/config', '/etc/ssh/sshd_config'), units=['kdump.service'],
+                    kernelArguments=['audit=1'], fips=True),
+            ndp.file_catalog())
+        assert result['reboot']
+        assert result['reasons'] == [
+            'kernelArguments: audit=1', 'fips: True',
+            'file /etc/selinux/config has no policy', 'unit kdump.service has no policy']
+
+    def test_units_and_mco_defaults(self):
+        result = ndp.analyze_machineconfig(
+            make_mc('75-a', ['/etc/containers/policy.json'], units=['chronyd.service']),
+            ndp.file_catalog())
+        assert not result['reboot']
+        assert ndp.describe_actions(result['actions']) == (
+            'Reload crio.service, DaemonReload, Restart chronyd.service')
+
+    def test_core_ssh_keys_do_not_reboot(self):
+        mc = make_mc('75-a')
+        mc['doc']['spec']['config']['passwd'] = {'users': [{'name': 'core', 'sshAuthorizedKeys': ['k']}]}
+        assert not ndp.analyze_machineconfig(mc, ndp.file_catalog())['reboot']
+
+
+class TestBuildPolicy:
+    def test_only_matched_entries_without_anchors(self):
+        catalog = ndp.file_catalog()
+        analyses = [ndp.analyze_machineconfig(m, catalog) for m in (
+            make_mc('75-a', ('/etc/login.defs', '/etc/issue', '/etc/sysctl.d/a.conf')),
+            make_mc('75-b', ['/etc/sysctl.d/b.conf'], units=['sshd.service']),
+        )]
+        policy = ndp.build_policy(analyses, catalog)
+        assert policy['kind'] == 'MachineConfiguration'
+        assert policy['metadata'] == {'name': 'cluster'}
+        ndpolicy = policy['spec']['nodeDisruptionPolicy']
+        assert [f['path'] for f in ndpolicy['files']] == ['/etc/issue', '/etc/login.defs', '/etc/sysctl.d']
+        assert ndpolicy['units'] == [{'name': 'sshd.service', 'actions': [
+            {'type': 'DaemonReload'},
+            {'type': 'Restart', 'restart': {'serviceName': 'sshd.service'}}]}]
+        assert '&id' not in yaml.dump(policy)
+
+    def test_all_includes_full_catalog(self):
+        catalog = ndp.file_catalog()
+        policy = ndp.build_policy([], catalog, include_all=True)
+        assert len(policy['spec']['nodeDisruptionPolicy']['files']) == len(catalog)
+        assert len(catalog) <= ndp.MAX_POLICY_ENTRIES
+
+
+class TestMain:
+    def test_writes_policy_and_report(self, tmp_path):
+        src = tmp_path / 'src'
+        write_mc(src, make_mc('75-sshd', ['/etc/ssh/sshd_config']))
+        write_mc(src, make_mc('75-kargs', role='master', kernelArguments=['audit=1']))
+        write_mc(src / 'combo', make_mc('75-old', ['/etc/selinux/config']))
+
+        out, report = tmp_path / 'policy.yaml', tmp_path / 'report.json'
+        result = subprocess.run([sys.executable, SCRIPT, '--src-dir', str(src), '-o', str(out),
+                                 '--report', str(report)], capture_output=True, text=True, check=True)
+        assert 'REBOOT    75-kargs' in result.stderr
+        assert 'Pool master: 1 of 1 MachineConfigs still reboot' in result.stderr
+        assert 'Pool worker: all 1 MachineConfigs apply without a reboot.' in result.stderr
+        policy = yaml.safe_load(out.read_text())
+        assert [f['path'] for f in policy['spec']['nodeDisruptionPolicy']['files']] == ['/etc/ssh/sshd_config']
+        names = {m['name']: m['reboot'] for m in json.loads(report.read_text())['machineconfigs']}
+        assert names == {'75-sshd': False, '75-kargs': True}
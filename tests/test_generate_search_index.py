@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for scripts/generate-search-index.py and docs/assets/js/search.js."""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+_spec = spec_from_file_location(
+    "generate_search_index",
+    os.path.join(os.path.dirname(__file__), "..", "scripts", "generate-search-index.py"))
+assert _spec and _spec.loader
+search_index = module_from_spec(_spec)
+_spec.loader.exec_module(search_index)
+
+REPO = Path(__file__).resolve().parents[1]
+SEARCH_JS = REPO / "docs" / "assets" / "js" / "search.js"
+
+
+def scan_export() -> dict:
+    return {
+        "remediations": {"high": [{
+            "name": "rhcos4-e8-worker-sshd-disable-root-login", "severity": "high",
+            "platform": "rhcos", "description": "Disable SSH Root Login\nThe root user should never log in."}]},
+        "passing_checks": {"medium": [{
+            "name": "ocp4-cis-audit-profile-set", "severity": "medium", "platform": "ocp",
+            "description": "Ensure that the audit profile is set", "summary": "Configure API server audit"}]},
+        "manual_checks": [{"name": "ocp4-cis-secrets-no-env", "description": "Do not use secrets in env"}],
+    }
+
+
+def tracking() -> dict:
+    return {
+        "groups": {"M1": {"title": "SSHD Configuration", "status": "pending",
+                          "status_note": "Hardened defaults on RHCOS 10"}},
+        "remediations": {"sshd-disable-root-login": {"group": "M1"}},
+    }
+
+
+def decode(postings: list[int]) -> list[int]:
+    ids, total = [], 0
+    for gap in postings:
+        total += gap
+        ids.append(total)
+    return ids
+
+
+def lookup(shard: dict, term: str) -> list[str]:
+    ids = decode(shard["postings"][shard["terms"].index(term)])
+    return [shard["docs"][i][1] for i in ids]
+
+
+class TestTokenize:
+    def test_drops_stopwords_and_single_characters(self):
+        assert search_index.tokenize("Ensure that the audit-profile is set, x") == {
+            "ensure", "audit", "profile", "set"}
+
+
+class TestBuildShard:
+    def test_documents(self):
+        shard = search_index.build_shard("5.0", scan_export(), tracking())
+        assert shard["docs"][0] == ["c", "ocp4-cis-audit-profile-set", 1, "", "Ensure that the audit profile is set"]
+        assert shard["docs"][2] == ["c", "rhcos4-e8-worker-sshd-disable-root-login", 0, "M1", "Disable SSH Root Login"]
+        assert shard["docs"][3] == ["g", "M1", "pending", "M1", "SSHD Configuration"]
+        assert shard["statuses"][:3] == ["FAIL", "PASS", "MANUAL"]
+
+    def test_postings_cover_names_descriptions_summaries_and_groups(self):
+        shard = search_index.build_shard("5.0", scan_export(), tracking())
+        assert shard["terms"] == sorted(shard["terms"])
+        assert lookup(shard, "root") == ["rhcos4-e8-worker-sshd-disable-root-login"]
+        assert lookup(shard, "api") == ["ocp4-cis-audit-profile-set"]
+        assert lookup(shard, "m1") == ["rhcos4-e8-worker-sshd-disable-root-login", "M1"]
+        assert lookup(shard, "hardened") == ["M1"]
+        assert "the" not in shard["terms"]
+
+    def test_check_groups_prefers_longest_suffix(self):
+        groups = search_index.check_groups(
+            ["rhcos4-e8-worker-disable-root", "plain"],
+            {"disable-root": {"group": "M1"}, "root": {"group": "M2"}, "plain": {"group": "M3"}})
+        assert groups == {"rhcos4-e8-worker-disable-root": "M1", "plain": "M3"}
+
+
+class TestGenerate:
+    def test_manifest_and_shards(self, tmp_path):
+        (tmp_path / "ocp-4_22.json").write_text(json.dumps(scan_export()))
+        (tmp_path / "ocp-5_0.json").write_text(json.dumps(scan_export()))
+        (tmp_path / "ocp-5_0-2026-08-12.json").write_text("{}")
+        (tmp_path / "tracking.json").write_text(json.dumps(tracking()))
+        files = search_index.generate(str(tmp_path))
+        assert sorted(files) == ["index.json", "ocp-4_22.json", "ocp-5_0.json"]
+        manifest = json.loads(files["index.json"])
+        assert manifest["latest"] == "5.0"
+        assert manifest["versions"]["4.22"] == {"shard": "ocp-4_22.json", "docs": 4, "terms": len(
+            json.loads(files["ocp-4_22.json"])["terms"])}
+
+
+def test_committed_index_is_current():
+    for name, content in search_index.generate(str(REPO / "docs" / "_data")).items():
+        path = REPO / "docs" / "assets" / "search" / name
+        assert path.read_text() == content, f"Run make generate-search-index ({name})"
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestQueryEngine:
+    def query(self, shard: dict, queries: list[str]) -> list[list[str]]:
+        script = (
+            "const fs = require('fs'), vm = require('vm');"
+            f"vm.runInThisContext(fs.readFileSync({json.dumps(str(SEARCH_JS))}, 'utf8'));"
+            "const input = JSON.parse(fs.readFileSync(0, 'utf8'));"
+            "console.log(JSON.stringify(input.queries.map(q => searchQuery(input.shard, q).map(r => r.id))));"
+        )
+        result = subprocess.run(["node", "-e", script], input=json.dumps({"shard": shard, "queries": queries}),
+                                capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+    def test_queries(self):
+        shard = search_index.build_shard("5.0", scan_export(), tracking())
+        queries = ["sshd root", "aud", "audit ", "profile the set", "ss", "x", "nothing", "sshd and", "and"]
+        assert self.query(shard, queries) == [
+            ["rhcos4-e8-worker-sshd-disable-root-login"],
+            ["ocp4-cis-audit-profile-set"],
+            ["ocp4-cis-audit-profile-set"],
+            ["ocp4-cis-audit-profile-set"],
+            ["M1", "rhcos4-e8-worker-sshd-disable-root-login"],
+            [],
+            [],
+            ["M1", "rhcos4-e8-worker-sshd-disable-root-login"],
+            [],
+        ]
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Tests for the batched -x rollout in core/organize-machine-configs.sh.
+
+The script is sourced for its functions and run against stub oc and yq
+commands on PATH; the oc stub logs every call, one line per call.
+"""
+from __future__ import annotations
+
+import os
+import stat
+import subprocess
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO = Path(__file__).resolve().parents[1]
+SCRIPT = REPO / "core" / "organize-machine-configs.sh"
+
+# Logs "<args>" per call. The real apply fails when OC_FAIL_APPLY is set.
+# The Updated=True wait logs its start and end around a short sleep so
+# concurrent waits interleave.
+OC_STUB = r"""#!/bin/bash
+echo "$*" >>"$OC_LOG"
+if [[ "$1" == "apply" && "$2" != "--dry-run=server" && -n "${OC_FAIL_APPLY:-}" ]]; then
+    exit 1
+fi
+if [[ "$1" == "wait" && "$*" == *"Updated=True"* ]]; then
+    echo "start $2" >>"$OC_LOG"
+    sleep 0.3
+    echo "end $2" >>"$OC_LOG"
+fi
+exit 0
+"""
+
+# Answers the two queries the script makes: yq e '<expr>' FILE
+YQ_STUB = r"""#!/usr/bin/env python3
+import sys
+import yaml
+
+expr, path = sys.argv[2], sys.argv[3]
+with open(path) as f:
+    doc = yaml.safe_load(f) or {}
+if expr == '.kind':
+    print(doc.get('kind', 'null'))
+else:
+    print(((doc.get('metadata') or {}).get('labels') or {}).get(
+        'machineconfiguration.openshift.io/role', 'null'))
+"""
+
+
+@pytest.fixture
+def shell(tmp_path):
+    """Run a snippet with the script's functions loaded; returns (result, oc calls)."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, body in (("oc", OC_STUB), ("yq", YQ_STUB)):
+        (bin_dir / name).write_text(body)
+        (bin_dir / name).chmod(stat.S_IRWXU)
+    oc_log = tmp_path / "oc.log"
+
+    def run(snippet: str, **env: str) -> tuple[subprocess.CompletedProcess, list[str]]:
+        oc_log.write_text("")
+        result = subprocess.run(
+            ["bash", "-c", f'source "{SCRIPT}"\ntrap - EXIT\nset +e\n{snippet}'],
+            cwd=tmp_path, capture_output=True, text=True,
+            env={**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}",
+                 "OC_LOG": str(oc_log), "LOG_LEVEL": "3", **env})
+        return result, oc_log.read_text().splitlines()
+
+    return run
+
+
+def write_manifest(directory: Path, name: str, kind: str, role: str | None = None) -> str:
+    doc: dict = {"kind": kind, "metadata": {"name": name}}
+    if role:
+        doc["metadata"]["labels"] = {"machineconfiguration.openshift.io/role": role}
+    path = directory / f"{name}.yaml"
+    path.write_text(yaml.safe_dump(doc))
+    return str(path)
+
+
+def test_plan_puts_manifests_first_then_one_batch_per_pool(shell, tmp_path):
+    paths = [write_manifest(tmp_path, "w1", "MachineConfig", "worker"),
+             write_manifest(tmp_path, "api", "APIServer"),
+             write_manifest(tmp_path, "m1", "MachineConfig", "master"),
+             write_manifest(tmp_path, "w2", "MachineConfig", "worker")]
+    result, _ = shell('plan_rollout "$PATHS"', PATHS="\n".join(paths))
+    assert result.returncode == 0, result.stderr
+    assert [line.split("\t") for line in result.stdout.splitlines()] == [
+        ["manifests", paths[1]], ["mcp/master", paths[2]],
+        ["mcp/worker", paths[0]], ["mcp/worker", paths[3]]]
+
+
+def test_pool_batch_pauses_applies_then_unpauses(shell):
+    result, calls = shell("apply_pool_batch worker a.yaml b.yaml")
+    assert result.returncode == 0, result.stderr
+    assert calls == [
+        "apply --dry-run=server -f a.yaml -f b.yaml",
+        'patch mcp/worker --type merge -p {"spec":{"paused":true}}',
+        "apply -f a.yaml -f b.yaml",
+        'patch mcp/worker --type merge -p {"spec":{"paused":false}}',
+    ]
+
+
+def test_pool_batch_unpauses_when_apply_fails(shell):
+    result, calls = shell('apply_pool_batch worker a.yaml; echo "rc=$?"', OC_FAIL_APPLY="1")
+    assert "rc=1" in result.stdout
+    assert calls[-2:] == [
+        "apply -f a.yaml",
+        'patch mcp/worker --type merge -p {"spec":{"paused":false}}',
+    ]
+
+
+def test_pools_are_waited_on_concurrently(shell, tmp_path):
+    result, calls = shell('wait_for_pools "$PWD" master worker; echo "rc=$?"')
+    assert "rc=0" in result.stdout
+    marks = [c for c in calls if c.startswith(("start ", "end "))]
+    assert sorted(marks[:2]) == ["start mcp/master", "start mcp/worker"]
+    assert sorted(marks[2:]) == ["end mcp/master", "end mcp/worker"]
+    assert (tmp_path / "wait-master.log").exists() and (tmp_path / "wait-worker.log").exists()
+
+
+def test_rollout_applies_manifests_before_pools_and_waits_once_per_pool(shell, tmp_path):
+    paths = [write_manifest(tmp_path, "w1", "MachineConfig", "worker"),
+             write_manifest(tmp_path, "api", "APIServer"),
+             write_manifest(tmp_path, "m1", "MachineConfig", "master")]
+    result, calls = shell('new_paths="$PATHS"; run_automated_tests', PATHS="\n".join(paths) + "\n")
+    assert result.returncode == 0, result.stderr
+    applies = [c for c in calls if c.startswith("apply -f") or c.startswith("patch mcp")]
+    assert applies[0] == f"apply -f {paths[1]}"
+    assert [c for c in applies if c.startswith("apply")][1:] == [
+        f"apply -f {paths[2]}", f"apply -f {paths[0]}"]
+    assert sum(c.startswith("start ") for c in calls) == 2
+    results_dir = next((tmp_path / "test-results").iterdir())
+    assert (results_dir / "post-manifests").is_dir()
+    assert not (results_dir / "post-machineconfigs").exists()
+    assert calls.count("adm top nodes") == 3  # baseline, post-manifests, post
+
+
+def test_rollout_without_pool_batches_takes_no_extra_snapshot(shell, tmp_path):
+    path = write_manifest(tmp_path, "api", "APIServer")
+    result, calls = shell('new_paths="$PATHS"; run_automated_tests', PATHS=path + "\n")
+    assert result.returncode == 0, result.stderr
+    assert calls.count("adm top nodes") == 2  # baseline, post
+    results_dir = next((tmp_path / "test-results").iterdir())
+    assert not (results_dir / "post-manifests").exists()
@@ -19,6 +19,8 @@ spec = spec_from_file_location(
     os.path.join(os.path.dirname(__file__), '..', 'scripts',
                  'parse-oscap-results.py'))
 parse_oscap = module_from_spec(spec)
+# Registered so ProcessPoolExecutor workers can pickle module functions.
+sys.modules["parse_oscap"] = parse_oscap
 spec.loader.exec_module(parse_oscap)
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
@@ -301,3 +303,151 @@ class TestWriteFailingList:
         with open(filepath) as f:
             content = f.read()
         assert content == ""
+
+
+PROFILE_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<Benchmark xmlns="http://checklists.nist.gov/xccdf/1.2">
+  <TestResult>
+    <profile idref="xccdf_org.ssgproject.content_profile_{profile}"/>
+{rules}
+  </TestResult>
+</Benchmark>
+"""
+
+
+def profile_xml(profile: str, results: dict[str, str]) -> str:
+    """Build a results document for a profile from a rule -> result map."""
+    rules = "\n".join(
+        f'    <rule-result idref="xccdf_org.ssgproject.content_rule_{rule}">'
+        f"<result>{result}</result></rule-result>"
+        for rule, result in results.items()
+    )
+    return PROFILE_XML.format(profile=profile, rules=rules)
+
+
+# --- profile_name ---
+
+
+class TestProfileName:
+    def test_from_testresult_profile(self, tmpdir):
+        fp = write_xml(tmpdir, "anything.xml", profile_xml("e8", {"a": "pass"}))
+        assert parse_oscap.profile_name(fp) == "e8"
+
+    def test_from_results_filename(self, tmpdir):
+        fp = write_xml(tmpdir, "results-moderate.xml", MINIMAL_XML)
+        assert parse_oscap.profile_name(fp) == "moderate"
+
+    def test_falls_back_to_stem(self):
+        assert parse_oscap.profile_name(SAMPLE_XML) == "sample-oscap-results"
+
+
+# --- parse_many / merge_results ---
+
+
+class TestParseMany:
+    def test_single_file(self, tmpdir):
+        fp = write_xml(tmpdir, "results-e8.xml", MINIMAL_XML)
+        per_profile = parse_oscap.parse_many([fp])
+        assert list(per_profile) == ["e8"]
+        assert per_profile["e8"][0]["name"] == "test-check"
+
+    def test_parallel_preserves_order(self, tmpdir):
+        files = [
+            write_xml(tmpdir, f"results-{p}.xml", profile_xml(p, {"a": "pass"}))
+            for p in ["moderate", "e8", "cis"]
+        ]
+        per_profile = parse_oscap.parse_many(files, jobs=2)
+        assert list(per_profile) == ["moderate", "e8", "cis"]
+
+    def test_duplicate_profiles_kept(self, tmpdir):
+        a = write_xml(tmpdir, "one.xml", profile_xml("e8", {"a": "pass"}))
+        b = write_xml(tmpdir, "two.xml", profile_xml("e8", {"a": "fail"}))
+        per_profile = parse_oscap.parse_many([a, b], jobs=1)
+        assert len(per_profile) == 2
+        assert "e8" in per_profile
+        assert "e8 (two.xml)" in per_profile
+
+
+class TestMergeResults:
+    def test_fail_wins_over_pass(self):
+        per_profile = {
+            "e8": [{"id": "x", "name": "a", "result": "pass"}],
+            "moderate": [{"id": "x", "name": "a", "result": "fail"}],
+        }
+        merged = parse_oscap.merge_results(per_profile)
+        assert merged == [{"id": "x", "name": "a", "result": "fail"}]
+
+    def test_pass_wins_over_notapplicable(self):
+        per_profile = {
+            "e8": [{"id": "x", "name": "a", "result": "notapplicable"}],
+            "moderate": [{"id": "x", "name": "a", "result": "pass"}],
+        }
+        assert parse_oscap.merge_results(per_profile)[0]["result"] == "pass"
+
+    def test_union_of_names_sorted(self):
+        per_profile = {
+            "e8": [{"id": "b", "name": "b", "result": "pass"}],
+            "moderate": [{"id": "a", "name": "a", "result": "fail"}],
+        }
+        merged = parse_oscap.merge_results(per_profile)
+        assert [c["name"] for c in merged] == ["a", "b"]
+
+
+# --- main (multi-file) ---
+
+
+class TestMainMultiFile:
+    def run_main(self, monkeypatch, capsys, argv: list[str]) -> str:
+        monkeypatch.setattr(sys, "argv", ["parse-oscap-results.py"] + argv)
+        parse_oscap.main()
+        return capsys.readouterr().out
+
+    def write_profiles(self, tmpdir: str) -> list[str]:
+        return [
+            write_xml(tmpdir, "results-e8.xml", profile_xml(
+                "e8", {"crypto_policy": "pass", "sshd_root": "fail"})),
+            write_xml(tmpdir, "results-moderate.xml", profile_xml(
+                "moderate", {"crypto_policy": "fail", "audit_dac": "pass"})),
+        ]
+
+    def test_json_report(self, tmpdir, monkeypatch, capsys):
+        files = self.write_profiles(tmpdir)
+        tracking = write_json_file(tmpdir, "tracking.json", {
+            "groups": {"H1": {"title": "Crypto", "status": "pending"}},
+            "remediations": {"crypto-policy": {"group": "H1"}},
+        })
+        out = self.run_main(monkeypatch, capsys, files + [
+            "--format", "json", "--tracking", tracking, "--jobs", "2"])
+        report = json.loads(out)
+        assert report["profiles"]["e8"]["summary"] == {"pass": 1, "fail": 1}
+        assert report["profiles"]["moderate"]["failing"] == ["crypto-policy"]
+        assert report["summary"] == {"pass": 1, "fail": 2}
+        assert report["groups"]["H1"]["needs_remediation"] is True
+
+    def test_text_report_has_profile_table(self, tmpdir, monkeypatch, capsys):
+        files = self.write_profiles(tmpdir)
+        out = self.run_main(monkeypatch, capsys, files)
+        assert "=== Profile Summary ===" in out
+        assert "union" in out
+        assert "FAIL: crypto-policy" in out
+
+    def test_per_profile_output_files(self, tmpdir, monkeypatch, capsys):
+        files = self.write_profiles(tmpdir)
+        self.run_main(monkeypatch, capsys, files + [
+            "--failing-file", os.path.join(tmpdir, "actual-{profile}.txt"),
+            "--markdown-file", os.path.join(tmpdir, "summary-{profile}.md"),
+        ])
+        with open(os.path.join(tmpdir, "actual-e8.txt")) as f:
+            assert f.read() == "sshd-root\n"
+        with open(os.path.join(tmpdir, "actual-moderate.txt")) as f:
+            assert f.read() == "crypto-policy\n"
+        assert os.path.exists(os.path.join(tmpdir, "summary-e8.md"))
+        assert os.path.exists(os.path.join(tmpdir, "summary-moderate.md"))
+
+    def test_union_failing_file(self, tmpdir, monkeypatch, capsys):
+        files = self.write_profiles(tmpdir)
+        union = os.path.join(tmpdir, "union.txt")
+        self.run_main(monkeypatch, capsys, files + ["--failing-file", union])
+        with open(union) as f:
+            assert f.read().split() == ["crypto-policy", "sshd-root"]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for scripts/publish-data-assets.py and docs/assets/js/data-assets.js."""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+_spec = spec_from_file_location(
+    "publish_data_assets",
+    os.path.join(os.path.dirname(__file__), "..", "scripts", "publish-data-assets.py"))
+assert _spec and _spec.loader
+publish_data_assets = module_from_spec(_spec)
+_spec.loader.exec_module(publish_data_assets)
+
+REPO = Path(__file__).resolve().parents[1]
+DATA_ASSETS_JS = REPO / "docs" / "assets" / "js" / "data-assets.js"
+
+
+def make_assets(root: Path) -> None:
+    (root / "compare" / "diff").mkdir(parents=True)
+    (root / "search").mkdir()
+    (root / "css").mkdir()
+    (root / "compare" / "index.json").write_text('{"versions": {}}\n')
+    (root / "compare" / "diff" / "4_22_to_5_0.json").write_text('{"pass_to_fail": []}\n')
+    (root / "search" / "index.json").write_text('{"versions": {}}\n')
+    (root / "css" / "style.json").write_text("{}\n")
+
+
+class TestHashedName:
+    def test_hash_before_extension(self):
+        name = publish_data_assets.hashed_name("compare/diff/a_to_b.json", b"{}")
+        assert name == "compare/diff/a_to_b.44136fa355b3.json"
+
+    def test_changes_with_content(self):
+        assert (publish_data_assets.hashed_name("search/index.json", b"1")
+                != publish_data_assets.hashed_name("search/index.json", b"2"))
+
+
+class TestPublish:
+    def test_writes_hashed_copies_and_manifest(self, tmp_path):
+        make_assets(tmp_path)
+        out = tmp_path / "data"
+        manifest = publish_data_assets.publish(str(tmp_path), str(out))
+        assert sorted(manifest) == [
+            "compare/diff/4_22_to_5_0.json", "compare/index.json", "search/index.json"]
+        assert json.loads((out / "manifest.json").read_text()) == {"files": manifest}
+        for rel, name in manifest.items():
+            assert (out / name).read_bytes() == (tmp_path / rel).read_bytes()
+
+    def test_removes_outdated_copies(self, tmp_path):
+        make_assets(tmp_path)
+        out = tmp_path / "data"
+        old = publish_data_assets.publish(str(tmp_path), str(out))["search/index.json"]
+        (tmp_path / "search" / "index.json").write_text('{"versions": {"5.0": {}}}\n')
+        new = publish_data_assets.publish(str(tmp_path), str(out))["search/index.json"]
+        assert new != old
+        assert (out / new).exists()
+        assert not (out / old).exists()
+
+    def test_covers_committed_compare_and_search_data(self, tmp_path):
+        manifest = publish_data_assets.publish(str(REPO / "docs" / "assets"), str(tmp_path))
+        assert "compare/index.json" in manifest
+        assert "search/index.json" in manifest
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+class TestDataAssetsJs:
+    def resolve(self, manifest: dict | None, paths: list[str]) -> list[str]:
+        script = (
+            "const fs = require('fs'), vm = require('vm');"
+            "const input = JSON.parse(fs.readFileSync(0, 'utf8'));"
+            "global.document = {currentScript: {getAttribute: () => '/site/assets/'}};"
+            "global.fetch = () => Promise.resolve(input.manifest"
+            "  ? {ok: true, json: () => Promise.resolve(input.manifest)} : {ok: false});"
+            f"vm.runInThisContext(fs.readFileSync({json.dumps(str(DATA_ASSETS_JS))}, 'utf8'));"
+            "Promise.all(input.paths.map(dataAssetUrl)).then(urls => console.log(JSON.stringify(urls)));"
+        )
+        result = subprocess.run(["node", "-e", script], input=json.dumps({"manifest": manifest, "paths": paths}),
+                                capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+    def test_resolves_through_manifest(self):
+        manifest = {"files": {"compare/index.json": "compare/index.0123456789ab.json"}}
+        assert self.resolve(manifest, ["compare/index.json", "search/index.json"]) == [
+            "/site/assets/data/compare/index.0123456789ab.json",
+            "/site/assets/search/index.json",
+        ]
+
+    def test_falls_back_to_stable_names_without_manifest(self):
+        assert self.resolve(None, ["compare/index.json"]) == ["/site/assets/compare/index.json"]
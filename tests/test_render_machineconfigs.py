@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Tests for scripts/render-machineconfigs.py"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+
+import yaml
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'render-machineconfigs.py')
+_spec = spec_from_file_location("render", SCRIPT)
+assert _spec and _spec.loader
+render = module_from_spec(_spec)
+_spec.loader.exec_module(render)
+
+sys.path.insert(0, os.path.dirname(__file__))
+from machineconfig_helpers import file_entry, make_mc, write_mc  # noqa: E402
+
+
+def sha(content: str) -> str:
+    return render.hashlib.sha256(content.encode()).hexdigest()
+
+
+class TestMergeIgnition:
+    def test_keyed_lists_merge_fields_in_place(self):
+        parent = {'storage': {'files': [{'path': '/a', 'mode': 420, 'user': {'name': 'root'}},
+                                        {'path': '/b', 'mode': 420}]}}
+        child = {'storage': {'files': [{'path': '/a', 'mode': 384, 'user': None},
+                                       {'path': '/c', 'mode': 256}]}}
+        assert render.merge_ignition(parent, child) == {'storage': {'files': [
+            {'path': '/a', 'mode': 384, 'user': {'name': 'root'}},
+            {'path': '/b', 'mode': 420},
+            {'path': '/c', 'mode': 256}]}}
+
+    def test_plain_lists_union(self):
+        merged = render.merge_ignition(
+            {'passwd': {'users': [{'name': 'core', 'sshAuthorizedKeys': ['a', 'b']}]}},
+            {'passwd': {'users': [{'name': 'core', 'sshAuthorizedKeys': ['b', 'c']}]}})
+        assert merged['passwd']['users'][0]['sshAuthorizedKeys'] == ['a', 'b', 'c']
+
+
+class TestRenderPool:
+    def test_lexical_order_decides_overrides(self):
+        result = render.render_pool('worker', ['worker'], [
+            make_mc('99-z', [file_entry('/etc/x.conf', 'z\n')]),
+            make_mc('00-a', [file_entry('/etc/x.conf', 'a\n'), file_entry('/etc/y.conf', 'y\n')]),
+            make_mc('50-m', [file_entry('/etc/x.conf', 'm\n')], role='master'),
+        ])
+        assert result['machineconfigs'] == ['00-a', '99-z']
+        assert result['files']['/etc/x.conf'] == {
+            'set_by': ['00-a', '99-z'], 'mode': '0600', 'overwrite': True,
+            'size': 2, 'sha256': sha('z\n')}
+        assert result['files']['/etc/y.conf']['set_by'] == ['00-a']
+        assert result['errors'] == []
+
+    def test_compression_left_over_from_earlier_config_is_an_error(self):
+        result = render.render_pool('worker', ['worker'], [
+            make_mc('00-a', [file_entry('/etc/x.rules', '-w /etc/x -p wa\n' * 20, compress=True)]),
+            make_mc('10-b', [file_entry('/etc/x.rules', 'plain\n')]),
+        ])
+        assert result['config']['storage']['files'][0]['contents']['compression'] == 'gzip'
+        assert result['errors'][0].startswith('file /etc/x.rules: contents cannot be decoded')
+
+    def test_spec_fields(self):
+        result = render.render_pool('worker', ['worker'], [
+            make_mc('00-a', kernelArguments=['audit=1', 'slub_debug=P'], extensions=['usbguard'],
+                    kernelType='realtime'),
+            make_mc('10-b', kernelArguments=['audit=1', 'slub_debug=F'], extensions=['usbguard'],
+                    fips=True, kernelType='default'),
+        ])
+        assert result['kernel_arguments'] == ['audit=1', 'slub_debug=P', 'audit=1', 'slub_debug=F']
+        assert result['extensions'] == ['usbguard']
+        assert result['fips'] is True
+        assert result['kernel_type'] == 'realtime'
+        assert 'kernel argument audit=1 is set 2 times' in result['warnings']
+        assert any('slub_debug has conflicting values' in w for w in result['warnings'])
+
+    def test_ignition_versions(self):
+        result = render.render_pool('worker', ['worker'], [
+            make_mc('00-a', [file_entry('/a', 'a')], version='2.2.0'),
+            make_mc('10-b', [file_entry('/b', 'b')], version='4.0.0'),
+            make_mc('20-c', [file_entry('/c', 'c')], version='3.2.0'),
+        ])
+        assert result['errors'] == ['10-b: unsupported Ignition version 4.0.0']
+        assert any('2.2.0 is converted' in w for w in result['warnings'])
+        assert sorted(result['files']) == ['/a', '/c']
+        assert result['ignition_version'] == '3.2.0'
+
+
+class TestPools:
+    def test_custom_pools_inherit_worker(self):
+        mcs = [make_mc('00-w', [file_entry('/w', 'w')]), make_mc('00-i', [file_entry('/i', 'i')], role='infra'),
+               make_mc('00-m', [file_entry('/m', 'm')], role='master')]
+        rendered = render.render(mcs)
+        assert {pool: sorted(r['files']) for pool, r in rendered.items()} == {
+            'infra': ['/i', '/w'], 'master': ['/m'], 'worker': ['/w']}
+        rendered = render.render(mcs, {'infra': ['infra']})
+        assert sorted(rendered['infra']['files']) == ['/i']
+
+
+class TestCompareRenders:
+    def test_reports_only_effective_changes(self):
+        base = [make_mc('00-a', [file_entry('/etc/x.conf', 'x\n'), file_entry('/etc/y.conf', 'y\n')],
+                        kernelArguments=['audit=1'])]
+        same = base + [make_mc('75-c', [file_entry('/etc/x.conf', 'x\n', compress=True)])]
+        assert render.compare_renders(render.render(base), render.render(same)) == {}
+
+        changed = base + [make_mc('75-c', [file_entry('/etc/x.conf', 'new\n'), file_entry('/etc/z.conf', 'z\n')],
+                                  kernelArguments=['slub_debug=P'], fips=True)]
+        assert render.compare_renders(render.render(base), render.render(changed)) == {'worker': {
+            'files': {'added': ['/etc/z.conf'], 'removed': [], 'changed': ['/etc/x.conf']},
+            'kernel_arguments': {'added': ['slub_debug=P'], 'removed': []},
+            'fips': {'from': False, 'to': True},
+        }}
+
+
+class TestMain:
+    def test_rendered_machineconfigs_in_cluster_dump_are_ignored(self, tmp_path):
+        cluster = tmp_path / 'cluster'
+        os.makedirs(cluster)
+        rendered_worker = make_mc('rendered-worker-0123abcd', [file_entry('/etc/ssh/sshd_config', 'old\n')])['doc']
+        del rendered_worker['metadata']['labels']
+        rendered_master = make_mc('rendered-master-4567ef01', [file_entry('/etc/master.conf', 'm\n')])['doc']
+        rendered_master['metadata'] = {'name': 'rendered-master-4567ef01', 'ownerReferences': [
+            {'apiVersion': 'machineconfiguration.openshift.io/v1', 'kind': 'MachineConfigPool',
+             'name': 'master'}]}
+        listing = {'apiVersion': 'v1', 'kind': 'List', 'items': [
+            make_mc('00-worker', [file_entry('/etc/ssh/sshd_config', 'old\n')])['doc'],
+            rendered_worker, rendered_master]}
+        with open(cluster / 'all.yaml', 'w') as f:
+            yaml.dump(listing, f)
+        new = tmp_path / 'new'
+        write_mc(new, make_mc('75-sshd', [file_entry('/etc/ssh/sshd_config', 'new\n')]))
+
+        result = subprocess.run([sys.executable, SCRIPT, '--baseline', str(cluster), '--src-dir', str(cluster),
+                                 '--src-dir', str(new), '--exit-code'], capture_output=True, text=True)
+        assert result.returncode == 3
+        assert result.stdout.splitlines() == ['Pool worker:', '  ~ file /etc/ssh/sshd_config']
+        assert 'Ignoring 2 rendered MachineConfig(s)' in result.stderr
+
+    def test_cluster_dump_baseline_and_exit_code(self, tmp_path):
+        cluster = tmp_path / 'cluster'
+        os.makedirs(cluster)
+        listing = {'apiVersion': 'v1', 'kind': 'List', 'items': [
+            make_mc('00-worker', [file_entry('/etc/x.conf', 'x\n')])['doc'],
+            make_mc('00-master', [file_entry('/etc/x.conf', 'x\n')], role='master')['doc'],
+        ]}
+        with open(cluster / 'all.yaml', 'w') as f:
+            yaml.dump(listing, f)
+        new = tmp_path / 'new'
+        write_mc(new, make_mc('75-new', [file_entry('/etc/x.conf', 'x\n')],
+                              units=[{'name': 'sshd.service', 'enabled': True,
+                                      'dropins': [{'name': '10-x.conf', 'contents': '[Service]\n'}]}]))
+        write_mc(new / 'consolidated', make_mc('75-copy', [file_entry('/etc/other.conf', 'o\n')]))
+
+        args = [sys.executable, SCRIPT, '--baseline', str(cluster), '--src-dir', str(cluster),
+                '--src-dir', str(new), '--exit-code', '--dump', str(tmp_path / 'out'),
+                '--json', str(tmp_path / 'diff.json')]
+        result = subprocess.run(args, capture_output=True, text=True)
+        assert result.returncode == 3
+        assert result.stdout.splitlines() == ['Pool worker:', '  + unit sshd.service']
+        assert json.loads((tmp_path / 'diff.json').read_text())['diff']['worker']['units']['added'] == [
+            'sshd.service']
+        assert (tmp_path / 'out' / 'master' / 'etc' / 'x.conf').read_text() == 'x\n'
+        assert (tmp_path / 'out' / 'worker' / 'etc' / 'systemd' / 'system' / 'sshd.service.d'
+                / '10-x.conf').read_text() == '[Service]\n'
+        assert not (tmp_path / 'out' / 'worker' / 'etc' / 'other.conf').exists()
+
+        result = subprocess.run([sys.executable, SCRIPT, '--baseline', str(cluster), '--src-dir',
+                                 str(cluster), '--exit-code'], capture_output=True, text=True)
+        assert result.returncode == 0
+        assert 'No changes' in result.stdout
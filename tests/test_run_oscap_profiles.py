@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests for scripts/run-oscap-profiles.py"""
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import tempfile
+import time
+
+import pytest
+from importlib.util import spec_from_file_location, module_from_spec
+
+spec = spec_from_file_location(
+    "run_oscap_profiles",
+    os.path.join(os.path.dirname(__file__), '..', 'scripts',
+                 'run-oscap-profiles.py'))
+runner = module_from_spec(spec)
+spec.loader.exec_module(runner)
+
+E8 = "xccdf_org.ssgproject.content_profile_e8"
+MODERATE = "xccdf_org.ssgproject.content_profile_moderate"
+CIS = "xccdf_org.ssgproject.content_profile_cis"
+
+# Stand-in for oscap: writes a results file for --profile to --results,
+# records the probe root, sleeps for STUB_SLEEP and exits with STUB_RC.
+STUB_OSCAP = """\
+#!/bin/sh
+while [ $# -gt 0 ]; do
+  case "$1" in
+    --profile) profile="$2"; shift 2 ;;
+    --results) results="$2"; shift 2 ;;
+    *) shift ;;
+  esac
+done
+echo "probe_root=$OSCAP_PROBE_ROOT profile=$profile"
+sleep "${STUB_SLEEP:-0}"
+if [ "${STUB_RC:-2}" != "1" ]; then
+  echo "<TestResult profile=\\"$profile\\"/>" > "$results"
+fi
+exit "${STUB_RC:-2}"
+"""
+
+
+@pytest.fixture
+def tmpdir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+
+@pytest.fixture
+def stub_oscap(tmpdir):
+    path = os.path.join(tmpdir, "oscap")
+    with open(path, "w") as f:
+        f.write(STUB_OSCAP)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+class TestProfileShort:
+    def test_strips_prefix(self):
+        assert runner.profile_short(E8) == "e8"
+
+    def test_short_name_unchanged(self):
+        assert runner.profile_short("moderate") == "moderate"
+
+
+class TestBuildCommand:
+    def test_scanner_mounts_readonly(self):
+        argv, env = runner.build_command(
+            E8, "/root-fs", "/ds.xml", "/out", scanner="img:tag")
+        assert argv[:3] == ["podman", "run", "--rm"]
+        assert "/root-fs:/hostroot:ro" in argv
+        assert "/ds.xml:/content/ssg-rhcos4-ds.xml:ro" in argv
+        assert "/results/results-e8.xml" in argv
+        assert env is None
+
+    def test_local_oscap_sets_probe_root(self):
+        argv, env = runner.build_command(
+            E8, "/root-fs", "/ds.xml", "/out", oscap="/bin/oscap")
+        assert argv[0] == "/bin/oscap"
+        assert argv[-1] == "/ds.xml"
+        assert os.path.join("/out", "results-e8.xml") in argv
+        assert env["OSCAP_PROBE_ROOT"] == "/root-fs"
+
+
+class TestRunProfiles:
+    def test_collects_results_in_order(self, tmpdir, stub_oscap):
+        out = os.path.join(tmpdir, "results")
+        results = runner.run_profiles(
+            [MODERATE, E8], "/rootfs", "/ds.xml", out, oscap=stub_oscap)
+        assert [r["profile"] for r in results] == ["moderate", "e8"]
+        assert all(r["ok"] for r in results)
+        assert os.path.isfile(os.path.join(out, "results-e8.xml"))
+        with open(os.path.join(out, "oscap-e8.log")) as f:
+            assert f.read().strip() == f"probe_root=/rootfs profile={E8}"
+
+    def test_runs_concurrently(self, tmpdir, stub_oscap, monkeypatch):
+        monkeypatch.setenv("STUB_SLEEP", "1")
+        start = time.monotonic()
+        results = runner.run_profiles(
+            [E8, MODERATE, CIS], "/rootfs", "/ds.xml", tmpdir,
+            jobs=3, oscap=stub_oscap)
+        assert time.monotonic() - start < 2.5
+        assert all(r["ok"] for r in results)
+
+    def test_oscap_error_marked_not_ok(self, tmpdir, stub_oscap, monkeypatch):
+        monkeypatch.setenv("STUB_RC", "1")
+        results = runner.run_profiles(
+            [E8], "/rootfs", "/ds.xml", tmpdir, oscap=stub_oscap)
+        assert results[0]["returncode"] == 1
+        assert results[0]["ok"] is False
+
+    def test_missing_binary(self, tmpdir):
+        results = runner.run_profiles(
+            [E8], "/rootfs", "/ds.xml", tmpdir,
+            oscap=os.path.join(tmpdir, "no-such-oscap"))
+        assert results[0]["returncode"] == 127
+        assert results[0]["ok"] is False
+
+    def test_no_profiles(self, tmpdir):
+        assert runner.run_profiles([], "/rootfs", "/ds.xml", tmpdir) == []
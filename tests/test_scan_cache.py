@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Tests for scripts/scan-cache.py"""
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+from importlib.util import spec_from_file_location, module_from_spec
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'scan-cache.py')
+spec = spec_from_file_location("scan_cache", SCRIPT)
+scan_cache = module_from_spec(spec)
+spec.loader.exec_module(scan_cache)
+
+RHCOS_A = "quay.io/openshift-release-dev/ocp-v4.0-art-dev@sha256:aaaa"
+RHCOS_B = "quay.io/openshift-release-dev/ocp-v4.0-art-dev@sha256:bbbb"
+CONTENT = "quay.io/bapalm/k8scontent:v0.1.81"
+
+
+@pytest.fixture
+def root():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+
+def populate(root: str, kind: str, ref: str, size: int,
+             max_size: int | None = None, keep: set[str] | None = None) -> str:
+    """Reserve, fill with ``size`` bytes, and commit an entry."""
+    staging = scan_cache.reserve(root, kind)
+    with open(os.path.join(staging, "blob"), "wb") as f:
+        f.write(b"x" * size)
+    return scan_cache.commit(root, kind, ref, staging, max_size, keep)
+
+
+def set_last_used(root: str, kind: str, ref: str, when: float) -> None:
+    _data_dir, meta_file = scan_cache.entry_paths(root, kind, ref)
+    meta = scan_cache.read_meta(meta_file)
+    meta["last_used"] = when
+    scan_cache.write_meta(meta_file, meta)
+
+
+class TestParseSize:
+    @pytest.mark.parametrize("value,expected", [
+        ("512", 512),
+        ("10K", 10 * 1024),
+        ("500M", 500 * 1024 ** 2),
+        ("20G", 20 * 1024 ** 3),
+        ("1.5GiB", int(1.5 * 1024 ** 3)),
+    ])
+    def test_units(self, value, expected):
+        assert scan_cache.parse_size(value) == expected
+
+    def test_invalid(self):
+        with pytest.raises(SystemExit):
+            scan_cache.parse_size("lots")
+
+
+class TestCacheKey:
+    def test_digest_ref_keyed_by_digest(self):
+        assert scan_cache.cache_key(RHCOS_A) == "sha256_aaaa"
+
+    def test_mirror_shares_digest_key(self):
+        mirrored = "registry.local/rhcos@sha256:aaaa"
+        assert scan_cache.cache_key(mirrored) == scan_cache.cache_key(RHCOS_A)
+
+    def test_tag_ref_keeps_repo_and_tag(self):
+        assert scan_cache.cache_key(CONTENT) == "quay.io_bapalm_k8scontent_v0.1.81"
+
+
+class TestLookupAndCommit:
+    def test_miss(self, root):
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) is None
+
+    def test_hit_after_commit(self, root):
+        path = populate(root, "rootfs", RHCOS_A, 10)
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) == path
+        assert os.path.isfile(os.path.join(path, "blob"))
+
+    def test_staging_removed_on_commit(self, root):
+        staging = scan_cache.reserve(root, "datastream")
+        scan_cache.commit(root, "datastream", CONTENT, staging)
+        assert not os.path.exists(staging)
+
+    def test_commit_records_size(self, root):
+        populate(root, "datastream", CONTENT, 1234)
+        [entry] = scan_cache.list_entries(root)
+        assert entry["size"] == 1234
+        assert entry["ref"] == CONTENT
+
+    def test_second_commit_keeps_existing(self, root):
+        first = populate(root, "rootfs", RHCOS_A, 10)
+        second = populate(root, "rootfs", RHCOS_A, 99)
+        assert first == second
+        assert os.path.getsize(os.path.join(first, "blob")) == 10
+
+    def test_metadata_without_data_is_miss(self, root):
+        path = populate(root, "rootfs", RHCOS_A, 10)
+        shutil.rmtree(path)
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) is None
+
+
+class TestEvict:
+    def test_evicts_least_recently_used_first(self, root):
+        populate(root, "rootfs", RHCOS_A, 100)
+        populate(root, "rootfs", RHCOS_B, 100)
+        populate(root, "datastream", CONTENT, 10)
+        set_last_used(root, "rootfs", RHCOS_A, 1)
+        set_last_used(root, "rootfs", RHCOS_B, 3)
+        set_last_used(root, "datastream", CONTENT, 2)
+
+        evicted = scan_cache.evict(root, 150)
+        assert [e["ref"] for e in evicted] == [RHCOS_A]
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) is None
+        assert scan_cache.lookup(root, "rootfs", RHCOS_B) is not None
+
+    def test_lookup_refreshes_lru_order(self, root):
+        populate(root, "rootfs", RHCOS_A, 100)
+        populate(root, "rootfs", RHCOS_B, 100)
+        set_last_used(root, "rootfs", RHCOS_A, 1)
+        set_last_used(root, "rootfs", RHCOS_B, 2)
+        scan_cache.lookup(root, "rootfs", RHCOS_A)
+
+        evicted = scan_cache.evict(root, 100)
+        assert [e["ref"] for e in evicted] == [RHCOS_B]
+
+    def test_commit_enforces_cap_but_keeps_new_entry(self, root):
+        populate(root, "rootfs", RHCOS_A, 100)
+        set_last_used(root, "rootfs", RHCOS_A, 1)
+        path = populate(root, "rootfs", RHCOS_B, 100, max_size=50)
+        assert os.path.isdir(path)
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) is None
+
+    def test_under_cap_evicts_nothing(self, root):
+        populate(root, "rootfs", RHCOS_A, 100)
+        assert scan_cache.evict(root, 1000) == []
+
+    def test_commit_keeps_other_entries_in_use(self, root):
+        rootfs = populate(root, "rootfs", RHCOS_A, 100)
+        set_last_used(root, "rootfs", RHCOS_A, 1)
+        datastream = populate(root, "datastream", CONTENT, 100, max_size=150,
+                              keep={rootfs + "/"})
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) == rootfs
+        assert os.path.isdir(datastream)
+
+    def test_cli_commit_keep(self, root):
+        rootfs = populate(root, "rootfs", RHCOS_A, 100)
+        set_last_used(root, "rootfs", RHCOS_A, 1)
+        populate(root, "rootfs", RHCOS_B, 100)
+        set_last_used(root, "rootfs", RHCOS_B, 2)
+        staging = scan_cache.reserve(root, "datastream")
+        subprocess.run([sys.executable, SCRIPT, "--cache-dir", root, "--max-size", "100",
+                        "commit", "datastream", CONTENT, staging, "--keep", rootfs],
+                       check=True, capture_output=True)
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) == rootfs
+        assert scan_cache.lookup(root, "rootfs", RHCOS_B) is None
+
+    def test_cli_evict_max_size_after_subcommand(self, root):
+        populate(root, "rootfs", RHCOS_A, 100)
+        result = subprocess.run([sys.executable, SCRIPT, "--cache-dir", root, "evict",
+                                 "--max-size", "50"], check=True, capture_output=True, text=True)
+        assert RHCOS_A in result.stdout
+        assert scan_cache.list_entries(root) == []
+
+    def test_failed_removal_keeps_metadata(self, root, monkeypatch):
+        path = populate(root, "rootfs", RHCOS_A, 100)
+
+        def fail(_path):
+            raise PermissionError("busy")
+        monkeypatch.setattr(scan_cache.shutil, "rmtree", fail)
+        assert scan_cache.evict(root, 50) == []
+        meta = scan_cache.read_meta(f"{path}.json")
+        assert meta["evicting"] is True and meta["size"] == 100
+        assert scan_cache.lookup(root, "rootfs", RHCOS_A) is None
+
+        monkeypatch.undo()
+        assert [e["ref"] for e in scan_cache.evict(root, 50)] == [RHCOS_A]
+        assert not os.path.exists(path) and not os.path.exists(f"{path}.json")
@@ -2,9 +2,12 @@
 """Tests for scripts/suggest-groups.py"""
 from __future__ import annotations
 
+import json
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 from importlib.util import spec_from_file_location, module_from_spec
 
@@ -16,46 +19,54 @@ suggest_groups = module_from_spec(spec)
 spec.loader.exec_module(suggest_groups)
 
 
+def empty_indexes() -> tuple:
+    return suggest_groups.PrefixTrie(), suggest_groups.TokenIndex.build({}, {})
+
+
 class TestSuggestGroup:
     def test_sysctl_kernel_dmesg_matches_l2(self):
         gid, conf, _ = suggest_groups.suggest_group(
-            "sysctl-kernel-dmesg-restrict", {}, {}
+            "sysctl-kernel-dmesg-restrict", *empty_indexes()
         )
         assert gid == "L2"
         assert conf == 0.95
 
     def test_sysctl_net_matches_m22(self):
         gid, conf, _ = suggest_groups.suggest_group(
-            "sysctl-net-ipv4-something", {}, {}
+            "sysctl-net-ipv4-something", *empty_indexes()
         )
         assert gid == "M22"
         assert conf == 0.90
 
-    def test_keyword_match_uses_medium_threshold(self):
-        gid, conf, _ = suggest_groups.suggest_group(
-            "test-check", {}, {"test": "M1"}
+    def test_similarity_fallback_without_prefix(self):
+        tracking = {"groups": {"M1": {"title": "Test harness"}}, "remediations": {}}
+        similarity = suggest_groups.TokenIndex.build(tracking, {})
+        gid, conf, reason = suggest_groups.suggest_group(
+            "test-check", suggest_groups.PrefixTrie(), similarity
         )
         assert gid == "M1"
-        assert conf == suggest_groups.MEDIUM_THRESHOLD
+        assert reason.startswith("similar to M1")
 
-    def test_custom_medium_threshold_on_keyword(self):
+    def test_custom_medium_threshold_accepts_weak_prefix(self):
+        trie = suggest_groups.PrefixTrie.from_prefix_map({"audit": {"M4": 1, "M5": 1}})
         gid, conf, _ = suggest_groups.suggest_group(
-            "test-check", {}, {"test": "M1"}, medium_threshold=0.3
+            "audit-rules-new", trie, empty_indexes()[1], medium_threshold=0.6
         )
-        assert conf == 0.3
+        assert gid == "M4"
+        assert conf == pytest.approx(0.6)
 
     def test_no_match_returns_none(self):
         gid, conf, reason = suggest_groups.suggest_group(
-            "completely-unknown-check", {}, {}
+            "completely-unknown-check", *empty_indexes()
         )
         assert gid is None
         assert conf == 0.0
         assert reason == "no match"
 
     def test_prefix_match_below_threshold_falls_through(self):
-        prefix_map = {"audit": {"M4": 1, "M5": 1}}
+        trie = suggest_groups.PrefixTrie.from_prefix_map({"audit": {"M4": 1, "M5": 1}})
         gid, conf, _ = suggest_groups.suggest_group(
-            "audit-rules-new", prefix_map, {}, medium_threshold=0.99
+            "audit-rules-new", trie, empty_indexes()[1], medium_threshold=0.99
         )
         assert gid is None
 
@@ -80,3 +91,206 @@ class TestStripProfilePrefix:
         assert suggest_groups.strip_profile_prefix(
             "ocp4-moderate-api-server-encryption"
         ) == "api-server-encryption"
+
+
+def make_tracking() -> dict:
+    return {
+        "groups": {
+            "M4": {"title": "Audit rules"},
+            "M5": {"title": "Audit daemon"},
+            "H1": {"title": "Crypto policy"},
+        },
+        "remediations": {
+            "audit-rules-dac-modification-chmod": {"group": "M4"},
+            "audit-rules-dac-modification-chown": {"group": "M4"},
+            "audit-rules-login-events": {"group": "M4"},
+            "auditd-data-retention-action-mail-acct": {"group": "M5"},
+            "audit-rules-immutable": {"group": "M5"},
+            "configure-crypto-policy": {"group": "H1"},
+        },
+    }
+
+
+class TestPrefixTrie:
+    def test_node_counts_match_prefix_map(self):
+        trie, _, _ = suggest_groups.build_indexes(make_tracking())
+        node = trie.path(["audit", "rules"])[-1]
+        assert node["groups"] == {"M4": 3, "M5": 1}
+        assert node["top"] == "M4"
+        assert node["total"] == 4
+
+    def test_depth_is_capped(self):
+        trie, _, _ = suggest_groups.build_indexes(make_tracking())
+        parts = "auditd-data-retention-action-mail-acct-extra".split("-")
+        assert len(trie.path(parts)) == suggest_groups.MAX_PREFIX_DEPTH
+
+    def test_unique_prefix(self):
+        trie, _, kw_map = suggest_groups.build_indexes(make_tracking())
+        gid, conf, reason = suggest_groups.suggest_group(
+            "audit-rules-dac-modification-fchmod", trie, kw_map)
+        assert gid == "M4"
+        assert conf == pytest.approx(0.9)
+        assert reason == "prefix 'audit-rules-dac-modification' unique to M4"
+
+    def test_dominant_prefix(self):
+        trie, _, kw_map = suggest_groups.build_indexes(make_tracking())
+        gid, _, reason = suggest_groups.suggest_group(
+            "audit-rules-time-adjtimex", trie, kw_map)
+        assert gid == "M4"
+        assert reason == "prefix 'audit-rules' → M4 (3/4 checks)"
+
+    def test_flat_prefix_map_matches_trie(self):
+        tracking = make_tracking()
+        trie, _, kw_map = suggest_groups.build_indexes(tracking)
+        flat: dict = {}
+        for check, info in tracking["remediations"].items():
+            parts = check.split("-")
+            for depth in range(1, min(len(parts), 6) + 1):
+                counts = flat.setdefault("-".join(parts[:depth]), {})
+                counts[info["group"]] = counts.get(info["group"], 0) + 1
+        names = ["audit-rules-foo", "auditd-new", "configure-crypto-x",
+                 "audit-rules-dac-modification-lchown", "unknown-check"]
+        flat_trie = suggest_groups.PrefixTrie.from_prefix_map(flat)
+        assert (suggest_groups.suggest_groups(names, trie, kw_map)
+                == [suggest_groups.suggest_group(n, flat_trie, kw_map) for n in names])
+
+
+class TestTokenIndex:
+    def test_scores_are_unit_cosines(self):
+        _, _, index = suggest_groups.build_indexes(make_tracking())
+        acc, known = index.scores("audit-rules-dac-modification-chmod")
+        assert set(known) == {"audit", "rules", "dac", "modification", "chmod"}
+        assert index.groups[acc.index(max(acc))] == "M4"
+        assert all(0.0 <= c <= 1.0 + 1e-9 for c in acc)
+
+    def test_title_tokens_count(self):
+        _, _, index = suggest_groups.build_indexes(make_tracking())
+        gid, conf, reason = index.best("sshd-use-strong-crypto")
+        assert gid == "H1"
+        assert 0.0 < conf <= suggest_groups.SIMILARITY_CAP
+        assert "'crypto'" in reason
+
+    def test_unseen_tokens_lower_confidence(self):
+        _, _, index = suggest_groups.build_indexes(make_tracking())
+        _, close, _ = index.best("crypto-policy")
+        _, far, _ = index.best("crypto-unrelated-words-everywhere")
+        assert far < close
+
+    def test_unknown_tokens_are_no_match(self):
+        _, _, index = suggest_groups.build_indexes(make_tracking())
+        assert index.best("completely-unknown") == (None, 0.0, "no match")
+
+    def test_fallback_after_inconclusive_prefix(self):
+        trie, _, index = suggest_groups.build_indexes(make_tracking())
+        gid, conf, reason = suggest_groups.suggest_group(
+            "kernel-crypto-policy", trie, index)
+        assert gid == "H1"
+        assert 0.0 < conf <= suggest_groups.SIMILARITY_CAP
+        assert reason.startswith("similar to H1")
+
+
+class TestPersistedIndex:
+    def write_tracking(self, tmp_path, data) -> str:
+        path = tmp_path / "tracking.json"
+        path.write_text(json.dumps(data))
+        return str(path)
+
+    def test_index_reused_while_tracking_unchanged(self, tmp_path, monkeypatch):
+        tracking_path = self.write_tracking(tmp_path, make_tracking())
+        index_path = str(tmp_path / "index.json")
+        _, trie, _, kw_map = suggest_groups.load_tracking_index(tracking_path, index_path)
+        assert os.path.exists(index_path)
+
+        def no_build(tracking):
+            raise AssertionError("index should not be rebuilt")
+
+        monkeypatch.setattr(suggest_groups, "build_indexes", no_build)
+        _, loaded, _, loaded_kw = suggest_groups.load_tracking_index(
+            tracking_path, index_path)
+        assert loaded.root == trie.root
+        assert loaded_kw.to_json() == kw_map.to_json()
+        assert suggest_groups.suggest_group("audit-rules-x", loaded, loaded_kw)[0] == "M4"
+
+    def test_index_rebuilt_when_tracking_changes(self, tmp_path):
+        data = make_tracking()
+        tracking_path = self.write_tracking(tmp_path, data)
+        index_path = str(tmp_path / "index.json")
+        suggest_groups.load_tracking_index(tracking_path, index_path)
+
+        data["remediations"]["sshd-disable-root-login"] = {"group": "H1"}
+        self.write_tracking(tmp_path, data)
+        _, trie, _, _ = suggest_groups.load_tracking_index(tracking_path, index_path)
+        assert trie.path(["sshd"])[0]["groups"] == {"H1": 1}
+
+    def test_corrupt_index_is_ignored(self, tmp_path):
+        (tmp_path / "index.json").write_text("{not json")
+        assert suggest_groups.load_index(str(tmp_path / "index.json"), "x") is None
+
+
+def make_scan() -> dict:
+    return {
+        "version": "5.0",
+        "scan_date": "2026-10-01T00:00:00Z",
+        "remediations": {
+            "high": [{"name": "rhcos4-e8-worker-audit-rules-time-stime", "severity": "high"}],
+            "medium": [{"name": "ocp4-cis-configure-crypto-policy-x"},
+                       {"name": "rhcos4-e8-master-audit-rules-login-events"}],
+            "low": [],
+        },
+        "passing_checks": {
+            "medium": [{"name": "rhcos4-e8-worker-auditd-freq"}],
+        },
+        "manual_checks": [{"name": "ocp4-cis-manual-review"}],
+    }
+
+
+class TestBatchSuggestions:
+    def test_extract_failing_checks(self):
+        assert suggest_groups.extract_failing_checks(make_scan()) == {
+            "audit-rules-time-stime": "high",
+            "configure-crypto-policy-x": "medium",
+            "audit-rules-login-events": "medium",
+        }
+
+    def test_confidence_bucket(self):
+        bucket = suggest_groups.confidence_bucket
+        assert bucket(0.9, 0.8, 0.5) == "high"
+        assert bucket(0.5, 0.8, 0.5) == "medium"
+        assert bucket(0.1, 0.8, 0.5) == "low"
+        assert bucket(0.0, 0.8, 0.5) == "unmatched"
+
+    def test_build_suggestion_file(self):
+        results = [
+            {"check": "a", "group": "M4", "confidence": 0.9, "reason": "r"},
+            {"check": "b", "group": None, "confidence": 0.0, "reason": "r"},
+        ]
+        doc = suggest_groups.build_suggestion_file(
+            results, "tracking.json", 0.8, 0.5, scan_path="ocp.json",
+            scan_data=make_scan(), severities={"a": "high"})
+        assert doc["version"] == "5.0"
+        assert doc["summary"] == {"total": 2, "high": 1, "medium": 0,
+                                  "low": 0, "unmatched": 1}
+        assert doc["suggestions"][0]["bucket"] == "high"
+        assert doc["suggestions"][0]["severity"] == "high"
+        assert "severity" not in doc["suggestions"][1]
+
+    def test_main_failing_output(self, tmp_path, monkeypatch, capsys):
+        tracking_path = tmp_path / "tracking.json"
+        tracking_path.write_text(json.dumps(make_tracking()))
+        scan_path = tmp_path / "ocp.json"
+        scan_path.write_text(json.dumps(make_scan()))
+        out_path = tmp_path / "suggestions.json"
+        monkeypatch.setattr(sys, "argv", [
+            "suggest-groups.py", "--tracking", str(tracking_path), "--failing",
+            "--output", str(out_path), str(scan_path)])
+        suggest_groups.main()
+        capsys.readouterr()
+
+        doc = json.loads(out_path.read_text())
+        checks = {s["check"]: s for s in doc["suggestions"]}
+        # audit-rules-login-events is already grouped; passing and manual
+        # checks are not considered with --failing.
+        assert set(checks) == {"audit-rules-time-stime", "configure-crypto-policy-x"}
+        assert checks["audit-rules-time-stime"]["group"] == "M4"
+        assert checks["audit-rules-time-stime"]["severity"] == "high"
+        assert doc["summary"]["total"] == 2
@@ -21,6 +21,11 @@ summarize_remediations = module_from_spec(spec)
 spec.loader.exec_module(summarize_remediations)
 
 DESC = "A long enough description for summarization purposes here."
+SYSCTL_DESC = (
+    "Restrict Access to Kernel Message Buffer\n"
+    "To set the runtime status of the kernel.dmesg_restrict kernel parameter, "
+    "run the following command:\n\n$ sudo sysctl -w kernel.dmesg_restrict=1"
+)
 
 
 def _mock_client(response_text: str) -> MagicMock:
@@ -199,6 +204,28 @@ class TestProcessChecks:
         assert result[0]["summary"] == "from cache"
         client.messages.create.assert_not_called()
 
+    def test_recognised_description_extracted_without_api(self):
+        client = _mock_client("unused")
+        cache: dict[str, str] = {}
+        checks = [{"name": "sysctl-kernel-dmesg-restrict",
+                   "description": SYSCTL_DESC}]
+        result = summarize_remediations.process_checks(
+            client, checks, cache=cache
+        )
+        assert result[0]["summary"] == "Set kernel.dmesg_restrict=1 via sysctl"
+        client.messages.create.assert_not_called()
+        assert cache == {}
+
+    def test_no_extract_sends_recognised_description_to_api(self):
+        client = _mock_client("from api")
+        checks = [{"name": "sysctl-kernel-dmesg-restrict",
+                   "description": SYSCTL_DESC}]
+        result = summarize_remediations.process_checks(
+            client, checks, extract=False
+        )
+        assert result[0]["summary"] == "from api"
+        client.messages.create.assert_called_once()
+
 
 class TestMainIntegration:
     def test_offline_with_cache(self):
@@ -2,6 +2,7 @@
 """Tests for scripts/validate-dashboard-data.py"""
 from __future__ import annotations
 
+import io
 import json
 import os
 import sys
@@ -19,6 +20,8 @@ spec = spec_from_file_location(
     os.path.join(os.path.dirname(__file__), '..', 'scripts',
                  'validate-dashboard-data.py'))
 validate_dashboard = module_from_spec(spec)
+# Registered so ProcessPoolExecutor workers can pickle module functions.
+sys.modules["validate_dashboard"] = validate_dashboard
 spec.loader.exec_module(validate_dashboard)
 
 
@@ -822,6 +825,64 @@ class TestValidateUpstreamPrs:
         assert validate_dashboard.validate_upstream_prs(fp) == []
 
 
+class TestSchemaEngine:
+    def test_fast_path_agrees_with_reporting_path(self):
+        scan = make_valid_scan_export()
+        assert validate_dashboard.check_scan_export(scan) == []
+        scan["remediations"]["high"].append({"name": "x"})
+        assert validate_dashboard.check_scan_export(scan) == [
+            "remediations.high[1] missing 'status'",
+            "remediations.high[1] missing 'severity'",
+        ]
+
+    def test_non_object_check_item_reports_missing_fields(self):
+        scan = make_valid_scan_export()
+        scan["manual_checks"] = ["rhcos4-foo"]
+        assert validate_dashboard.check_scan_export(scan) == [
+            "manual_checks[0] missing 'name'"]
+
+    def test_non_object_document_reported_not_raised(self):
+        assert validate_dashboard.check_scan_export([]) == [
+            "scan export must be a JSON object"]
+        assert validate_dashboard.check_tracking("x") == [
+            "tracking file must be a JSON object"]
+
+    def test_unhashable_enum_value(self):
+        data = make_valid_tracking()
+        data["groups"]["H1"]["severity"] = ["HIGH"]
+        assert validate_dashboard.check_tracking(data) == [
+            "groups.H1 invalid severity: '['HIGH']'"]
+
+    def test_only_invalid_items_are_reported(self):
+        items = [{"name": f"check-{i}"} for i in range(1000)]
+        items[500] = {}
+        schema = validate_dashboard.compile_schema(
+            validate_dashboard.List(validate_dashboard.Object(required_each=("name",))))
+        assert schema(items) == ["[500] missing 'name'"]
+
+    def test_custom_schema(self):
+        v = validate_dashboard
+        schema = v.compile_schema(
+            v.Object(
+                sep=" ",
+                required={"id"},
+                fields={
+                    "id": v.Int(minimum=1),
+                    "owner": v.Ref("people", "unknown {key} '{value}'",
+                                   nullable=True),
+                    "tags": v.List(v.Str(), nullable=True),
+                },
+            ),
+            context=lambda data: {"people": {"alice"}},
+        )
+        assert schema({"id": 3, "owner": "alice", "tags": ["a"]}) == []
+        assert schema({"id": 0, "owner": "bob", "tags": ["a", 2]}) == [
+            "id must be >= 1, got 0",
+            "unknown owner 'bob'",
+            "tags[1] must be a string, got int",
+        ]
+
+
 # --- main() integration ---
 
 
@@ -893,6 +954,229 @@ class TestMainIntegration:
             sys.argv = old_argv
 
 
+class TestValidateFiles:
+    def write_dataset(self, tmpdir: str) -> None:
+        write_json(tmpdir, "ocp-4_22.json", make_valid_scan_export())
+        write_json(tmpdir, "tracking-4_22.json", make_valid_tracking())
+        write_json(tmpdir, "scan-history.json", make_valid_scan_history())
+        write_json(tmpdir, "group-matrix.json", make_valid_group_matrix())
+        write_json(tmpdir, "ocp-4_22-baseline.json", {"junk": True})
+
+    def test_collect_files_order_and_kinds(self, tmpdir):
+        self.write_dataset(tmpdir)
+        files = validate_dashboard.collect_files(tmpdir)
+        assert [(k, os.path.basename(p)) for k, p in files] == [
+            ("scan", "ocp-4_22.json"),
+            ("tracking", "tracking-4_22.json"),
+            ("scan-history", "scan-history.json"),
+            ("group-matrix", "group-matrix.json"),
+        ]
+
+    def test_registry_holds_errors_and_names(self, tmpdir):
+        self.write_dataset(tmpdir)
+        files = validate_dashboard.collect_files(tmpdir)
+        registry = validate_dashboard.validate_files(files, jobs=1)
+        scan_errors, scan_names = registry[files[0][1]]
+        assert scan_errors == []
+        assert scan_names == {"check-a", "check-b"}
+        assert registry[files[2][1]] == ([], None)
+
+    def test_malformed_files_are_reported_not_raised(self, tmpdir, monkeypatch, capsys):
+        self.write_dataset(tmpdir)
+        scan = make_valid_scan_export()
+        scan["remediations"]["high"].append({"status": "FAIL", "severity": "high"})
+        scan["passing_checks"] = ["check-c"]
+        scan["manual_checks"] = [{"name": "check-d"}, "check-e"]
+        write_json(tmpdir, "ocp-4_22.json", scan)
+        write_json(tmpdir, "tracking-4_22.json", {"meta": {}, "groups": {}, "remediations": []})
+        files = validate_dashboard.collect_files(tmpdir)
+        registry = validate_dashboard.validate_files(files, jobs=1)
+        scan_errors, scan_names = registry[files[0][1]]
+        assert "remediations.high[1] missing 'name'" in scan_errors
+        assert scan_names == {"check-a", "check-b", "check-d"}
+        assert registry[files[1][1]][1] == []
+
+        monkeypatch.setattr(sys, "argv", ["validate-dashboard-data.py", tmpdir, "-j", "1"])
+        with pytest.raises(SystemExit):
+            validate_dashboard.main()
+        out = capsys.readouterr().out
+        assert "Validating ocp-4_22.json... FAIL" in out
+        assert "Cross-referencing ocp-4_22.json <-> tracking-4_22.json... OK" in out
+
+    def test_pool_matches_serial(self, tmpdir):
+        self.write_dataset(tmpdir)
+        write_json(tmpdir, "upstream-prs.json", {"bad": "not-a-list"})
+        files = validate_dashboard.collect_files(tmpdir)
+        serial = validate_dashboard.validate_files(files, jobs=1)
+        pooled = validate_dashboard.validate_files(files, jobs=2)
+        assert pooled == serial
+        assert serial[os.path.join(tmpdir, "upstream-prs.json")][0]
+
+    def test_each_file_parsed_once(self, tmpdir, monkeypatch, capsys):
+        self.write_dataset(tmpdir)
+        loads: list[str] = []
+        real_load = validate_dashboard.load_json
+
+        def counting_load(filepath: str) -> Any:
+            loads.append(os.path.basename(filepath))
+            return real_load(filepath)
+
+        monkeypatch.setattr(validate_dashboard, "load_json", counting_load)
+        monkeypatch.setattr(sys, "argv",
+                            ["validate-dashboard-data.py", tmpdir, "-j", "1"])
+        validate_dashboard.main()
+        assert sorted(loads) == sorted(set(loads))
+        assert "Cross-referencing ocp-4_22.json <-> tracking-4_22.json" in (
+            capsys.readouterr().out)
+
+
+class TestIncrementalCache:
+    def write_dataset(self, tmpdir: str) -> None:
+        write_json(tmpdir, "ocp-4_22.json", make_valid_scan_export())
+        write_json(tmpdir, "tracking-4_22.json", make_valid_tracking())
+        write_json(tmpdir, "scan-history.json", make_valid_scan_history())
+
+    def run_main(self, monkeypatch, *args: str) -> None:
+        monkeypatch.setattr(sys, "argv",
+                            ["validate-dashboard-data.py", *args, "-j", "1"])
+        validate_dashboard.main()
+
+    def count_loads(self, monkeypatch) -> list[str]:
+        loads: list[str] = []
+        real_load = validate_dashboard.load_json
+
+        def counting_load(filepath: str) -> Any:
+            loads.append(os.path.basename(filepath))
+            return real_load(filepath)
+
+        monkeypatch.setattr(validate_dashboard, "load_json", counting_load)
+        return loads
+
+    def test_second_run_is_served_from_cache(self, tmpdir, monkeypatch, capsys):
+        data_dir = os.path.join(tmpdir, "data")
+        os.makedirs(data_dir)
+        self.write_dataset(data_dir)
+        cache_file = os.path.join(tmpdir, "cache.json")
+        self.run_main(monkeypatch, data_dir, "--cache", cache_file)
+        first = capsys.readouterr().out
+        assert "(cached)" not in first
+
+        loads = self.count_loads(monkeypatch)
+        self.run_main(monkeypatch, data_dir, "--cache", cache_file)
+        second = capsys.readouterr().out
+        assert loads == ["cache.json"]
+        assert "Validating ocp-4_22.json... OK (cached)" in second
+        assert "tracking-4_22.json... OK (cached)" in second
+
+    def test_changed_file_is_revalidated(self, tmpdir, monkeypatch, capsys):
+        data_dir = os.path.join(tmpdir, "data")
+        os.makedirs(data_dir)
+        self.write_dataset(data_dir)
+        cache_file = os.path.join(tmpdir, "cache.json")
+        self.run_main(monkeypatch, data_dir, "--cache", cache_file)
+        capsys.readouterr()
+
+        tracking = make_valid_tracking()
+        tracking["remediations"]["not-in-scan"] = dict(
+            next(iter(tracking["remediations"].values())))
+        write_json(data_dir, "tracking-4_22.json", tracking)
+        loads = self.count_loads(monkeypatch)
+        self.run_main(monkeypatch, data_dir, "--cache", cache_file)
+        out = capsys.readouterr().out
+        assert sorted(loads) == ["cache.json", "tracking-4_22.json"]
+        assert "Validating ocp-4_22.json... OK (cached)" in out
+        assert "Validating tracking-4_22.json... OK\n" in out
+        # The tracking side changed, so the cross-reference is recomputed.
+        assert "tracking-4_22.json... WARN\n" in out
+        assert "not-in-scan" in out
+
+    def test_stale_validator_version_discards_cache(self, tmpdir):
+        cache_file = os.path.join(tmpdir, "cache.json")
+        cache = validate_dashboard.empty_cache("old")
+        cache["files"]["x"] = {"sha256": "abc"}
+        validate_dashboard.save_cache(cache_file, cache)
+        assert validate_dashboard.load_cache(cache_file, "old")["files"]
+        assert validate_dashboard.load_cache(cache_file, "new")["files"] == {}
+
+    def test_corrupt_cache_starts_fresh(self, tmpdir):
+        cache_file = os.path.join(tmpdir, "cache.json")
+        with open(cache_file, "w") as f:
+            f.write("{not json")
+        cache = validate_dashboard.load_cache(cache_file, "v")
+        assert cache == validate_dashboard.empty_cache("v")
+
+    def test_cross_reference_reused_only_when_inputs_unchanged(self, tmpdir):
+        self.write_dataset(tmpdir)
+        scan = os.path.join(tmpdir, "ocp-4_22.json")
+        tracking = os.path.join(tmpdir, "tracking-4_22.json")
+        registry = {scan: ([], {"a"}), tracking: ([], ["a", "b"])}
+        cache = validate_dashboard.empty_cache("v")
+        digests = {scan: "s1", tracking: "t1"}
+
+        errors, hit = validate_dashboard.cross_reference(
+            scan, tracking, registry, cache, digests)
+        assert errors and not hit
+        assert validate_dashboard.cross_reference(
+            scan, tracking, registry, cache, digests) == (errors, True)
+
+        registry[scan] = ([], {"a", "b"})
+        digests[scan] = "s2"
+        assert validate_dashboard.cross_reference(
+            scan, tracking, registry, cache, digests) == ([], False)
+
+
+class TestChangedOnly:
+    def write_dataset(self, tmpdir: str) -> None:
+        write_json(tmpdir, "ocp-4_21.json", make_valid_scan_export())
+        write_json(tmpdir, "ocp-4_22.json", make_valid_scan_export())
+        write_json(tmpdir, "tracking-4_22.json", make_valid_tracking())
+        write_json(tmpdir, "tracking.json", make_valid_tracking())
+        write_json(tmpdir, "scan-history.json", make_valid_scan_history())
+
+    def selected(self, tmpdir: str, *changed: str) -> list[str]:
+        files = validate_dashboard.collect_files(tmpdir)
+        paths = [os.path.join(tmpdir, name) for name in changed]
+        return [os.path.basename(p) for _k, p in
+                validate_dashboard.select_changed(tmpdir, files, paths)]
+
+    def test_scan_pulls_in_its_tracking_partner(self, tmpdir):
+        self.write_dataset(tmpdir)
+        assert self.selected(tmpdir, "ocp-4_22.json") == [
+            "ocp-4_22.json", "tracking-4_22.json"]
+
+    def test_default_tracking_pulls_in_unversioned_scans(self, tmpdir):
+        self.write_dataset(tmpdir)
+        assert self.selected(tmpdir, "tracking.json") == [
+            "ocp-4_21.json", "tracking.json"]
+
+    def test_standalone_and_unrelated_paths(self, tmpdir):
+        self.write_dataset(tmpdir)
+        assert self.selected(tmpdir, "scan-history.json", "README.md",
+                             "deleted.json") == ["scan-history.json"]
+
+    def test_main_reads_paths_from_stdin(self, tmpdir, monkeypatch, capsys):
+        self.write_dataset(tmpdir)
+        monkeypatch.setattr(sys, "stdin", io.StringIO(
+            os.path.join(tmpdir, "scan-history.json") + "\n\n"))
+        monkeypatch.setattr(sys, "argv", [
+            "validate-dashboard-data.py", tmpdir, "--changed-only", "-"])
+        validate_dashboard.main()
+        out = capsys.readouterr().out
+        assert "Validating scan-history.json... OK" in out
+        assert "ocp-4_22.json" not in out
+        assert "All 1 file(s) valid." in out
+
+    def test_main_with_no_data_changes(self, tmpdir, monkeypatch, capsys):
+        self.write_dataset(tmpdir)
+        paths_file = os.path.join(tmpdir, "changed.txt")
+        with open(paths_file, "w") as f:
+            f.write("scripts/diff-scans.py\n")
+        monkeypatch.setattr(sys, "argv", [
+            "validate-dashboard-data.py", tmpdir, "--changed-only", paths_file])
+        validate_dashboard.main()
+        assert "No dashboard data files changed." in capsys.readouterr().out
+
+
 class TestStripProfilePrefix:
     def test_rhcos4_e8_master(self):
         assert validate_dashboard.strip_profile_prefix(
@@ -14,8 +14,8 @@ usage() {
 	echo "Usage: $0 [-n|--namespace NAMESPACE] [--watch] [--interval SECONDS] [--filter SUBSTRING]"
 	echo "\nOptions:"
 	echo "  -n, --namespace   Target namespace (default: openshift-compliance)"
-	echo "      --watch       Continuously watch and refresh output"
-	echo "      --interval    Refresh interval in seconds (default: 10)"
+	echo "      --watch       Refresh on every suite/scan phase change"
+	echo "      --interval    Refresh at least this often, in seconds (default: 10)"
 	echo "      --filter      Only include scans whose name contains this substring"
 	echo "  -h, --help       Show this help"
 }
@@ -140,11 +140,18 @@ render() {
 }
 
 if [[ "$WATCH" == true ]]; then
+	# Re-render as soon as a suite or scan changes phase, or every INTERVAL
+	# seconds otherwise. Transitions arriving together trigger one refresh;
+	# if the watcher exits, fall back to plain interval polling.
 	while true; do
 		clear || true
 		render || true
-		sleep "$INTERVAL"
-	done
+		if read -r -t "$INTERVAL" _; then
+			while read -r -t 1 _; do :; done
+		elif (($? <= 128)); then
+			sleep "$INTERVAL"
+		fi
+	done < <(python3 "$SCRIPT_DIR/lib/cluster_watch.py" -n "$NAMESPACE" events --kinds suite,scan 2>/dev/null || true)
 else
 	render
 fi